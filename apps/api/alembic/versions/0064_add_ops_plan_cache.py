@@ -0,0 +1,42 @@
+"""Add OPS plan cache table for semantic plan reuse
+
+Revision ID: 0064_add_ops_plan_cache
+Revises: 0063
+Create Date: 2026-10-16
+
+Stores question embeddings and cached PlanOutputs so near-identical
+questions can skip LLM planning (ops_plan_cache_semantic_enabled).
+"""
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0064_add_ops_plan_cache"
+down_revision = "0063"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.create_table(
+        "tb_ops_plan_cache",
+        sa.Column("id", sa.String(length=36), primary_key=True, nullable=False),
+        sa.Column("context_key", sa.Text(), nullable=False),
+        sa.Column("question", sa.Text(), nullable=False),
+        sa.Column("embedding", Vector(1536), nullable=False),
+        sa.Column("plan_output", postgresql.JSONB(), nullable=False),
+        sa.Column("elapsed_ms", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("expires_at", sa.TIMESTAMP(timezone=True), nullable=False),
+    )
+    op.create_index("ix_tb_ops_plan_cache_context_key", "tb_ops_plan_cache", ["context_key"])
+    op.create_index("ix_tb_ops_plan_cache_expires_at", "tb_ops_plan_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tb_ops_plan_cache_expires_at", table_name="tb_ops_plan_cache")
+    op.drop_index("ix_tb_ops_plan_cache_context_key", table_name="tb_ops_plan_cache")
+    op.drop_table("tb_ops_plan_cache")
@@ -0,0 +1,34 @@
+"""Add content-hash embedding cache
+
+Revision ID: 0065_add_embedding_cache
+Revises: 0064_add_ops_plan_cache
+Create Date: 2026-10-16
+
+Maps (embed model, sha256 of text) to its vector so reindexing a document
+only calls the embeddings API for chunks whose text actually changed.
+"""
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision = "0065_add_embedding_cache"
+down_revision = "0064_add_ops_plan_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.create_table(
+        "tb_embedding_cache",
+        sa.Column("model", sa.String(length=200), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("model", "content_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tb_embedding_cache")
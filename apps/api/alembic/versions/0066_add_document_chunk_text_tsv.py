@@ -0,0 +1,54 @@
+"""Add stored tsvector and trigram indexes for document chunk text search
+
+Revision ID: 0066_add_document_chunk_text_tsv
+Revises: 0065_add_embedding_cache
+Create Date: 2026-10-16
+
+Text search ranks with the 'simple' configuration, which the existing
+to_tsvector('english', text) expression indexes never matched, so every
+query recomputed the tsvector per row. Store it as a generated column with
+a GIN index, and add a pg_trgm index for the ILIKE keyword fallback. The
+unusable 'english' expression indexes are dropped.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0066_add_document_chunk_text_tsv"
+down_revision = "0065_add_embedding_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE document_chunks
+        ADD COLUMN IF NOT EXISTS text_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(text, ''))) STORED;
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_document_chunks_text_tsv
+        ON document_chunks USING GIN (text_tsv);
+    """)
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_document_chunks_text_trgm
+        ON document_chunks USING GIN (text gin_trgm_ops);
+    """)
+
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_text_tsvector;")
+    op.execute("DROP INDEX IF EXISTS idx_document_chunk_text_search;")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_document_chunks_text_tsvector
+        ON document_chunks USING GIN (to_tsvector('english', text));
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_document_chunk_text_search
+        ON document_chunks USING GIN (to_tsvector('english', text));
+    """)
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_text_trgm;")
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_text_tsv;")
+    op.execute("ALTER TABLE document_chunks DROP COLUMN IF EXISTS text_tsv;")
@@ -0,0 +1,43 @@
+"""Add per-minute trace rollups
+
+Revision ID: 0067_add_trace_rollup
+Revises: 0066_add_document_chunk_text_tsv
+Create Date: 2026-10-16
+
+Each row holds request/error/no-data counts and a mergeable latency sketch
+for one (minute, tenant, ops_mode, tool) bucket as flushed by one worker.
+Observability KPIs merge these rows instead of scanning tb_execution_trace.
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0067_add_trace_rollup"
+down_revision = "0066_add_document_chunk_text_tsv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tb_trace_rollup",
+        sa.Column("id", sa.Text(), nullable=False),
+        sa.Column("bucket_start", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("tenant_id", sa.Text(), nullable=False),
+        sa.Column("ops_mode", sa.Text(), nullable=False),
+        sa.Column("tool", sa.Text(), nullable=False, server_default=sa.text("''")),
+        sa.Column("request_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("error_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("no_data_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("sketch", postgresql.JSONB(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tb_trace_rollup_bucket_start", "tb_trace_rollup", ["bucket_start"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tb_trace_rollup_bucket_start", table_name="tb_trace_rollup")
+    op.drop_table("tb_trace_rollup")
@@ -0,0 +1,21 @@
+import hmac
+
+from core.config import get_settings
+from core.metrics import render_metrics
+from fastapi import APIRouter, HTTPException, Request, Response
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """Prometheus / OpenMetrics exposition for all workers; requires METRICS_BEARER_TOKEN"""
+    settings = get_settings()
+    # Labels expose rule ids, route paths and tool names: never serve unauthenticated
+    if not settings.metrics_enabled or not settings.metrics_bearer_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    presented = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(presented.encode(), settings.metrics_bearer_token.encode()):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    body, content_type = render_metrics(request.headers.get("accept"))
+    return Response(content=body, media_type=content_type)
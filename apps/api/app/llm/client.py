@@ -4,7 +4,7 @@ import json
 import logging
 from datetime import datetime
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from app.core.exceptions import CircuitOpenError
 from app.llm.circuit_breaker import (
@@ -14,6 +14,7 @@ from app.llm.circuit_breaker import (
 from app.modules.operation_settings.crud import get_setting_effective_value
 from core.config import AppSettings, get_settings
 from core.db import get_session_context
+from core.telemetry_sink import submit_telemetry
 from openai import AsyncOpenAI, OpenAI
 from sqlmodel import Session
 
@@ -525,19 +526,13 @@ class LlmCallLogger:
             "error_type": type(error).__name__,
         }
 
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
-            self.log_error(exc_val)
-
-        # Save to database (non-blocking)
+    def _save(self) -> None:
+        """Hand the call log to the telemetry sink (written in the background)"""
         try:
-            from .models import LlmCallLogCreate
+            from app.modules.llm.models import LlmCallLogCreate, TbLlmCallLog
 
             log_create = LlmCallLogCreate(
-                trace_id=self.trace_id,
+                trace_id=str(self.trace_id) if self.trace_id else None,
                 call_type=self.call_type,
                 system_prompt=self.system_prompt,
                 user_prompt=self.user_prompt,
@@ -560,13 +555,21 @@ class LlmCallLogger:
                 ui_endpoint=self.ui_endpoint,
                 user_id=self.user_id,
             )
-
-            from .crud import create_llm_call_log
-            create_llm_call_log(self.session, log_create)
-
+            submit_telemetry(
+                TbLlmCallLog(**log_create.model_dump(exclude_none=True), id=uuid4()),
+                self.session,
+            )
         except Exception as log_exc:
             logging.warning(f"Failed to log LLM call: {log_exc}")
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.log_error(exc_val)
+        self._save()
+
     def __enter__(self):
         # For synchronous context
         return self
@@ -574,38 +577,4 @@ class LlmCallLogger:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             self.log_error(exc_val)
-
-        # Save to database (synchronous)
-        try:
-            from .models import LlmCallLogCreate
-
-            log_create = LlmCallLogCreate(
-                trace_id=self.trace_id,
-                call_type=self.call_type,
-                system_prompt=self.system_prompt,
-                user_prompt=self.user_prompt,
-                context=self.context,
-                raw_response=self.raw_response,
-                parsed_response=self.parsed_response,
-                model_name=self.model_name,
-                provider=self.provider,
-                input_tokens=self.input_tokens,
-                output_tokens=self.output_tokens,
-                total_tokens=self.total_tokens,
-                latency_ms=self.duration_ms,
-                request_time=self.request_time,
-                response_time=self.response_time,
-                duration_ms=self.duration_ms,
-                status=self.status,
-                error_message=self.error_message,
-                error_details=self.error_details,
-                feature=self.feature,
-                ui_endpoint=self.ui_endpoint,
-                user_id=self.user_id,
-            )
-
-            from .crud import create_llm_call_log
-            create_llm_call_log(self.session, log_create)
-
-        except Exception as log_exc:
-            logging.warning(f"Failed to log LLM call: {log_exc}")
+        self._save()
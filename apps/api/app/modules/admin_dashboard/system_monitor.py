@@ -5,6 +5,13 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import psutil
+from core.metrics import (
+    DB_CONNECTIONS,
+    DB_POOL_SIZE,
+    SYSTEM_CPU_PERCENT,
+    SYSTEM_DISK_PERCENT,
+    SYSTEM_MEMORY_PERCENT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +142,10 @@ class SystemMonitor:
                 disk_available_gb=disk_available_gb,
             )
 
+            SYSTEM_CPU_PERCENT.set(cpu_percent)
+            SYSTEM_MEMORY_PERCENT.set(memory_percent)
+            SYSTEM_DISK_PERCENT.set(disk_percent)
+
             # Store metric
             self.resource_metrics.append(metric)
 
@@ -261,6 +272,8 @@ class SystemMonitor:
             error_count=error_count,
         )
 
+        DB_CONNECTIONS.set(connection_count)
+        DB_POOL_SIZE.set(pool_size)
         self.database_metrics.append(metric)
 
         # Keep only recent metrics
@@ -0,0 +1,369 @@
+"""
+Verified API key cache and write-behind ``last_used_at`` updates.
+
+``validate_api_key`` bcrypt-verifies the presented key, which is deliberately
+slow. A successful verification is cached for a short TTL under an
+HMAC-SHA256 digest of the key (the raw key is never stored), capped at the
+key's own ``expires_at``. Entries are dropped when a ``tb_api_key`` row is
+written (revoke, scope change, delete) - detected from ORM flushes - and the
+invalidation is fanned out to other workers over Redis pub/sub.
+
+``last_used_at`` is buffered per key and written in one batched UPDATE by a
+background flusher instead of a commit per request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from core.config import get_settings
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from app.modules.api_keys.models import TbApiKey
+
+logger = logging.getLogger(__name__)
+
+_API_KEY_TABLE = "tb_api_key"
+_PENDING_CHANGES_KEY = "_api_key_changes"
+
+
+def key_digest(key: str) -> str:
+    secret = (get_settings().jwt_secret_key or "").encode("utf-8")
+    return hmac.new(secret, key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def seconds_until(expires_at: Optional[datetime], now: Optional[datetime] = None) -> float:
+    """Seconds until ``expires_at`` (naive values are treated as UTC); inf if unset"""
+    if expires_at is None:
+        return float("inf")
+    now = now or datetime.now(timezone.utc)
+    if expires_at.tzinfo is None:
+        now = now.replace(tzinfo=None)
+    return (expires_at - now).total_seconds()
+
+
+@dataclass
+class _VerifiedKey:
+    key_id: str
+    snapshot: Dict[str, Any]
+    expires_at: float
+
+
+class VerifiedKeyCache:
+    """LRU + TTL map of key digest -> verified TbApiKey snapshot"""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _VerifiedKey] = OrderedDict()
+        self._by_key_id: Dict[str, set[str]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "invalidations": 0,
+            "remote_invalidations": 0,
+        }
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, digest: str) -> Optional[TbApiKey]:
+        """Detached copy of the cached key record, or None"""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and time.monotonic() >= entry.expires_at:
+                self._drop(digest)
+                entry = None
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._counters["hits"] += 1
+            snapshot = dict(entry.snapshot)
+        return TbApiKey(**snapshot)
+
+    def put(self, digest: str, api_key: TbApiKey, generation: int) -> None:
+        ttl = min(self.ttl_seconds, seconds_until(api_key.expires_at))
+        if ttl <= 0:
+            return
+        entry = _VerifiedKey(
+            key_id=str(api_key.id),
+            snapshot=api_key.model_dump(),
+            expires_at=time.monotonic() + ttl,
+        )
+        with self._lock:
+            if generation != self._generation:
+                # A key was revoked while this one was being verified
+                return
+            self._drop(digest)
+            self._entries[digest] = entry
+            self._by_key_id.setdefault(entry.key_id, set()).add(digest)
+            self._counters["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, key_ids: Iterable[str], remote: bool = False) -> int:
+        with self._lock:
+            digests = [
+                digest
+                for key_id in key_ids
+                for digest in self._by_key_id.get(str(key_id), ())
+            ]
+            for digest in digests:
+                self._drop(digest)
+            self._generation += 1
+            self._counters["remote_invalidations" if remote else "invalidations"] += 1
+        return len(digests)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_key_id.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._entries), **self._counters}
+
+    def _drop(self, digest: str) -> None:
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return
+        digests = self._by_key_id.get(entry.key_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_key_id[entry.key_id]
+
+
+class LastUsedBuffer:
+    """Coalesces ``last_used_at`` per key and writes them in one batch"""
+
+    def __init__(self, flush_seconds: float = 30.0):
+        self.flush_seconds = flush_seconds
+        self._pending: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def touch(self, key_id: str, used_at: Optional[datetime] = None) -> None:
+        with self._lock:
+            self._pending[str(key_id)] = used_at or datetime.now(timezone.utc)
+
+    def pending(self) -> Dict[str, datetime]:
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        from core.db import get_session_context
+
+        try:
+            with get_session_context() as session:
+                # Bulk UPDATE by primary key: no ORM flush, so the key cache
+                # is not invalidated by its own bookkeeping
+                session.execute(
+                    update(TbApiKey),
+                    [
+                        {"id": key_id, "last_used_at": used_at}
+                        for key_id, used_at in pending.items()
+                    ],
+                )
+                session.commit()
+        except Exception as exc:
+            logger.warning(f"Failed to flush API key last_used_at: {exc}")
+            with self._lock:
+                for key_id, used_at in pending.items():
+                    current = self._pending.get(key_id)
+                    if current is None or current < used_at:
+                        self._pending[key_id] = used_at
+            return 0
+        return len(pending)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="api-key-last-used", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_seconds):
+            self.flush()
+
+
+class ApiKeyInvalidationBus:
+    """Fan-out of API key cache invalidations to other workers via Redis pub/sub."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._client = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def _get_client(self):
+        if self._client is None:
+            from core.redis import create_redis_client
+
+            self._client = create_redis_client(get_settings())
+        return self._client
+
+    def publish(self, key_ids: Iterable[str]) -> None:
+        if not get_settings().redis_url:
+            return
+        message = json.dumps({"origin": self.origin, "key_ids": sorted(key_ids)})
+        try:
+            self._get_client().publish(self.channel, message)
+        except Exception as exc:
+            logger.warning(f"Failed to publish API key cache invalidation: {exc}")
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        if not get_settings().redis_url:
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name="api-key-cache-invalidation", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                logger.info(f"Listening for API key cache invalidations on {self.channel}")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle(message.get("data"))
+            except Exception as exc:
+                logger.warning(f"API key cache invalidation listener error: {exc}")
+                self._stop.wait(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.origin:
+            return
+        get_verified_key_cache().invalidate(payload.get("key_ids") or [], remote=True)
+
+
+def notify_api_keys_changed(key_ids: Iterable[str]) -> None:
+    """Invalidate locally and broadcast to other workers."""
+    key_ids = {str(key_id) for key_id in key_ids}
+    if not key_ids:
+        return
+    get_verified_key_cache().invalidate(key_ids)
+    get_invalidation_bus().publish(key_ids)
+
+
+def _collect_api_key_changes(session: Session, flush_context: Any) -> None:
+    changed: set[str] = session.info.setdefault(_PENDING_CHANGES_KEY, set())
+    for obj in (*session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) == _API_KEY_TABLE and obj.id:
+            changed.add(str(obj.id))
+
+
+def _flush_api_key_changes(session: Session) -> None:
+    changed = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if changed:
+        notify_api_keys_changed(changed)
+
+
+def _discard_api_key_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_api_key_changes)
+event.listen(Session, "after_commit", _flush_api_key_changes)
+event.listen(Session, "after_rollback", _discard_api_key_changes)
+
+
+_key_cache: Optional[VerifiedKeyCache] = None
+_last_used_buffer: Optional[LastUsedBuffer] = None
+_invalidation_bus: Optional[ApiKeyInvalidationBus] = None
+_singleton_lock = threading.Lock()
+
+
+def get_verified_key_cache() -> VerifiedKeyCache:
+    """Get the process-wide verified API key cache."""
+    global _key_cache
+    if _key_cache is None:
+        with _singleton_lock:
+            if _key_cache is None:
+                settings = get_settings()
+                _key_cache = VerifiedKeyCache(
+                    max_entries=settings.api_key_cache_max_entries,
+                    ttl_seconds=settings.api_key_cache_ttl_seconds,
+                )
+    return _key_cache
+
+
+def get_last_used_buffer() -> LastUsedBuffer:
+    """Get the process-wide last_used_at write-behind buffer."""
+    global _last_used_buffer
+    if _last_used_buffer is None:
+        with _singleton_lock:
+            if _last_used_buffer is None:
+                _last_used_buffer = LastUsedBuffer(
+                    get_settings().api_key_last_used_flush_seconds
+                )
+    return _last_used_buffer
+
+
+def get_invalidation_bus() -> ApiKeyInvalidationBus:
+    """Get the process-wide Redis invalidation bus."""
+    global _invalidation_bus
+    if _invalidation_bus is None:
+        with _singleton_lock:
+            if _invalidation_bus is None:
+                _invalidation_bus = ApiKeyInvalidationBus(
+                    get_settings().api_key_cache_invalidation_channel
+                )
+    return _invalidation_bus
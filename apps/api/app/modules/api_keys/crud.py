@@ -5,9 +5,16 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
+from core.config import get_settings
 from passlib.context import CryptContext
 from sqlmodel import Session, select
 
+from app.modules.api_keys.cache import (
+    get_last_used_buffer,
+    get_verified_key_cache,
+    key_digest,
+    seconds_until,
+)
 from app.modules.api_keys.models import TbApiKey
 
 # Password context for API key hashing
@@ -75,6 +82,11 @@ def validate_api_key(session: Session, key: str) -> Optional[TbApiKey]:
     """
     Validate an API key and return the associated API key record.
 
+    Successful verifications are cached for a short TTL (see
+    ``app.modules.api_keys.cache``), so repeat calls skip bcrypt; cache hits
+    return a detached copy of the record. ``last_used_at`` is buffered and
+    written in batches rather than committed here.
+
     Args:
         session: Database session
         key: The API key to validate
@@ -82,6 +94,16 @@ def validate_api_key(session: Session, key: str) -> Optional[TbApiKey]:
     Returns:
         TbApiKey record if valid, None otherwise
     """
+    settings = get_settings()
+    cache = get_verified_key_cache() if settings.api_key_cache_enabled else None
+    digest = key_digest(key) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(digest)
+        if cached is not None:
+            get_last_used_buffer().touch(cached.id)
+            return cached
+        generation = cache.generation()
+
     # Extract key prefix (first 8 chars)
     key_prefix = key[:8]
 
@@ -96,23 +118,14 @@ def validate_api_key(session: Session, key: str) -> Optional[TbApiKey]:
     # Verify full key against hash (only one should match)
     for candidate in candidates:
         # Check if expired
-        if candidate.expires_at:
-            now = datetime.now(timezone.utc)
-            if candidate.expires_at.tzinfo is None:
-                # Handle naive datetime
-                if candidate.expires_at <= now.replace(tzinfo=None):
-                    continue
-            else:
-                # Handle timezone-aware datetime
-                if candidate.expires_at <= now:
-                    continue
+        if seconds_until(candidate.expires_at) <= 0:
+            continue
 
         # Verify key hash
         if pwd_context.verify(key, candidate.key_hash):
-            # Update last_used_at
-            candidate.last_used_at = datetime.now(timezone.utc)
-            session.add(candidate)
-            session.commit()
+            get_last_used_buffer().touch(candidate.id)
+            if cache is not None:
+                cache.put(digest, candidate, generation)
             return candidate
 
     return None
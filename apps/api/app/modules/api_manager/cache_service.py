@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from core.config import get_settings
+from core.metrics import CACHE_REQUESTS
 from core.redis import create_redis_client
 from redis import Redis
 
@@ -77,19 +78,26 @@ class APICacheService:
             return "redis"
         return "memory"
 
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self._hit_count += 1
+        else:
+            self._miss_count += 1
+        CACHE_REQUESTS.labels("api_manager", "hit" if hit else "miss").inc()
+
     def get(self, api_id: str, params: dict[str, Any]) -> dict[str, Any] | None:
         key = self._make_key(api_id, params)
         if self._redis is not None:
             try:
                 raw = self._redis.get(key)
                 if not raw:
-                    self._miss_count += 1
+                    self._record(hit=False)
                     return None
                 value = json.loads(raw)
                 if isinstance(value, dict):
-                    self._hit_count += 1
+                    self._record(hit=True)
                     return value
-                self._miss_count += 1
+                self._record(hit=False)
                 return None
             except Exception as exc:
                 logger.warning("APICacheService redis get failed, fallback to memory: %s", exc)
@@ -97,13 +105,13 @@ class APICacheService:
 
         item = self._items.get(key)
         if not item:
-            self._miss_count += 1
+            self._record(hit=False)
             return None
         if item.expires_at < time.time():
             self._items.pop(key, None)
-            self._miss_count += 1
+            self._record(hit=False)
             return None
-        self._hit_count += 1
+        self._record(hit=True)
         return item.value
 
     def set(
@@ -4,6 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
+from core.telemetry_sink import submit_telemetry
 from models import ApiExecutionLog
 from sqlalchemy import text
 from sqlmodel import Session, select
@@ -15,11 +16,19 @@ VALID_LOGIC_TYPES = {"sql", "workflow", "python", "script", "http"}
 DRY_RUN_API_ID = "00000000-0000-0000-0000-000000000000"
 
 
+# Log tables are not dropped at runtime, so a positive lookup is cached per process
+_existing_tables: set[str] = set()
+
+
 def _table_exists(session: Session, table_name: str) -> bool:
+    if table_name in _existing_tables:
+        return True
     result = session.exec(
         text("SELECT to_regclass(:table_name)"),
         params={"table_name": f"public.{table_name}"},
     ).one()
+    if result[0]:
+        _existing_tables.add(table_name)
     return bool(result[0])
 
 
@@ -133,9 +142,9 @@ def record_exec_log(
             request_params=params or None,
             error_message=error_message,
         )
-        session.add(log)
-        session.commit()
-        session.refresh(log)
+        # exec_id is assigned client-side, so callers can link step logs
+        # before the sink has written the row
+        submit_telemetry(log, session)
         return log
 
     if _table_exists(session, "api_execution_logs"):
@@ -182,9 +191,7 @@ def record_exec_step(
         references=references,
         error_message=error_message,
     )
-    session.add(step)
-    session.commit()
-    session.refresh(step)
+    submit_telemetry(step, session)
     return step
 
 
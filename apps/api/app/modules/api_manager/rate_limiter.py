@@ -0,0 +1,286 @@
+"""
+Rate limiting for ``/runtime/*`` APIs.
+
+Two interchangeable limiters implement ``hit(key, limit)``:
+
+- ``GcraLimiter``: in-process GCRA (one theoretical-arrival time per key, O(1)
+  per request, LRU-bounded key count).
+- ``RedisSlidingWindowLimiter``: sliding-window counter evaluated atomically
+  in a Lua script, so every worker shares one budget per key.
+
+``RuntimeRateLimiter`` picks the backend like ``APICacheService`` does
+(``auto``/``redis``/``memory``, falling back to memory when Redis fails and
+retrying Redis after an exponential backoff starting at
+``runtime_rate_limit_redis_retry_seconds``) and counts decisions per
+dimension (ip, api, api_key, tenant) for metrics.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.config import get_settings
+from core.redis import create_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    requests: int
+    window_seconds: float
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: float = 0.0
+
+
+class GcraLimiter:
+    """Generic cell rate algorithm; a full burst of ``requests`` is allowed"""
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max(1, max_keys)
+        self._clock = clock
+        self._tat: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: RateLimit) -> RateLimitDecision:
+        interval = limit.window_seconds / limit.requests
+        with self._lock:
+            now = self._clock()
+            tat = max(self._tat.get(key, now), now)
+            new_tat = tat + interval
+            if new_tat - now > limit.window_seconds:
+                return RateLimitDecision(False, new_tat - limit.window_seconds - now)
+            self._tat[key] = new_tat
+            self._tat.move_to_end(key)
+            while len(self._tat) > self.max_keys:
+                self._tat.popitem(last=False)
+        return RateLimitDecision(True)
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+# KEYS[1]: key prefix (with a hash tag so both windows share a cluster slot)
+# ARGV: window_ms, limit. Returns {allowed, retry_after_ms}.
+_SLIDING_WINDOW_LUA = """
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local current = math.floor(now / window)
+local cur_key = KEYS[1] .. ':' .. current
+local prev_key = KEYS[1] .. ':' .. (current - 1)
+local cur = tonumber(redis.call('GET', cur_key) or '0')
+local prev = tonumber(redis.call('GET', prev_key) or '0')
+local into = now % window
+if prev * (1 - into / window) + cur + 1 > limit then
+  local retry = window - into
+  if cur + 1 <= limit and prev > 0 then
+    retry = math.ceil((1 - (limit - cur - 1) / prev) * window - into)
+  end
+  return {0, math.max(retry, 1)}
+end
+redis.call('INCR', cur_key)
+redis.call('PEXPIRE', cur_key, window * 2)
+return {1, 0}
+"""
+
+
+class RedisSlidingWindowLimiter:
+    def __init__(self, client: Any, prefix: str = "runtime_rl:"):
+        self._client = client
+        self._prefix = prefix
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+
+    def hit(self, key: str, limit: RateLimit) -> RateLimitDecision:
+        window_ms = max(1, int(limit.window_seconds * 1000))
+        allowed, retry_ms = self._script(
+            keys=[f"{self._prefix}{{{key}}}"], args=[window_ms, limit.requests]
+        )
+        return RateLimitDecision(bool(int(allowed)), int(retry_ms) / 1000.0)
+
+
+MAX_REDIS_RETRY_SECONDS = 60.0
+
+
+class RuntimeRateLimiter:
+    def __init__(
+        self,
+        *,
+        use_redis: bool | None = None,
+        redis_client: Any = None,
+        max_keys: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        settings = get_settings()
+        self._backend = settings.runtime_rate_limit_backend
+        self._memory = GcraLimiter(max_keys or settings.runtime_rate_limit_max_keys)
+        self._redis: Optional[RedisSlidingWindowLimiter] = None
+        self._redis_retry_seconds = settings.runtime_rate_limit_redis_retry_seconds
+        self._redis_backoff = 0.0
+        self._redis_down_until = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._allowed: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+        redis_enabled = (
+            bool(use_redis) if use_redis is not None else self._backend in {"auto", "redis"}
+        )
+        if redis_enabled and (redis_client is not None or settings.redis_url):
+            try:
+                client = redis_client or create_redis_client(settings)
+                self._redis = RedisSlidingWindowLimiter(
+                    client, settings.runtime_rate_limit_prefix
+                )
+                client.ping()
+            except Exception as exc:  # noqa: BLE001
+                if self._redis is not None:
+                    self._mark_redis_down(exc)
+                else:
+                    logger.warning(
+                        "Runtime rate limiter redis unavailable, using per-process limits: %s",
+                        exc,
+                    )
+        elif self._backend == "redis":
+            logger.warning(
+                "Runtime rate limiter configured with redis backend but REDIS_URL is missing; "
+                "using per-process limits"
+            )
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self._redis_usable() else "memory"
+
+    def check(
+        self, limits: Iterable[Tuple[str, str, RateLimit]]
+    ) -> Optional[Tuple[str, RateLimitDecision]]:
+        """Apply ``(dimension, key, limit)`` in order; returns the first rejection"""
+        for dimension, key, limit in limits:
+            decision = self._hit(f"{dimension}:{key}", limit)
+            with self._lock:
+                counters = self._allowed if decision.allowed else self._rejected
+                counters[dimension] = counters.get(dimension, 0) + 1
+            if not decision.allowed:
+                return dimension, decision
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "allowed": dict(self._allowed),
+                "rejected": dict(self._rejected),
+                "memory_keys": len(self._memory),
+            }
+
+    def _redis_usable(self) -> bool:
+        return self._redis is not None and self._clock() >= self._redis_down_until
+
+    def _mark_redis_down(self, exc: Exception) -> None:
+        with self._lock:
+            if self._redis_backoff:
+                self._redis_backoff = min(self._redis_backoff * 2, MAX_REDIS_RETRY_SECONDS)
+            else:
+                self._redis_backoff = self._redis_retry_seconds
+            self._redis_down_until = self._clock() + self._redis_backoff
+            backoff = self._redis_backoff
+        logger.warning(
+            "Runtime rate limiter redis failed, using per-process limits for %.0fs: %s",
+            backoff,
+            exc,
+        )
+
+    def _hit(self, key: str, limit: RateLimit) -> RateLimitDecision:
+        redis_limiter = self._redis
+        if redis_limiter is not None and self._redis_usable():
+            try:
+                decision = redis_limiter.hit(key, limit)
+            except Exception as exc:  # noqa: BLE001
+                self._mark_redis_down(exc)
+            else:
+                if self._redis_backoff:
+                    with self._lock:
+                        self._redis_backoff = 0.0
+                    logger.info("Runtime rate limiter redis recovered")
+                return decision
+        return self._memory.hit(key, limit)
+
+
+def _limit(requests: Any, window_seconds: Any) -> Optional[RateLimit]:
+    try:
+        requests = int(requests)
+        window_seconds = float(window_seconds)
+    except (TypeError, ValueError):
+        return None
+    if requests <= 0 or not math.isfinite(window_seconds) or window_seconds <= 0:
+        return None
+    return RateLimit(requests, window_seconds)
+
+
+def client_limits(client_ip: str) -> List[Tuple[str, str, RateLimit]]:
+    """Per-IP limit, applied before the route is resolved"""
+    settings = get_settings()
+    limit = _limit(settings.runtime_rate_limit_per_ip, settings.runtime_rate_limit_window_seconds)
+    return [("ip", client_ip, limit)] if limit else []
+
+
+def route_limits(
+    api_id: str,
+    runtime_policy: Dict[str, Any] | None,
+    api_key_id: str | None,
+    tenant_id: str | None,
+) -> List[Tuple[str, str, RateLimit]]:
+    """
+    Limits for one runtime API call.
+
+    ``runtime_policy["rate_limit"]`` may set ``requests`` (whole API),
+    ``per_api_key`` and ``per_tenant`` with an optional ``window_seconds``;
+    per-key/per-tenant values set there are scoped to the API, otherwise the
+    global defaults apply across all APIs.
+    """
+    settings = get_settings()
+    policy = (runtime_policy or {}).get("rate_limit")
+    policy = policy if isinstance(policy, dict) else {}
+    window = policy.get("window_seconds") or settings.runtime_rate_limit_window_seconds
+
+    limits: List[Tuple[str, str, RateLimit]] = []
+    api_limit = _limit(policy.get("requests"), window)
+    if api_limit:
+        limits.append(("api", api_id, api_limit))
+    for dimension, subject, default in (
+        ("api_key", api_key_id, settings.runtime_rate_limit_per_api_key),
+        ("tenant", tenant_id, settings.runtime_rate_limit_per_tenant),
+    ):
+        if not subject:
+            continue
+        override = _limit(policy.get(f"per_{dimension}"), window)
+        if override:
+            limits.append((dimension, f"{api_id}:{subject}", override))
+            continue
+        limit = _limit(default, settings.runtime_rate_limit_window_seconds)
+        if limit:
+            limits.append((dimension, subject, limit))
+    return limits
+
+
+_limiter: Optional[RuntimeRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_runtime_rate_limiter() -> RuntimeRateLimiter:
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RuntimeRateLimiter()
+    return _limiter
@@ -0,0 +1,336 @@
+"""
+Compiled in-memory route table for ``/runtime/*`` dispatch.
+
+Runtime requests used to run several SELECTs over ``api_definitions`` (and two
+operation-setting lookups in auth) before doing any work. The table holds a
+snapshot of every enabled API keyed by ``(METHOD, normalized path)`` together
+with its auth mode, scopes and cache policy, plus the published auth
+defaults, so dispatch and auth resolution are dictionary lookups.
+
+- The table is built at startup and rebuilt lazily (one query) on the next
+  lookup after it is invalidated, or once it is older than
+  ``api_route_table_max_age_seconds`` so a missed invalidation only lasts
+  that long.
+- The API-definition routes and the operation-settings upsert call
+  ``notify_routes_changed`` after they commit; other ORM writes to
+  ``api_definitions`` or the ``api_auth_*`` settings are detected from
+  flushes and invalidate the table on commit. Invalidations are fanned out to
+  other workers over Redis pub/sub.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from core.config import get_settings
+from models.api_definition import ApiDefinition
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import select
+
+from app.modules.operation_settings.crud import get_setting_effective_value
+
+logger = logging.getLogger(__name__)
+
+_API_TABLE = "api_definitions"
+_SETTINGS_TABLE = "tb_operation_settings"
+_AUTH_SETTING_KEYS = ("api_auth_default_mode", "api_auth_enforce_scopes")
+_PENDING_CHANGES_KEY = "_runtime_route_changes"
+_UNSET = object()
+
+
+@dataclass(frozen=True)
+class RuntimeRoute:
+    """Detached snapshot of an enabled ApiDefinition"""
+
+    id: uuid.UUID
+    name: str
+    method: str
+    path: str
+    mode: str | None
+    logic: str | None
+    runtime_policy: dict[str, Any] = field(default_factory=dict)
+    auth_mode: str | None = None
+    required_scopes: tuple[str, ...] = ()
+    cache_policy: dict[str, Any] = field(default_factory=dict)
+
+
+def normalize_runtime_path(path: str) -> str:
+    """``/runtime/a/b/`` -> ``/a/b``; stored and requested paths share this key"""
+    normalized = f"/{path.lstrip('/')}"
+    if normalized == "/runtime" or normalized.startswith("/runtime/"):
+        normalized = f"/{normalized[len('/runtime'):].lstrip('/')}"
+    return normalized.rstrip("/") or "/"
+
+
+def _scopes(value: Any) -> tuple[str, ...]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return ()
+    if not isinstance(value, list):
+        return ()
+    return tuple(str(scope) for scope in value)
+
+
+def _enum_value(value: Any) -> str | None:
+    if value is None:
+        return None
+    return str(getattr(value, "value", value))
+
+
+def _snapshot(api: ApiDefinition) -> RuntimeRoute:
+    runtime_policy = api.runtime_policy if isinstance(api.runtime_policy, dict) else {}
+    cache_policy = runtime_policy.get("cache")
+    return RuntimeRoute(
+        id=api.id,
+        name=api.name,
+        method=str(api.method).upper(),
+        path=api.path,
+        mode=_enum_value(api.mode),
+        logic=api.logic,
+        runtime_policy=dict(runtime_policy),
+        auth_mode=_enum_value(api.auth_mode),
+        required_scopes=_scopes(api.required_scopes),
+        cache_policy=dict(cache_policy) if isinstance(cache_policy, dict) else {},
+    )
+
+
+@dataclass(frozen=True)
+class _CompiledRoutes:
+    routes: Dict[tuple[str, str], RuntimeRoute]
+    published_settings: Dict[str, Any]
+
+
+class RuntimeRouteTable:
+    """
+    Snapshot of runtime routes, swapped atomically on rebuild.
+
+    A generation counter is bumped on every invalidation; a rebuild that
+    raced with a write leaves the table stale so the next lookup reloads.
+    Tables older than ``max_age_seconds`` (0 disables) are rebuilt as well.
+    """
+
+    def __init__(self, max_age_seconds: float | None = None) -> None:
+        if max_age_seconds is None:
+            max_age_seconds = get_settings().api_route_table_max_age_seconds
+        self._max_age_seconds = max_age_seconds
+        self._compiled: Optional[_CompiledRoutes] = None
+        self._generation = 0
+        self._built_generation = -1
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"builds": 0, "invalidations": 0, "remote_invalidations": 0}
+
+    def lookup(self, session: Any, method: str, path: str) -> Optional[RuntimeRoute]:
+        compiled = self._ensure(session)
+        return compiled.routes.get((method.upper(), normalize_runtime_path(path)))
+
+    def published_setting(self, session: Any, key: str, default: Any) -> Any:
+        """Published operation setting value, else ``default``"""
+        value = self._ensure(session).published_settings.get(key, _UNSET)
+        return default if value is _UNSET else value
+
+    def build(self, session: Any) -> None:
+        with self._lock:
+            generation = self._generation
+        started_at = time.monotonic()
+        routes: Dict[tuple[str, str], RuntimeRoute] = {}
+        apis = session.exec(
+            select(ApiDefinition)
+            .where(ApiDefinition.is_enabled)
+            .order_by(ApiDefinition.created_at)
+        ).all()
+        for api in apis:
+            route = _snapshot(api)
+            routes.setdefault((route.method, normalize_runtime_path(route.path)), route)
+        published: Dict[str, Any] = {}
+        for key in _AUTH_SETTING_KEYS:
+            effective = get_setting_effective_value(
+                session=session, setting_key=key, default_value=None
+            )
+            if effective.get("source") == "published":
+                published[key] = effective.get("value")
+
+        with self._lock:
+            self._compiled = _CompiledRoutes(routes=routes, published_settings=published)
+            self._built_generation = generation
+            self._built_at = started_at
+            self._stats["builds"] += 1
+        logger.debug(f"Runtime route table built with {len(routes)} routes")
+
+    def invalidate(self, remote: bool = False) -> None:
+        with self._lock:
+            self._generation += 1
+            self._stats["remote_invalidations" if remote else "invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "routes": len(self._compiled.routes) if self._compiled else 0,
+                "stale": not self._is_fresh(),
+            }
+
+    def _is_fresh(self) -> bool:
+        if self._built_generation != self._generation:
+            return False
+        age = time.monotonic() - self._built_at
+        return not self._max_age_seconds or age < self._max_age_seconds
+
+    def _ensure(self, session: Any) -> _CompiledRoutes:
+        with self._lock:
+            compiled = self._compiled
+            fresh = self._is_fresh()
+        if compiled is None or not fresh:
+            self.build(session)
+            with self._lock:
+                compiled = self._compiled
+        return compiled
+
+
+class RouteTableInvalidationBus:
+    """Fan-out of route table invalidations to other workers via Redis pub/sub."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._client = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def _get_client(self):
+        if self._client is None:
+            from core.redis import create_redis_client
+
+            self._client = create_redis_client(get_settings())
+        return self._client
+
+    def publish(self) -> None:
+        if not get_settings().redis_url:
+            return
+        try:
+            self._get_client().publish(self.channel, json.dumps({"origin": self.origin}))
+        except Exception as exc:
+            logger.warning(f"Failed to publish route table invalidation: {exc}")
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        if not get_settings().redis_url:
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name="runtime-route-invalidation", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                logger.info(f"Listening for route table invalidations on {self.channel}")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle(message.get("data"))
+            except Exception as exc:
+                logger.warning(f"Route table invalidation listener error: {exc}")
+                self._stop.wait(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.origin:
+            return
+        get_route_table().invalidate(remote=True)
+
+
+def notify_routes_changed() -> None:
+    """Invalidate locally and broadcast to other workers."""
+    get_route_table().invalidate()
+    get_invalidation_bus().publish()
+
+
+def notify_setting_changed(setting_key: str) -> None:
+    """``notify_routes_changed`` if the table snapshots ``setting_key``."""
+    if setting_key in _AUTH_SETTING_KEYS:
+        notify_routes_changed()
+
+
+def _is_route_change(obj: Any) -> bool:
+    table = getattr(obj, "__tablename__", None)
+    if table == _API_TABLE:
+        return True
+    return table == _SETTINGS_TABLE and getattr(obj, "setting_key", None) in _AUTH_SETTING_KEYS
+
+
+def _collect_route_changes(session: Session, flush_context: Any) -> None:
+    if any(_is_route_change(obj) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_PENDING_CHANGES_KEY] = True
+
+
+def _flush_route_changes(session: Session) -> None:
+    if session.info.pop(_PENDING_CHANGES_KEY, None):
+        notify_routes_changed()
+
+
+def _discard_route_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_route_changes)
+event.listen(Session, "after_commit", _flush_route_changes)
+event.listen(Session, "after_rollback", _discard_route_changes)
+
+
+_route_table: Optional[RuntimeRouteTable] = None
+_invalidation_bus: Optional[RouteTableInvalidationBus] = None
+_singleton_lock = threading.Lock()
+
+
+def get_route_table() -> RuntimeRouteTable:
+    """Get the process-wide runtime route table."""
+    global _route_table
+    if _route_table is None:
+        with _singleton_lock:
+            if _route_table is None:
+                _route_table = RuntimeRouteTable()
+    return _route_table
+
+
+def get_invalidation_bus() -> RouteTableInvalidationBus:
+    """Get the process-wide Redis invalidation bus."""
+    global _invalidation_bus
+    if _invalidation_bus is None:
+        with _singleton_lock:
+            if _invalidation_bus is None:
+                _invalidation_bus = RouteTableInvalidationBus(
+                    get_settings().api_route_table_invalidation_channel
+                )
+    return _invalidation_bus
+
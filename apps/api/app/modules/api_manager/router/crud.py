@@ -15,6 +15,7 @@ from sqlmodel import Session, select
 from app.modules.auth.models import TbUser
 
 from ..crud import _parse_api_uuid, _record_api_version
+from ..route_table import notify_routes_changed
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api-manager", tags=["api-manager"])
@@ -218,6 +219,7 @@ async def create_or_update_api(
             session.add(api)
 
         session.commit()
+        notify_routes_changed()
         session.refresh(api)
         _record_api_version(
             session,
@@ -298,6 +300,7 @@ async def create_api(
         )
         session.add(api)
         session.commit()
+        notify_routes_changed()
         session.refresh(api)
         _record_api_version(
             session,
@@ -414,6 +417,7 @@ async def update_api(
 
         session.add(api)
         session.commit()
+        notify_routes_changed()
         session.refresh(api)
         _record_api_version(
             session,
@@ -473,6 +477,7 @@ async def update_api_auth_policy(
 
         session.add(api)
         session.commit()
+        notify_routes_changed()
         session.refresh(api)
         _record_api_version(
             session,
@@ -516,6 +521,7 @@ async def delete_api(
         api.deleted_at = datetime.utcnow()
         session.add(api)
         session.commit()
+        notify_routes_changed()
 
         return ResponseEnvelope.success(message=f"API {api_id} deleted")
 
@@ -14,6 +14,7 @@ from sqlmodel import Session, select
 from app.modules.auth.models import TbUser
 
 from ..crud import _record_api_version
+from ..route_table import notify_routes_changed
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api-manager", tags=["api-manager"])
@@ -144,6 +145,7 @@ async def register_discovered_endpoints(
             )
             created += 1
         session.commit()
+        notify_routes_changed()
         return ResponseEnvelope.success(
             data={
                 "discovered": len(discovered),
@@ -8,6 +8,7 @@ from schemas import ResponseEnvelope
 from sqlmodel import Session
 
 from ..crud import list_exec_logs
+from ..rate_limiter import get_runtime_rate_limiter
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api-manager", tags=["api-manager"])
@@ -49,3 +50,9 @@ async def get_logs(
     except Exception as e:
         logger.error(f"Get logs failed: {str(e)}")
         raise HTTPException(500, str(e))
+
+
+@router.get("/runtime/rate-limits", response_model=ResponseEnvelope)
+async def get_runtime_rate_limit_stats():
+    """Runtime rate limiter decisions (allowed/rejected per dimension) for this worker."""
+    return ResponseEnvelope.success(data=get_runtime_rate_limiter().stats())
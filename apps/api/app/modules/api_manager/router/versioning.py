@@ -20,6 +20,7 @@ from sqlmodel import Session, select
 from app.modules.auth.models import TbUser
 
 from ..crud import _api_snapshot, _parse_api_uuid, _record_api_version
+from ..route_table import notify_routes_changed
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api-manager", tags=["api-manager"])
@@ -145,6 +146,7 @@ async def rollback_api(
 
         session.add(api)
         session.commit()
+        notify_routes_changed()
         session.refresh(api)
 
         new_version = _record_api_version(
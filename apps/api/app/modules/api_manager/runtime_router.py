@@ -2,81 +2,47 @@
 
 from __future__ import annotations
 
-import time
-from collections import defaultdict
+import math
 from typing import Any
 
+from core.auth import get_current_user
 from core.db import get_session
+from core.tenant import get_optional_tenant
 from fastapi import APIRouter, Depends, HTTPException, Request
-from models.api_definition import ApiDefinition
 from schemas.common import ResponseEnvelope
-from sqlalchemy import select
 from sqlmodel import Session
 
+from app.modules.auth.models import TbUser
+
 from .executor import (
     execute_http_api,
     execute_sql_api,
     is_http_logic_body,
     normalize_limit,
 )
+from .rate_limiter import (
+    RateLimit,
+    client_limits,
+    get_runtime_rate_limiter,
+    route_limits,
+)
+from .route_table import RuntimeRoute, get_route_table
 from .script_executor import execute_script_api
 from .workflow_executor import execute_workflow_api
 
 runtime_router = APIRouter(tags=["runtime"])
 
-# ---------------------------------------------------------------------------
-# In-memory sliding-window rate limiter
-# ---------------------------------------------------------------------------
-RATE_LIMIT_WINDOW_SEC = 60
-RATE_LIMIT_MAX_REQUESTS = 120  # max per IP per window
-
-_rate_buckets: dict[str, list[float]] = defaultdict(list)
-_last_cleanup = time.monotonic()
-_CLEANUP_INTERVAL = 300  # prune stale entries every 5 min
-
-
-def _unwrap_api_definition(result: Any) -> ApiDefinition | None:
-    if isinstance(result, ApiDefinition):
-        return result
-    mapping = getattr(result, "_mapping", None)
-    if mapping is not None:
-        direct = mapping.get(ApiDefinition)
-        if isinstance(direct, ApiDefinition):
-            return direct
-        for value in mapping.values():
-            if isinstance(value, ApiDefinition):
-                return value
-    if isinstance(result, (tuple, list)) and result:
-        first = result[0]
-        if isinstance(first, ApiDefinition):
-            return first
-    return None
-
-
-def _check_rate_limit(client_ip: str) -> None:
-    global _last_cleanup
-    now = time.monotonic()
-
-    # Periodic cleanup of stale buckets
-    if now - _last_cleanup > _CLEANUP_INTERVAL:
-        cutoff = now - RATE_LIMIT_WINDOW_SEC
-        stale_keys = [k for k, v in _rate_buckets.items() if not v or v[-1] < cutoff]
-        for k in stale_keys:
-            del _rate_buckets[k]
-        _last_cleanup = now
-
-    bucket = _rate_buckets[client_ip]
-    window_start = now - RATE_LIMIT_WINDOW_SEC
-    # Remove timestamps outside the window
-    while bucket and bucket[0] < window_start:
-        bucket.pop(0)
 
-    if len(bucket) >= RATE_LIMIT_MAX_REQUESTS:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Rate limit exceeded: {RATE_LIMIT_MAX_REQUESTS} requests per {RATE_LIMIT_WINDOW_SEC}s",
-        )
-    bucket.append(now)
+def _check_rate_limit(limits: list[tuple[str, str, RateLimit]]) -> None:
+    rejection = get_runtime_rate_limiter().check(limits)
+    if rejection is None:
+        return
+    dimension, decision = rejection
+    raise HTTPException(
+        status_code=429,
+        detail=f"Rate limit exceeded for {dimension}",
+        headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+    )
 
 
 @runtime_router.api_route("/runtime/{path:path}", methods=["GET", "POST"])
@@ -84,14 +50,23 @@ async def handle_runtime_request(
     path: str,
     request: Request,
     session: Session = Depends(get_session),
+    current_user: TbUser = Depends(get_current_user),
 ) -> ResponseEnvelope:
     client_ip = request.client.host if request.client else "unknown"
-    _check_rate_limit(client_ip)
+    _check_rate_limit(client_limits(client_ip))
 
     normalized_path = _normalize_runtime_path(path)
     api = _find_runtime_api(session, normalized_path, request.method)
     if not api:
         raise HTTPException(status_code=404, detail="Runtime API not found")
+    _check_rate_limit(
+        route_limits(
+            str(api.id),
+            api.runtime_policy,
+            api_key_id=getattr(current_user, "_api_key_id", None),
+            tenant_id=get_optional_tenant(request) or getattr(current_user, "tenant_id", None),
+        )
+    )
     params, raw_limit, input_payload = await _extract_runtime_params(request)
     executed_by = request.headers.get("X-Executed-By") or "anonymous"
 
@@ -239,58 +214,10 @@ def _normalize_runtime_path(path: str) -> str:
 
 def _find_runtime_api(
     session: Session, endpoint: str, method: str
-) -> ApiDefinition | None:
-    cleaned = _normalize_endpoint(endpoint)
-    statement = (
-        select(ApiDefinition)
-        .where(
-            ApiDefinition.path.in_(
-                [
-                    cleaned,
-                    f"/runtime{cleaned}",
-                    f"/{cleaned.lstrip('/')}",
-                ]
-            )
-        )
-        .where(ApiDefinition.method == method)
-        .where(ApiDefinition.is_enabled)
-        .limit(1)
-    )
-    first_row = session.exec(statement).first()
-    api = _unwrap_api_definition(first_row)
-    if api is None:
-        mapping = getattr(first_row, "_mapping", None)
-        if mapping is not None and "id" in mapping:
-            try:
-                api = session.get(ApiDefinition, mapping["id"])
-            except Exception:
-                api = None
-    if api:
-        return api
-    second_row = session.exec(
-        select(ApiDefinition)
-        .where(ApiDefinition.path == cleaned.rstrip("/"))
-        .where(ApiDefinition.method == method)
-        .where(ApiDefinition.is_enabled)
-        .limit(1)
-    ).first()
-    api = _unwrap_api_definition(second_row)
-    if api is None:
-        mapping = getattr(second_row, "_mapping", None)
-        if mapping is not None and "id" in mapping:
-            try:
-                api = session.get(ApiDefinition, mapping["id"])
-            except Exception:
-                api = None
-    return api
-
-
-def _normalize_endpoint(endpoint: str) -> str:
-    normalized = f"/{endpoint.lstrip('/')}"
-    if normalized.startswith("/runtime/"):
-        normalized = normalized[len("/runtime") :]
-        normalized = f"/{normalized.lstrip('/')}"
-    return normalized
+) -> RuntimeRoute | None:
+    # Served from the compiled route table; the session is only used to
+    # rebuild it after an API or auth setting change
+    return get_route_table().lookup(session, method, endpoint)
 
 
 async def _extract_runtime_params(
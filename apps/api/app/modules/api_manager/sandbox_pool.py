@@ -0,0 +1,382 @@
+"""Pool of pre-warmed sandbox processes for API Manager Python scripts.
+
+Starting ``script_executor_runner.py`` per call costs an interpreter start
+plus imports before user code runs. Pooled workers run the same runner in
+``--serve`` mode (import hook installed, ``requests`` imported) and exchange
+length-prefixed JSON frames over their stdin/stdout pipes.
+
+- Workers are fork servers: the warm parent never runs user code, it forks
+  a fresh child per call that runs one script and exits. Nothing a script
+  patches survives into another call, API or tenant.
+- Each call has a wall-clock timeout; CPU-seconds and address-space rlimits
+  are applied to the child.
+- A worker is recycled after ``max_executions`` calls, on a timeout or
+  crash, or when it cannot fork. Each worker leads its own process group so
+  recycling also kills a child that is still running.
+- Worker stderr (including from script children) goes to this module's log.
+- The pool grows on demand up to ``max_size`` and idle workers above
+  ``min_size`` are retired after ``idle_seconds``.
+
+``run_script_runner`` keeps the ``subprocess.run`` result contract
+(returncode/stdout/stderr, ``subprocess.TimeoutExpired``) so callers handle
+pooled and one-shot execution the same way.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_RUNNER = Path(__file__).resolve().parent / "script_executor_runner.py"
+MAX_STDERR_LINE = 2000
+# Must match script_executor_runner.FRAME_HEADER (not imported: the runner
+# pulls in requests, which the API process does not otherwise need)
+FRAME_HEADER = struct.Struct(">I")
+
+
+def write_frame(stream, body: bytes) -> None:
+    stream.write(FRAME_HEADER.pack(len(body)) + body)
+    stream.flush()
+
+
+def read_frame(stream) -> Optional[bytes]:
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise EOFError("Truncated frame header")
+    (length,) = FRAME_HEADER.unpack(header)
+    body = stream.read(length)
+    if len(body) < length:
+        raise EOFError("Truncated frame body")
+    return body
+
+
+@dataclass
+class RunnerResult:
+    returncode: int
+    stdout: bytes
+    stderr: bytes = b""
+
+
+class SandboxWorkerError(RuntimeError):
+    """A worker died or broke protocol"""
+
+
+class SandboxWorker:
+    def __init__(self, command: List[str]):
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=True,
+            start_new_session=True,
+        )
+        self.executions = 0
+        self.last_used = time.monotonic()
+        threading.Thread(
+            target=self._log_stderr, name=f"sandbox-stderr-{self.process.pid}", daemon=True
+        ).start()
+
+    def _log_stderr(self) -> None:
+        pid = self.process.pid
+        try:
+            with self.process.stderr:
+                for raw in self.process.stderr:
+                    line = raw.decode("utf-8", errors="replace").rstrip()
+                    if line:
+                        logger.warning(f"Sandbox worker {pid}: {line[:MAX_STDERR_LINE]}")
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def call(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request; raises TimeoutExpired or SandboxWorkerError"""
+        self.executions += 1
+        self.last_used = time.monotonic()
+        try:
+            write_frame(self.process.stdin, json.dumps(payload).encode("utf-8"))
+        except (BrokenPipeError, OSError) as exc:
+            raise SandboxWorkerError("Sandbox worker is not accepting requests") from exc
+
+        ready, _, _ = select.select([self.process.stdout], [], [], timeout)
+        if not ready:
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        try:
+            frame = read_frame(self.process.stdout)
+        except EOFError as exc:
+            raise SandboxWorkerError("Sandbox worker exited mid-response") from exc
+        if frame is None:
+            raise SandboxWorkerError("Sandbox worker exited")
+        self.last_used = time.monotonic()
+        return json.loads(frame)
+
+    def stop(self) -> None:
+        # The whole group: a script child may still be running
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class SandboxPool:
+    def __init__(
+        self,
+        min_size: int = 2,
+        max_size: int = 8,
+        max_executions: int = 100,
+        idle_seconds: float = 300.0,
+        memory_mb: int = 512,
+        command: Optional[List[str]] = None,
+    ):
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.max_executions = max(1, max_executions)
+        self.idle_seconds = idle_seconds
+        self.memory_mb = memory_mb
+        self.command = command or [sys.executable, str(SCRIPT_RUNNER), "--serve"]
+        self._idle: List[SandboxWorker] = []
+        self._busy = 0
+        self._spawning = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"calls": 0, "spawned": 0, "recycled": 0, "timeouts": 0, "waits": 0}
+        self._warm()
+
+    def execute(self, payload: Dict[str, Any], timeout: float) -> RunnerResult:
+        """Run one script payload on a pooled worker"""
+        deadline = time.monotonic() + timeout
+        request = dict(payload)
+        request.setdefault("cpu_seconds", max(1, math.ceil(timeout)))
+        request.setdefault("memory_mb", self.memory_mb)
+
+        worker = self._acquire(deadline)
+        keep = False
+        try:
+            response = worker.call(request, max(0.0, deadline - time.monotonic()))
+            keep = not response.pop("recycle", False)
+            return _as_runner_result(response)
+        except subprocess.TimeoutExpired:
+            self._count("timeouts")
+            raise
+        except SandboxWorkerError as exc:
+            # The fork server itself died; report it, never re-run
+            try:
+                returncode = worker.process.wait(timeout=1) or 1
+            except subprocess.TimeoutExpired:
+                returncode = 1
+            return RunnerResult(
+                returncode=returncode,
+                stdout=b"",
+                stderr=f"{exc}; exit code {returncode}".encode("utf-8"),
+            )
+        finally:
+            self._count("calls")
+            self._release(worker, keep)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self._stats,
+                "idle": len(self._idle),
+                "busy": self._busy,
+                "size": len(self._idle) + self._busy,
+            }
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            workers, self._idle = self._idle, []
+            self._cond.notify_all()
+        for worker in workers:
+            worker.stop()
+
+    def _acquire(self, deadline: float) -> SandboxWorker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise OSError("Sandbox pool is shut down")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive:
+                        self._busy += 1
+                        return worker
+                    self._recycle(worker)
+                if self._size() < self.max_size:
+                    self._busy += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired("sandbox-pool", 0)
+                self._stats["waits"] += 1
+                self._cond.wait(remaining)
+        try:
+            return self._spawn()
+        except Exception:
+            with self._cond:
+                self._busy -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, worker: SandboxWorker, keep: bool) -> None:
+        with self._cond:
+            self._busy -= 1
+            if (
+                keep
+                and not self._closed
+                and worker.alive
+                and worker.executions < self.max_executions
+            ):
+                self._idle.append(worker)
+            else:
+                self._recycle(worker)
+            self._reap_idle()
+            self._cond.notify()
+        self._warm()
+
+    def _recycle(self, worker: SandboxWorker) -> None:
+        self._stats["recycled"] += 1
+        threading.Thread(target=worker.stop, daemon=True).start()
+
+    def _reap_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_seconds
+        while len(self._idle) + self._busy > self.min_size and self._idle:
+            oldest = min(self._idle, key=lambda w: w.last_used)
+            if oldest.last_used > cutoff:
+                break
+            self._idle.remove(oldest)
+            self._recycle(oldest)
+
+    def _size(self) -> int:
+        return len(self._idle) + self._busy + self._spawning
+
+    def _warm(self) -> None:
+        """Top the pool up to min_size in the background"""
+        with self._cond:
+            missing = self.min_size - self._size()
+            if self._closed or missing <= 0:
+                return
+            self._spawning += missing
+        threading.Thread(target=self._warm_workers, args=(missing,), daemon=True).start()
+
+    def _warm_workers(self, count: int) -> None:
+        for _ in range(count):
+            try:
+                worker = self._spawn()
+            except Exception as exc:
+                logger.warning(f"Failed to start sandbox worker: {exc}")
+                worker = None
+            with self._cond:
+                self._spawning -= 1
+                if worker is not None:
+                    if self._closed:
+                        self._recycle(worker)
+                    else:
+                        self._idle.append(worker)
+                self._cond.notify()
+
+    def _spawn(self) -> SandboxWorker:
+        worker = SandboxWorker(self.command)
+        self._count("spawned")
+        return worker
+
+    def _count(self, key: str) -> None:
+        with self._cond:
+            self._stats[key] += 1
+
+
+def _as_runner_result(response: Dict[str, Any]) -> RunnerResult:
+    # Same shape the one-shot runner prints: exit 1 with the error payload
+    returncode = 0 if response.get("status") == "success" else 1
+    return RunnerResult(
+        returncode=returncode,
+        stdout=json.dumps(response, ensure_ascii=False).encode("utf-8"),
+    )
+
+
+_pool: Optional[SandboxPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> Optional[SandboxPool]:
+    """Shared pool, or None when pooling is disabled or unsupported"""
+    global _pool
+    settings = get_settings()
+    if not settings.script_sandbox_pool_enabled or os.name != "posix":
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SandboxPool(
+                    min_size=settings.script_sandbox_pool_min_size,
+                    max_size=settings.script_sandbox_pool_max_size,
+                    max_executions=settings.script_sandbox_max_executions,
+                    idle_seconds=settings.script_sandbox_idle_seconds,
+                    memory_mb=settings.script_sandbox_memory_mb,
+                )
+    return _pool
+
+
+def shutdown_sandbox_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def run_script_runner(payload: Dict[str, Any], timeout: float) -> Any:
+    """Run a script payload on the pool, or in a one-shot runner process"""
+    pool = get_sandbox_pool()
+    if pool is not None:
+        try:
+            return pool.execute(payload, timeout)
+        except OSError as exc:
+            # Workers could not be started; the call itself never ran
+            logger.warning(f"Sandbox pool unavailable, using one-shot runner: {exc}")
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_RUNNER)],
+        input=json.dumps(payload).encode("utf-8"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=timeout,
+    )
+
+
+__all__ = [
+    "RunnerResult",
+    "SandboxPool",
+    "SandboxWorkerError",
+    "get_sandbox_pool",
+    "run_script_runner",
+    "shutdown_sandbox_pool",
+]
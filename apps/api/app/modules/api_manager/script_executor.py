@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import json
 import subprocess
-import sys
-from pathlib import Path
 from typing import Any, Dict
 
 from core.config import get_settings
@@ -13,9 +11,9 @@ from fastapi import HTTPException
 from sqlmodel import Session
 
 from .crud import record_exec_log
+from .sandbox_pool import run_script_runner
 from .schemas import ApiScriptExecuteResult
 
-SCRIPT_RUNNER = Path(__file__).resolve().parent / "script_executor_runner.py"
 DEFAULT_SCRIPT_TIMEOUT_MS = 5000
 DEFAULT_OUTPUT_BYTES = 1_048_576
 
@@ -67,13 +65,7 @@ def execute_script_api(
     output: Dict[str, Any] = {}
     try:
         try:
-            proc = subprocess.run(
-                [sys.executable, str(SCRIPT_RUNNER)],
-                input=json.dumps(payload).encode("utf-8"),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=(timeout_ms / 1000) + 1,
-            )
+            proc = run_script_runner(payload, timeout=(timeout_ms / 1000) + 1)
         except subprocess.TimeoutExpired as exc:
             status = "fail"
             error_message = "Script execution timed out"
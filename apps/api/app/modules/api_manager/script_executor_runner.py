@@ -5,7 +5,10 @@ from __future__ import annotations
 import importlib.abc
 import ipaddress
 import json
+import os
+import signal
 import socket
+import struct
 import sys
 import time
 import traceback
@@ -36,6 +39,7 @@ PRIVATE_NETWORKS = [
 METADATA_HOSTS = {"169.254.169.254"}
 DEFAULT_TIMEOUT_MS = 5000
 DEFAULT_MAX_RESPONSE_BYTES = 1_048_576
+FRAME_HEADER = struct.Struct(">I")
 
 
 class BlockedImportFinder(importlib.abc.MetaPathFinder):
@@ -325,5 +329,153 @@ def main() -> None:
         sys.exit(1)
 
 
+def read_frame(stream) -> bytes | None:
+    """Read one length-prefixed frame; None on a clean EOF"""
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise EOFError("Truncated frame header")
+    (length,) = FRAME_HEADER.unpack(header)
+    body = stream.read(length)
+    if len(body) < length:
+        raise EOFError("Truncated frame body")
+    return body
+
+
+def write_frame(stream, body: bytes) -> None:
+    stream.write(FRAME_HEADER.pack(len(body)) + body)
+    stream.flush()
+
+
+def _apply_limits(payload: Dict[str, Any]) -> None:
+    """Per-call CPU budget and address-space cap (POSIX only)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    cpu_seconds = int(payload.get("cpu_seconds") or 0)
+    if cpu_seconds > 0:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime) + 1
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = used + cpu_seconds
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        # Exceeding the soft limit raises SIGXCPU and ends the worker
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    memory_mb = int(payload.get("memory_mb") or 0)
+    if memory_mb > 0:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        soft = memory_mb * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _execute_request(frame: bytes) -> bytes:
+    """Run one framed request in the current process and encode its response"""
+    try:
+        payload = json.loads(frame)
+        _apply_limits(payload)
+        result = run_script(payload)
+    except (MemoryError, RecursionError) as exc:
+        result = {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    except BaseException as exc:
+        context = _context_holder[0]
+        result = {
+            "status": "error",
+            "error": str(exc),
+            "traceback": traceback.format_exc(limit=2),
+        }
+        if context:
+            result["logs"] = context.logs
+            result["references"] = context.finalize_references()
+    try:
+        return json.dumps(result, ensure_ascii=False).encode("utf-8")
+    except (TypeError, ValueError) as exc:
+        return json.dumps(
+            {"status": "error", "error": f"Unserializable output: {exc}"}
+        ).encode("utf-8")
+
+
+def _describe_exit(status: int) -> str:
+    if os.WIFSIGNALED(status):
+        name = signal.Signals(os.WTERMSIG(status)).name
+        return f"Script process killed by {name} (resource limit exceeded?)"
+    return f"Script process exited with code {os.waitstatus_to_exitcode(status)}"
+
+
+def _fork_call(frame: bytes, inherited: tuple[Any, ...]) -> bytes:
+    """
+    Run one request in a forked child and return its response frame body.
+
+    The child starts from the server's warm state, runs a single script and
+    exits, so nothing a script changes (patched classes, monkey-patched
+    modules, meta_path) is visible to later calls.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_fd)
+            # Scripts must not reach the protocol pipes
+            for stream in inherited:
+                stream.close()
+            with os.fdopen(write_fd, "wb") as result_out:
+                result_out.write(_execute_request(frame))
+            status = 0
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as result_in:
+        body = result_in.read()
+    _, status = os.waitpid(pid, 0)
+    if body:
+        return body
+    return json.dumps({"status": "error", "error": _describe_exit(status)}).encode("utf-8")
+
+
+def serve() -> None:
+    """
+    Pooled fork server: one length-prefixed JSON request in, one response out.
+
+    The server only imports and installs the import hook; each request runs
+    in a fresh forked child (see ``_fork_call``), and CPU/memory rlimits apply
+    to that child alone. The protocol uses private copies of stdin/stdout;
+    fd 0/1 are pointed at /dev/null so script print()/input() cannot corrupt
+    the stream. A response with ``recycle`` set asks the pool to retire this
+    server.
+    """
+    _ensure_import_hook()
+    proto_in = os.fdopen(os.dup(0), "rb")
+    proto_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    sys.stdout = open(os.devnull, "w")
+
+    while True:
+        frame = read_frame(proto_in)
+        if frame is None:
+            return
+        recycle = False
+        try:
+            body = _fork_call(frame, (proto_in, proto_out))
+        except OSError as exc:
+            # fork/pipe failed (fd or process limits); let the pool replace us
+            recycle = True
+            body = json.dumps(
+                {"status": "error", "error": f"Unable to start script: {exc}", "recycle": True}
+            ).encode("utf-8")
+        write_frame(proto_out, body)
+        if recycle:
+            return
+
+
 if __name__ == "__main__":
-    main()
+    if "--serve" in sys.argv[1:]:
+        serve()
+    else:
+        main()
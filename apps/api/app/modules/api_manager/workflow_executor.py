@@ -5,13 +5,15 @@ from __future__ import annotations
 import json
 import re
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from time import perf_counter
 from typing import Any, Dict
 
+from core.config import get_settings
 from fastapi import HTTPException
 from models.api_definition import ApiDefinition
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from .crud import record_exec_log, record_exec_step
 from .executor import execute_sql_api
@@ -43,6 +45,15 @@ def execute_workflow_api(
     executed_by: str,
     limit: int | None,
 ) -> WorkflowExecuteResult:
+    """
+    Run a workflow as a DAG.
+
+    Dependencies come from ``{{steps.<id>...}}`` references in node params and
+    input (plus an optional ``depends_on`` list). A node runs once its
+    dependencies have finished; independent nodes run concurrently, up to
+    ``max_concurrency`` (spec) or ``api_workflow_max_concurrency``, each on its
+    own session. A lone ready node runs inline on the caller's session.
+    """
     params = params or {}
     workflow_params = dict(params)
     if input_payload is not None:
@@ -74,148 +85,130 @@ def execute_workflow_api(
         seen_ids.add(node_id)
 
     steps_context: dict[str, dict[str, Any]] = {}
-    step_records: list[_WorkflowStepRecord] = []
-    references: list[dict[str, Any]] = []
+    outcomes: dict[str, _NodeOutcome] = {}
     final_output: dict[str, Any] | None = None
     status = "success"
     error_message: str | None = None
     start = perf_counter()
     try:
         for node in nodes:
-            node_id = node["id"]
             node_type = node.get("type")
             if node_type not in {"sql", "script"}:
                 raise HTTPException(
                     status_code=400, detail=f"Unsupported node type '{node_type}'"
                 )
-            node_api_id = node.get("api_id")
-            if not node_api_id:
+            if not node.get("api_id"):
                 raise HTTPException(
-                    status_code=400, detail=f"Node '{node_id}' missing api_id"
+                    status_code=400, detail=f"Node '{node['id']}' missing api_id"
                 )
-            node_api = _get_node_api(session, str(node_api_id))
+        nodes_by_id = {node["id"]: node for node in nodes}
+        dependencies = _node_dependencies(nodes)
+        order = _execution_order(nodes, dependencies)
+        node_apis = _prefetch_node_apis(
+            session, [str(node["api_id"]) for node in nodes]
+        )
+        concurrency = _workflow_concurrency(spec)
+
+        def prepare(node_id: str) -> _PreparedNode:
+            node = nodes_by_id[node_id]
+            node_api_id = str(node["api_id"])
+            node_api = node_apis.get(node_api_id)
             if not node_api:
                 raise HTTPException(
                     status_code=404, detail=f"Node API '{node_api_id}' not found"
                 )
-            node_params = _render_templates(
-                node.get("params") or {}, workflow_params, steps_context
-            )
-            node_input = (
-                _render_templates(node.get("input"), workflow_params, steps_context)
-                if node_type == "script"
-                else None
-            )
-            node_limit = _parse_node_limit(node.get("limit"), limit)
-            step_refs: dict[str, Any] | None = None
-            step_rows: list[dict[str, Any]] = []
-            step_columns: list[str] | None = None
-            step_output: dict[str, Any] | None = None
-            node_start = perf_counter()
-            try:
-                if node_type == "sql":
-                    node_api_id_value = _node_api_id(node_api)
-                    node_logic = _node_logic(node_api)
-                    sql_result = execute_sql_api(
-                        session=session,
-                        api_id=node_api_id_value,
-                        logic_body=node_logic,
-                        params=node_params,
-                        limit=node_limit,
-                        executed_by=executed_by,
-                    )
-                    step_rows = sql_result.rows
-                    step_columns = sql_result.columns
-                    step_output = {
-                        "columns": sql_result.columns,
-                        "rows": sql_result.rows,
-                    }
-                    step_refs = {
-                        "node_id": node_id,
-                        "node_type": "sql",
-                        "sql_template": node_logic,
-                        "params": node_params,
-                        "limit": node_limit,
-                    }
-                else:
-                    node_api_id_value = _node_api_id(node_api)
-                    node_logic = _node_logic(node_api)
-                    script_result = execute_script_api(
-                        session=session,
-                        api_id=node_api_id_value,
-                        logic_body=node_logic,
-                        params=node_params,
-                        input_payload=node_input,
-                        executed_by=executed_by,
-                        runtime_policy=_node_runtime_policy(node_api),
-                    )
-                    step_output = script_result.output
-                    step_rows = []
-                    step_columns = None
-                    step_refs = {
-                        "node_id": node_id,
-                        "node_type": "script",
-                        "references": script_result.references,
-                    }
-            except HTTPException as exc:
-                status = "fail"
-                error_message = exc.detail if isinstance(exc.detail, str) else str(exc)
-                duration_ms = int((perf_counter() - node_start) * 1000)
-                step = _WorkflowStepRecord(
-                    node_id=node_id,
-                    node_type=node_type,
-                    status="fail",
-                    duration_ms=duration_ms,
-                    row_count=len(step_rows),
-                    columns=step_columns,
-                    output=step_output,
-                    references=step_refs,
-                    error_message=error_message,
-                )
-                step_records.append(step)
-                raise
-            except Exception as exc:
-                status = "fail"
-                error_message = "Workflow node execution failed"
-                duration_ms = int((perf_counter() - node_start) * 1000)
-                step = _WorkflowStepRecord(
-                    node_id=node_id,
-                    node_type=node_type,
-                    status="fail",
-                    duration_ms=duration_ms,
-                    row_count=len(step_rows),
-                    columns=step_columns,
-                    output=step_output,
-                    references=step_refs,
-                    error_message=str(exc),
-                )
-                step_records.append(step)
-                raise HTTPException(status_code=500, detail=error_message) from exc
-            duration_ms = int((perf_counter() - node_start) * 1000)
-            step = _WorkflowStepRecord(
+            node_type = node["type"]
+            return _PreparedNode(
                 node_id=node_id,
                 node_type=node_type,
-                status="success",
-                duration_ms=duration_ms,
-                row_count=len(step_rows),
-                columns=step_columns,
-                output=step_output,
-                references=step_refs,
+                api_id=_node_api_id(node_api),
+                logic=_node_logic(node_api),
+                runtime_policy=_node_runtime_policy(node_api),
+                params=_render_templates(
+                    node.get("params") or {}, workflow_params, steps_context
+                ),
+                input=(
+                    _render_templates(node.get("input"), workflow_params, steps_context)
+                    if node_type == "script"
+                    else None
+                ),
+                limit=_parse_node_limit(node.get("limit"), limit),
             )
-            step_records.append(step)
-            steps_context[node_id] = {
-                "rows": step_rows,
-                "output": step_output,
+
+        failure: HTTPException | None = None
+
+        def finish(outcome: _NodeOutcome) -> None:
+            nonlocal failure
+            outcomes[outcome.record.node_id] = outcome
+            if outcome.error is not None:
+                if failure is None:
+                    failure = outcome.error
+                return
+            steps_context[outcome.record.node_id] = {
+                "rows": outcome.rows,
+                "output": outcome.record.output,
             }
-            if step_refs:
-                references.append(step_refs)
-            final_output = step_output or {"rows": step_rows}
+
+        pending = list(order)
+        running: dict[Future, str] = {}
+        pool: ThreadPoolExecutor | None = None
+        try:
+            while (pending and failure is None) or running:
+                ready = (
+                    [
+                        node_id
+                        for node_id in pending
+                        if dependencies[node_id] <= steps_context.keys()
+                    ]
+                    if failure is None
+                    else []
+                )
+                try:
+                    if len(ready) == 1 and not running:
+                        pending.remove(ready[0])
+                        finish(_execute_node(session, prepare(ready[0]), executed_by))
+                        continue
+                    for node_id in ready[: max(0, concurrency - len(running))]:
+                        pending.remove(node_id)
+                        prepared = prepare(node_id)
+                        if pool is None:
+                            pool = ThreadPoolExecutor(
+                                max_workers=concurrency,
+                                thread_name_prefix="workflow-node",
+                            )
+                        future = pool.submit(
+                            _execute_isolated, session, prepared, executed_by
+                        )
+                        running[future] = node_id
+                except HTTPException as exc:
+                    if failure is None:
+                        failure = exc
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    running.pop(future)
+                    finish(future.result())
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+        if failure is not None:
+            raise failure
+        last = outcomes[nodes[-1]["id"]]
+        final_output = last.record.output or {"rows": last.rows}
+        step_records = _ordered_records(nodes, outcomes)
         return WorkflowExecuteResult(
             steps=[WorkflowStep(**step.__dict__) for step in step_records],
             final_output=final_output or {},
-            references=references,
+            references=[step.references for step in step_records if step.references],
         )
+    except HTTPException as exc:
+        status = "fail"
+        error_message = exc.detail if isinstance(exc.detail, str) else str(exc)
+        raise
     finally:
+        step_records = _ordered_records(nodes, outcomes)
         duration_ms = int((perf_counter() - start) * 1000)
         exec_row_count = step_records[-1].row_count if step_records else 0
         workflow_api_id = _node_api_id(workflow_api)
@@ -244,6 +237,228 @@ def execute_workflow_api(
             )
 
 
+@dataclass
+class _PreparedNode:
+    """Rendered node inputs, detached from ORM objects so threads can use it"""
+
+    node_id: str
+    node_type: str
+    api_id: str
+    logic: str
+    runtime_policy: dict[str, Any]
+    params: Any
+    input: Any
+    limit: int | None
+
+
+@dataclass
+class _NodeOutcome:
+    record: _WorkflowStepRecord
+    rows: list[dict[str, Any]]
+    error: HTTPException | None = None
+
+
+def _execute_node(
+    session: Session, node: _PreparedNode, executed_by: str
+) -> _NodeOutcome:
+    step_refs: dict[str, Any] | None = None
+    step_rows: list[dict[str, Any]] = []
+    step_columns: list[str] | None = None
+    step_output: dict[str, Any] | None = None
+    node_start = perf_counter()
+    try:
+        if node.node_type == "sql":
+            sql_result = execute_sql_api(
+                session=session,
+                api_id=node.api_id,
+                logic_body=node.logic,
+                params=node.params,
+                limit=node.limit,
+                executed_by=executed_by,
+            )
+            step_rows = sql_result.rows
+            step_columns = sql_result.columns
+            step_output = {
+                "columns": sql_result.columns,
+                "rows": sql_result.rows,
+            }
+            step_refs = {
+                "node_id": node.node_id,
+                "node_type": "sql",
+                "sql_template": node.logic,
+                "params": node.params,
+                "limit": node.limit,
+            }
+        else:
+            script_result = execute_script_api(
+                session=session,
+                api_id=node.api_id,
+                logic_body=node.logic,
+                params=node.params,
+                input_payload=node.input,
+                executed_by=executed_by,
+                runtime_policy=node.runtime_policy,
+            )
+            step_output = script_result.output
+            step_refs = {
+                "node_id": node.node_id,
+                "node_type": "script",
+                "references": script_result.references,
+            }
+    except Exception as exc:
+        if isinstance(exc, HTTPException):
+            error = exc
+            detail = exc.detail if isinstance(exc.detail, str) else str(exc)
+        else:
+            error = HTTPException(status_code=500, detail="Workflow node execution failed")
+            error.__cause__ = exc
+            detail = str(exc)
+        return _NodeOutcome(
+            record=_WorkflowStepRecord(
+                node_id=node.node_id,
+                node_type=node.node_type,
+                status="fail",
+                duration_ms=int((perf_counter() - node_start) * 1000),
+                row_count=len(step_rows),
+                columns=step_columns,
+                output=step_output,
+                references=step_refs,
+                error_message=detail,
+            ),
+            rows=step_rows,
+            error=error,
+        )
+    return _NodeOutcome(
+        record=_WorkflowStepRecord(
+            node_id=node.node_id,
+            node_type=node.node_type,
+            status="success",
+            duration_ms=int((perf_counter() - node_start) * 1000),
+            row_count=len(step_rows),
+            columns=step_columns,
+            output=step_output,
+            references=step_refs,
+        ),
+        rows=step_rows,
+    )
+
+
+def _execute_isolated(
+    session: Session, node: _PreparedNode, executed_by: str
+) -> _NodeOutcome:
+    """Run a node on its own session (sessions are not thread-safe)"""
+    node_session = Session(bind=session.get_bind())
+    try:
+        return _execute_node(node_session, node, executed_by)
+    finally:
+        node_session.close()
+
+
+def _ordered_records(
+    nodes: list[dict[str, Any]], outcomes: dict[str, _NodeOutcome]
+) -> list[_WorkflowStepRecord]:
+    return [
+        outcomes[node["id"]].record
+        for node in nodes
+        if isinstance(node, dict) and node.get("id") in outcomes
+    ]
+
+
+def _template_step_refs(value: Any) -> set[str]:
+    if isinstance(value, dict):
+        return set().union(*(_template_step_refs(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_template_step_refs(item) for item in value))
+    if isinstance(value, str):
+        refs = set()
+        for match in PLACEHOLDER_PATTERN.finditer(value):
+            parts = match.group(1).split(".")
+            if len(parts) >= 2 and parts[0] == "steps":
+                refs.add(parts[1])
+        return refs
+    return set()
+
+
+def _node_dependencies(nodes: list[dict[str, Any]]) -> dict[str, set[str]]:
+    node_ids = {node["id"] for node in nodes}
+    dependencies: dict[str, set[str]] = {}
+    for node in nodes:
+        refs = _template_step_refs(node.get("params")) | _template_step_refs(
+            node.get("input")
+        )
+        explicit = node.get("depends_on") or []
+        if isinstance(explicit, str):
+            explicit = [explicit]
+        refs |= {str(item) for item in explicit}
+        # Unknown ids are left to template rendering, which reports them
+        dependencies[node["id"]] = (refs & node_ids) - {node["id"]}
+    return dependencies
+
+
+def _execution_order(
+    nodes: list[dict[str, Any]], dependencies: dict[str, set[str]]
+) -> list[str]:
+    """Topological order (Kahn), keeping spec order among ready nodes"""
+    remaining = {node["id"]: set(dependencies[node["id"]]) for node in nodes}
+    order: list[str] = []
+    while remaining:
+        ready = [node_id for node_id, deps in remaining.items() if not deps]
+        if not ready:
+            raise HTTPException(
+                status_code=400,
+                detail="Workflow has circular step references: "
+                + ", ".join(sorted(remaining)),
+            )
+        for node_id in ready:
+            del remaining[node_id]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+        order.extend(ready)
+    return order
+
+
+def _workflow_concurrency(spec: dict[str, Any]) -> int:
+    value = spec.get("max_concurrency")
+    if value is None:
+        value = get_settings().api_workflow_max_concurrency
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=400, detail="Workflow max_concurrency must be an integer"
+        )
+
+
+def _prefetch_node_apis(
+    session: Session, node_api_ids: list[str]
+) -> dict[str, ApiDefinition | TbApiDef]:
+    """Load every node's API definition with one query per table"""
+    found: dict[str, ApiDefinition | TbApiDef] = {}
+    uuid_ids: dict[uuid.UUID, str] = {}
+    other_ids: list[str] = []
+    for node_api_id in dict.fromkeys(node_api_ids):
+        try:
+            uuid_ids[uuid.UUID(node_api_id)] = node_api_id
+        except ValueError:
+            other_ids.append(node_api_id)
+
+    for model, key in ((ApiDefinition, ApiDefinition.id), (TbApiDef, TbApiDef.api_id)):
+        missing = [api_uuid for api_uuid, raw in uuid_ids.items() if raw not in found]
+        if not missing:
+            break
+        for api in session.exec(select(model).where(key.in_(missing))).all():
+            api_uuid = api.id if model is ApiDefinition else api.api_id
+            raw = uuid_ids.get(api_uuid)
+            if raw is not None:
+                found[raw] = api
+
+    for node_api_id in other_ids:
+        api = _get_node_api(session, node_api_id)
+        if api:
+            found[node_api_id] = api
+    return found
+
+
 def _extract_workflow_spec(workflow_api: Any) -> dict[str, Any]:
     logic_spec = getattr(workflow_api, "logic_spec", None)
     if isinstance(logic_spec, dict):
@@ -0,0 +1,379 @@
+"""
+Read-through cache for Asset Registry loaders.
+
+Loader results are cached per (asset_type, scope, name, version, qualifier)
+so a single /ops/ask request does not hit the DB for the same source/tool/
+prompt dozens of times. Entries are invalidated when an asset row of the
+same type is written (publish, rollback, update, delete) - detected from
+ORM flushes on ``tb_asset_registry`` - and the invalidation is fanned out to
+other workers over Redis pub/sub.
+
+Only ORM unit-of-work writes are detected. Core ``update()``/``delete()``
+statements and raw SQL against ``tb_asset_registry`` bypass the flush hook;
+such write paths must call ``notify_asset_changed`` after they commit (the
+TTL bounds staleness otherwise).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from core.config import get_settings
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_ASSET_TABLE = "tb_asset_registry"
+_PENDING_CHANGES_KEY = "_asset_registry_changes"
+
+
+@dataclass(frozen=True)
+class AssetCacheKey:
+    asset_type: str
+    scope: str | None
+    name: str
+    version: int | None = None
+    qualifier: str | None = None
+
+
+@dataclass
+class _AssetCacheEntry:
+    value: Any
+    expires_at: float
+
+
+class AssetCache:
+    """
+    LRU + TTL cache of loader payloads.
+
+    Values are ``(payload, tracked_info)`` tuples; payloads are deep-copied on
+    the way in and out so callers can mutate what they get back. Each
+    asset_type has a generation counter that is bumped on invalidation, so a
+    load that raced with a publish never stores a stale payload.
+    """
+
+    def __init__(self, max_entries: int = 2000, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[AssetCacheKey, _AssetCacheEntry] = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "remote_invalidations": 0,
+            "stale_skips": 0,
+        }
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def get(self, key: AssetCacheKey) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() >= entry.expires_at:
+                del self._entries[key]
+                self._counters["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._misses[key.asset_type] = self._misses.get(key.asset_type, 0) + 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits[key.asset_type] = self._hits.get(key.asset_type, 0) + 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def generation(self, asset_type: str) -> int:
+        with self._lock:
+            return self._generation_locked(asset_type)
+
+    def _generation_locked(self, asset_type: str) -> int:
+        return self._generations.get(asset_type, 0) + self._generations.get("*", 0)
+
+    def put(self, key: AssetCacheKey, value: Any, generation: int) -> None:
+        stored = copy.deepcopy(value)
+        with self._lock:
+            if self._generation_locked(key.asset_type) != generation:
+                # Invalidated while loading; the loaded payload may be stale
+                self._counters["stale_skips"] += 1
+                return
+            self._entries[key] = _AssetCacheEntry(
+                value=stored, expires_at=time.monotonic() + self.ttl_seconds
+            )
+            self._entries.move_to_end(key)
+            self._counters["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, asset_type: str | None = None, remote: bool = False) -> int:
+        """
+        Drop cached entries for an asset type (all types when None).
+
+        Invalidation is per asset_type rather than per name: lookups such as
+        "catalog for source_ref" or "tool by UUID" are not keyed by the asset
+        name, and publishes are rare enough that reloading a type is cheap.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if asset_type is None or key.asset_type == asset_type
+            ]
+            for key in keys:
+                del self._entries[key]
+            generation_key = asset_type or "*"
+            self._generations[generation_key] = self._generations.get(generation_key, 0) + 1
+            self._counters["remote_invalidations" if remote else "invalidations"] += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            total = hits + misses
+            by_type = {
+                asset_type: {
+                    "hits": self._hits.get(asset_type, 0),
+                    "misses": self._misses.get(asset_type, 0),
+                }
+                for asset_type in sorted(set(self._hits) | set(self._misses))
+            }
+            return {
+                "enabled": get_settings().asset_cache_enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+                "by_asset_type": by_type,
+                **self._counters,
+            }
+
+
+def load_through_cache(
+    key: AssetCacheKey,
+    fetch: Callable[[], tuple[Any, dict[str, Any] | None] | None],
+    track: Callable[[dict[str, Any]], None] | None = None,
+) -> Any | None:
+    """
+    Return a loader payload from cache, fetching and storing it on a miss.
+
+    ``fetch`` returns ``(payload, tracked_info)`` or None when the asset does
+    not exist (misses are not cached). ``track`` is the inspector
+    ``track_*_asset_to_stage`` hook; it runs on hits as well as misses so
+    stage asset tracking sees every load.
+    """
+    if not get_settings().asset_cache_enabled:
+        entry = fetch()
+    else:
+        cache = get_asset_cache()
+        entry = cache.get(key)
+        if entry is None:
+            generation = cache.generation(key.asset_type)
+            entry = fetch()
+            if entry is not None:
+                cache.put(key, entry, generation)
+
+    if entry is None:
+        return None
+    payload, tracked = entry
+    if track is not None and tracked is not None:
+        track(tracked)
+    return payload
+
+
+class AssetInvalidationBus:
+    """Fan-out of asset cache invalidations to other workers via Redis pub/sub."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._client = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def _get_client(self):
+        if self._client is None:
+            from core.redis import create_redis_client
+
+            self._client = create_redis_client(get_settings())
+        return self._client
+
+    def publish(self, asset_types: Iterable[str], source_names: Iterable[str]) -> None:
+        if not get_settings().redis_url:
+            return
+        message = json.dumps(
+            {
+                "origin": self.origin,
+                "asset_types": sorted(asset_types),
+                "source_names": sorted(source_names),
+            }
+        )
+        try:
+            self._get_client().publish(self.channel, message)
+        except Exception as exc:
+            logger.warning(f"Failed to publish asset cache invalidation: {exc}")
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        if not get_settings().redis_url:
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name="asset-cache-invalidation", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                logger.info(f"Listening for asset cache invalidations on {self.channel}")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle(message.get("data"))
+            except Exception as exc:
+                logger.warning(f"Asset cache invalidation listener error: {exc}")
+                self._stop.wait(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.origin:
+            return
+        apply_asset_changes(
+            payload.get("asset_types") or [],
+            payload.get("source_names") or [],
+            remote=True,
+        )
+
+
+def apply_asset_changes(
+    asset_types: Iterable[str], source_names: Iterable[str], remote: bool = False
+) -> None:
+    """Drop process-local state derived from changed assets."""
+    cache = get_asset_cache()
+    for asset_type in asset_types:
+        cache.invalidate(asset_type, remote=remote)
+
+    names = [name for name in source_names if name]
+    if names:
+        try:
+            from app.modules.ops.services.connections import invalidate_source_pools
+
+            for name in names:
+                invalidate_source_pools(name)
+        except Exception as exc:
+            logger.warning(f"Failed to invalidate source connection pools: {exc}")
+
+
+def notify_asset_changed(asset_types: Iterable[str], source_names: Iterable[str] = ()) -> None:
+    """
+    Invalidate locally and broadcast to other workers.
+
+    Called on commit for ORM writes; Core/raw SQL writers call it themselves.
+    """
+    asset_types = set(asset_types)
+    source_names = set(source_names)
+    if not asset_types:
+        return
+    apply_asset_changes(asset_types, source_names)
+    get_invalidation_bus().publish(asset_types, source_names)
+
+
+def _collect_asset_changes(session: Session, flush_context: Any) -> None:
+    changed: dict[str, set[str]] = session.info.setdefault(_PENDING_CHANGES_KEY, {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) != _ASSET_TABLE:
+            continue
+        asset_type = getattr(obj, "asset_type", None)
+        if not asset_type:
+            continue
+        names = changed.setdefault(asset_type, set())
+        if getattr(obj, "name", None):
+            names.add(obj.name)
+        try:
+            # Include the previous name so renamed sources drop their old pool
+            names.update(n for n in inspect(obj).attrs.name.history.deleted if n)
+        except Exception:
+            pass
+
+
+def _flush_asset_changes(session: Session) -> None:
+    changed = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if changed:
+        notify_asset_changed(changed.keys(), changed.get("source", ()))
+
+
+def _discard_asset_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_asset_changes)
+event.listen(Session, "after_commit", _flush_asset_changes)
+event.listen(Session, "after_rollback", _discard_asset_changes)
+
+
+_asset_cache: Optional[AssetCache] = None
+_invalidation_bus: Optional[AssetInvalidationBus] = None
+_singleton_lock = threading.Lock()
+
+
+def get_asset_cache() -> AssetCache:
+    """Get the process-wide asset cache."""
+    global _asset_cache
+    if _asset_cache is None:
+        with _singleton_lock:
+            if _asset_cache is None:
+                settings = get_settings()
+                _asset_cache = AssetCache(
+                    max_entries=settings.asset_cache_max_entries,
+                    ttl_seconds=settings.asset_cache_ttl_seconds,
+                )
+    return _asset_cache
+
+
+def get_invalidation_bus() -> AssetInvalidationBus:
+    """Get the process-wide Redis invalidation bus."""
+    global _invalidation_bus
+    if _invalidation_bus is None:
+        with _singleton_lock:
+            if _invalidation_bus is None:
+                _invalidation_bus = AssetInvalidationBus(
+                    get_settings().asset_cache_invalidation_channel
+                )
+    return _invalidation_bus
@@ -16,6 +16,7 @@ from app.modules.inspector.asset_context import (
     track_tool_asset_to_stage,
 )
 
+from .cache import AssetCacheKey, load_through_cache
 from .models import TbAssetRegistry
 from .source_models import coerce_source_connection, coerce_source_type
 
@@ -36,7 +37,7 @@ def load_prompt_asset(
     scope: str, engine: str, name: str, version: int | None = None
 ) -> dict[str, Any] | None:
     """
-    Load prompt asset from Asset Registry (DB only).
+    Load prompt asset from Asset Registry (cached, DB on miss).
 
     Args:
         scope: Prompt scope (e.g., "ci")
@@ -44,6 +45,23 @@ def load_prompt_asset(
         name: Asset name
         version: Specific version to load (None for published)
     """
+    payload = load_through_cache(
+        AssetCacheKey("prompt", scope, name, version, qualifier=engine),
+        lambda: _fetch_prompt_asset(scope, engine, name, version),
+        track_prompt_asset_to_stage,
+    )
+    if payload is not None:
+        return payload
+
+    raise ValueError(
+        f"Prompt asset not found in Asset Registry: {name} "
+        f"(scope={scope}, engine={engine}, version={version or 'published'})"
+    )
+
+
+def _fetch_prompt_asset(
+    scope: str, engine: str, name: str, version: int | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
     with get_session_context() as session:
         # Try DB first
         query = (
@@ -78,29 +96,24 @@ def load_prompt_asset(
                 "params": params,
                 "source": "asset_registry",
             }
-            track_prompt_asset_to_stage(
-                {
-                    "asset_id": str(asset.asset_id),
-                    "name": asset.name,
-                    "version": asset.version,
-                    "source": "asset_registry",
-                    "scope": scope,
-                    "engine": engine,
-                }
-            )
-            return payload
+            tracked = {
+                "asset_id": str(asset.asset_id),
+                "name": asset.name,
+                "version": asset.version,
+                "source": "asset_registry",
+                "scope": scope,
+                "engine": engine,
+            }
+            return payload, tracked
 
-    raise ValueError(
-        f"Prompt asset not found in Asset Registry: {name} "
-        f"(scope={scope}, engine={engine}, version={version or 'published'})"
-    )
+    return None
 
 
 def load_mapping_asset(
     mapping_type: str, version: int | None = None, scope: str | None = None
 ) -> tuple[dict[str, Any] | None, str | None]:
     """
-    Load mapping asset from Asset Registry (DB only).
+    Load mapping asset from Asset Registry (cached, DB on miss).
 
     Args:
         mapping_type: Mapping type identifier (required)
@@ -110,6 +123,22 @@ def load_mapping_asset(
     Returns:
         Tuple of (content_dict, metadata_str) or (None, None) if not found
     """
+    payload = load_through_cache(
+        AssetCacheKey("mapping", scope, mapping_type, version),
+        lambda: _fetch_mapping_asset(mapping_type, version, scope),
+        track_mapping_asset_to_stage,
+    )
+    if payload is not None:
+        return payload
+
+    # Asset not found
+    logger.warning(f"Mapping asset not found: {mapping_type} (scope={scope})")
+    return (None, None)
+
+
+def _fetch_mapping_asset(
+    mapping_type: str, version: int | None, scope: str | None
+) -> tuple[tuple[dict[str, Any], str], dict[str, Any]] | None:
     with get_session_context() as session:
         # Query by name instead of mapping_type since mapping_type may be NULL
         # Assets are created with name = mapping_type identifier
@@ -135,34 +164,46 @@ def load_mapping_asset(
                 f"Loaded mapping from asset registry: {asset.name} (v{asset.version})"
             )
             metadata_str = f"asset_registry:{asset.name}:v{asset.version}"
-            track_mapping_asset_to_stage(
-                {
-                    "asset_id": str(asset.asset_id),
-                    "name": asset.name,
-                    "version": asset.version,
-                    "source": "asset_registry",
-                    "mapping_type": mapping_type,
-                }
-            )
-            # Return tuple: (content_dict, metadata_str)
-            return (dict(asset.content or {}), metadata_str)
+            tracked = {
+                "asset_id": str(asset.asset_id),
+                "name": asset.name,
+                "version": asset.version,
+                "source": "asset_registry",
+                "mapping_type": mapping_type,
+            }
+            # Payload tuple: (content_dict, metadata_str)
+            return (dict(asset.content or {}), metadata_str), tracked
 
-    # Asset not found
-    logger.warning(f"Mapping asset not found: {mapping_type} (scope={scope})")
-    return (None, None)
+    return None
 
 
 def load_policy_asset(
     policy_type: str, version: int | None = None, scope: str | None = None
 ) -> dict[str, Any] | None:
     """
-    Load policy asset from Asset Registry (DB only).
+    Load policy asset from Asset Registry (cached, DB on miss).
 
     Args:
         policy_type: Policy type identifier (required)
         version: Specific version to load (None for published)
         scope: Scope to filter by (e.g., "ops", "ci"). If None, searches all scopes.
     """
+    payload = load_through_cache(
+        AssetCacheKey("policy", scope, policy_type, version),
+        lambda: _fetch_policy_asset(policy_type, version, scope),
+        track_policy_asset_to_stage,
+    )
+    if payload is not None:
+        return payload
+
+    # Asset not found
+    logger.warning(f"Policy asset not found: {policy_type} (scope={scope})")
+    return None
+
+
+def _fetch_policy_asset(
+    policy_type: str, version: int | None, scope: str | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
     with get_session_context() as session:
         query = (
             select(TbAssetRegistry)
@@ -209,19 +250,15 @@ def load_policy_asset(
                     "policy_type": policy_type,
                 }
             }
-            track_policy_asset_to_stage(
-                {
-                    "asset_id": str(asset.asset_id),
-                    "name": asset.name,
-                    "version": asset.version,
-                    "source": "asset_registry",
-                    "policy_type": policy_type,
-                }
-            )
-            return payload
+            tracked = {
+                "asset_id": str(asset.asset_id),
+                "name": asset.name,
+                "version": asset.version,
+                "source": "asset_registry",
+                "policy_type": policy_type,
+            }
+            return payload, tracked
 
-    # Asset not found
-    logger.warning(f"Policy asset not found: {policy_type} (scope={scope})")
     return None
 
 
@@ -241,6 +278,22 @@ def load_query_asset(
     Returns:
         Query asset content dict, or None if not found
     """
+    payload = load_through_cache(
+        AssetCacheKey("query", scope, name, version),
+        lambda: _fetch_query_asset(scope, name, version),
+    )
+    if payload is not None:
+        return payload
+
+    raise ValueError(
+        "Query asset not found in Asset Registry: "
+        f"{name} (scope={scope}, version={version or 'published'})"
+    )
+
+
+def _fetch_query_asset(
+    scope: str, name: str, version: int | None
+) -> tuple[tuple[dict[str, Any], str], None] | None:
     with get_session_context() as session:
         # Try DB first
         query = (
@@ -260,7 +313,7 @@ def load_query_asset(
         if asset:
             logger.info(f"Loaded query from asset registry: {name} (v{asset.version})")
             asset_identifier = f"{str(asset.asset_id)}:v{asset.version}"
-            return (
+            payload = (
                 {
                     "sql": asset.query_sql,
                     "cypher": asset.query_cypher,
@@ -272,16 +325,14 @@ def load_query_asset(
                 },
                 asset_identifier,
             )
+            return payload, None
 
-    raise ValueError(
-        "Query asset not found in Asset Registry: "
-        f"{name} (scope={scope}, version={version or 'published'})"
-    )
+    return None
 
 
 def load_source_asset(name: str, version: int | None = None) -> dict[str, Any] | None:
     """
-    Load source asset from Asset Registry (DB only).
+    Load source asset from Asset Registry (cached, DB on miss).
 
     Args:
         name: Name of source asset
@@ -290,6 +341,23 @@ def load_source_asset(name: str, version: int | None = None) -> dict[str, Any] |
     Returns:
         Dictionary containing source connection details
     """
+    payload = load_through_cache(
+        AssetCacheKey("source", None, name, version),
+        lambda: _fetch_source_asset(name, version),
+        track_source_asset_to_stage,
+    )
+    if payload is not None:
+        return payload
+
+    raise ValueError(
+        f"Source asset not found in Asset Registry: {name} "
+        f"(version={version or 'published'})"
+    )
+
+
+def _fetch_source_asset(
+    name: str, version: int | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
     with get_session_context() as session:
         # Try DB first
         query = (
@@ -322,27 +390,21 @@ def load_source_asset(name: str, version: int | None = None) -> dict[str, Any] |
                 "scope": asset.scope,
                 "tags": asset.tags,
             }
-            track_source_asset_to_stage(
-                {
-                    "asset_id": str(asset.asset_id),
-                    "name": asset.name,
-                    "version": asset.version,
-                    "source": "asset_registry",
-                    "scope": asset.scope,
-                }
-            )
-
-            return payload
+            tracked = {
+                "asset_id": str(asset.asset_id),
+                "name": asset.name,
+                "version": asset.version,
+                "source": "asset_registry",
+                "scope": asset.scope,
+            }
+            return payload, tracked
 
-    raise ValueError(
-        f"Source asset not found in Asset Registry: {name} "
-        f"(version={version or 'published'})"
-    )
+    return None
 
 
 def load_catalog_asset(name: str, version: int | None = None) -> dict[str, Any] | None:
     """
-    Load catalog asset from Asset Registry (DB only).
+    Load catalog asset from Asset Registry (cached, DB on miss).
 
     Args:
         name: Name of catalog asset
@@ -351,6 +413,23 @@ def load_catalog_asset(name: str, version: int | None = None) -> dict[str, Any]
     Returns:
         Dictionary containing database catalog information
     """
+    payload = load_through_cache(
+        AssetCacheKey("catalog", None, name, version),
+        lambda: _fetch_catalog_asset(name, version),
+        track_catalog_asset_to_stage,
+    )
+    if payload is not None:
+        return payload
+
+    raise ValueError(
+        f"Catalog asset not found in Asset Registry: {name} "
+        f"(version={version or 'published'})"
+    )
+
+
+def _fetch_catalog_asset(
+    name: str, version: int | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
     with get_session_context() as session:
         # Try DB first
         query = (
@@ -385,28 +464,22 @@ def load_catalog_asset(name: str, version: int | None = None) -> dict[str, Any]
                 "scope": asset.scope,
                 "tags": asset.tags,
             }
-            # Track catalog asset for inspector
-            track_catalog_asset_to_stage(
-                {
-                    "asset_id": str(asset.asset_id),
-                    "name": asset.name,
-                    "version": asset.version,
-                    "source": "asset_registry",
-                    "scope": asset.scope,
-                }
-            )
-
-            return payload
+            # Tracked for inspector on every load (cache hit or miss)
+            tracked = {
+                "asset_id": str(asset.asset_id),
+                "name": asset.name,
+                "version": asset.version,
+                "source": "asset_registry",
+                "scope": asset.scope,
+            }
+            return payload, tracked
 
-    raise ValueError(
-        f"Catalog asset not found in Asset Registry: {name} "
-        f"(version={version or 'published'})"
-    )
+    return None
 
 
 def load_resolver_asset(name: str, version: int | None = None) -> dict[str, Any] | None:
     """
-    Load resolver asset from Asset Registry (DB only).
+    Load resolver asset from Asset Registry (cached, DB on miss).
 
     Args:
         name: Name of resolver asset
@@ -415,6 +488,23 @@ def load_resolver_asset(name: str, version: int | None = None) -> dict[str, Any]
     Returns:
         Dictionary containing resolver configuration
     """
+    payload = load_through_cache(
+        AssetCacheKey("resolver", None, name, version),
+        lambda: _fetch_resolver_asset(name, version),
+        track_resolver_asset_to_stage,
+    )
+    if payload is not None:
+        return payload
+
+    raise ValueError(
+        f"Resolver asset not found in Asset Registry: {name} "
+        f"(version={version or 'published'})"
+    )
+
+
+def _fetch_resolver_asset(
+    name: str, version: int | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
     with get_session_context() as session:
         # Try DB first
         query = (
@@ -447,22 +537,16 @@ def load_resolver_asset(name: str, version: int | None = None) -> dict[str, Any]
                 "scope": asset.scope,
                 "tags": asset.tags,
             }
-            track_resolver_asset_to_stage(
-                {
-                    "asset_id": str(asset.asset_id),
-                    "name": asset.name,
-                    "version": asset.version,
-                    "source": "asset_registry",
-                    "scope": asset.scope,
-                }
-            )
-
-            return payload
+            tracked = {
+                "asset_id": str(asset.asset_id),
+                "name": asset.name,
+                "version": asset.version,
+                "source": "asset_registry",
+                "scope": asset.scope,
+            }
+            return payload, tracked
 
-    raise ValueError(
-        f"Resolver asset not found in Asset Registry: {name} "
-        f"(version={version or 'published'})"
-    )
+    return None
 def load_tool_asset(
     name_or_id: str,
     version: int | None = None,
@@ -479,6 +563,16 @@ def load_tool_asset(
     Returns:
         Tool asset dict or None if not found
     """
+    return load_through_cache(
+        AssetCacheKey("tool", None, name_or_id, version, qualifier=status),
+        lambda: _fetch_tool_asset(name_or_id, version, status),
+        track_tool_asset_to_stage,
+    )
+
+
+def _fetch_tool_asset(
+    name_or_id: str, version: int | None, status: str | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
     import uuid
 
     with get_session_context() as session:
@@ -525,16 +619,16 @@ def load_tool_asset(
             "source": "asset_registry",
         }
 
-        # Track tool asset for inspector
-        track_tool_asset_to_stage({
+        # Tracked for inspector on every load (cache hit or miss)
+        tracked = {
             "asset_id": str(asset.asset_id),
             "name": asset.name,
             "tool_type": asset.tool_type,
             "version": asset.version,
             "source": "asset_registry",
-        })
+        }
 
-        return tool_info
+        return tool_info, tracked
 
 
 def load_all_published_tools() -> list[dict[str, Any]]:
@@ -613,6 +707,15 @@ def resolve_catalog_asset_for_source(source_ref: str) -> dict[str, Any] | None:
     if not source_ref:
         return None
 
+    return load_through_cache(
+        AssetCacheKey("catalog", None, source_ref, qualifier="by_source_ref"),
+        lambda: _fetch_catalog_asset_for_source(source_ref),
+    )
+
+
+def _fetch_catalog_asset_for_source(
+    source_ref: str,
+) -> tuple[dict[str, Any], None] | None:
     with get_session_context() as session:
         query = (
             select(TbAssetRegistry)
@@ -628,7 +731,7 @@ def resolve_catalog_asset_for_source(source_ref: str) -> dict[str, Any] | None:
             catalog_source_ref = _extract_catalog_source_ref(content)
             if catalog_source_ref != source_ref:
                 continue
-            return {
+            payload = {
                 "name": asset.name,
                 "source_ref": catalog_source_ref,
                 "catalog": catalog if isinstance(catalog, dict) else {},
@@ -639,6 +742,7 @@ def resolve_catalog_asset_for_source(source_ref: str) -> dict[str, Any] | None:
                 "scope": asset.scope,
                 "tags": asset.tags,
             }
+            return payload, None
 
     return None
 
@@ -15,6 +15,7 @@ from sqlmodel import Session, select
 
 logger = logging.getLogger(__name__)
 
+from app.modules.asset_registry.cache import get_asset_cache
 from app.modules.asset_registry.crud import (
     build_schema_catalog,
     create_resolver_asset,
@@ -76,6 +77,9 @@ from app.modules.asset_registry.source_models import (
 from app.modules.auth.models import TbUser
 from app.modules.inspector import crud as inspector_crud
 from app.modules.inspector.schemas import TraceSummary
+from app.modules.ops.services.orchestration.services.result_store import (
+    invalidate_result_tags,
+)
 from app.modules.permissions.crud import check_permission
 from app.modules.permissions.models import ResourcePermission
 
@@ -323,6 +327,12 @@ def create_query_asset_impl(
         raise HTTPException(status_code=500, detail=f"Failed to create asset: {str(e)}")
 
 
+@router.get("/cache/stats", response_model=ResponseEnvelope)
+def get_asset_cache_stats(current_user: TbUser = Depends(get_current_user)):
+    """Asset loader cache hit/miss counters for this worker."""
+    return ResponseEnvelope.success(data={"asset_cache": get_asset_cache().stats()})
+
+
 @router.get("/assets", response_model=ResponseEnvelope)
 def list_assets(
     asset_type: str | None = None,
@@ -1212,12 +1222,15 @@ def update_source(
 ):
     """Update a source asset"""
     with get_session_context() as session:
+        previous = get_source_asset(session, asset_id)
         try:
             asset = update_source_asset(
                 session, asset_id, payload, updated_by=current_user.id
             )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
+        # Tool results read through this source (under its old or new name)
+        invalidate_result_tags({f"source_ref:{previous.name}", f"source_ref:{asset.name}"})
         return ResponseEnvelope.success(
             data=SourceAssetResponse(
                 asset_id=str(asset.asset_id),
@@ -1245,7 +1258,10 @@ def delete_source(
 ):
     """Delete a source asset"""
     with get_session_context() as session:
+        source = get_source_asset(session, asset_id)
         delete_source_asset(session, asset_id)
+        if source:
+            invalidate_result_tags([f"source_ref:{source.name}"])
         return ResponseEnvelope.success(message="Source asset deleted")
 
 
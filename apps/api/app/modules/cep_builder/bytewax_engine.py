@@ -5,6 +5,12 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from .windowing import (
+    RunningAggregate,
+    WindowedAggregator,
+    percentile_of,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +44,7 @@ class EventProcessor(ABC):
 
     @abstractmethod
     def process(self, event: dict, context: dict) -> Optional[dict]:
-        """Process event and return result or None to filter out"""
+        """Process event and return result (or list of results) or None to filter out"""
         pass
 
 
@@ -99,114 +105,63 @@ class FilterProcessor(EventProcessor):
 
 
 class AggregationProcessor(EventProcessor):
-    """Aggregate events based on configuration"""
+    """Aggregate events based on configuration (running totals per group)"""
 
     def __init__(self, aggregation_spec: dict):
         self.aggregation_spec = aggregation_spec
-        self.state: Dict[str, Any] = {}
+        self.state: Dict[str, RunningAggregate] = {}
 
     def process(self, event: dict, context: dict) -> Optional[dict]:
         """Apply aggregation to event"""
         group_by_field = self.aggregation_spec.get("group_by")
-        agg_type = self.aggregation_spec.get("type")  # count, sum, avg, min, max
+        agg_type = self.aggregation_spec.get("type")  # count, sum, avg, min, max, pNN
         metric_field = self.aggregation_spec.get("field")
 
         # Get group key
         group_key = event.get(group_by_field, "default")
-        if group_key not in self.state:
-            self.state[group_key] = {
-                "count": 0,
-                "sum": 0,
-                "values": [],
-                "min": float("inf"),
-                "max": float("-inf"),
-            }
+        state = self.state.get(group_key)
+        if state is None:
+            state = RunningAggregate(track_quantiles=percentile_of(agg_type) is not None)
+            self.state[group_key] = state
 
-        state = self.state[group_key]
-
-        # Update state
-        state["count"] += 1
+        # Update state (O(1): no per-value history is kept)
+        metric_value = None
         if metric_field and metric_field in event:
             try:
                 metric_value = float(event[metric_field])
-                state["sum"] += metric_value
-                state["values"].append(metric_value)
-                state["min"] = min(state["min"], metric_value)
-                state["max"] = max(state["max"], metric_value)
             except (ValueError, TypeError):
                 pass
+        state.add(metric_value)
 
-        # Calculate aggregated value based on type
-        if agg_type == "count":
-            return {
-                "group": group_key,
-                "aggregated_value": state["count"],
-                "aggregation_type": "count",
-            }
-        elif agg_type == "sum":
-            return {
-                "group": group_key,
-                "aggregated_value": state["sum"],
-                "aggregation_type": "sum",
-            }
-        elif agg_type == "avg":
-            avg = state["sum"] / state["count"] if state["count"] > 0 else 0
-            return {
-                "group": group_key,
-                "aggregated_value": avg,
-                "aggregation_type": "avg",
-            }
-        elif agg_type == "min":
-            return {
-                "group": group_key,
-                "aggregated_value": state["min"],
-                "aggregation_type": "min",
-            }
-        elif agg_type == "max":
-            return {
-                "group": group_key,
-                "aggregated_value": state["max"],
-                "aggregation_type": "max",
-            }
-
-        return None
+        if agg_type not in ("count", "sum", "avg", "min", "max") and percentile_of(
+            agg_type
+        ) is None:
+            return None
+        return {
+            "group": group_key,
+            "aggregated_value": state.result(agg_type),
+            "aggregation_type": agg_type,
+        }
 
 
 class WindowProcessor(EventProcessor):
-    """Window events for time-based aggregation"""
+    """
+    Window events for time-based aggregation
+
+    Emits aggregated results only when a window closes (or an early trigger
+    fires); open windows keep an incremental aggregate, not their events.
+    """
 
-    def __init__(self, window_config: dict):
+    def __init__(self, window_config: dict, aggregation_spec: Optional[dict] = None):
         self.window_config = window_config
-        self.window_type = window_config.get("type")  # tumbling, sliding
+        self.window_type = window_config.get("type")  # tumbling, sliding, session
         self.window_size_seconds = window_config.get("size_seconds")
         self.slide_seconds = window_config.get("slide_seconds")
-        self.windows: Dict[int, List[dict]] = {}
+        self.aggregator = WindowedAggregator(window_config, aggregation_spec)
 
-    def process(self, event: dict, context: dict) -> Optional[dict]:
-        """Add event to appropriate window(s)"""
-        now = datetime.utcnow()
-        timestamp = event.get("timestamp", now)
-
-        if isinstance(timestamp, str):
-            try:
-                timestamp = datetime.fromisoformat(timestamp)
-            except (ValueError, TypeError):
-                timestamp = now
-
-        window_id = int(timestamp.timestamp() // self.window_size_seconds)
-
-        if window_id not in self.windows:
-            self.windows[window_id] = []
-
-        self.windows[window_id].append(event)
-
-        # Return windowed events
-        return {
-            "window_id": window_id,
-            "events": self.windows[window_id],
-            "event_count": len(self.windows[window_id]),
-            "window_type": self.window_type,
-        }
+    def process(self, event: dict, context: dict) -> Optional[List[dict]]:
+        """Add event to its window(s) and return results that fired, if any"""
+        return self.aggregator.add(event) or None
 
 
 class EnrichmentProcessor(EventProcessor):
@@ -261,13 +216,12 @@ class BytewaxCEPEngine:
         if rule.filters:
             processors.append(FilterProcessor(rule.filters))
 
-        # Add aggregation processor if aggregation is specified
-        if rule.aggregation:
-            processors.append(AggregationProcessor(rule.aggregation))
-
-        # Add window processor if windowing is configured
+        # Windowed aggregation when windowing is configured, otherwise a
+        # running aggregation if one is specified
         if rule.window_config:
-            processors.append(WindowProcessor(rule.window_config))
+            processors.append(WindowProcessor(rule.window_config, rule.aggregation))
+        elif rule.aggregation:
+            processors.append(AggregationProcessor(rule.aggregation))
 
         # Add enrichment processor if enrichment is specified
         if rule.enrichment:
@@ -292,7 +246,9 @@ class BytewaxCEPEngine:
             new_results = []
             for result in results:
                 processed = processor.process(result, context)
-                if processed is not None:
+                if isinstance(processed, list):
+                    new_results.extend(processed)
+                elif processed is not None:
                     new_results.append(processed)
             results = new_results
 
@@ -344,6 +300,12 @@ class BytewaxCEPEngine:
 
         return action_results
 
+    def _window_processor(self, rule_id: str) -> Optional[WindowProcessor]:
+        for processor in self.processors.get(rule_id, []):
+            if isinstance(processor, WindowProcessor):
+                return processor
+        return None
+
     def get_rule_stats(self, rule_id: str) -> Dict[str, Any]:
         """Get statistics for a rule"""
         rule = self.rules.get(rule_id)
@@ -351,6 +313,7 @@ class BytewaxCEPEngine:
             return {}
 
         state = self.state_store.get(rule_id, {})
+        processor = self._window_processor(rule_id)
 
         return {
             "rule_id": rule_id,
@@ -361,6 +324,7 @@ class BytewaxCEPEngine:
             "events_matched": state.get("events_matched", 0),
             "last_execution": state.get("last_execution"),
             "error_count": state.get("error_count", 0),
+            "windows": processor.aggregator.stats() if processor else None,
         }
 
     def disable_rule(self, rule_id: str) -> bool:
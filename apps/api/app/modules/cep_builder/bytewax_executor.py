@@ -108,6 +108,11 @@ def convert_db_rule_to_bytewax(
             "type": window_spec.get("type", "tumbling"),
             "size_seconds": window_spec.get("size_seconds", 60),
             "slide_seconds": window_spec.get("slide_seconds"),
+            "gap_seconds": window_spec.get("gap_seconds"),
+            "allowed_lateness_seconds": window_spec.get("allowed_lateness_seconds", 0),
+            "watermark_delay_seconds": window_spec.get("watermark_delay_seconds", 0),
+            "trigger_every": window_spec.get("trigger_every", 0),
+            "max_windows": window_spec.get("max_windows"),
         }
 
     # Convert action spec
@@ -40,6 +40,23 @@ def list_rules(
     return session.exec(query).scalars().all()
 
 
+def list_rules_updated_since(
+    session: Session, since: datetime, rule_ids: list[str] | None = None
+) -> list[TbCepRule]:
+    """
+    Rules changed at or after ``since`` or listed in ``rule_ids``
+    (any trigger type, active or not).
+
+    Used by the metric poll queue for incremental refreshes: rules that stopped
+    being active metric rules must be seen too so they can be dropped.
+    """
+    condition = TbCepRule.updated_at >= since
+    if rule_ids:
+        condition = condition | TbCepRule.rule_id.in_(rule_ids)
+    query = select(TbCepRule).where(condition).order_by(TbCepRule.updated_at)
+    return session.exec(query).scalars().all()
+
+
 def get_rule(session: Session, rule_id: str) -> TbCepRule | None:
     return session.get(TbCepRule, rule_id)
 
@@ -67,6 +84,7 @@ def create_rule(
 def update_rule(session: Session, rule: TbCepRule, payload: CepRuleUpdate) -> TbCepRule:
     for attr, value in payload.model_dump(exclude_unset=True).items():
         setattr(rule, attr, value)
+    rule.updated_at = func.now()
     session.add(rule)
     session.commit()
     session.refresh(rule)
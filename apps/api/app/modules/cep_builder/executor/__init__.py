@@ -17,6 +17,7 @@ from .metric_executor import (
     apply_window_aggregation,
     evaluate_aggregation,
     fetch_runtime_value,
+    fetch_runtime_value_async,
     get_path_value,
 )
 from .notification_executor import (
@@ -35,13 +36,14 @@ def evaluate_trigger(
     trigger_type: str,
     trigger_spec: Dict[str, Any] | None,
     payload: Dict[str, Any] | None,
+    runtime_payload: Dict[str, Any] | None = None,
 ) -> tuple[bool, Dict[str, Any]]:
     """Evaluate trigger based on type."""
     spec = trigger_spec or {}
     if trigger_type == "schedule":
         return True, {"trigger_spec": spec}
     if trigger_type == "metric":
-        return _evaluate_metric_trigger(spec, payload)
+        return _evaluate_metric_trigger(spec, payload, runtime_payload)
     if trigger_type == "event":
         return _evaluate_event_trigger(spec, payload)
     if trigger_type == "anomaly":
@@ -56,6 +58,7 @@ def manual_trigger(
     payload: Dict[str, Any] | None = None,
     executed_by: str = "cep-builder",
     session: Session | None = None,
+    runtime_payload: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
     """
     Manually trigger a CEP rule execution.
@@ -65,13 +68,14 @@ def manual_trigger(
         payload: Event payload to evaluate against the rule
         executed_by: Who triggered this execution
         session: Optional database session (created if not provided)
+        runtime_payload: Prefetched runtime response for metric rules
 
     Returns:
         Execution result with status, condition_met, result, references, etc.
     """
     start = time.perf_counter()
     condition, trigger_refs = evaluate_trigger(
-        rule.trigger_type, rule.trigger_spec, payload
+        rule.trigger_type, rule.trigger_spec, payload, runtime_payload
     )
     lock_conn = _try_acquire_rule_lock(rule.rule_id)
     references: Dict[str, Any] = {"trigger": trigger_refs}
@@ -156,6 +160,7 @@ __all__ = [
     "manual_trigger",
     "execute_action",
     "fetch_runtime_value",
+    "fetch_runtime_value_async",
     "get_path_value",
     "evaluate_aggregation",
     "apply_window_aggregation",
@@ -0,0 +1,149 @@
+"""Shared async HTTP client for CEP metric polling.
+
+The metric poll loop used to run every rule through ``fetch_runtime_value``
+in a worker thread, each with its own ``httpx.Client`` (own pool, own TCP
+connection). This client keeps one keep-alive ``httpx.AsyncClient`` per event
+loop, caps concurrent requests per host, and coalesces identical requests
+(method + URL + params) issued within the same poll tick, so N rules watching
+one runtime endpoint cost a single HTTP call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+RequestKey = Tuple[str, str, str]
+
+# HTTP/2 needs the optional 'h2' package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def request_key(url: str, method: str, params: Dict[str, Any]) -> RequestKey:
+    """Identity of a runtime request; identical keys share one HTTP call per tick."""
+    return method, url, json.dumps(params, sort_keys=True, default=str)
+
+
+class MetricPollTick:
+    """Coalescing scope for one poll tick: identical requests share one task."""
+
+    def __init__(self, client: "RuntimeMetricClient"):
+        self._client = client
+        self._requests: Dict[RequestKey, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def fetch(self, url: str, method: str, params: Dict[str, Any]) -> Any:
+        key = request_key(url, method, params)
+        task = self._requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._client.fetch(url, method, params))
+            self._requests[key] = task
+        else:
+            self.coalesced += 1
+        # shield: one follower being cancelled must not cancel the shared call
+        return await asyncio.shield(task)
+
+    @property
+    def request_count(self) -> int:
+        return len(self._requests)
+
+
+class RuntimeMetricClient:
+    """Keep-alive ``httpx.AsyncClient`` with per-host concurrency limits."""
+
+    def __init__(
+        self,
+        timeout: float,
+        max_connections: int = 100,
+        per_host_limit: int = 20,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=self.http2,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._per_host_limit = max(1, per_host_limit)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._requests = 0
+
+    def tick(self) -> MetricPollTick:
+        """Start a coalescing scope for one poll tick."""
+        return MetricPollTick(self)
+
+    async def fetch(self, url: str, method: str, params: Dict[str, Any]) -> Any:
+        """GET (params as query) or POST (params as JSON) and return the decoded body."""
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._per_host_limit)
+            self._host_semaphores[host] = semaphore
+        async with semaphore:
+            self._requests += 1
+            response = (
+                await self._client.get(url, params=params)
+                if method == "GET"
+                else await self._client.post(url, json=params)
+            )
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "hosts": len(self._host_semaphores),
+            "http2": self.http2,
+        }
+
+
+_client: Optional[RuntimeMetricClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_runtime_metric_client() -> RuntimeMetricClient:
+    """Get the metric client for the running loop (created on first use)."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.closed or _client_loop is not loop:
+        settings = get_settings()
+        _client = RuntimeMetricClient(
+            timeout=settings.cep_metric_http_timeout_seconds,
+            max_connections=settings.cep_metric_http_max_connections,
+            per_host_limit=settings.cep_metric_http_per_host_limit,
+            http2=settings.cep_metric_http2,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_runtime_metric_client() -> None:
+    """Close the shared client (scheduler shutdown)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.closed:
+        try:
+            await client.aclose()
+        except Exception:
+            logger.exception("Failed to close runtime metric client")
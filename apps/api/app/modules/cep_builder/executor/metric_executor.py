@@ -8,6 +8,7 @@ import httpx
 from core.config import get_settings
 from fastapi import HTTPException
 
+from .metric_client import MetricPollTick, get_runtime_metric_client
 from .rule_executor import get_path_value
 
 
@@ -59,32 +60,60 @@ def fetch_runtime_value(
             )
             response.raise_for_status()
             raw_payload = response.json()
-    except httpx.RequestError as exc:
-        raise HTTPException(
-            status_code=502, detail=f"Runtime request failed: {exc}"
-        ) from exc
-    except httpx.HTTPStatusError as exc:
-        raise HTTPException(
-            status_code=502,
-            detail=f"Runtime response error: {exc.response.status_code}",
-        ) from exc
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=502, detail="Runtime response is not valid JSON"
-        ) from exc
+    except (httpx.RequestError, httpx.HTTPStatusError, ValueError) as exc:
+        raise _runtime_fetch_error(exc) from exc
+    value_path = trigger_spec.get("value_path")
+    extracted_value = get_path_value(raw_payload, value_path)
+    return raw_payload, extracted_value
+
+
+async def fetch_runtime_value_async(
+    trigger_spec: Dict[str, Any],
+    tick: MetricPollTick | None = None,
+) -> Tuple[Dict[str, Any], Any | None]:
+    """
+    Async ``fetch_runtime_value`` on the shared metric client.
+
+    Requests made through the same ``tick`` with identical endpoint, method
+    and params share one HTTP call.
+    """
+    url, method, params = _resolve_metric_request(trigger_spec)
+    try:
+        if tick is not None:
+            raw_payload = await tick.fetch(url, method, params)
+        else:
+            raw_payload = await get_runtime_metric_client().fetch(url, method, params)
+    except (httpx.RequestError, httpx.HTTPStatusError, ValueError) as exc:
+        raise _runtime_fetch_error(exc) from exc
     value_path = trigger_spec.get("value_path")
     extracted_value = get_path_value(raw_payload, value_path)
     return raw_payload, extracted_value
 
 
+def _runtime_fetch_error(exc: Exception) -> HTTPException:
+    if isinstance(exc, httpx.RequestError):
+        return HTTPException(status_code=502, detail=f"Runtime request failed: {exc}")
+    if isinstance(exc, httpx.HTTPStatusError):
+        return HTTPException(
+            status_code=502,
+            detail=f"Runtime response error: {exc.response.status_code}",
+        )
+    return HTTPException(status_code=502, detail="Runtime response is not valid JSON")
+
+
 METRIC_OPERATORS = {">", "<", ">=", "<=", "=="}
 
 
 def _evaluate_metric_trigger(
     trigger_spec: Dict[str, Any],
     payload: Dict[str, Any] | None,
+    runtime_payload: Dict[str, Any] | None = None,
 ) -> Tuple[bool, Dict[str, Any]]:
-    """Evaluate metric trigger."""
+    """Evaluate metric trigger.
+
+    ``runtime_payload`` is a runtime response already fetched by the caller
+    (the metric poll loop); without it the runtime endpoint is called here.
+    """
     spec = trigger_spec
     references: Dict[str, Any] = {"trigger_spec": spec}
     source = spec.get("source", "runtime")
@@ -127,7 +156,10 @@ def _evaluate_metric_trigger(
         }
     )
 
-    if payload is None:
+    if payload is None and runtime_payload is not None:
+        extracted_value = get_path_value(runtime_payload, value_path)
+        references["runtime_prefetched"] = True
+    elif payload is None:
         _, extracted_value = fetch_runtime_value(spec)
     else:
         extracted_value = get_path_value(payload, value_path)
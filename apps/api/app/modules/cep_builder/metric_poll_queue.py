@@ -0,0 +1,184 @@
+"""Due-time priority queue for CEP metric polling.
+
+Replaces the "reload every metric rule and check each one" tick with a heap
+keyed by next due time: a tick pops only the rules that are due and
+reschedules them. The rule set is maintained incrementally (``upsert`` /
+``remove`` from rule change events, ``sync`` for periodic reconciliation),
+and rescheduling adds jitter so rules created together do not keep firing in
+the same tick.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from .models import TbCepRule
+
+
+def rule_poll_interval(rule: TbCepRule, default_seconds: float) -> float:
+    """
+    Polling interval for a rule.
+
+    ``poll_interval_seconds`` can only slow a rule down: the global interval
+    is the floor, as it was when every rule was checked once per global tick.
+    """
+    spec = rule.trigger_spec or {}
+    try:
+        interval = float(spec.get("poll_interval_seconds") or 0)
+    except (TypeError, ValueError):
+        interval = 0.0
+    return max(interval, default_seconds, 1.0)
+
+
+@dataclass
+class _Scheduled:
+    rule: TbCepRule
+    interval: float
+    due_at: float
+    version: int
+
+
+class MetricPollQueue:
+    """
+    Min-heap of metric rules by next due time.
+
+    Heap entries are ``(due_at, seq, rule_id, version)``; updates and removals
+    bump the rule's version and stale heap entries are skipped when popped.
+    """
+
+    def __init__(
+        self,
+        default_interval_seconds: float,
+        jitter_ratio: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ):
+        self.default_interval_seconds = default_interval_seconds
+        self.jitter_ratio = max(0.0, min(jitter_ratio, 1.0))
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._rules: Dict[str, _Scheduled] = {}
+        self._seq = 0
+        self._version = 0
+        self.last_tick_lag_seconds = 0.0
+        self.last_tick_due_count = 0
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __contains__(self, rule_id: object) -> bool:
+        return str(rule_id) in self._rules
+
+    def upsert(self, rule: TbCepRule) -> None:
+        """Add or refresh a rule; inactive or non-metric rules are removed."""
+        rule_id = str(rule.rule_id)
+        if not rule.is_active or rule.trigger_type != "metric":
+            self.remove(rule_id)
+            return
+        interval = rule_poll_interval(rule, self.default_interval_seconds)
+        current = self._rules.get(rule_id)
+        if current is not None and current.interval == interval:
+            # Same cadence: keep the slot, pick up the new spec on next run
+            current.rule = rule
+            return
+        now = self._clock()
+        if current is None:
+            # Spread first polls over the jitter window instead of one burst
+            due_at = now + self._rng.uniform(0, interval * self.jitter_ratio)
+        else:
+            due_at = min(current.due_at, now + interval)
+        self._schedule(rule, interval, due_at)
+
+    def remove(self, rule_id: str) -> None:
+        # Heap entry becomes stale and is dropped when it surfaces
+        self._rules.pop(str(rule_id), None)
+
+    def sync(self, rules: Iterable[TbCepRule]) -> None:
+        """Reconcile with the full rule set (drops rules that no longer exist)."""
+        seen = set()
+        for rule in rules:
+            seen.add(str(rule.rule_id))
+            self.upsert(rule)
+        for rule_id in [rid for rid in self._rules if rid not in seen]:
+            self.remove(rule_id)
+
+    def pop_due(self, limit: int | None = None) -> List[TbCepRule]:
+        """
+        Pop up to ``limit`` due rules and reschedule each one interval later.
+
+        Records the worst lag (how late the oldest popped rule was) and leaves
+        anything beyond ``limit`` due for the next tick (see ``backlog``).
+        """
+        now = self._clock()
+        due: List[TbCepRule] = []
+        lag = 0.0
+        while self._heap and self._heap[0][0] <= now:
+            if limit is not None and len(due) >= limit:
+                break
+            due_at, _, rule_id, version = heapq.heappop(self._heap)
+            scheduled = self._rules.get(rule_id)
+            if scheduled is None or scheduled.version != version:
+                continue
+            lag = max(lag, now - due_at)
+            due.append(scheduled.rule)
+            next_due = due_at + scheduled.interval
+            if next_due <= now:
+                # Fell behind by more than an interval: skip missed runs
+                next_due = now + scheduled.interval
+            self._schedule(scheduled.rule, scheduled.interval, next_due + self._jitter(scheduled.interval))
+        self.last_tick_lag_seconds = lag
+        self.last_tick_due_count = len(due)
+        return due
+
+    def backlog(self) -> int:
+        """Rules already due but not yet dispatched."""
+        now = self._clock()
+        return sum(
+            1
+            for due_at, _, rule_id, version in self._heap
+            if due_at <= now and self._is_current(rule_id, version)
+        )
+
+    def next_due_in(self) -> float | None:
+        """Seconds until the next live entry is due (None if empty)."""
+        while self._heap and not self._is_current(self._heap[0][2], self._heap[0][3]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(self._heap[0][0] - self._clock(), 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        next_due = self.next_due_in()
+        return {
+            "metric_poll_queue_size": len(self._rules),
+            "metric_poll_backlog": self.backlog(),
+            "metric_poll_last_tick_lag_ms": int(self.last_tick_lag_seconds * 1000),
+            "metric_poll_next_due_in_ms": int(next_due * 1000) if next_due is not None else None,
+        }
+
+    def _schedule(self, rule: TbCepRule, interval: float, due_at: float) -> None:
+        self._version += 1
+        self._seq += 1
+        rule_id = str(rule.rule_id)
+        self._rules[rule_id] = _Scheduled(rule, interval, due_at, self._version)
+        heapq.heappush(self._heap, (due_at, self._seq, rule_id, self._version))
+        # Compact when stale entries dominate (many updates/removals)
+        if len(self._heap) > 2 * len(self._rules) + 64:
+            self._heap = [
+                (s.due_at, i, rid, s.version)
+                for i, (rid, s) in enumerate(self._rules.items())
+            ]
+            heapq.heapify(self._heap)
+
+    def _is_current(self, rule_id: str, version: int) -> bool:
+        scheduled = self._rules.get(rule_id)
+        return scheduled is not None and scheduled.version == version
+
+    def _jitter(self, interval: float) -> float:
+        spread = interval * self.jitter_ratio / 2
+        return self._rng.uniform(-spread, spread) if spread else 0.0
@@ -4,17 +4,19 @@ Simple webhook notification engine for metric polling.
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import socket
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple
 from urllib.parse import urlparse
 
 import httpx
 from core.config import get_settings
 from core.db import get_session_context
-from sqlalchemy import desc, func, select
+from sqlalchemy import and_, func, select
 
 from .crud import (
     get_rule,
@@ -126,45 +128,112 @@ def _serialize_snapshots(snapshots: List[Dict[str, Any]]) -> List[Dict[str, Any]
     return safe
 
 
+@dataclass
+class _Delivery:
+    """One matched notification for this tick and its outcome."""
+
+    notification: TbCepNotification
+    trigger: Dict[str, Any]
+    snapshots: List[Dict[str, Any]]
+    dedup_key: str
+    status: str | None = None
+    reason: str | None = None
+    response_status: int | None = None
+    response_body: str | None = None
+
+
 def run_once() -> None:
+    """
+    Evaluate every active notification in one batch.
+
+    Snapshots are loaded once per distinct ``window_minutes``, cooldown and
+    rate-limit state comes from a single grouped log query, and webhooks are
+    sent concurrently (``cep_notification_send_concurrency``).
+    """
     settings = get_settings()
     if not settings.cep_enable_notifications:
         return
     now = datetime.utcnow()
     with get_session_context() as session:
         notifications = list_notifications(session)
-        for notification in notifications:
-            _evaluate_notification(session, notification, now)
+        deliveries = _evaluate_notifications(session, notifications, now)
+        if not deliveries:
+            return
+        pending = [delivery for delivery in deliveries if delivery.status is None]
+        if pending:
+            concurrency = max(1, settings.cep_notification_send_concurrency)
+            asyncio.run(_send_webhooks(pending, concurrency))
+        _record_deliveries(session, deliveries)
+
+
+def _evaluate_notifications(
+    session, notifications: List[TbCepNotification], now: datetime
+) -> List[_Delivery]:
+    snapshots_by_window: Dict[int, List[Dict[str, Any]]] = {}
+
+    def snapshots_for(window_minutes: int) -> List[Dict[str, Any]]:
+        if window_minutes not in snapshots_by_window:
+            snapshots_by_window[window_minutes] = [
+                snapshot.model_dump()
+                for snapshot in list_metric_poll_snapshots(
+                    session, limit=MAX_SNAPSHOTS, since_minutes=window_minutes
+                )
+            ]
+        return snapshots_by_window[window_minutes]
+
+    deliveries = [
+        delivery
+        for notification in notifications
+        if (delivery := _evaluate_notification(notification, snapshots_for))
+    ]
+    if not deliveries:
+        return []
+    policies = [
+        _delivery_policy(delivery.notification) for delivery in deliveries
+    ]
+    lookback = max([3600] + [cooldown for cooldown, _ in policies])
+    last_fired, sent_last_hour = _load_delivery_state(
+        session,
+        [delivery.notification.notification_id for delivery in deliveries],
+        now,
+        lookback,
+    )
+    for delivery, (cooldown, max_per_hour) in zip(deliveries, policies):
+        notification_id = delivery.notification.notification_id
+        fired_at = last_fired.get((notification_id, delivery.dedup_key))
+        if cooldown > 0 and fired_at and fired_at >= now - timedelta(seconds=cooldown):
+            delivery.status = "skipped"
+            delivery.reason = f"cooldown {cooldown}s"
+        elif max_per_hour > 0 and sent_last_hour.get(notification_id, 0) >= max_per_hour:
+            delivery.status = "skipped"
+            delivery.reason = f"rate limit ({max_per_hour}/h)"
+    return deliveries
 
 
 def _evaluate_notification(
-    session, notification: TbCepNotification, now: datetime
-) -> None:
+    notification: TbCepNotification,
+    snapshots_for: Callable[[int], List[Dict[str, Any]]],
+) -> _Delivery | None:
     if notification.channel != "webhook":
-        return
+        return None
     trigger = notification.trigger or {}
     if trigger.get("type") != "snapshot_threshold":
-        return
+        return None
     window_minutes = int(trigger.get("window_minutes") or 5)
-    snapshot_models = list_metric_poll_snapshots(
-        session, limit=MAX_SNAPSHOTS, since_minutes=window_minutes
-    )
-    if not snapshot_models:
-        return
-    snapshots = [snapshot.model_dump() for snapshot in snapshot_models]
+    snapshots = snapshots_for(window_minutes)
     if not snapshots:
-        return
+        return None
     field = trigger.get("field")
     op = trigger.get("op", ">=")
     threshold_raw = trigger.get("value")
     try:
         threshold = float(threshold_raw)
     except (TypeError, ValueError):
-        return
+        return None
     if not any(
         _value_satisfies(snapshot.get(field), op, threshold) for snapshot in snapshots
     ):
-        return
+        return None
     dedup_key = ":".join(
         [
             str(notification.notification_id),
@@ -174,98 +243,135 @@ def _evaluate_notification(
             str(threshold),
         ]
     )
+    return _Delivery(notification, trigger, snapshots, dedup_key)
+
+
+def _delivery_policy(notification: TbCepNotification) -> Tuple[int, int]:
     policy = notification.policy or {}
     cooldown = int(policy.get("cooldown_seconds") or 300)
     max_per_hour = int(policy.get("max_per_hour") or 20)
-    reason = None
-    if _is_within_cooldown(
-        session, notification.notification_id, dedup_key, now, cooldown
-    ):
-        reason = f"cooldown {cooldown}s"
-        _log_notification(
-            session, notification, "skipped", reason, dedup_key, trigger, snapshots
-        )
-        return
-    if _exceeds_rate_limit(session, notification.notification_id, now, max_per_hour):
-        reason = f"rate limit ({max_per_hour}/h)"
-        _log_notification(
-            session, notification, "skipped", reason, dedup_key, trigger, snapshots
-        )
-        return
-    payload = _build_payload(notification, trigger, _serialize_snapshots(snapshots))
-    headers = notification.headers or {}
-    try:
-        _ensure_webhook_allowed(notification.webhook_url)
-        response = _send_webhook(notification.webhook_url, headers, payload)
-        _log_notification(
-            session,
-            notification,
-            "sent",
-            "webhook sent",
-            dedup_key,
-            trigger,
-            snapshots,
-            response.status_code,
-            response.text[:MAX_RESPONSE_BODY],
-        )
-    except Exception as exc:
-        _log_notification(
-            session,
-            notification,
-            "fail",
-            str(exc),
-            dedup_key,
-            trigger,
-            snapshots,
-        )
+    return cooldown, max_per_hour
 
 
-def _is_within_cooldown(
+def _load_delivery_state(
     session,
-    notification_id: uuid.UUID,
-    dedup_key: str,
+    notification_ids: List[uuid.UUID],
     now: datetime,
-    cooldown_seconds: int,
-) -> bool:
-    if cooldown_seconds <= 0:
-        return False
-    cutoff = now - timedelta(seconds=cooldown_seconds)
+    lookback_seconds: int,
+) -> Tuple[Dict[Tuple[uuid.UUID, str], datetime], Dict[uuid.UUID, int]]:
+    """
+    Cooldown and rate-limit state for all notifications in one grouped query.
+
+    Returns the last fire time per (notification, dedup_key), over any status
+    as the per-notification cooldown check always did, and the number of
+    ``sent`` logs in the last hour per notification.
+    """
+    hour_ago = now - timedelta(hours=1)
     query = (
-        select(TbCepNotificationLog)
-        .where(TbCepNotificationLog.notification_id == notification_id)
-        .where(TbCepNotificationLog.dedup_key == dedup_key)
-        .where(TbCepNotificationLog.fired_at >= cutoff)
-        .order_by(desc(TbCepNotificationLog.fired_at))
-        .limit(1)
+        select(
+            TbCepNotificationLog.notification_id,
+            TbCepNotificationLog.dedup_key,
+            func.max(TbCepNotificationLog.fired_at),
+            func.count().filter(
+                and_(
+                    TbCepNotificationLog.status == "sent",
+                    TbCepNotificationLog.fired_at >= hour_ago,
+                )
+            ),
+        )
+        .where(TbCepNotificationLog.notification_id.in_(notification_ids))
+        .where(
+            TbCepNotificationLog.fired_at >= now - timedelta(seconds=lookback_seconds)
+        )
+        .group_by(TbCepNotificationLog.notification_id, TbCepNotificationLog.dedup_key)
     )
-    recent = session.exec(query).first()
-    return recent is not None
+    last_fired: Dict[Tuple[uuid.UUID, str], datetime] = {}
+    sent_last_hour: Dict[uuid.UUID, int] = {}
+    for notification_id, dedup_key, fired_at, sent_count in session.exec(query).all():
+        last_fired[(notification_id, dedup_key)] = _naive_utc(fired_at)
+        sent_last_hour[notification_id] = (
+            sent_last_hour.get(notification_id, 0) + (sent_count or 0)
+        )
+    return last_fired, sent_last_hour
 
 
-def _exceeds_rate_limit(
-    session, notification_id: uuid.UUID, now: datetime, max_per_hour: int
-) -> bool:
-    if max_per_hour <= 0:
-        return False
-    cutoff = now - timedelta(hours=1)
-    count_query = (
-        select(func.count())
-        .where(TbCepNotificationLog.notification_id == notification_id)
-        .where(TbCepNotificationLog.status == "sent")
-        .where(TbCepNotificationLog.fired_at >= cutoff)
-    )
-    count = session.exec(count_query).scalar_one_or_none() or 0
-    return count >= max_per_hour
+def _naive_utc(value: datetime) -> datetime:
+    # fired_at is timestamptz; compare against datetime.utcnow()
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
 
-def _send_webhook(
-    url: str, headers: dict[str, Any], payload: dict[str, Any]
+async def _send_webhooks(
+    deliveries: List[_Delivery],
+    concurrency: int,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=transport) as client:
+
+        async def deliver(delivery: _Delivery) -> None:
+            notification = delivery.notification
+            payload = _build_payload(
+                notification, delivery.trigger, _serialize_snapshots(delivery.snapshots)
+            )
+            async with semaphore:
+                try:
+                    # DNS lookup blocks; keep it off the loop
+                    await asyncio.to_thread(
+                        _ensure_webhook_allowed, notification.webhook_url
+                    )
+                    response = await _send_webhook(
+                        client, notification.webhook_url, notification.headers, payload
+                    )
+                except Exception as exc:
+                    delivery.status = "fail"
+                    delivery.reason = str(exc)
+                    return
+            delivery.status = "sent"
+            delivery.reason = "webhook sent"
+            delivery.response_status = response.status_code
+            delivery.response_body = response.text[:MAX_RESPONSE_BODY]
+
+        await asyncio.gather(*(deliver(delivery) for delivery in deliveries))
+
+
+async def _send_webhook(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, Any] | None,
+    payload: dict[str, Any],
 ) -> httpx.Response:
     headers_clean = {str(key): str(value) for key, value in (headers or {}).items()}
-    with httpx.Client(timeout=HTTP_TIMEOUT) as client:
-        response = client.post(url, headers=headers_clean, json=payload)
-        response.raise_for_status()
-        return response
+    response = await client.post(url, headers=headers_clean, json=payload)
+    response.raise_for_status()
+    return response
+
+
+def _record_deliveries(session, deliveries: List[_Delivery]) -> None:
+    rule_names: Dict[str, str | None] = {}
+    for delivery in deliveries:
+        _log_notification(
+            session,
+            delivery.notification,
+            delivery.status or "fail",
+            delivery.reason or "",
+            delivery.dedup_key,
+            delivery.trigger,
+            delivery.snapshots,
+            delivery.response_status,
+            delivery.response_body,
+            rule_names=rule_names,
+        )
+    # One summary for the whole batch instead of one per log
+    summary = summarize_events(session)
+    event_broadcaster.publish(
+        "summary",
+        {
+            "unacked_count": summary["unacked_count"],
+            "by_severity": summary["by_severity"],
+        },
+    )
 
 
 def _log_notification(
@@ -278,6 +384,8 @@ def _log_notification(
     snapshots: List[Dict[str, Any]],
     response_status: int | None = None,
     response_body: str | None = None,
+    *,
+    rule_names: Dict[str, str | None],
 ) -> None:
     payload = {
         "notification": {
@@ -297,10 +405,14 @@ def _log_notification(
         "dedup_key": dedup_key,
     }
     saved = insert_notification_log(session, log_payload)
-    summary = summarize_events(session)
-    rule = (
-        get_rule(session, str(notification.rule_id)) if notification.rule_id else None
-    )
+    rule_name = None
+    if notification.rule_id:
+        # Rule names are cached per batch
+        rule_key = str(notification.rule_id)
+        if rule_key not in rule_names:
+            rule = get_rule(session, rule_key)
+            rule_names[rule_key] = rule.rule_name if rule else None
+        rule_name = rule_names[rule_key]
     event_broadcaster.publish(
         "new_event",
         {
@@ -312,14 +424,7 @@ def _log_notification(
             "ack": saved.ack,
             "ack_at": saved.ack_at.isoformat() if saved.ack_at else None,
             "rule_id": str(notification.rule_id) if notification.rule_id else None,
-            "rule_name": rule.rule_name if rule else None,
+            "rule_name": rule_name,
             "notification_id": str(notification.notification_id),
         },
     )
-    event_broadcaster.publish(
-        "summary",
-        {
-            "unacked_count": summary["unacked_count"],
-            "by_severity": summary["by_severity"],
-        },
-    )
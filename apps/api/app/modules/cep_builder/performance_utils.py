@@ -11,6 +11,8 @@ from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 
+from core.metrics import CEP_OPERATION_DURATION
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +36,11 @@ class PerformanceMetrics:
 
         self.metrics[metric_name].append(entry)
 
+        operation = metric_name
+        if metadata and metric_name == "query" and metadata.get("query"):
+            operation = f"query:{metadata['query']}"
+        CEP_OPERATION_DURATION.labels(operation).observe(value / 1000)
+
     def get_stats(self, metric_name: str) -> Dict[str, float]:
         """Get statistics for a metric"""
         if metric_name not in self.metrics or not self.metrics[metric_name]:
@@ -31,6 +31,7 @@ from ..form_converter import (
     convert_form_to_trigger_spec,
 )
 from ..models import TbCepExecLog
+from ..scheduler import notify_metric_rule_changed
 from ..schemas import (
     CepExecLogRead,
     CepRuleCreate,
@@ -204,6 +205,7 @@ def create_rule_endpoint(
 ) -> ResponseEnvelope:
     """Create a new CEP rule."""
     rule = create_rule(session, payload, tenant_id=tenant_id)
+    notify_metric_rule_changed(rule.rule_id)
 
     create_audit_log(
         session=session,
@@ -256,6 +258,7 @@ def create_rule_from_form(
 
     # Create rule
     rule = create_rule(session, rule_create, tenant_id=tenant_id)
+    notify_metric_rule_changed(rule.rule_id)
 
     create_audit_log(
         session=session,
@@ -285,6 +288,7 @@ def update_rule_endpoint(
     if not rule:
         raise HTTPException(status_code=404, detail="Rule not found")
     updated = update_rule(session, rule, payload)
+    notify_metric_rule_changed(updated.rule_id)
 
     create_audit_log(
         session=session,
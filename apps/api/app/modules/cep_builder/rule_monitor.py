@@ -5,6 +5,8 @@ import statistics
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from core.metrics import CEP_RULE_DURATION, CEP_RULE_EVENTS, CEP_RULE_EXECUTIONS
+
 logger = logging.getLogger(__name__)
 
 
@@ -130,6 +132,11 @@ class RulePerformanceMonitor:
         if rule_id in self.stats_cache:
             del self.stats_cache[rule_id]
 
+        CEP_RULE_EXECUTIONS.labels(rule_id, "success" if metric.success else "error").inc()
+        CEP_RULE_DURATION.labels(rule_id).observe(execution_time_ms / 1000)
+        CEP_RULE_EVENTS.labels(rule_id, "processed").inc(events_processed)
+        CEP_RULE_EVENTS.labels(rule_id, "matched").inc(events_matched)
+
         logger.debug(
             f"Recorded execution for rule {rule_id}: "
             f"{execution_time_ms}ms, {events_processed} events, {events_matched} matches"
@@ -4,6 +4,8 @@ import asyncio
 import logging
 import os
 import socket
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
@@ -16,8 +18,14 @@ from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
 from . import notification_engine
-from .crud import insert_metric_poll_snapshot, list_rules
-from .executor import manual_trigger
+from .crud import insert_metric_poll_snapshot, list_rules, list_rules_updated_since
+from .executor import fetch_runtime_value_async, manual_trigger
+from .executor.metric_client import (
+    MetricPollTick,
+    close_runtime_metric_client,
+    get_runtime_metric_client,
+)
+from .metric_poll_queue import MetricPollQueue
 from .models import TbCepRule
 
 logger = logging.getLogger(__name__)
@@ -27,7 +35,16 @@ _follower_task: asyncio.Task | None = None
 _metric_poll_task: asyncio.Task | None = None
 _metric_poll_semaphore: asyncio.Semaphore | None = None
 _notification_task: asyncio.Task | None = None
-_metric_last_polled: dict[str, datetime] = {}
+_metric_poll_queue: MetricPollQueue | None = None
+_metric_rule_watermark: datetime | None = None
+_metric_rule_last_refresh: float = 0.0
+_metric_rule_last_full_sync: float = 0.0
+_metric_rule_changes: set[str] = set()
+_metric_rule_changes_lock = threading.Lock()
+# Re-read rules updated slightly before the watermark: a transaction's now()
+# can precede its commit, so a late commit would otherwise be missed.
+METRIC_RULE_WATERMARK_OVERLAP = timedelta(seconds=30)
+MIN_METRIC_POLL_SLEEP = 0.1
 _metric_telemetry: dict[str, Any] = {
     "metric_polling_enabled": False,
     "metric_poll_last_tick_at": None,
@@ -37,6 +54,11 @@ _metric_telemetry: dict[str, Any] = {
     "metric_poll_last_tick_matched_count": 0,
     "metric_poll_last_tick_skipped_count": 0,
     "metric_poll_last_tick_fail_count": 0,
+    "metric_poll_last_tick_http_request_count": 0,
+    "metric_poll_last_tick_coalesced_count": 0,
+    "metric_poll_last_tick_lag_ms": 0,
+    "metric_poll_backlog": 0,
+    "metric_poll_queue_size": 0,
     "metric_poll_last_error": None,
     "metric_poll_recent_matches": [],
     "metric_poll_recent_failures": [],
@@ -292,9 +314,103 @@ async def _stop_metric_poll_loop() -> None:
             pass
     _metric_poll_task = None
     _metric_poll_semaphore = None
-
-
-async def _run_metric_rule(rule: TbCepRule) -> dict[str, Any]:
+    _reset_metric_poll_queue()
+    await close_runtime_metric_client()
+
+
+def notify_metric_rule_changed(rule_id: Any) -> None:
+    """
+    Mark a rule as created/updated/deleted so the next poll tick reloads it.
+
+    Safe to call from request threads; the poll loop reads the rule back from
+    the DB. Changes made by other instances are picked up via ``updated_at``.
+    """
+    with _metric_rule_changes_lock:
+        _metric_rule_changes.add(str(rule_id))
+
+
+def _reset_metric_poll_queue() -> None:
+    global _metric_poll_queue, _metric_rule_watermark
+    global _metric_rule_last_refresh, _metric_rule_last_full_sync
+    _metric_poll_queue = None
+    _metric_rule_watermark = None
+    _metric_rule_last_refresh = 0.0
+    _metric_rule_last_full_sync = 0.0
+
+
+def _refresh_metric_poll_queue(settings: Any) -> MetricPollQueue:
+    """
+    Keep the due-time queue in sync with the rule table.
+
+    Full reload on first use and every ``cep_metric_rule_full_sync_seconds``
+    (catches deletions); otherwise only rules changed since the last refresh
+    or flagged by ``notify_metric_rule_changed`` are read.
+    """
+    global _metric_poll_queue, _metric_rule_watermark
+    global _metric_rule_last_refresh, _metric_rule_last_full_sync
+    interval = max(settings.cep_metric_poll_global_interval_seconds, 1)
+    queue = _metric_poll_queue
+    if queue is None:
+        queue = MetricPollQueue(
+            interval, jitter_ratio=settings.cep_metric_poll_jitter_ratio
+        )
+    queue.default_interval_seconds = interval
+    with _metric_rule_changes_lock:
+        changed = list(_metric_rule_changes)
+        _metric_rule_changes.clear()
+    now = time.monotonic()
+    full_sync = (
+        _metric_poll_queue is None
+        or _metric_rule_watermark is None
+        or now - _metric_rule_last_full_sync
+        >= max(settings.cep_metric_rule_full_sync_seconds, interval)
+    )
+    if not full_sync and not changed and now - _metric_rule_last_refresh < interval:
+        return queue
+    started_at = datetime.now(timezone.utc)
+    try:
+        with get_session_context() as session:
+            if full_sync:
+                rules = list_rules(session, trigger_type="metric")
+            else:
+                since = _metric_rule_watermark - METRIC_RULE_WATERMARK_OVERLAP
+                rules = list_rules_updated_since(session, since, rule_ids=changed)
+    except Exception:
+        # Retry the flagged rules on the next tick
+        with _metric_rule_changes_lock:
+            _metric_rule_changes.update(changed)
+        raise
+    if full_sync:
+        queue.sync(rules)
+        _metric_rule_last_full_sync = now
+        _metric_rule_watermark = started_at
+    else:
+        fetched = {str(rule.rule_id) for rule in rules}
+        for rule in rules:
+            queue.upsert(rule)
+        # Flagged but no longer in the table: deleted
+        for rule_id in changed:
+            if rule_id not in fetched:
+                queue.remove(rule_id)
+        for rule in rules:
+            if rule.updated_at and rule.updated_at > _metric_rule_watermark:
+                _metric_rule_watermark = rule.updated_at
+    _metric_rule_last_refresh = now
+    _metric_poll_queue = queue
+    return queue
+
+
+def _metric_poll_sleep(queue: MetricPollQueue, interval: float) -> float:
+    """Sleep until the next rule is due, capped at the global interval."""
+    next_due = queue.next_due_in()
+    if next_due is None:
+        return interval
+    return min(max(next_due, MIN_METRIC_POLL_SLEEP), interval)
+
+
+async def _run_metric_rule(
+    rule: TbCepRule, tick: MetricPollTick | None = None
+) -> dict[str, Any]:
     sem = _metric_poll_semaphore
     timestamp = datetime.utcnow()
     result: dict[str, Any] = {
@@ -310,30 +426,40 @@ async def _run_metric_rule(rule: TbCepRule) -> dict[str, Any]:
     }
     if sem is None:
         return result
-    async with sem:
-        try:
+    try:
+        # Runtime fetch happens on the loop (shared client, coalesced per tick);
+        # only the lock/exec-log work goes to a thread.
+        runtime_payload = None
+        spec = rule.trigger_spec or {}
+        if spec.get("source", "runtime") == "runtime":
+            runtime_payload, _ = await fetch_runtime_value_async(spec, tick)
+        async with sem:
             execution = await asyncio.to_thread(
-                manual_trigger, rule, None, "cep-metric-poll"
-            )
-            trigger_refs = (execution.get("references") or {}).get("trigger") or {}
-            result["status"] = execution.get("status", "unknown")
-            result["matched"] = bool(execution.get("condition_met"))
-            result["actual_value"] = trigger_refs.get("actual_value")
-            result["threshold"] = trigger_refs.get("threshold")
-            result["op"] = trigger_refs.get("op")
-            return result
-        except HTTPException as exc:
-            logger.warning("Metric rule %s failed: %s", rule.rule_id, exc.detail)
-            result["status"] = "fail"
-            result["error"] = str(exc.detail) if exc.detail is not None else str(exc)
-            return result
-        except Exception as exc:
-            logger.exception(
-                "Metric rule %s encountered an unexpected error", rule.rule_id
+                manual_trigger,
+                rule,
+                None,
+                "cep-metric-poll",
+                runtime_payload=runtime_payload,
             )
-            result["status"] = "fail"
-            result["error"] = str(exc)
-            return result
+        trigger_refs = (execution.get("references") or {}).get("trigger") or {}
+        result["status"] = execution.get("status", "unknown")
+        result["matched"] = bool(execution.get("condition_met"))
+        result["actual_value"] = trigger_refs.get("actual_value")
+        result["threshold"] = trigger_refs.get("threshold")
+        result["op"] = trigger_refs.get("op")
+        return result
+    except HTTPException as exc:
+        logger.warning("Metric rule %s failed: %s", rule.rule_id, exc.detail)
+        result["status"] = "fail"
+        result["error"] = str(exc.detail) if exc.detail is not None else str(exc)
+        return result
+    except Exception as exc:
+        logger.exception(
+            "Metric rule %s encountered an unexpected error", rule.rule_id
+        )
+        result["status"] = "fail"
+        result["error"] = str(exc)
+        return result
 
 
 async def _metric_poll_loop() -> None:
@@ -341,6 +467,7 @@ async def _metric_poll_loop() -> None:
     while True:
         settings = get_settings()
         interval = max(settings.cep_metric_poll_global_interval_seconds, 1)
+        sleep_for: float = interval
         tick_start = datetime.utcnow()
         _metric_telemetry["metric_polling_enabled"] = settings.cep_enable_metric_polling
         try:
@@ -352,36 +479,39 @@ async def _metric_poll_loop() -> None:
                 _metric_telemetry["metric_poll_last_tick_matched_count"] = 0
                 _metric_telemetry["metric_poll_last_tick_skipped_count"] = 0
                 _metric_telemetry["metric_poll_last_tick_fail_count"] = 0
+                _metric_telemetry["metric_poll_last_tick_http_request_count"] = 0
+                _metric_telemetry["metric_poll_last_tick_coalesced_count"] = 0
+                _metric_telemetry["metric_poll_last_tick_lag_ms"] = 0
+                _metric_telemetry["metric_poll_backlog"] = 0
+                _metric_telemetry["metric_poll_queue_size"] = 0
                 _metric_telemetry["metric_poll_last_error"] = None
+                # Rebuilt from a full sync if this instance becomes leader again
+                _reset_metric_poll_queue()
                 continue
-            now = datetime.utcnow()
-            rules: list[TbCepRule] = []
-            with get_session_context() as session:
-                rules = list_rules(session, trigger_type="metric")
-            tasks: list[asyncio.Task] = []
-            rule_count = 0
-            for rule in rules:
-                if not rule.is_active:
-                    continue
-                spec = rule.trigger_spec or {}
-                poll_interval = spec.get("poll_interval_seconds")
-                try:
-                    poll_secs = (
-                        float(poll_interval) if poll_interval is not None else 0.0
-                    )
-                except (TypeError, ValueError):
-                    poll_secs = 0.0
-                last_polled = _metric_last_polled.get(str(rule.rule_id))
-                if last_polled and (now - last_polled).total_seconds() < poll_secs:
-                    continue
-                _metric_last_polled[str(rule.rule_id)] = now
-                rule_count += 1
-                tasks.append(asyncio.create_task(_run_metric_rule(rule)))
+            queue = _refresh_metric_poll_queue(settings)
+            rules = queue.pop_due(
+                limit=max(1, settings.cep_metric_poll_max_rules_per_tick)
+            )
+            _metric_telemetry["metric_poll_queue_size"] = len(queue)
+            if not rules:
+                # Nothing due: keep the last tick's telemetry
+                sleep_for = _metric_poll_sleep(queue, interval)
+                continue
+            tick = get_runtime_metric_client().tick()
+            tasks = [
+                asyncio.create_task(_run_metric_rule(rule, tick)) for rule in rules
+            ]
+            rule_count = len(rules)
+            _metric_telemetry["metric_poll_last_tick_lag_ms"] = int(
+                queue.last_tick_lag_seconds * 1000
+            )
             _metric_telemetry["metric_poll_last_tick_rule_count"] = rule_count
             _metric_telemetry["metric_poll_last_tick_evaluated_count"] = 0
             _metric_telemetry["metric_poll_last_tick_matched_count"] = 0
             _metric_telemetry["metric_poll_last_tick_skipped_count"] = 0
             _metric_telemetry["metric_poll_last_tick_fail_count"] = 0
+            _metric_telemetry["metric_poll_last_tick_http_request_count"] = 0
+            _metric_telemetry["metric_poll_last_tick_coalesced_count"] = 0
             _metric_telemetry["metric_poll_last_error"] = None
             _metric_telemetry["metric_poll_recent_matches"] = _metric_telemetry[
                 "metric_poll_recent_matches"
@@ -427,12 +557,20 @@ async def _metric_poll_loop() -> None:
                 _metric_telemetry["metric_poll_last_tick_skipped_count"] = skipped
                 _metric_telemetry["metric_poll_last_tick_fail_count"] = len(failures)
                 _metric_telemetry["metric_poll_last_error"] = last_error
+                _metric_telemetry["metric_poll_last_tick_http_request_count"] = (
+                    tick.request_count
+                )
+                _metric_telemetry["metric_poll_last_tick_coalesced_count"] = (
+                    tick.coalesced
+                )
                 _metric_telemetry["metric_poll_recent_matches"] = (
                     matches + _metric_telemetry["metric_poll_recent_matches"]
                 )[:20]
                 _metric_telemetry["metric_poll_recent_failures"] = (
                     failures + _metric_telemetry["metric_poll_recent_failures"]
                 )[:20]
+            _metric_telemetry["metric_poll_backlog"] = queue.backlog()
+            sleep_for = _metric_poll_sleep(queue, interval)
             tick_end = datetime.utcnow()
             _metric_telemetry["metric_poll_last_tick_at"] = tick_end
             _metric_telemetry["metric_poll_last_tick_duration_ms"] = int(
@@ -443,7 +581,7 @@ async def _metric_poll_loop() -> None:
             logger.exception("Metric polling loop failure")
             _metric_telemetry["metric_poll_last_error"] = "Metric polling loop failure"
         finally:
-            await asyncio.sleep(interval)
+            await asyncio.sleep(sleep_for)
 
 
 async def _notification_loop() -> None:
@@ -527,6 +665,15 @@ def get_metric_poll_stats() -> dict[str, Any]:
         "metric_poll_last_tick_fail_count": telemetry[
             "metric_poll_last_tick_fail_count"
         ],
+        "metric_poll_last_tick_http_request_count": telemetry[
+            "metric_poll_last_tick_http_request_count"
+        ],
+        "metric_poll_last_tick_coalesced_count": telemetry[
+            "metric_poll_last_tick_coalesced_count"
+        ],
+        "metric_poll_last_tick_lag_ms": telemetry["metric_poll_last_tick_lag_ms"],
+        "metric_poll_backlog": telemetry["metric_poll_backlog"],
+        "metric_poll_queue_size": telemetry["metric_poll_queue_size"],
         "metric_poll_last_error": telemetry["metric_poll_last_error"],
     }
 
@@ -0,0 +1,379 @@
+"""Bounded-state windowed aggregation for the Bytewax CEP engine
+
+Aggregates are incremental (count/sum/min/max/avg in O(1), percentiles via the
+shared ``LatencySketch`` DDSketch), so a window holds a fixed-size summary
+instead of its events. Windows are keyed by event time, closed by a watermark
+(max event time minus ``watermark_delay_seconds``) once ``allowed_lateness_seconds``
+has passed, and evicted as soon as they emit.
+"""
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.latency_sketch import LatencySketch
+
+PERCENTILE_PATTERN = re.compile(r"^p(\d{1,2}(?:\.\d+)?)$")
+DEFAULT_MAX_WINDOWS = 10000
+
+
+def percentile_of(agg_type: Optional[str]) -> Optional[float]:
+    """Quantile (0-1) for aggregation types like "p95", else None"""
+    match = PERCENTILE_PATTERN.match(str(agg_type or "").lower())
+    return float(match.group(1)) / 100 if match else None
+
+
+def event_time(event: dict, field: str = "timestamp") -> float:
+    """Event time as epoch seconds (naive datetimes are UTC); now if missing"""
+    value = event.get(field)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            value = None
+    if not isinstance(value, datetime):
+        value = datetime.now(timezone.utc)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _iso(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()
+
+
+class RunningAggregate:
+    """O(1) count/sum/min/max/avg with an optional quantile sketch"""
+
+    __slots__ = ("count", "value_count", "sum", "min", "max", "sketch")
+
+    def __init__(self, track_quantiles: bool = False):
+        self.count = 0
+        self.value_count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = LatencySketch() if track_quantiles else None
+
+    def add(self, value: Optional[float]) -> None:
+        """Count an event; ``value`` (if numeric) feeds the value aggregates"""
+        self.count += 1
+        if value is None:
+            return
+        self.value_count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if self.sketch is not None:
+            self.sketch.add(value)
+
+    def merge(self, other: "RunningAggregate") -> None:
+        self.count += other.count
+        self.value_count += other.value_count
+        self.sum += other.sum
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    def result(self, agg_type: str) -> Optional[float]:
+        agg_type = (agg_type or "count").lower()
+        if agg_type == "count":
+            return self.count
+        if agg_type == "sum":
+            return self.sum
+        if agg_type == "avg":
+            return self.sum / self.value_count if self.value_count else None
+        if agg_type == "min":
+            return self.min
+        if agg_type == "max":
+            return self.max
+        q = percentile_of(agg_type)
+        if q is not None and self.sketch is not None:
+            return self.sketch.quantile(q)
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "value_count": self.value_count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "sketch": self.sketch.to_dict() if self.sketch is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunningAggregate":
+        agg = cls()
+        agg.count = int(data.get("count", 0))
+        agg.value_count = int(data.get("value_count", 0))
+        agg.sum = float(data.get("sum", 0.0))
+        agg.min = data.get("min")
+        agg.max = data.get("max")
+        if data.get("sketch"):
+            agg.sketch = LatencySketch.from_dict(data["sketch"])
+        return agg
+
+
+@dataclass
+class WindowSpec:
+    """Window configuration (``window_config`` of a CEP rule)"""
+
+    type: str = "tumbling"  # tumbling, sliding, session
+    size_seconds: float = 60.0
+    slide_seconds: Optional[float] = None
+    gap_seconds: Optional[float] = None
+    allowed_lateness_seconds: float = 0.0
+    watermark_delay_seconds: float = 0.0
+    trigger_every: int = 0  # early (non-final) result every N events; 0 = close only
+    max_windows: int = DEFAULT_MAX_WINDOWS
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> "WindowSpec":
+        config = config or {}
+        size = float(config.get("size_seconds") or 60)
+        slide = config.get("slide_seconds")
+        gap = config.get("gap_seconds")
+        return cls(
+            type=str(config.get("type") or "tumbling").lower(),
+            size_seconds=size,
+            slide_seconds=float(slide) if slide else None,
+            gap_seconds=float(gap) if gap else None,
+            allowed_lateness_seconds=float(config.get("allowed_lateness_seconds") or 0),
+            watermark_delay_seconds=float(config.get("watermark_delay_seconds") or 0),
+            trigger_every=int(config.get("trigger_every") or 0),
+            max_windows=int(config.get("max_windows") or DEFAULT_MAX_WINDOWS),
+        )
+
+
+class _Window:
+    __slots__ = ("group", "start", "end", "agg", "pending")
+
+    def __init__(self, group: Any, start: float, end: float, agg: RunningAggregate):
+        self.group = group
+        self.start = start
+        self.end = end
+        self.agg = agg
+        self.pending = 0
+
+
+WindowKey = Tuple[Any, float]
+
+
+class WindowedAggregator:
+    """
+    Event-time windows with incremental aggregates and watermark-driven close.
+
+    ``add`` returns the results that fired (early triggers and closed windows);
+    nothing is emitted for events that only update an open window.
+    """
+
+    def __init__(self, window_config: Optional[dict], aggregation_spec: Optional[dict] = None):
+        self.spec = WindowSpec.from_config(window_config)
+        aggregation_spec = aggregation_spec or {}
+        self.agg_type = str(aggregation_spec.get("type") or "count").lower()
+        self.field = aggregation_spec.get("field")
+        self.group_by = aggregation_spec.get("group_by")
+        self.track_quantiles = percentile_of(self.agg_type) is not None
+        self.watermark = float("-inf")
+        self.late_dropped = 0
+        self._windows: Dict[WindowKey, _Window] = {}
+        # Open session starts per group, so merging does not scan every window
+        self._sessions: Dict[Any, set] = {}
+        # (close_at, seq, key); stale entries (session grew / window gone) are skipped
+        self._close_heap: List[Tuple[float, int, WindowKey]] = []
+        self._seq = 0
+
+    def add(self, event: dict) -> List[dict]:
+        timestamp = event_time(event)
+        group = event.get(self.group_by, "default") if self.group_by else "default"
+        value = self._value(event)
+        fired: List[dict] = []
+        if self.spec.type == "session":
+            window = self._session_window(group, timestamp)
+            if window is not None:
+                self._update(window, value, fired)
+        else:
+            for start, end in self._assign(timestamp):
+                if end + self.spec.allowed_lateness_seconds <= self.watermark:
+                    self.late_dropped += 1
+                    continue
+                key = (group, start)
+                window = self._windows.get(key)
+                if window is None:
+                    window = _Window(group, start, end, RunningAggregate(self.track_quantiles))
+                    self._open(window)
+                self._update(window, value, fired)
+        fired.extend(self.advance_watermark(timestamp - self.spec.watermark_delay_seconds))
+        fired.extend(self._enforce_bound())
+        return fired
+
+    def advance_watermark(self, watermark: float) -> List[dict]:
+        """Move the watermark forward (never back) and emit windows it closes"""
+        if watermark > self.watermark:
+            self.watermark = watermark
+        fired: List[dict] = []
+        while self._close_heap and self._close_heap[0][0] <= self.watermark:
+            _, _, key = heapq.heappop(self._close_heap)
+            window = self._windows.get(key)
+            if window is None or self._close_at(window) > self.watermark:
+                continue
+            self._evict(key)
+            fired.append(self._result(window, final=True))
+        return fired
+
+    def flush(self) -> List[dict]:
+        """Emit and evict every open window (e.g. on rule shutdown)"""
+        fired = [self._result(w, final=True) for w in self._windows.values()]
+        self._windows.clear()
+        self._sessions.clear()
+        self._close_heap.clear()
+        return fired
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open_windows": len(self._windows),
+            "watermark": _iso(self.watermark) if math.isfinite(self.watermark) else None,
+            "late_dropped": self.late_dropped,
+        }
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """JSON-serializable state for ``restore``"""
+        return {
+            "watermark": self.watermark if math.isfinite(self.watermark) else None,
+            "late_dropped": self.late_dropped,
+            "windows": [
+                {
+                    "group": w.group,
+                    "start": w.start,
+                    "end": w.end,
+                    "pending": w.pending,
+                    "agg": w.agg.to_dict(),
+                }
+                for w in self._windows.values()
+            ],
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        watermark = state.get("watermark")
+        self.watermark = float(watermark) if watermark is not None else float("-inf")
+        self.late_dropped = int(state.get("late_dropped", 0))
+        self._windows.clear()
+        self._sessions.clear()
+        self._close_heap.clear()
+        for item in state.get("windows", []):
+            window = _Window(
+                item["group"],
+                float(item["start"]),
+                float(item["end"]),
+                RunningAggregate.from_dict(item["agg"]),
+            )
+            window.pending = int(item.get("pending", 0))
+            self._open(window)
+
+    def _value(self, event: dict) -> Optional[float]:
+        if not self.field or self.field not in event:
+            return None
+        try:
+            return float(event[self.field])
+        except (ValueError, TypeError):
+            return None
+
+    def _assign(self, timestamp: float) -> List[Tuple[float, float]]:
+        size = self.spec.size_seconds
+        if self.spec.type != "sliding":
+            start = math.floor(timestamp / size) * size
+            return [(start, start + size)]
+        slide = self.spec.slide_seconds or size
+        windows = []
+        start = math.floor(timestamp / slide) * slide
+        while start > timestamp - size:
+            windows.append((start, start + size))
+            start -= slide
+        return windows
+
+    def _session_window(self, group: Any, timestamp: float) -> Optional[_Window]:
+        gap = self.spec.gap_seconds or self.spec.size_seconds
+        if timestamp + gap + self.spec.allowed_lateness_seconds <= self.watermark:
+            self.late_dropped += 1
+            return None
+        start, end = timestamp, timestamp + gap
+        agg = RunningAggregate(self.track_quantiles)
+        pending = 0
+        # Merge every session of this group that the new event bridges
+        for session_start in list(self._sessions.get(group, ())):
+            other = self._windows[(group, session_start)]
+            if other.start > end or other.end < start:
+                continue
+            self._evict((group, session_start))
+            start, end = min(start, other.start), max(end, other.end)
+            agg.merge(other.agg)
+            pending += other.pending
+        window = _Window(group, start, end, agg)
+        window.pending = pending
+        self._open(window)
+        return window
+
+    def _update(self, window: _Window, value: Optional[float], fired: List[dict]) -> None:
+        window.agg.add(value)
+        window.pending += 1
+        if self.spec.trigger_every and window.pending >= self.spec.trigger_every:
+            window.pending = 0
+            fired.append(self._result(window, final=False))
+
+    def _enforce_bound(self) -> List[dict]:
+        # Over capacity: close the windows due soonest, ahead of the watermark
+        fired: List[dict] = []
+        while len(self._windows) > self.spec.max_windows and self._close_heap:
+            close_at, _, key = heapq.heappop(self._close_heap)
+            window = self._windows.get(key)
+            if window is None or self._close_at(window) != close_at:
+                continue
+            self._evict(key)
+            result = self._result(window, final=True)
+            result["evicted"] = True
+            fired.append(result)
+        return fired
+
+    def _open(self, window: _Window) -> None:
+        key = (window.group, window.start)
+        self._windows[key] = window
+        if self.spec.type == "session":
+            self._sessions.setdefault(window.group, set()).add(window.start)
+        self._schedule_close(key, window)
+
+    def _evict(self, key: WindowKey) -> None:
+        self._windows.pop(key, None)
+        starts = self._sessions.get(key[0])
+        if starts is not None:
+            starts.discard(key[1])
+            if not starts:
+                del self._sessions[key[0]]
+
+    def _close_at(self, window: _Window) -> float:
+        return window.end + self.spec.allowed_lateness_seconds
+
+    def _schedule_close(self, key: WindowKey, window: _Window) -> None:
+        self._seq += 1
+        heapq.heappush(self._close_heap, (self._close_at(window), self._seq, key))
+
+    def _result(self, window: _Window, final: bool) -> dict:
+        return {
+            "group": window.group,
+            "window_id": int(window.start),
+            "window_start": _iso(window.start),
+            "window_end": _iso(window.end),
+            "window_type": self.spec.type,
+            "aggregation_type": self.agg_type,
+            "aggregated_value": window.agg.result(self.agg_type),
+            "event_count": window.agg.count,
+            "final": final,
+        }
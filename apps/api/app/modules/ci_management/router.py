@@ -13,6 +13,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from schemas.common import ResponseEnvelope
 from sqlmodel import Session
 
+from app.modules.ops.services.orchestration.services.result_store import (
+    invalidate_result_tags,
+)
+
 from . import crud
 from .models import (
     ChangeStatus,
@@ -151,6 +155,8 @@ def apply_ci_change(
         change = crud.apply_change(session, change_id)
         if not change:
             raise HTTPException(status_code=404, detail="CI change not found")
+        # Cached OPS results that read this CI are stale now
+        invalidate_result_tags([f"ci_id:{change.ci_id}"])
 
         return ResponseEnvelope(
             code=200,
@@ -302,6 +308,10 @@ def confirm_duplicate(
 
     if not duplicate:
         raise HTTPException(status_code=404, detail="Duplicate entry not found")
+    if duplicate.is_merged:
+        invalidate_result_tags(
+            [f"ci_id:{duplicate.ci_id_1}", f"ci_id:{duplicate.ci_id_2}"]
+        )
 
     return ResponseEnvelope(
         code=200,
@@ -8,8 +8,17 @@ from typing import List, Optional
 
 from core.auth import get_current_user
 from core.config import get_settings
-from core.db import get_session
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from core.db import SessionLocal, get_session
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from models.document import Document, DocumentChunk, DocumentStatus
 from models.history import QueryHistory
@@ -17,6 +26,8 @@ from pydantic import BaseModel
 from schemas.common import ResponseEnvelope
 from services.orchestrator import OpenAIOrchestrator
 from sqlmodel import Session, select
+from workers.jobs import ingest_uploaded_document
+from workers.queue import enqueue_ingest_document
 
 from app.modules.auth.models import TbUser
 
@@ -30,12 +41,11 @@ from .crud import (
     list_chunks_by_document,
 )
 from .services import (
-    ChunkingStrategy,
     DocumentExportService,
-    DocumentProcessingError,
     DocumentProcessor,
     DocumentSearchService,
     SearchFilters,
+    copy_upload,
 )
 
 logger = logging.getLogger(__name__)
@@ -180,7 +190,6 @@ class ChunkResponse(BaseModel):
 # Initialize services
 processor = DocumentProcessor()
 search_service = DocumentSearchService()
-chunking = ChunkingStrategy()
 export_service = DocumentExportService()
 
 
@@ -198,6 +207,15 @@ def _user_id_from_user(current_user: TbUser) -> str:
     return str(user_id)
 
 
+def _query_embedding_service():
+    settings = get_settings()
+    if not (settings.openai_api_key and settings.embed_model):
+        return None
+    from services.embedding import get_embedding_service
+
+    return get_embedding_service()
+
+
 def _storage_path_for(document_id: str, tenant_id: str, filename: str) -> Path:
     settings = get_settings()
     return settings.document_storage_path / tenant_id / document_id / filename
@@ -229,6 +247,7 @@ def _build_document_payload(document: Document, chunk_count: int = 0) -> dict:
 
 @router.post("/upload", response_model=ResponseEnvelope)
 async def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: TbUser = Depends(get_current_user),
     session: Session = Depends(get_session),
@@ -243,7 +262,9 @@ async def upload_document(
     - PowerPoint (.pptx)
     - Images (.jpg, .jpeg, .png)
 
-    The document will be processed asynchronously in the background.
+    The upload is streamed to storage and the document is queued; parsing,
+    chunking and embedding run in a worker (or a background task when no
+    queue is configured). Poll the document for status and progress.
     """
 
     if not file.filename:
@@ -261,98 +282,50 @@ async def upload_document(
         )
 
     try:
-        # Read file content
-        file_content = await file.read()
-        file_size = len(file_content)
-
         tenant_id = _tenant_id_from_user(current_user)
         user_id = _user_id_from_user(current_user)
-        logger.info(
-            f"Uploading document: {file.filename} ({file_size} bytes, user: {user_id}, tenant: {tenant_id})"
-        )
 
-        # Use CRUD to create document
+        # Use CRUD to create document; size is filled in once the copy ends
         document = create_document(
             session,
             tenant_id=tenant_id,
             user_id=user_id,
             filename=file.filename,
             content_type=file.content_type or "application/octet-stream",
-            file_size=file_size,
+            file_size=0,
             file_format=file_ext,
             metadata={},
         )
 
         storage_path = _storage_path_for(document.id, tenant_id, file.filename)
-        storage_path.parent.mkdir(parents=True, exist_ok=True)
-        storage_path.write_bytes(file_content)
-
-        page_chunks: list[tuple[int | None, str]] = []
-        if file_ext == "txt":
-            extracted = file_content.decode("utf-8", errors="ignore")
-            if extracted.strip():
-                page_chunks.append((1, extracted))
-            processing_meta = {"format": "txt", "extraction_method": "plain_text"}
-        else:
-            processed = processor.process(str(storage_path), file_ext)
-            pages = processed.get("pages", [])
-            for page in pages:
-                if not isinstance(page, dict):
-                    continue
-                text = page.get("text", "")
-                page_num = page.get("page_num")
-                if text and text.strip():
-                    page_chunks.append(
-                        ((page_num + 1) if isinstance(page_num, int) else None, text)
-                    )
-            processing_meta = processed.get("metadata", {})
-
-        created_chunks = 0
-        for page_number, page_text in page_chunks:
-            text_chunks = chunking.chunk_text(page_text, chunk_size=300, overlap=50)
-            for chunk_text in text_chunks:
-                if not chunk_text.strip():
-                    continue
-                chunk = DocumentChunk(
-                    document_id=document.id,
-                    chunk_index=created_chunks,
-                    page=page_number,
-                    text=chunk_text,
-                    embedding=[0.0] * 1536,
-                    chunk_type="text",
-                    position_in_doc=created_chunks,
-                    page_number=page_number,
-                    source_hash=chunking.compute_source_hash(chunk_text),
-                    chunk_version=1,
-                )
-                session.add(chunk)
-                created_chunks += 1
+        file_size = await run_in_threadpool(copy_upload, file.file, storage_path)
+        logger.info(
+            f"Uploaded document: {file.filename} ({file_size} bytes, user: {user_id}, tenant: {tenant_id})"
+        )
 
-        document.status = DocumentStatus.done
-        document.processing_progress = 100
-        document.total_chunks = created_chunks
-        document.doc_metadata = {
-            "storage_path": str(storage_path),
-            "processed_at": datetime.now(timezone.utc).isoformat(),
-            **(processing_meta or {}),
-        }
+        document.size = file_size
+        document.status = DocumentStatus.queued
+        document.doc_metadata = {"storage_path": str(storage_path)}
         document.updated_at = datetime.now(timezone.utc)
         session.add(document)
         session.commit()
         session.refresh(document)
 
+        try:
+            enqueue_ingest_document(document.id)
+        except Exception as exc:
+            logger.warning(
+                f"Ingestion queue unavailable ({exc}); processing {document.id} in background"
+            )
+            background_tasks.add_task(ingest_uploaded_document, document.id)
+
         return ResponseEnvelope.success(
             data={
-                "document": _build_document_payload(
-                    document, chunk_count=created_chunks
-                ),
-                "status": "done",
+                "document": _build_document_payload(document, chunk_count=0),
+                "status": "queued",
             }
         )
 
-    except DocumentProcessingError as e:
-        logger.error(f"Document processing error: {str(e)}")
-        raise HTTPException(400, f"Processing failed: {str(e)}")
     except HTTPException:
         raise
     except Exception as e:
@@ -833,8 +806,13 @@ async def search_documents(
             min_relevance=request.min_relevance,
         )
 
-        # Initialize search service with session
-        search_svc = DocumentSearchService(db_session=session, embedding_service=None)
+        # Initialize search service with session; retrievers get their own
+        # sessions so hybrid text/vector queries run in parallel
+        search_svc = DocumentSearchService(
+            db_session=session,
+            embedding_service=_query_embedding_service(),
+            session_factory=SessionLocal,
+        )
 
         # Perform search
         start_time = time.time()
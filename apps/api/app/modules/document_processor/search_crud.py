@@ -65,15 +65,15 @@ def search_chunks_by_text(
 
     where_clause = " AND ".join(base_where)
 
-    # Try tsvector search first
+    # Try tsvector search first (stored text_tsv column, GIN-indexed)
     ts_sql = f"""
     SELECT dc.id, dc.document_id, d.filename, dc.text,
            COALESCE(dc.page_number, dc.page) as page_number, dc.chunk_type,
-           ts_rank(to_tsvector('simple', dc.text),
-                   plainto_tsquery('simple', :query)) as score
+           ts_rank(dc.text_tsv, plainto_tsquery('simple', :query)) as score
     FROM document_chunks dc
     JOIN documents d ON d.id = dc.document_id
     WHERE {where_clause}
+      AND dc.text_tsv @@ plainto_tsquery('simple', :query)
     ORDER BY score DESC
     LIMIT :top_k
     """
@@ -81,7 +81,7 @@ def search_chunks_by_text(
     try:
         rows = session.execute(text(ts_sql), params).fetchall()
 
-        # If tsvector returns nothing, fallback to ILIKE
+        # If tsvector returns nothing, fallback to ILIKE (trigram-indexed)
         if not rows:
             keywords = [kw.strip() for kw in query.split() if len(kw.strip()) >= 2]
             if keywords:
@@ -171,11 +171,11 @@ def search_chunks_by_vector(
     sql = f"""
     SELECT dc.id, dc.document_id, d.filename, dc.text,
            dc.page_number, dc.chunk_type,
-           1 - (dc.embedding <=> :embedding::vector) as cosine_similarity
+           1 - (dc.embedding <=> CAST(:embedding AS vector)) as cosine_similarity
     FROM document_chunks dc
     JOIN documents d ON d.id = dc.document_id
     WHERE {where_clause}
-    ORDER BY cosine_similarity DESC
+    ORDER BY dc.embedding <=> CAST(:embedding AS vector)
     LIMIT :top_k
     """
 
@@ -196,8 +196,10 @@ def search_chunks_by_vector(
         ]
 
     except Exception as e:
+        # Surface the failure; the caller decides whether to degrade to text-only
         logger.error(f"Vector search error: {str(e)}")
-        return []
+        session.rollback()
+        raise
 
 
 def log_search(
@@ -7,12 +7,15 @@ from .export_service import (
     ExportFormat,
 )
 from .format_processor import DocumentProcessingError, DocumentProcessor
+from .ingestion_pipeline import DocumentIngestionPipeline, copy_upload
 from .search_service import DocumentSearchService, SearchFilters, SearchResult
 
 __all__ = [
     "DocumentProcessor",
     "DocumentProcessingError",
     "ChunkingStrategy",
+    "DocumentIngestionPipeline",
+    "copy_upload",
     "ChunkMetadata",
     "DocumentSearchService",
     "SearchFilters",
@@ -1,7 +1,7 @@
 """Format processor for multi-format document extraction"""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
 
 try:
     import pdf2image
@@ -88,6 +88,46 @@ class DocumentProcessor:
         else:
             raise DocumentProcessingError(f"Unsupported format: {format}")
 
+    def iter_pages(self, file_path: str, format: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield extracted pages one at a time
+
+        PDFs are extracted page by page so large files never sit fully in
+        memory; other formats are small enough to go through ``process``.
+        """
+
+        format = format.lower()
+        if format != "pdf":
+            yield from self.process(file_path, format).get("pages", [])
+            return
+
+        if PdfReader is None:
+            raise DocumentProcessingError("pypdf library not installed")
+
+        try:
+            pdf_document = PdfReader(file_path)
+            for page_num, page in enumerate(pdf_document.pages):
+                yield {
+                    "page_num": page_num,
+                    "text": page.extract_text() or "",
+                    "tables": [],
+                    "images": [],
+                }
+        except DocumentProcessingError:
+            raise
+        except Exception as e:
+            raise DocumentProcessingError(f"PDF processing failed: {str(e)}")
+
+    def page_count(self, file_path: str, format: str) -> Optional[int]:
+        """Number of pages when cheap to know up front (PDF), else None"""
+
+        if format.lower() != "pdf" or PdfReader is None:
+            return None
+        try:
+            return len(PdfReader(file_path).pages)
+        except Exception:
+            return None
+
     def _process_pdf(self, file_path: str) -> Dict[str, Any]:
         """Extract content from PDF"""
 
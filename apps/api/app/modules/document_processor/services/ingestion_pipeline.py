@@ -0,0 +1,296 @@
+"""Staged, streaming ingestion pipeline for uploaded documents
+
+Upload handling only streams the file to disk and enqueues the document; the
+pipeline then runs in a worker as parse -> chunk -> embed -> bulk-insert
+stages. Stages are chained generators, so at most one page and one insert
+batch are in memory at a time, and per-stage counts/timings are written to
+``doc_metadata["ingestion"]`` as the document progresses.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.config import get_settings
+from models.document import Document, DocumentChunk, DocumentStatus
+from sqlalchemy import delete
+from sqlmodel import Session
+
+from .chunk_service import ChunkingStrategy
+from .format_processor import DocumentProcessingError, DocumentProcessor
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_COPY_BYTES = 1024 * 1024
+TEXT_BLOCK_CHARS = 64 * 1024
+INSERT_BATCH_SIZE = 64
+CHUNK_SIZE = 300
+CHUNK_OVERLAP = 50
+STAGES = ("parse", "chunk", "embed", "insert")
+
+Embedder = Callable[[List[str]], List[List[float]]]
+
+
+def copy_upload(source: BinaryIO, destination: Path) -> int:
+    """Copy an upload to disk in fixed-size chunks; returns bytes written"""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with destination.open("wb") as target:
+        while True:
+            block = source.read(UPLOAD_COPY_BYTES)
+            if not block:
+                break
+            target.write(block)
+            written += len(block)
+    return written
+
+
+@dataclass
+class StageStats:
+    items: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "items": self.items,
+            "seconds": round(self.seconds, 3),
+            "per_second": round(self.items / self.seconds, 2) if self.seconds else None,
+        }
+
+
+class IngestionProgress:
+    """Per-stage counters and timings for one document"""
+
+    def __init__(self, pages_total: Optional[int] = None):
+        self.pages_total = pages_total
+        self.stages = {stage: StageStats() for stage in STAGES}
+        self.started = time.perf_counter()
+
+    def timed(self, stage: str, items: Iterable) -> Iterator:
+        """Wrap a generator stage, charging time spent producing items to it"""
+        stats = self.stages[stage]
+        iterator = iter(items)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stats.seconds += time.perf_counter() - started
+                return
+            stats.seconds += time.perf_counter() - started
+            stats.items += 1
+            yield item
+
+    def percent(self) -> int:
+        if not self.pages_total:
+            return 0
+        # Leave 100 for the final commit
+        return min(99, int(self.stages["parse"].items * 100 / self.pages_total))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "pages_total": self.pages_total,
+            "elapsed_seconds": round(time.perf_counter() - self.started, 3),
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+        }
+
+
+def iter_text_blocks(path: Path) -> Iterator[str]:
+    """Read a text file in paragraph-aligned blocks of about TEXT_BLOCK_CHARS"""
+    buffer: List[str] = []
+    size = 0
+    with path.open("r", encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            buffer.append(line)
+            size += len(line)
+            if size >= TEXT_BLOCK_CHARS and not line.strip():
+                yield "".join(buffer)
+                buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def default_embedder() -> Embedder:
+    """Embedding model when configured, else the zero-vector placeholder"""
+    settings = get_settings()
+    if not (settings.openai_api_key and settings.embed_model):
+        dimension = settings.embedding_dimension
+
+        def placeholder(texts: List[str]) -> List[List[float]]:
+            return [[0.0] * dimension for _ in texts]
+
+        return placeholder
+
+    from services.embedding import get_embedding_service
+
+    return get_embedding_service().embed_texts
+
+
+class DocumentIngestionPipeline:
+    """Parse -> chunk -> embed -> bulk-insert for one stored document"""
+
+    def __init__(
+        self,
+        session: Session,
+        processor: Optional[DocumentProcessor] = None,
+        chunking: Optional[ChunkingStrategy] = None,
+        embedder: Optional[Embedder] = None,
+        batch_size: int = INSERT_BATCH_SIZE,
+    ):
+        self.session = session
+        self.processor = processor or DocumentProcessor()
+        self.chunking = chunking or ChunkingStrategy()
+        self.embedder = embedder
+        self.batch_size = max(1, batch_size)
+
+    def run(self, document_id: str) -> Dict[str, object]:
+        document = self.session.get(Document, document_id)
+        if not document:
+            raise DocumentProcessingError(f"Document '{document_id}' not found")
+        metadata = dict(document.doc_metadata or {})
+        storage_path = Path(metadata.get("storage_path", ""))
+        file_format = (document.format or storage_path.suffix.lstrip(".")).lower()
+        progress = IngestionProgress(
+            self.processor.page_count(str(storage_path), file_format)
+        )
+
+        try:
+            if not storage_path.is_file():
+                raise DocumentProcessingError("Uploaded document is missing on disk")
+            embedder = self.embedder or default_embedder()
+            self._start(document, metadata)
+
+            chunk_count = 0
+            pages = progress.timed("parse", self._pages(storage_path, file_format))
+            chunks = progress.timed("chunk", self._chunks(pages))
+            for batch in _batched(chunks, self.batch_size):
+                started = time.perf_counter()
+                vectors = embedder([text for _, text in batch])
+                progress.stages["embed"].seconds += time.perf_counter() - started
+                progress.stages["embed"].items += len(batch)
+                if len(vectors) != len(batch):
+                    raise DocumentProcessingError("Embedding count does not match chunks")
+
+                started = time.perf_counter()
+                self._insert(document.id, chunk_count, batch, vectors)
+                chunk_count += len(batch)
+                document.processing_progress = progress.percent()
+                document.total_chunks = chunk_count
+                document.doc_metadata = {**metadata, "ingestion": progress.to_dict()}
+                self.session.add(document)
+                self.session.commit()
+                progress.stages["insert"].seconds += time.perf_counter() - started
+                progress.stages["insert"].items += len(batch)
+
+            document.status = DocumentStatus.done
+            document.processing_progress = 100
+            document.total_chunks = chunk_count
+            document.doc_metadata = {
+                **metadata,
+                "processed_at": datetime.now(timezone.utc).isoformat(),
+                "ingestion": progress.to_dict(),
+            }
+            document.updated_at = datetime.now(timezone.utc)
+            self.session.add(document)
+            self.session.commit()
+            logger.info(
+                "Ingested document %s: %s chunks (%s)",
+                document_id,
+                chunk_count,
+                progress.to_dict()["stages"],
+            )
+            return {"document_id": document_id, "status": "done", "chunks": chunk_count}
+        except Exception as exc:
+            self.session.rollback()
+            document.status = DocumentStatus.failed
+            document.error_message = str(exc)
+            document.doc_metadata = {**metadata, "ingestion": progress.to_dict()}
+            document.updated_at = datetime.now(timezone.utc)
+            self.session.add(document)
+            self.session.commit()
+            raise
+
+    def _start(self, document: Document, metadata: dict) -> None:
+        # Retried jobs start over instead of appending duplicate chunks
+        self.session.exec(
+            delete(DocumentChunk).where(DocumentChunk.document_id == document.id)
+        )
+        document.status = DocumentStatus.processing
+        document.processing_progress = 0
+        document.error_message = None
+        document.updated_at = datetime.now(timezone.utc)
+        self.session.add(document)
+        self.session.commit()
+
+    def _pages(self, path: Path, file_format: str) -> Iterator[Tuple[Optional[int], str]]:
+        if file_format == "txt":
+            for block in iter_text_blocks(path):
+                yield 1, block
+            return
+        for page in self.processor.iter_pages(str(path), file_format):
+            if not isinstance(page, dict):
+                continue
+            page_num = page.get("page_num")
+            yield ((page_num + 1) if isinstance(page_num, int) else None), page.get(
+                "text", ""
+            )
+
+    def _chunks(
+        self, pages: Iterable[Tuple[Optional[int], str]]
+    ) -> Iterator[Tuple[Optional[int], str]]:
+        for page_number, page_text in pages:
+            if not page_text or not page_text.strip():
+                continue
+            for chunk_text in self.chunking.chunk_text(
+                page_text, chunk_size=CHUNK_SIZE, overlap=CHUNK_OVERLAP
+            ):
+                if chunk_text.strip():
+                    yield page_number, chunk_text
+
+    def _insert(
+        self,
+        document_id: str,
+        offset: int,
+        batch: List[Tuple[Optional[int], str]],
+        vectors: List[List[float]],
+    ) -> None:
+        self.session.add_all(
+            [
+                DocumentChunk(
+                    document_id=document_id,
+                    chunk_index=offset + index,
+                    page=page_number,
+                    text=chunk_text,
+                    embedding=vector,
+                    chunk_type="text",
+                    position_in_doc=offset + index,
+                    page_number=page_number,
+                    source_hash=self.chunking.compute_source_hash(chunk_text),
+                    chunk_version=1,
+                )
+                for index, ((page_number, chunk_text), vector) in enumerate(
+                    zip(batch, vectors)
+                )
+            ]
+        )
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    batch: list = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+__all__ = [
+    "DocumentIngestionPipeline",
+    "IngestionProgress",
+    "copy_upload",
+]
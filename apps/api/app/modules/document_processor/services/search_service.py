@@ -1,10 +1,14 @@
 """Advanced document search service with hybrid vector + BM25 search"""
 
+import asyncio
+import inspect
 import logging
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..search_crud import (
     get_search_suggestions,
@@ -15,6 +19,45 @@ from ..search_crud import (
 
 logger = logging.getLogger(__name__)
 
+QUERY_EMBEDDING_CACHE_SIZE = 512
+RRF_K = 60
+
+
+class QueryEmbeddingCache:
+    """Process-wide LRU of query embeddings, keyed by embedder and query"""
+
+    def __init__(self, max_entries: int = QUERY_EMBEDDING_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def set(self, key: Tuple[str, str], embedding: List[float]) -> None:
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+query_embedding_cache = QueryEmbeddingCache()
+
 
 @dataclass
 class SearchFilters:
@@ -44,18 +87,28 @@ class SearchResult:
 class DocumentSearchService:
     """Advanced document search with hybrid vector + BM25 approach"""
 
-    def __init__(self, db_session=None, embedding_service=None):
+    def __init__(
+        self,
+        db_session=None,
+        embedding_service=None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
         """
         Initialize search service
 
         Args:
             db_session: Database session
-            embedding_service: LLM embedding service for vector search
+            embedding_service: Embedding service for vector search (async
+                ``embed(text)`` or sync ``embed_query(text)``)
+            session_factory: Creates extra sessions so hybrid retrievers can
+                query in parallel; without it they share ``db_session``
         """
 
         self.db = db_session
         self.embedding_service = embedding_service
+        self.session_factory = session_factory
         self.logger = logging.getLogger(__name__)
+        self._db_lock = asyncio.Lock()
 
     async def search(
         self,
@@ -88,10 +141,20 @@ class DocumentSearchService:
                 results = await self._vector_search(query, filters, top_k * 2)
 
             else:  # hybrid (default)
-                text_results = await self._text_search(query, filters, top_k * 2)
-                vector_results = await self._vector_search(query, filters, top_k * 2)
-                # If vector search fails, fall back to text-only results
-                if vector_results:
+                text_results, vector_results = await asyncio.gather(
+                    self._with_session(self._text_search, query, filters, top_k * 2),
+                    self._with_session(self._vector_search, query, filters, top_k * 2),
+                    return_exceptions=True,
+                )
+                if isinstance(text_results, BaseException):
+                    raise text_results
+                if isinstance(vector_results, BaseException):
+                    self.logger.error(
+                        f"Vector retriever failed, hybrid search degraded to text-only: {vector_results}",
+                        exc_info=vector_results,
+                    )
+                    results = text_results
+                elif vector_results:
                     results = self._combine_results(text_results, vector_results, top_k * 2)
                 else:
                     results = text_results
@@ -112,7 +175,7 @@ class DocumentSearchService:
             raise
 
     async def _text_search(
-        self, query: str, filters: SearchFilters, top_k: int
+        self, query: str, filters: SearchFilters, top_k: int, session=None
     ) -> List[SearchResult]:
         """
         Full-text search using BM25 (PostgreSQL tsvector) with ILIKE fallback.
@@ -122,14 +185,17 @@ class DocumentSearchService:
         """
 
         results = []
+        session = session or self.db
 
-        if not self.db:
+        if not session:
             return results
 
         try:
             # Use CRUD for text search
-            rows = search_chunks_by_text(
-                session=self.db,
+            rows = await self._run_db(
+                session,
+                search_chunks_by_text,
+                session=session,
                 query=query,
                 tenant_id=filters.tenant_id,
                 top_k=top_k * 2,  # Get more for ranking
@@ -160,15 +226,17 @@ class DocumentSearchService:
         return results
 
     async def _vector_search(
-        self, query: str, filters: SearchFilters, top_k: int
+        self, query: str, filters: SearchFilters, top_k: int, session=None
     ) -> List[SearchResult]:
         """
         Vector similarity search using pgvector
 
-        Uses cosine similarity on 1536-dimensional embeddings
+        Uses cosine similarity on 1536-dimensional embeddings. Embedding or
+        query failures are raised; hybrid search degrades to text-only.
         """
 
         results = []
+        session = session or self.db
 
         try:
             # 1. Embed the query
@@ -176,14 +244,16 @@ class DocumentSearchService:
                 self.logger.warning("No embedding service provided for vector search")
                 return results
 
-            query_embedding = await self.embedding_service.embed(query)
+            query_embedding = await self._embed_query(query)
 
-            if not self.db:
+            if not session:
                 return results
 
             # Use CRUD for vector search
-            rows = search_chunks_by_vector(
-                session=self.db,
+            rows = await self._run_db(
+                session,
+                search_chunks_by_vector,
+                session=session,
                 query_embedding=query_embedding,
                 tenant_id=filters.tenant_id,
                 top_k=top_k,
@@ -212,11 +282,50 @@ class DocumentSearchService:
 
         except Exception as e:
             self.logger.error(f"Vector search error: {str(e)}")
-            # Fallback: return empty results, BM25 will be used
-            results = []
+            raise
 
         return results
 
+    async def _with_session(self, retriever, query: str, filters: SearchFilters, top_k: int):
+        """Run a retriever on its own session when a session factory is set"""
+        if self.session_factory is None or self.db is None:
+            return await retriever(query, filters, top_k)
+        session = self.session_factory()
+        try:
+            return await retriever(query, filters, top_k, session=session)
+        finally:
+            session.close()
+
+    async def _run_db(self, db, func, **kwargs):
+        """Run a blocking CRUD call off the event loop"""
+        if db is self.db:
+            # The request session is not thread-safe; serialize its users
+            async with self._db_lock:
+                return await asyncio.to_thread(func, **kwargs)
+        return await asyncio.to_thread(func, **kwargs)
+
+    async def _embed_query(self, query: str) -> List[float]:
+        service = self.embedding_service
+        key = (
+            f"{type(service).__qualname__}:{getattr(service, 'model', '')}",
+            " ".join(query.split()),
+        )
+        cached = query_embedding_cache.get(key)
+        if cached is not None:
+            return cached
+
+        embed = getattr(service, "embed", None)
+        if embed is not None:
+            embedding = embed(query)
+            if inspect.isawaitable(embedding):
+                embedding = await embedding
+        else:
+            embedding = await asyncio.to_thread(service.embed_query, query)
+
+        embedding = list(embedding)
+        query_embedding_cache.set(key, embedding)
+        return embedding
+
     @staticmethod
     def _combine_results(
         text_results: List[SearchResult], vector_results: List[SearchResult], top_k: int
@@ -224,7 +333,7 @@ class DocumentSearchService:
         """
         Combine text and vector results using Reciprocal Rank Fusion (RRF)
 
-        RRF formula: score = 1 / (60 + rank)
+        RRF formula: score = 1 / (RRF_K + rank)
 
         This prevents one ranking method from dominating
         """
@@ -234,13 +343,13 @@ class DocumentSearchService:
 
         # Score text results
         for rank, result in enumerate(text_results, 1):
-            rrf_score = 1 / (60 + rank)
+            rrf_score = 1 / (RRF_K + rank)
             scores[result.chunk_id] = scores.get(result.chunk_id, 0) + rrf_score
             result_map[result.chunk_id] = result
 
         # Score vector results
         for rank, result in enumerate(vector_results, 1):
-            rrf_score = 1 / (60 + rank)
+            rrf_score = 1 / (RRF_K + rank)
             scores[result.chunk_id] = scores.get(result.chunk_id, 0) + rrf_score
             if result.chunk_id not in result_map:
                 result_map[result.chunk_id] = result
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -325,3 +326,40 @@ class TbRegressionRuleConfig(SQLModel, table=True):
         sa_column=Column(Text, nullable=True),
         description="User who last updated (optional)",
     )
+
+
+class TbTraceRollup(SQLModel, table=True):
+    """Per-minute trace counts and latency sketch for one dimension set"""
+
+    __tablename__ = "tb_trace_rollup"
+    __table_args__ = ({"extend_existing": True},)
+
+    id: str = Field(
+        default_factory=lambda: uuid.uuid4().hex,
+        sa_column=Column(Text, primary_key=True, nullable=False),
+    )
+    bucket_start: datetime = Field(
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False, index=True),
+        description="Start of the one-minute bucket (UTC)",
+    )
+    tenant_id: str = Field(sa_column=Column(Text, nullable=False))
+    ops_mode: str = Field(sa_column=Column(Text, nullable=False))
+    tool: str = Field(
+        default="",
+        sa_column=Column(Text, nullable=False, server_default=text("''")),
+        description="Tool name, or empty for whole-request rows",
+    )
+    request_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    error_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    no_data_count: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    sketch: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False),
+        description="LatencySketch.to_dict() of duration_ms",
+    )
@@ -10,10 +10,20 @@ from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional
 
+from core.config import get_settings
 from sqlalchemy import func, select
 from sqlmodel import Session
 
 from app.modules.inspector.models import TbExecutionTrace, TbRegressionRun
+from app.modules.inspector.rollups import (
+    RollupStats,
+    earliest_trace_rollup,
+    is_no_data_answer,
+    minute_bucket,
+    query_tool_rollups,
+    query_trace_rollups,
+    scan_trace_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +62,26 @@ def get_trace_count(
     return session.exec(query).scalar_one() or 0
 
 
+def has_traces_between(session: Session, since: datetime, until: datetime) -> bool:
+    """
+    Check whether any execution trace was created in [since, until).
+
+    Args:
+        session: Database session
+        since: Start datetime filter
+        until: End datetime filter (exclusive)
+
+    Returns:
+        True if at least one trace exists
+    """
+    query = (
+        select(TbExecutionTrace.trace_id)
+        .where(TbExecutionTrace.created_at >= since, TbExecutionTrace.created_at < until)
+        .limit(1)
+    )
+    return session.exec(query).first() is not None
+
+
 def get_trace_durations(session: Session, since: datetime) -> List[int]:
     """
     Get all trace durations since given time.
@@ -188,6 +218,79 @@ def get_recent_verdict_reasons(session: Session, limit: int = 100) -> List[str]:
     return [reason or "" for (reason,) in reasons if reason]
 
 
+# ============================================================================
+# Trace Rollups
+# ============================================================================
+
+
+def get_trace_rollup_stats(
+    session: Session, since: datetime, now: Optional[datetime] = None
+) -> RollupStats | None:
+    """
+    Get merged per-minute trace rollups since given time.
+
+    Buckets newer than the flush lag (rollup flush plus telemetry sink
+    interval) may not be written yet, so those minutes are scanned from the
+    trace table instead.
+
+    Args:
+        session: Database session
+        since: Start datetime filter
+        now: Current time (defaults to utcnow)
+
+    Returns:
+        Merged rollup stats, or None when rollups do not cover the window
+        (disabled, table missing or empty, or traces older than the earliest
+        bucket) and the caller should scan traces
+    """
+    settings = get_settings()
+    if not settings.trace_rollup_enabled:
+        return None
+    lag = timedelta(
+        seconds=settings.trace_rollup_flush_seconds
+        + settings.telemetry_sink_flush_interval_ms / 1000
+    )
+    cutoff = minute_bucket((now or datetime.utcnow()) - lag)
+    try:
+        earliest = earliest_trace_rollup(session)
+        if earliest is None:
+            return None
+        if earliest > minute_bucket(since) and has_traces_between(session, since, earliest):
+            return None
+        stats = query_trace_rollups(session, since, until=cutoff)
+        stats.merge(scan_trace_stats(session, max(since, cutoff)))
+    except Exception as exc:
+        logger.warning(f"Trace rollups unavailable, scanning traces: {exc}")
+        session.rollback()
+        return None
+    return stats if stats.request_count else None
+
+
+def get_tool_latency_summary(
+    session: Session, since: datetime, limit: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Get per-tool latency percentiles from rollups, slowest p95 first.
+
+    Args:
+        session: Database session
+        since: Start datetime filter
+        limit: Number of tools to return
+
+    Returns:
+        List of {tool, count, error_rate, p50, p95, p99} dicts
+    """
+    try:
+        tools = query_tool_rollups(session, since)
+    except Exception as exc:
+        logger.warning(f"Tool rollups unavailable: {exc}")
+        session.rollback()
+        return []
+    summaries = [{"tool": tool, **stats.summary()} for tool, stats in tools.items()]
+    summaries.sort(key=lambda item: item["p95"] or 0, reverse=True)
+    return summaries[:limit]
+
+
 # ============================================================================
 # High-Level Observability Functions
 # ============================================================================
@@ -202,23 +305,39 @@ def collect_observability_metrics(session: Session) -> Dict[str, Any]:
 
     Returns:
         Dict with success_rate, failure_rate, latency, regression_trend,
-             top_causes, no_data_ratio
+             top_causes, no_data_ratio, tool_latency
     """
     now = datetime.utcnow()
     since_day = now - timedelta(hours=24)
     since_week = now - timedelta(days=7)
 
-    # Success/Failure rates
-    recent_total = get_trace_count(session, since_day)
-    recent_success = get_trace_count(session, since_day, status="success")
-    success_rate = (recent_success / recent_total) if recent_total else 0.0
+    rollup = get_trace_rollup_stats(session, since_day)
+    if rollup is not None:
+        # Success/Failure rates, latency percentiles and no-data ratio from
+        # merged per-minute rollups
+        recent_total = rollup.request_count
+        success_rate = rollup.success_rate
+        latency_p50 = rollup.percentile(0.5)
+        latency_p95 = rollup.percentile(0.95)
+        no_data_ratio = rollup.no_data_count / recent_total
+    else:
+        # Success/Failure rates
+        recent_total = get_trace_count(session, since_day)
+        recent_success = get_trace_count(session, since_day, status="success")
+        success_rate = (recent_success / recent_total) if recent_total else 0.0
+
+        # Latency percentiles
+        durations_list = get_trace_durations(session, since_day)
+        latency_p50 = _percentile(durations_list, 0.5)
+        latency_p95 = _percentile(durations_list, 0.95)
+
+        # No data ratio
+        traces_samples = get_recent_trace_answers(session, limit=500)
+        sample_count = sum(1 for answer in traces_samples if answer is not None)
+        no_data_hits = sum(1 for answer in traces_samples if is_no_data_answer(answer))
+        no_data_ratio = (no_data_hits / sample_count) if sample_count else 0.0
     failure_rate = 1.0 - success_rate if recent_total else 0.0
 
-    # Latency percentiles
-    durations_list = get_trace_durations(session, since_day)
-    latency_p50 = _percentile(durations_list, 0.5)
-    latency_p95 = _percentile(durations_list, 0.95)
-
     # Regression trend
     trend_result = get_regression_trend(session, since_week)
     trend_map: dict[str, dict[str, int]] = defaultdict(
@@ -240,25 +359,6 @@ def collect_observability_metrics(session: Session) -> Dict[str, Any]:
         if safe_reason:
             overall_reasons[safe_reason] += 1
 
-    # No data ratio
-    traces_samples = get_recent_trace_answers(session, limit=500)
-
-    def _extract_summary(answer: dict[str, Any] | None) -> str:
-        if not answer:
-            return ""
-        meta = answer.get("meta")
-        if isinstance(meta, dict):
-            summary = meta.get("summary") or ""
-            return str(summary).lower()
-        return ""
-
-    sample_summaries = [
-        _extract_summary(answer) for answer in traces_samples if answer is not None
-    ]
-    no_data_hits = sum(1 for summary in sample_summaries if "no data" in summary)
-    sample_count = len(sample_summaries)
-    no_data_ratio = (no_data_hits / sample_count) if sample_count else 0.0
-
     return {
         "success_rate": round(success_rate, 3),
         "failure_rate": round(failure_rate, 3),
@@ -278,6 +378,7 @@ def collect_observability_metrics(session: Session) -> Dict[str, Any]:
             for reason, count in overall_reasons.most_common(5)
         ],
         "no_data_ratio": round(no_data_ratio, 3),
+        "tool_latency": get_tool_latency_summary(session, since_day),
     }
 
 
@@ -295,14 +396,20 @@ def collect_ops_summary_stats(session: Session) -> Dict[str, Any]:
     now = datetime.utcnow()
     since_day = now - timedelta(hours=24)
 
-    # Query counts
-    total_queries = get_trace_count(session, since_day)
-    successful_queries = get_trace_count(session, since_day, status="success")
+    rollup = get_trace_rollup_stats(session, since_day)
+    if rollup is not None:
+        total_queries = rollup.request_count
+        successful_queries = rollup.request_count - rollup.error_count
+        avg_latency = rollup.sketch.mean or 0.0
+    else:
+        # Query counts
+        total_queries = get_trace_count(session, since_day)
+        successful_queries = get_trace_count(session, since_day, status="success")
+
+        # Average latency
+        avg_latency = get_average_latency(session, since_day)
     failed_queries = total_queries - successful_queries
 
-    # Average latency
-    avg_latency = get_average_latency(session, since_day)
-
     # Recent activity
     recent_traces = get_recent_traces(session, limit=5)
 
@@ -0,0 +1,314 @@
+"""
+Per-minute trace rollups for observability KPIs.
+
+Each persisted execution trace is folded into in-memory rollups keyed by
+(minute, tenant, ops_mode, tool): request/error/no-data counts plus a
+mergeable ``LatencySketch`` of duration_ms. Whole-request rows use an empty
+tool; each tool call of the trace also updates its tool's row. A background
+flusher hands the accumulated rows to the telemetry sink every
+``trace_rollup_flush_seconds``, so a bucket may be split over several rows
+(per worker, per flush) - queries merge whatever rows fall in the window.
+
+KPI queries therefore cost O(rollup rows in the window), not O(traces). The
+flusher also deletes rows older than ``trace_rollup_retention_days``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from core.config import get_settings
+from core.latency_sketch import LatencySketch
+from core.logging import get_request_context
+from core.telemetry_sink import submit_telemetry
+from core.tenant import normalize_tenant_id
+from sqlalchemy import delete, func, select
+from sqlmodel import Session
+
+from app.modules.inspector.models import TbExecutionTrace, TbTraceRollup
+
+logger = logging.getLogger(__name__)
+
+RollupKey = Tuple[datetime, str, str, str]
+
+PURGE_INTERVAL_SECONDS = 3600.0
+
+
+def minute_bucket(moment: datetime) -> datetime:
+    """Naive-UTC start of the minute containing ``moment``"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.replace(second=0, microsecond=0)
+
+
+def is_no_data_answer(answer: Dict[str, Any] | None) -> bool:
+    if not isinstance(answer, dict):
+        return False
+    for key in ("meta", "envelope_meta"):
+        meta = answer.get(key)
+        if isinstance(meta, dict) and "no data" in str(meta.get("summary") or "").lower():
+            return True
+    return False
+
+
+@dataclass
+class RollupStats:
+    request_count: int = 0
+    error_count: int = 0
+    no_data_count: int = 0
+    sketch: LatencySketch = field(default_factory=LatencySketch)
+
+    def add(self, duration_ms: float, error: bool, no_data: bool = False) -> None:
+        self.request_count += 1
+        self.error_count += int(error)
+        self.no_data_count += int(no_data)
+        self.sketch.add(max(duration_ms or 0, 0))
+
+    def merge(self, other: "RollupStats") -> "RollupStats":
+        self.request_count += other.request_count
+        self.error_count += other.error_count
+        self.no_data_count += other.no_data_count
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def success_rate(self) -> float:
+        if not self.request_count:
+            return 0.0
+        return (self.request_count - self.error_count) / self.request_count
+
+    def percentile(self, q: float) -> int | None:
+        value = self.sketch.quantile(q)
+        return None if value is None else int(round(value))
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.request_count,
+            "error_rate": round(1.0 - self.success_rate, 3) if self.request_count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class TraceRollupAggregator:
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        flush_seconds: float = 15.0,
+        retention_days: float = 30,
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.flush_seconds = flush_seconds
+        self.retention_days = retention_days
+        self._pending: Dict[RollupKey, RollupStats] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def record_trace(self, trace: TbExecutionTrace, tenant_id: str | None = None) -> None:
+        if tenant_id is None:
+            tenant = get_request_context().get("tenant_id")
+            tenant_id = normalize_tenant_id(None if tenant == "-" else tenant)
+        minute = minute_bucket(trace.created_at or datetime.utcnow())
+        ops_mode = trace.ops_mode or "unknown"
+        with self._lock:
+            self._stats((minute, tenant_id, ops_mode, "")).add(
+                trace.duration_ms,
+                trace.status != "success",
+                is_no_data_answer(trace.answer),
+            )
+            for step in trace.execution_steps or []:
+                tool = step.get("tool_name")
+                if tool:
+                    self._stats((minute, tenant_id, ops_mode, str(tool))).add(
+                        step.get("duration_ms") or 0, step.get("status") == "error"
+                    )
+
+    def pending(self) -> Dict[RollupKey, RollupStats]:
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for (minute, tenant_id, ops_mode, tool), stats in pending.items():
+            try:
+                submit_telemetry(
+                    TbTraceRollup(
+                        bucket_start=minute,
+                        tenant_id=tenant_id,
+                        ops_mode=ops_mode,
+                        tool=tool,
+                        request_count=stats.request_count,
+                        error_count=stats.error_count,
+                        no_data_count=stats.no_data_count,
+                        sketch=stats.sketch.to_dict(),
+                    )
+                )
+            except Exception as exc:
+                logger.warning(f"Failed to write trace rollup: {exc}")
+        return len(pending)
+
+    def purge(self) -> int:
+        """Delete rollup rows older than the retention; 0 days keeps them"""
+        if not self.retention_days:
+            return 0
+        from core.db import get_session_context
+
+        cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+        try:
+            with get_session_context() as session:
+                removed = purge_trace_rollups(session, cutoff)
+        except Exception as exc:
+            logger.warning(f"Failed to purge trace rollups: {exc}")
+            return 0
+        if removed:
+            logger.info(f"Purged {removed} trace rollup rows older than {cutoff:%Y-%m-%d %H:%M}")
+        return removed
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="trace-rollup-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        next_purge = 0.0
+        while not self._stop.wait(self.flush_seconds):
+            self.flush()
+            if time.monotonic() >= next_purge:
+                self.purge()
+                next_purge = time.monotonic() + PURGE_INTERVAL_SECONDS
+
+    def _stats(self, key: RollupKey) -> RollupStats:
+        stats = self._pending.get(key)
+        if stats is None:
+            stats = RollupStats(sketch=LatencySketch(self.relative_accuracy))
+            self._pending[key] = stats
+        return stats
+
+
+def query_trace_rollups(
+    session: Session,
+    since: datetime,
+    *,
+    until: datetime | None = None,
+    tenant_id: str | None = None,
+    ops_mode: str | None = None,
+    tool: str = "",
+) -> RollupStats:
+    """Merge the rollup rows for one tool ("" = whole requests) since ``since``"""
+    query = select(
+        TbTraceRollup.request_count,
+        TbTraceRollup.error_count,
+        TbTraceRollup.no_data_count,
+        TbTraceRollup.sketch,
+    ).where(
+        TbTraceRollup.bucket_start >= minute_bucket(since),
+        TbTraceRollup.tool == tool,
+    )
+    if until is not None:
+        query = query.where(TbTraceRollup.bucket_start < minute_bucket(until))
+    if tenant_id:
+        query = query.where(TbTraceRollup.tenant_id == tenant_id)
+    if ops_mode:
+        query = query.where(TbTraceRollup.ops_mode == ops_mode)
+
+    total = RollupStats(sketch=LatencySketch(get_settings().trace_rollup_relative_accuracy))
+    for request_count, error_count, no_data_count, sketch in session.exec(query).all():
+        total.merge(
+            RollupStats(
+                request_count, error_count, no_data_count, LatencySketch.from_dict(sketch)
+            )
+        )
+    return total
+
+
+def scan_trace_stats(
+    session: Session, since: datetime, until: datetime | None = None
+) -> RollupStats:
+    """Whole-request stats folded from the trace table, for spans without rollups"""
+    query = select(
+        TbExecutionTrace.duration_ms, TbExecutionTrace.status, TbExecutionTrace.answer
+    ).where(TbExecutionTrace.created_at >= since)
+    if until is not None:
+        query = query.where(TbExecutionTrace.created_at < until)
+
+    stats = RollupStats(sketch=LatencySketch(get_settings().trace_rollup_relative_accuracy))
+    for duration_ms, status, answer in session.exec(query).all():
+        stats.add(duration_ms, status != "success", is_no_data_answer(answer))
+    return stats
+
+
+def earliest_trace_rollup(session: Session) -> datetime | None:
+    """Start of the oldest persisted rollup bucket (naive UTC)"""
+    earliest = session.exec(select(func.min(TbTraceRollup.bucket_start))).scalar_one_or_none()
+    return None if earliest is None else minute_bucket(earliest)
+
+
+def purge_trace_rollups(session: Session, older_than: datetime) -> int:
+    """Delete rollup rows for buckets before ``older_than``"""
+    result = session.exec(
+        delete(TbTraceRollup).where(TbTraceRollup.bucket_start < minute_bucket(older_than))
+    )
+    session.commit()
+    return result.rowcount or 0
+
+
+def query_tool_rollups(
+    session: Session, since: datetime, *, tenant_id: str | None = None
+) -> Dict[str, RollupStats]:
+    """Merged rollups per tool since ``since``"""
+    query = select(
+        TbTraceRollup.tool,
+        TbTraceRollup.request_count,
+        TbTraceRollup.error_count,
+        TbTraceRollup.sketch,
+    ).where(
+        TbTraceRollup.bucket_start >= minute_bucket(since),
+        TbTraceRollup.tool != "",
+    )
+    if tenant_id:
+        query = query.where(TbTraceRollup.tenant_id == tenant_id)
+
+    accuracy = get_settings().trace_rollup_relative_accuracy
+    tools: Dict[str, RollupStats] = {}
+    for tool, request_count, error_count, sketch in session.exec(query).all():
+        stats = tools.setdefault(tool, RollupStats(sketch=LatencySketch(accuracy)))
+        stats.merge(RollupStats(request_count, error_count, 0, LatencySketch.from_dict(sketch)))
+    return tools
+
+
+_aggregator: Optional[TraceRollupAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_trace_rollups() -> TraceRollupAggregator:
+    """Get the process-wide trace rollup aggregator."""
+    global _aggregator
+    if _aggregator is None:
+        with _aggregator_lock:
+            if _aggregator is None:
+                settings = get_settings()
+                _aggregator = TraceRollupAggregator(
+                    relative_accuracy=settings.trace_rollup_relative_accuracy,
+                    flush_seconds=settings.trace_rollup_flush_seconds,
+                    retention_days=settings.trace_rollup_retention_days,
+                )
+    return _aggregator
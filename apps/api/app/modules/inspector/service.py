@@ -3,13 +3,15 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, List
 
+from core.config import get_settings
+from core.telemetry_sink import submit_telemetry
 from fastapi.encoders import jsonable_encoder
 from sqlmodel import Session, select
 
 from app.modules.asset_registry.models import TbAssetRegistry
 from app.modules.inspector.asset_context import get_tracked_assets
-from app.modules.inspector.crud import create_execution_trace
 from app.modules.inspector.models import TbExecutionTrace
+from app.modules.inspector.rollups import get_trace_rollups
 
 
 def _summarize_asset(asset: Dict[str, Any] | None) -> Dict[str, Any] | None:
@@ -830,4 +832,11 @@ def persist_execution_trace(
         stage_outputs=safe_stage_outputs or [],
         replan_events=safe_replan_events or [],
     )
-    return create_execution_trace(session, trace_entry)
+    # Written by the telemetry sink's background flusher when it is running
+    submit_telemetry(trace_entry, session)
+    if get_settings().trace_rollup_enabled:
+        try:
+            get_trace_rollups().record_trace(trace_entry)
+        except Exception as exc:
+            logger.warning(f"Failed to update trace rollups for {trace_id}: {exc}")
+    return trace_entry
@@ -29,6 +29,15 @@ def get_all_settings(session: Session) -> list[TbOperationSettings]:
     return session.exec(statement).all()
 
 
+def _notify_route_table(setting_key: str) -> None:
+    # The Core UPDATE above never flushes ORM objects, so the route table's
+    # flush hook can't see it; route_table imports this module, hence the
+    # local import
+    from app.modules.api_manager.route_table import notify_setting_changed
+
+    notify_setting_changed(setting_key)
+
+
 def create_or_update_setting(
     session: Session,
     setting_key: str,
@@ -73,6 +82,7 @@ def create_or_update_setting(
         )
         session.execute(statement)
         session.commit()
+        _notify_route_table(setting_key)
 
         # Refresh to get the updated values from DB
         session.refresh(existing)
@@ -110,6 +120,7 @@ def create_or_update_setting(
 
         session.add(new_setting)
         session.commit()
+        _notify_route_table(setting_key)
         session.refresh(new_setting)
 
         # Record audit log
@@ -56,6 +56,7 @@ from .schemas import (
 )
 from .services import handle_ops_query
 from .services.action_registry import list_registered_actions
+from .services.connections import get_async_pool_registry, get_pool_registry
 from .services.observability_service import collect_observability_metrics
 from .services.orchestration.planner.plan_schema import (
     Plan,
@@ -209,6 +210,19 @@ def observability_kpis(
         )
 
 
+@router.get("/observability/connection-pools", response_model=ResponseEnvelope)
+def observability_connection_pools(
+    current_user: TbUser = Depends(get_current_user),
+) -> ResponseEnvelope:
+    """Report per-source connection pool stats for this worker."""
+    return ResponseEnvelope.success(
+        data={
+            "connection_pools": get_pool_registry().stats(),
+            "async_connection_pools": get_async_pool_registry().stats(),
+        }
+    )
+
+
 @router.post("/conversation/summary", response_model=ResponseEnvelope)
 def conversation_summary(
     request_data: dict,
@@ -50,6 +50,13 @@ from app.modules.ops.schemas import (
     RerunContext,
 )
 from app.modules.ops.security import SecurityUtils
+from app.modules.ops.services.ask_coalescer import (
+    AskFlight,
+    AskFlightAborted,
+    AskFlightError,
+    ask_flight_key,
+    get_ask_coalescer,
+)
 from app.modules.ops.services.control_loop import evaluate_replan
 from app.modules.ops.services.orchestration.blocks import text_block
 from app.modules.ops.services.orchestration.orchestrator.runner import (
@@ -183,6 +190,22 @@ def ask_ops(
     if parent_trace_id == "-":
         parent_trace_id = None
 
+    # Coalesce with an identical ask that is already running
+    flight: AskFlight | None = None
+    flight_error: Exception | None = None
+    if get_settings().ops_ask_coalesce_enabled:
+        flight, is_leader = get_ask_coalescer().join(
+            ask_flight_key("ask", tenant_id, payload), active_trace_id
+        )
+        if not is_leader:
+            follower_response = _follow_ask_flight(
+                flight, history_id, payload.mode or "all", start
+            )
+            if follower_response is not None:
+                return follower_response
+            # Leader is taking too long or went away; answer this request on its own
+            flight = None
+
     def _apply_resolver_rules(
         question: str, resolver_payload: dict[str, Any] | None
     ) -> tuple[str, list[str]]:
@@ -379,7 +402,11 @@ def ask_ops(
                     "ops.runner.planner.done",
                     extra={"llm_called": False, "elapsed_ms": planner_elapsed_ms},
                 )
-                end_span(planner_span, links={"plan_path": "plan.raw"})
+                end_span(
+                    planner_span,
+                    summary={"plan_cache": plan_output.metadata.get("plan_cache")},
+                    links={"plan_path": "plan.raw"},
+                )
             except Exception as e:
                 end_span(
                     planner_span,
@@ -410,6 +437,9 @@ def ask_ops(
                     raise
                 plan_output = plan_output.model_copy(update={"plan": plan_validated})
 
+            if plan_output.metadata.get("plan_cache"):
+                plan_trace["plan_cache"] = plan_output.metadata["plan_cache"]
+
         if plan_output is None:
             raise ValueError("Planner output missing")
 
@@ -601,6 +631,7 @@ def ask_ops(
 
     except Exception as exc:
         status = "error"
+        flight_error = exc
         logger.exception("ops.ask.error", exc_info=exc)
         error_body = ResponseEnvelope.error(message=str(exc)).model_dump(mode="json")
         error_response = JSONResponse(status_code=500, content=error_body)
@@ -622,6 +653,11 @@ def ask_ops(
                 logger.exception("ops.history.error_update_failed", exc_info=hist_exc)
 
     finally:
+        if flight is not None:
+            get_ask_coalescer().finish(
+                flight, result=result if response_payload else None, error=flight_error
+            )
+
         elapsed_ms = (
             duration_ms
             if duration_ms is not None
@@ -702,3 +738,83 @@ def ask_ops(
 
     assert response_payload or error_response
     return response_payload or error_response
+
+
+def _follow_ask_flight(
+    flight: AskFlight,
+    history_id: Any,
+    mode: str,
+    start: float,
+) -> ResponseEnvelope | JSONResponse | None:
+    """Answer a follower from the leader's result.
+
+    The follower gets its own history entry pointing at the leader's trace.
+    Returns None when the leader does not finish within
+    ``ops_ask_coalesce_wait_seconds`` or aborts without a result.
+    """
+    status = "ok"
+    result: dict[str, Any] | None = None
+    try:
+        result = flight.wait(get_settings().ops_ask_coalesce_wait_seconds)
+    except AskFlightAborted:
+        logger.info(
+            "ops.ask.coalesce_leader_aborted",
+            extra={"leader_trace_id": flight.leader_trace_id},
+        )
+        return None
+    except AskFlightError as exc:
+        status = "error"
+        error_body = ResponseEnvelope.error(message=str(exc)).model_dump(mode="json")
+        response: ResponseEnvelope | JSONResponse = JSONResponse(
+            status_code=500, content=error_body
+        )
+        history_response = error_body
+        summary = f"Error: {str(exc)[:200]}"
+    else:
+        if result is None:
+            logger.warning(
+                "ops.ask.coalesce_timeout",
+                extra={"leader_trace_id": flight.leader_trace_id},
+            )
+            return None
+        meta = result.get("meta") or {}
+        meta["coalesced"] = True
+        meta["timing_ms"] = int((time.perf_counter() - start) * 1000)
+        result["meta"] = meta
+        response = ResponseEnvelope.success(data=OpsAskResponse(**result).model_dump())
+        history_response = jsonable_encoder(response.model_dump())
+        summary = meta.get("summary") or meta.get("answer", "")[:200]
+
+    if history_id:
+        try:
+            with get_session_context() as session:
+                history_entry = session.get(QueryHistory, history_id)
+                if history_entry:
+                    history_entry.status = status
+                    history_entry.trace_id = flight.leader_trace_id
+                    history_entry.response = history_response
+                    history_entry.summary = summary
+                    history_entry.metadata_info = jsonable_encoder(
+                        {
+                            "uiMode": mode,
+                            "backendMode": mode,
+                            "trace": result.get("trace") if result else None,
+                            "nextActions": result.get("next_actions") if result else [],
+                            "coalescedFrom": flight.leader_trace_id,
+                        }
+                    )
+                    session.add(history_entry)
+                    session.commit()
+        except Exception as exc:
+            logger.exception("ops.history.update_failed", exc_info=exc)
+
+    logger.info(
+        "ops.ask.done",
+        extra={
+            "status": status,
+            "elapsed_ms": int((time.perf_counter() - start) * 1000),
+            "coalesced": True,
+            "leader_trace_id": flight.leader_trace_id,
+        },
+    )
+    return response
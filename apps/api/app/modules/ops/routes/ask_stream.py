@@ -9,6 +9,7 @@ Endpoints:
 """
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
 from typing import Any
@@ -40,6 +41,13 @@ from app.modules.inspector.span_tracker import (
     start_span,
 )
 from app.modules.ops.schemas import OpsAskRequest
+from app.modules.ops.services.ask_coalescer import (
+    AskFlight,
+    AskFlightAborted,
+    AskFlightError,
+    ask_flight_key,
+    get_ask_coalescer,
+)
 from app.modules.ops.services.orchestration.orchestrator.runner import (
     OpsOrchestratorRunner,
 )
@@ -143,10 +151,19 @@ async def ask_ops_stream(
         meta = {}
         history_id = None
         completed_stages = []
+        flight: AskFlight | None = None
+        flight_error: Exception | None = None
+        is_leader = True
+
+        def emit(event_type: str, data: dict[str, Any]) -> str:
+            # Followers of this request replay and follow the same events
+            if flight is not None and is_leader:
+                flight.publish(event_type, data)
+            return _sse_event(event_type, data)
         
         try:
             # Stage 1: Init
-            yield _sse_event("progress", {
+            yield emit("progress", {
                 "stage": OpsProgressStage.INIT.value,
                 "message": STAGE_MESSAGES[OpsProgressStage.INIT],
                 "elapsed_ms": elapsed_ms(),
@@ -183,9 +200,69 @@ async def ask_ops_stream(
                 history_id = history_entry.id
             except Exception as exc:
                 logger.exception("ci.history.create_failed", exc_info=exc)
+
+            # Coalesce with an identical ask that is already streaming
+            if get_settings().ops_ask_coalesce_enabled:
+                flight, is_leader = get_ask_coalescer().join(
+                    ask_flight_key("ask_stream", tenant_id, payload), active_trace_id
+                )
+            if not is_leader:
+                forwarded_error = False
+                try:
+                    async for event_type, data in flight.subscribe(
+                        get_settings().ops_ask_coalesce_wait_seconds
+                    ):
+                        if (
+                            event_type == "progress"
+                            and data.get("stage") == OpsProgressStage.INIT.value
+                        ):
+                            # Already sent this request's own init event
+                            continue
+                        if event_type == "complete":
+                            data["meta"] = {**(data.get("meta") or {}), "coalesced": True}
+                        forwarded_error = forwarded_error or event_type == "error"
+                        yield _sse_event(event_type, data)
+                except asyncio.TimeoutError:
+                    # Leader is taking too long; answer this request on its own
+                    # (same as /ops/ask)
+                    logger.warning(
+                        "ops.ask.coalesce_timeout",
+                        extra={"leader_trace_id": flight.leader_trace_id},
+                    )
+                    flight, is_leader = None, True
+                else:
+                    try:
+                        result = flight.result()
+                    except AskFlightAborted:
+                        # Leader's client went away; nothing failed, so answer
+                        # this request on its own (same as the timeout path)
+                        logger.info(
+                            "ops.ask.coalesce_leader_aborted",
+                            extra={"leader_trace_id": flight.leader_trace_id},
+                        )
+                        flight, is_leader = None, True
+                    except AskFlightError as exc:
+                        active_trace_id = flight.leader_trace_id
+                        status = "error"
+                        trace_status = "error"
+                        if not forwarded_error:
+                            yield _sse_event("error", {
+                                "message": str(exc),
+                                "stage": "execution",
+                                "elapsed_ms": elapsed_ms(),
+                            })
+                        return
+                    else:
+                        active_trace_id = flight.leader_trace_id
+                        envelope_blocks = result.get("blocks") or []
+                        next_actions = result.get("next_actions") or []
+                        trace_payload = result.get("trace") or {}
+                        meta = {**(result.get("meta") or {}), "coalesced": True}
+                        result["meta"] = meta
+                        return
             
             # Stage 2: Resolving
-            yield _sse_event("progress", {
+            yield emit("progress", {
                 "stage": OpsProgressStage.RESOLVING.value,
                 "message": STAGE_MESSAGES[OpsProgressStage.RESOLVING],
                 "elapsed_ms": elapsed_ms(),
@@ -232,7 +309,7 @@ async def ask_ops_stream(
                 pass
             
             # Stage 3: Planning
-            yield _sse_event("progress", {
+            yield emit("progress", {
                 "stage": OpsProgressStage.PLANNING.value,
                 "message": STAGE_MESSAGES[OpsProgressStage.PLANNING],
                 "elapsed_ms": elapsed_ms(),
@@ -330,7 +407,7 @@ async def ask_ops_stream(
                 envelope_blocks = blocks
             else:
                 # Stage 4: Executing
-                yield _sse_event("progress", {
+                yield emit("progress", {
                     "stage": OpsProgressStage.EXECUTING.value,
                     "message": STAGE_MESSAGES[OpsProgressStage.EXECUTING],
                     "elapsed_ms": elapsed_ms(),
@@ -357,7 +434,7 @@ async def ask_ops_stream(
                     # Send tool execution events
                     tool_calls = result.get("trace", {}).get("tool_calls", [])
                     for tc in tool_calls:
-                        yield _sse_event("tool_complete", {
+                        yield emit("tool_complete", {
                             "tool_type": tc.get("tool_type", "unknown"),
                             "tool_name": tc.get("tool_name", "unknown"),
                             "elapsed_ms": tc.get("timing_ms", 0),
@@ -380,7 +457,7 @@ async def ask_ops_stream(
                     raise
             
             # Stage 5: Composing
-            yield _sse_event("progress", {
+            yield emit("progress", {
                 "stage": OpsProgressStage.COMPOSING.value,
                 "message": STAGE_MESSAGES[OpsProgressStage.COMPOSING],
                 "elapsed_ms": elapsed_ms(),
@@ -390,14 +467,14 @@ async def ask_ops_stream(
             
             # Stream blocks
             for i, block in enumerate(envelope_blocks):
-                yield _sse_event("block", {
+                yield emit("block", {
                     "block": block,
                     "index": i,
                     "total": len(envelope_blocks),
                 })
             
             # Stage 6: Presenting
-            yield _sse_event("progress", {
+            yield emit("progress", {
                 "stage": OpsProgressStage.PRESENTING.value,
                 "message": STAGE_MESSAGES[OpsProgressStage.PRESENTING],
                 "elapsed_ms": elapsed_ms(),
@@ -415,7 +492,7 @@ async def ask_ops_stream(
                 result["trace"]["trace_id"] = active_trace_id
             
             # Complete event
-            yield _sse_event("complete", {
+            yield emit("complete", {
                 "answer": result.get("answer", "") if result else "",
                 "blocks": envelope_blocks,
                 "meta": {**(meta or {}), "timing_ms": elapsed_ms()},
@@ -430,9 +507,10 @@ async def ask_ops_stream(
         except Exception as exc:
             status = "error"
             trace_status = "error"
+            flight_error = exc
             logger.exception("ops.ask.stream.error", exc_info=exc)
             
-            yield _sse_event("error", {
+            yield emit("error", {
                 "message": str(exc),
                 "stage": "execution",
                 "elapsed_ms": elapsed_ms(),
@@ -440,8 +518,12 @@ async def ask_ops_stream(
         
         finally:
             elapsed = elapsed_ms()
+            if flight is not None and is_leader:
+                get_ask_coalescer().finish(
+                    flight, result=result if status == "ok" else None, error=flight_error
+                )
             
-            # Persist trace
+            # Persist trace (followers point at the leader's trace instead)
             flow_spans = get_all_spans()
             request_payload = {
                 "question": payload.question,
@@ -449,30 +531,31 @@ async def ask_ops_stream(
             }
             
             try:
-                with get_session_context() as session:
-                    persist_execution_trace(
-                        session=session,
-                        trace_id=active_trace_id,
-                        parent_trace_id=None,
-                        feature="ops",
-                        endpoint="/ops/ask/stream",
-                        method="POST",
-                        ops_mode=get_settings().ops_mode,
-                        question=payload.question,
-                        status=trace_status,
-                        duration_ms=int(elapsed),
-                        request_payload=jsonable_encoder(request_payload),
-                        plan_raw=jsonable_encoder(
-                            trace_payload.get("plan_raw") if trace_payload else None
-                        ),
-                        plan_validated=jsonable_encoder(
-                            trace_payload.get("plan_validated") if trace_payload else None
-                        ),
-                        trace_payload=jsonable_encoder(trace_payload if trace_payload else {}),
-                        answer_meta=jsonable_encoder(meta if meta else None),
-                        blocks=jsonable_encoder(envelope_blocks if envelope_blocks else None),
-                        flow_spans=flow_spans if flow_spans else None,
-                    )
+                if is_leader:
+                    with get_session_context() as session:
+                        persist_execution_trace(
+                            session=session,
+                            trace_id=active_trace_id,
+                            parent_trace_id=None,
+                            feature="ops",
+                            endpoint="/ops/ask/stream",
+                            method="POST",
+                            ops_mode=get_settings().ops_mode,
+                            question=payload.question,
+                            status=trace_status,
+                            duration_ms=int(elapsed),
+                            request_payload=jsonable_encoder(request_payload),
+                            plan_raw=jsonable_encoder(
+                                trace_payload.get("plan_raw") if trace_payload else None
+                            ),
+                            plan_validated=jsonable_encoder(
+                                trace_payload.get("plan_validated") if trace_payload else None
+                            ),
+                            trace_payload=jsonable_encoder(trace_payload if trace_payload else {}),
+                            answer_meta=jsonable_encoder(meta if meta else None),
+                            blocks=jsonable_encoder(envelope_blocks if envelope_blocks else None),
+                            flow_spans=flow_spans if flow_spans else None,
+                        )
             except Exception as exc:
                 logger.exception("ops.trace.persist_failed", exc_info=exc)
             
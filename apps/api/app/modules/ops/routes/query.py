@@ -6,6 +6,7 @@ Handles standard OPS query processing endpoints.
 Endpoints:
     POST /ops/query - Process OPS query with specified mode
     GET /ops/observability/kpis - Retrieve observability metrics
+    GET /ops/observability/connection-pools - Source connection pool stats
 """
 
 from __future__ import annotations
@@ -0,0 +1,224 @@
+"""
+In-flight coalescing for /ops/ask and /ops/ask/stream.
+
+During incidents many operators ask the same question within seconds. The
+first request for a key becomes the leader and runs the full pipeline;
+identical requests that arrive while it is still running become followers and
+attach to the leader's result (or replay and follow its SSE events) instead of
+re-running planning, tool execution and summarization.
+
+Only requests that overlap in time are coalesced: a flight is dropped from the
+registry as soon as its leader finishes, so nothing here behaves as a result
+cache. Followers still get their own history entries (handled by the routes).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from core.logging import get_logger
+
+from app.modules.ops.schemas import OpsAskRequest
+from app.modules.ops.services.orchestration.planner.plan_cache import (
+    fingerprint,
+    normalize_question,
+)
+
+logger = get_logger(__name__)
+
+_DONE = object()
+
+
+def ask_flight_key(endpoint: str, tenant_id: str, payload: OpsAskRequest) -> str:
+    """Key identical asks: tenant, normalized question, mode, assets and rerun patch."""
+    return fingerprint(
+        {
+            "endpoint": endpoint,
+            "tenant_id": tenant_id,
+            "question": normalize_question(payload.question),
+            "mode": payload.mode or "all",
+            "rerun": payload.rerun.model_dump(exclude_none=True) if payload.rerun else None,
+            "asset_overrides": payload.asset_overrides,
+            "source_asset": payload.source_asset,
+            "schema_asset": payload.schema_asset,
+            "resolver_asset": payload.resolver_asset,
+        }
+    )
+
+
+class AskFlightError(RuntimeError):
+    """The leader of a coalesced ask failed; followers surface its error."""
+
+
+class AskFlightAborted(AskFlightError):
+    """The leader went away without a result or an error; followers run on their own."""
+
+
+class AskFlight:
+    """A leader's in-progress ask that followers can wait on or stream from."""
+
+    def __init__(self, key: str, leader_trace_id: str | None):
+        self.key = key
+        self.leader_trace_id = leader_trace_id
+        self.started_at = time.monotonic()
+        self.followers = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._events: List[Tuple[str, Dict[str, Any]]] = []
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._result: Optional[Dict[str, Any]] = None
+        self._error: Optional[str] = None
+        self._aborted = False
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Record an SSE event from the leader and forward it to live followers."""
+        item = (event_type, copy.deepcopy(data))
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._events.append(item)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            self._notify(loop, queue, item)
+
+    def complete(
+        self, result: Optional[Dict[str, Any]] = None, error: Optional[BaseException] = None
+    ) -> None:
+        """Finish the flight; only the first call has any effect."""
+        with self._lock:
+            if self._done.is_set():
+                return
+            if result is not None and error is None:
+                self._result = copy.deepcopy(result)
+            elif error is not None:
+                self._error = str(error)
+            else:
+                # Client disconnect or cancellation, not a pipeline failure
+                self._aborted = True
+                self._error = "leader request aborted"
+            self._done.set()
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+        for loop, queue in subscribers:
+            self._notify(loop, queue, _DONE)
+
+    def wait(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Block until the leader finishes and return a private copy of its result.
+
+        Returns None if the leader did not finish within ``timeout``; raises
+        AskFlightAborted if it went away without a result and AskFlightError
+        if it failed.
+        """
+        if not self._done.wait(timeout):
+            return None
+        return self.result()
+
+    def result(self) -> Dict[str, Any]:
+        if self._aborted:
+            raise AskFlightAborted(self._error)
+        if self._error is not None:
+            raise AskFlightError(self._error)
+        return copy.deepcopy(self._result or {})
+
+    async def subscribe(self, timeout: float) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Replay the leader's events so far, then follow it until it finishes."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            backlog = list(self._events)
+            finished = self._done.is_set()
+            if not finished:
+                self._subscribers.append((loop, queue))
+        try:
+            for event_type, data in backlog:
+                yield event_type, copy.deepcopy(data)
+            if finished:
+                return
+            deadline = loop.time() + timeout
+            while True:
+                item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+                if item is _DONE:
+                    return
+                event_type, data = item
+                yield event_type, copy.deepcopy(data)
+        finally:
+            with self._lock:
+                if (loop, queue) in self._subscribers:
+                    self._subscribers.remove((loop, queue))
+
+    @staticmethod
+    def _notify(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, item: Any) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # Follower's loop already closed (client went away)
+            pass
+
+
+class AskCoalescer:
+    """Registry of in-flight asks keyed by ``ask_flight_key``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, AskFlight] = {}
+        self._counters: Dict[str, int] = {"leaders": 0, "followers": 0}
+
+    def join(self, key: str, trace_id: str | None) -> Tuple[AskFlight, bool]:
+        """Return ``(flight, is_leader)`` for ``key``."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and not flight.done:
+                flight.followers += 1
+                self._counters["followers"] += 1
+                return flight, False
+            flight = AskFlight(key, trace_id)
+            self._flights[key] = flight
+            self._counters["leaders"] += 1
+            return flight, True
+
+    def finish(
+        self,
+        flight: AskFlight,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        flight.complete(result=result, error=error)
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+        if flight.followers:
+            logger.info(
+                "ops.ask.coalesced",
+                extra={
+                    "leader_trace_id": flight.leader_trace_id,
+                    "followers": flight.followers,
+                    "elapsed_ms": int((time.monotonic() - flight.started_at) * 1000),
+                },
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._counters, "in_flight": len(self._flights)}
+
+
+_ask_coalescer: Optional[AskCoalescer] = None
+_ask_coalescer_lock = threading.Lock()
+
+
+def get_ask_coalescer() -> AskCoalescer:
+    """Get the process-wide ask coalescer."""
+    global _ask_coalescer
+    if _ask_coalescer is None:
+        with _ask_coalescer_lock:
+            if _ask_coalescer is None:
+                _ask_coalescer = AskCoalescer()
+    return _ask_coalescer
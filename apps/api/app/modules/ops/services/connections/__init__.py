@@ -3,10 +3,35 @@ ConnectionFactory Pattern - Dynamic source connection management.
 
 This module provides a factory pattern for creating connections to different
 data sources (PostgreSQL, Neo4j, REST API, etc.) based on source asset configuration.
+Connections are backed by per-source pools (see ``pool``); async-native
+connections for the serving event loop live in ``async_factory``.
 """
 
 from __future__ import annotations
 
+from .async_factory import AsyncConnectionFactory
+from .async_pool import get_async_pool_registry
 from .factory import ConnectionFactory, create_connection
+from .pool import (
+    ConnectionPoolRegistry,
+    PoolConfig,
+    PoolMaintainer,
+    SourceConnectionPool,
+    get_pool_maintainer,
+    get_pool_registry,
+    invalidate_source_pools,
+)
 
-__all__ = ["ConnectionFactory", "create_connection"]
+__all__ = [
+    "AsyncConnectionFactory",
+    "get_async_pool_registry",
+    "ConnectionFactory",
+    "create_connection",
+    "ConnectionPoolRegistry",
+    "PoolConfig",
+    "PoolMaintainer",
+    "SourceConnectionPool",
+    "get_pool_maintainer",
+    "get_pool_registry",
+    "invalidate_source_pools",
+]
@@ -0,0 +1,269 @@
+"""
+AsyncConnectionFactory - async-native connections for the serving event loop.
+
+Counterparts of ``PostgreSQLConnection`` / ``Neo4jConnection`` built on
+``psycopg.AsyncConnection`` and the neo4j ``AsyncDriver`` so tool queries
+issued from the serving loop never block it. Queries take an optional timeout;
+on timeout or task cancellation the server-side query is cancelled too.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from app.modules.ops.services.connections.async_pool import (
+    AsyncSourceConnectionPool,
+    get_async_pool_registry,
+)
+from app.modules.ops.services.connections.factory import (
+    Neo4jConnection,
+    PostgreSQLConnection,
+    prepare_sql,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPostgreSQLConnection(PostgreSQLConnection):
+    """
+    PostgreSQL connection using ``psycopg.AsyncConnection``.
+
+    Reuses the sync class for password resolution and source config; the
+    connection lifecycle and query execution are async.
+    """
+
+    def __init__(self, source_asset: Dict[str, Any]):
+        super().__init__(source_asset)
+        self._async_pool: AsyncSourceConnectionPool | None = None
+
+    async def _open_async_resource(self) -> Any:
+        import psycopg
+
+        conn_config = self.source_asset.get("connection", {})
+        connection = await psycopg.AsyncConnection.connect(
+            host=conn_config.get("host"),
+            port=conn_config.get("port", 5432),
+            user=conn_config.get("username"),
+            password=self._resolve_password(),
+            dbname=conn_config.get("database"),
+            connect_timeout=conn_config.get("timeout", 30),
+        )
+        logger.info(
+            f"Connected to PostgreSQL (async): {conn_config.get('host')}:{conn_config.get('port')}"
+        )
+        return connection
+
+    async def _close_async_resource(self, resource: Any) -> None:
+        await resource.close()
+
+    async def _check_async_resource(self, resource: Any) -> bool:
+        if resource.closed:
+            return False
+        async with resource.cursor() as cur:
+            await cur.execute("SELECT 1")
+        await resource.rollback()
+        return True
+
+    async def connect_async(self, timeout: float | None = None) -> None:
+        """Check out an async PostgreSQL connection from the source's async pool."""
+        try:
+            self._async_pool = get_async_pool_registry().get_pool(
+                self.source_asset,
+                opener=self._open_async_resource,
+                closer=self._close_async_resource,
+                health_check=self._check_async_resource,
+            )
+            self.connection = await self._async_pool.acquire(timeout=timeout)
+            self._broken = False
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
+
+    async def execute_async(
+        self,
+        query: str,
+        params: Dict[str, Any] | tuple | list | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Execute SQL; on timeout/cancellation the server-side query is cancelled."""
+        if not self.connection:
+            raise ConnectionError("Not connected to database")
+        try:
+            return await asyncio.wait_for(self._execute_async(query, params), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Query exceeded {timeout:.1f}s and was cancelled")
+
+    async def _execute_async(self, query: str, params: Any) -> Any:
+        try:
+            query_to_execute, execute_params = prepare_sql(query, params)
+            async with self.connection.cursor() as cur:
+                await cur.execute(query_to_execute, execute_params)
+                if cur.description:
+                    columns = [desc[0] for desc in cur.description]
+                    rows = await cur.fetchall()
+                    return [dict(zip(columns, row)) for row in rows]
+                await self.connection.commit()
+                return {"rowcount": cur.rowcount}
+        except asyncio.CancelledError:
+            self._broken = True
+            try:
+                await self.connection.cancel_safe()
+            except Exception as cancel_exc:
+                logger.debug(f"Failed to cancel PostgreSQL query: {cancel_exc}")
+            raise
+        except Exception as e:
+            try:
+                await self.connection.rollback()
+            except Exception:
+                self._broken = True
+            raise RuntimeError(f"Query execution failed: {e}")
+
+    async def close_async(self) -> None:
+        """Return the connection to the async pool (rolled back to idle)."""
+        if not self.connection:
+            return
+        connection, self.connection = self.connection, None
+        pool, self._async_pool = self._async_pool, None
+        broken = self._broken or bool(getattr(connection, "closed", False))
+        if not broken:
+            try:
+                # Never hand out a connection with an open transaction
+                await connection.rollback()
+            except Exception:
+                broken = True
+        if pool is None:
+            await self._close_async_resource(connection)
+        else:
+            await pool.release(connection, discard=broken)
+
+
+class AsyncNeo4jConnection(Neo4jConnection):
+    """
+    Neo4j connection using the neo4j ``AsyncDriver``.
+
+    One driver per source is shared by all callers on the serving loop.
+    """
+
+    def __init__(self, source_asset: Dict[str, Any]):
+        super().__init__(source_asset)
+        self._async_pool: AsyncSourceConnectionPool | None = None
+
+    async def _open_async_resource(self) -> Any:
+        from neo4j import AsyncGraphDatabase
+
+        conn_config = self.source_asset.get("connection", {})
+        uri = conn_config.get("uri")
+        if not uri:
+            host = conn_config.get("host", "localhost")
+            port = conn_config.get("port", "7687")
+            uri = f"bolt://{host}:{port}"
+        driver = AsyncGraphDatabase.driver(
+            uri,
+            auth=(conn_config.get("username", "neo4j"), self._resolve_password()),
+        )
+        await driver.verify_connectivity()
+        logger.info(f"Connected to Neo4j (async): {uri}")
+        return driver
+
+    async def _close_async_resource(self, resource: Any) -> None:
+        await resource.close()
+
+    async def _check_async_resource(self, resource: Any) -> bool:
+        await resource.verify_connectivity()
+        return True
+
+    async def connect_async(self, timeout: float | None = None) -> None:
+        """Check out the shared async Neo4j driver for this source."""
+        try:
+            self._async_pool = get_async_pool_registry().get_pool(
+                self.source_asset,
+                opener=self._open_async_resource,
+                closer=self._close_async_resource,
+                health_check=self._check_async_resource,
+                shared=True,
+            )
+            self.driver = await self._async_pool.acquire(timeout=timeout)
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to Neo4j: {e}")
+
+    async def execute_async(
+        self,
+        query: str,
+        params: Dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> list[Dict[str, Any]]:
+        """
+        Execute Cypher and return records as dicts.
+
+        ``timeout`` is enforced client-side and also sent as the transaction
+        timeout so the server stops work on its side.
+        """
+        if not self.driver:
+            raise ConnectionError("Not connected to Neo4j")
+        from neo4j import Query
+
+        async def _run() -> list[Dict[str, Any]]:
+            async with self.driver.session() as session:
+                result = await session.run(Query(query, timeout=timeout), params or {})
+                return await result.data()
+
+        try:
+            return await asyncio.wait_for(_run(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Cypher query exceeded {timeout:.1f}s and was cancelled")
+        except Exception as e:
+            raise RuntimeError(f"Cypher execution failed: {e}")
+
+    async def close_async(self) -> None:
+        """Release the async driver back to the pool."""
+        if not self.driver:
+            return
+        driver, self.driver = self.driver, None
+        pool, self._async_pool = self._async_pool, None
+        if pool is None:
+            await self._close_async_resource(driver)
+        else:
+            await pool.release(driver)
+
+
+class AsyncConnectionFactory:
+    """
+    Factory for async source connections.
+
+    Only usable on the serving loop (see ``is_available``); other callers
+    should use ``ConnectionFactory``.
+    """
+
+    _creators: Dict[str, type] = {
+        "postgres": AsyncPostgreSQLConnection,
+        "postgresql": AsyncPostgreSQLConnection,
+        "neo4j": AsyncNeo4jConnection,
+    }
+
+    @classmethod
+    def is_available(cls, source_asset: Dict[str, Any]) -> bool:
+        """True if this source type has an async driver and we are on the serving loop."""
+        source_type = str(source_asset.get("source_type", "")).lower()
+        return source_type in cls._creators and get_async_pool_registry().is_serving_loop()
+
+    @classmethod
+    async def create(
+        cls, source_asset: Dict[str, Any], timeout: float | None = None
+    ) -> AsyncPostgreSQLConnection | AsyncNeo4jConnection:
+        """
+        Create and connect an async connection for the given source asset.
+
+        Raises:
+            ValueError: If source type has no async driver
+        """
+        source_type = str(source_asset.get("source_type", "")).lower()
+        creator = cls._creators.get(source_type)
+        if not creator:
+            raise ValueError(
+                f"Unsupported async source type: {source_type}. "
+                f"Supported types: {list(cls._creators.keys())}"
+            )
+        connection = creator(source_asset)
+        await connection.connect_async(timeout=timeout)
+        return connection
@@ -0,0 +1,460 @@
+"""
+Async source connection pooling for the serving event loop.
+
+Async connections (``psycopg.AsyncConnection``, the neo4j ``AsyncDriver``) are
+bound to the event loop that opened them, so async pools only live on the
+long-lived serving loop registered at startup (``bind``). Code running on
+short-lived loops (``asyncio.run`` inside sync wrappers) keeps using the
+thread-safe sync pools in ``pool``.
+
+Pools share ``PoolConfig`` and keying with the sync pools, and are retired by
+``invalidate_source_pools`` when a source asset is republished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.modules.ops.services.connections.pool import (
+    PoolConfig,
+    _PooledResource,
+    connection_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSourceConnectionPool:
+    """
+    Pool of async connection resources for one source asset.
+
+    Must only be used from the event loop it was created on. Exclusive mode
+    (PostgreSQL) checks out one resource per caller; shared mode (Neo4j
+    AsyncDriver) hands a single resource to every caller.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        source_name: str,
+        source_type: str,
+        opener: Callable[[], Awaitable[Any]],
+        closer: Callable[[Any], Awaitable[None]],
+        health_check: Optional[Callable[[Any], Awaitable[bool]]] = None,
+        config: Optional[PoolConfig] = None,
+        shared: bool = False,
+    ):
+        self.key = key
+        self.source_name = source_name
+        self.source_type = source_type
+        self.shared = shared
+        self.config = config or PoolConfig()
+        self._opener = opener
+        self._closer = closer
+        self._health_check = health_check
+        self._slots = asyncio.Semaphore(self.config.max_size)
+        self._open_lock = asyncio.Lock()
+        self._idle: Deque[_PooledResource] = deque()
+        self._in_use: Dict[int, _PooledResource] = {}
+        self._closed = False
+        self._counters: Dict[str, int] = {
+            "created": 0,
+            "closed": 0,
+            "acquired": 0,
+            "reused": 0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+            "discarded": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._in_use)
+
+    async def acquire(self, timeout: float | None = None) -> Any:
+        """
+        Check out a resource, opening a new one if needed.
+
+        ``timeout`` caps the wait for a free slot below the pool's
+        ``acquire_timeout_seconds``.
+
+        Raises:
+            ConnectionError: If the pool is closed or exhausted past the acquire timeout
+        """
+        if self._closed:
+            raise ConnectionError(f"Connection pool for '{self.source_name}' is closed")
+        if self.shared:
+            return await self._acquire_shared()
+
+        wait = self.config.acquire_timeout_seconds
+        if timeout is not None:
+            wait = min(wait, timeout)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), max(wait, 0))
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            raise ConnectionError(
+                f"Connection pool for '{self.source_name}' exhausted "
+                f"(max_size={self.config.max_size})"
+            )
+
+        try:
+            await self._reap_idle()
+            while self._idle:
+                entry = self._idle.pop()
+                if await self._is_usable(entry):
+                    return self._checkout(entry, reused=True)
+                await self._close_entry(entry)
+            resource = await self._opener()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        now = time.monotonic()
+        self._counters["created"] += 1
+        return self._checkout(_PooledResource(resource, now, now, now), reused=False)
+
+    async def _acquire_shared(self) -> Any:
+        async with self._open_lock:
+            entry = self._idle[0] if self._idle else None
+            if entry is not None and not await self._is_usable(entry):
+                await self._retire_shared(entry)
+                entry = None
+            if entry is None:
+                resource = await self._opener()
+                now = time.monotonic()
+                entry = _PooledResource(resource, now, now, now)
+                self._idle.append(entry)
+                self._counters["created"] += 1
+                reused = False
+            else:
+                reused = True
+        entry.refs += 1
+        entry.use_count += 1
+        entry.last_used_at = time.monotonic()
+        self._counters["acquired"] += 1
+        if reused:
+            self._counters["reused"] += 1
+        return entry.resource
+
+    async def release(self, resource: Any, discard: bool = False) -> None:
+        """Return a resource to the pool, or close it if it is broken or retired."""
+        if resource is None:
+            return
+        if discard:
+            self._counters["discarded"] += 1
+        if self.shared:
+            await self._release_shared(resource, discard)
+            return
+
+        entry = self._in_use.pop(id(resource), None)
+        if entry is None:
+            await self._safe_close(resource)
+            return
+        self._slots.release()
+        entry.last_used_at = time.monotonic()
+        if discard or self._closed or self._expired(entry, entry.last_used_at):
+            await self._close_entry(entry)
+        else:
+            self._idle.append(entry)
+
+    async def _release_shared(self, resource: Any, discard: bool) -> None:
+        current = self._idle[0] if self._idle else None
+        if current is not None and current.resource is resource:
+            entry = current
+        else:
+            entry = self._in_use.get(id(resource))
+        if entry is None:
+            await self._safe_close(resource)
+            return
+        entry.refs = max(0, entry.refs - 1)
+        if discard or self._closed or entry is not current:
+            await self._retire_shared(entry)
+
+    async def _retire_shared(self, entry: _PooledResource) -> None:
+        if self._idle and self._idle[0] is entry:
+            self._idle.clear()
+        if entry.refs > 0:
+            # Still held by other callers; close once the last holder releases
+            self._in_use[id(entry.resource)] = entry
+        else:
+            self._in_use.pop(id(entry.resource), None)
+            await self._close_entry(entry)
+
+    def retire(self) -> None:
+        """Stop handing out resources; callable from any thread."""
+        self._closed = True
+
+    async def close(self) -> None:
+        """Retire the pool: close idle resources now, in-use ones on release."""
+        self._closed = True
+        if self.shared:
+            if self._idle:
+                await self._retire_shared(self._idle[0])
+            return
+        while self._idle:
+            await self._close_entry(self._idle.pop())
+
+    async def prune(self) -> int:
+        """Close idle resources past their idle timeout or lifetime."""
+        if self.shared:
+            return 0
+        return await self._reap_idle()
+
+    async def warm(self) -> int:
+        """Open idle resources until the pool holds ``min_size``."""
+        opened = 0
+        while not self._closed and self.size < self.config.min_size:
+            if self.shared:
+                if self._idle:
+                    break
+            elif self._slots.locked():
+                break
+            else:
+                # Hold a slot while opening so the pool never exceeds max_size
+                await self._slots.acquire()
+            try:
+                resource = await self._opener()
+            except Exception as exc:
+                logger.warning(f"Failed to pre-warm async connection pool '{self.key}': {exc}")
+                break
+            finally:
+                if not self.shared:
+                    self._slots.release()
+            now = time.monotonic()
+            entry = _PooledResource(resource, now, now, now)
+            self._counters["created"] += 1
+            if self._closed or (self.shared and self._idle):
+                await self._close_entry(entry)
+                break
+            self._idle.append(entry)
+            opened += 1
+        return opened
+
+    def stats(self) -> Dict[str, Any]:
+        if self.shared:
+            entries = list(self._idle) + list(self._in_use.values())
+            in_use = sum(entry.refs for entry in entries)
+            idle = sum(1 for entry in self._idle if entry.refs == 0)
+        else:
+            in_use = len(self._in_use)
+            idle = len(self._idle)
+        return {
+            "key": self.key,
+            "source_name": self.source_name,
+            "source_type": self.source_type,
+            "mode": "shared" if self.shared else "exclusive",
+            "retired": self._closed,
+            "size": self.size,
+            "idle": idle,
+            "in_use": in_use,
+            "config": asdict(self.config),
+            **self._counters,
+        }
+
+    def _checkout(self, entry: _PooledResource, reused: bool) -> Any:
+        entry.use_count += 1
+        entry.last_used_at = time.monotonic()
+        self._in_use[id(entry.resource)] = entry
+        self._counters["acquired"] += 1
+        if reused:
+            self._counters["reused"] += 1
+        return entry.resource
+
+    def _expired(self, entry: _PooledResource, now: float) -> bool:
+        max_lifetime = self.config.max_lifetime_seconds
+        return max_lifetime > 0 and now - entry.created_at >= max_lifetime
+
+    async def _is_usable(self, entry: _PooledResource) -> bool:
+        now = time.monotonic()
+        if self._expired(entry, now):
+            return False
+        if (
+            self._health_check is None
+            or now - entry.last_checked_at < self.config.health_check_interval_seconds
+        ):
+            return True
+        try:
+            healthy = bool(await self._health_check(entry.resource))
+        except Exception as exc:
+            logger.debug(f"Async pool health check raised for '{self.source_name}': {exc}")
+            healthy = False
+        entry.last_checked_at = now
+        if not healthy:
+            self._counters["health_check_failures"] += 1
+        return healthy
+
+    async def _reap_idle(self) -> int:
+        now = time.monotonic()
+        idle_timeout = self.config.idle_timeout_seconds
+        reaped = 0
+        # Oldest idle entries sit at the left end of the deque
+        while self._idle and self.size > self.config.min_size:
+            entry = self._idle[0]
+            idle_for = now - entry.last_used_at
+            if not self._expired(entry, now) and (idle_timeout <= 0 or idle_for < idle_timeout):
+                break
+            self._idle.popleft()
+            await self._close_entry(entry)
+            reaped += 1
+        return reaped
+
+    async def _close_entry(self, entry: _PooledResource) -> None:
+        self._counters["closed"] += 1
+        await self._safe_close(entry.resource)
+
+    async def _safe_close(self, resource: Any) -> None:
+        try:
+            await self._closer(resource)
+        except Exception as exc:
+            logger.debug(f"Failed to close async pooled resource for '{self.source_name}': {exc}")
+
+
+class AsyncConnectionPoolRegistry:
+    """Registry of async source pools on the serving event loop."""
+
+    def __init__(self):
+        self._pools: Dict[str, AsyncSourceConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._invalidations = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Register the long-lived loop that async pools may live on."""
+        self._loop = loop
+
+    def is_serving_loop(self) -> bool:
+        """True when called from the bound serving loop."""
+        try:
+            return self._loop is not None and asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def get_pool(
+        self,
+        source_asset: Dict[str, Any],
+        opener: Callable[[], Awaitable[Any]],
+        closer: Callable[[Any], Awaitable[None]],
+        health_check: Optional[Callable[[Any], Awaitable[bool]]] = None,
+        shared: bool = False,
+    ) -> AsyncSourceConnectionPool:
+        """Return the pool for a source asset; must be called on the serving loop."""
+        if not self.is_serving_loop():
+            raise RuntimeError("Async source pools are only available on the serving event loop")
+        source_name = str(source_asset.get("name") or "anonymous")
+        key = f"{source_name}:{connection_fingerprint(source_asset)}"
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is not None:
+                return pool
+            stale = [
+                self._pools.pop(k) for k, p in list(self._pools.items())
+                if p.source_name == source_name
+            ]
+            pool = AsyncSourceConnectionPool(
+                key=key,
+                source_name=source_name,
+                source_type=str(source_asset.get("source_type", "")).lower(),
+                opener=opener,
+                closer=closer,
+                health_check=health_check,
+                config=PoolConfig.from_source_asset(source_asset),
+                shared=shared,
+            )
+            self._pools[key] = pool
+        # Connection config changed under the same name: retire stale pools
+        self._schedule_close(stale)
+        logger.info(f"Created async connection pool: {key} (shared={shared})")
+        return pool
+
+    def invalidate(self, source_name: str | None = None) -> int:
+        """
+        Retire pools for a source (or all pools when source_name is None).
+
+        Safe to call from any thread; resources are closed on the serving loop.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, pool in self._pools.items()
+                if source_name is None or pool.source_name == source_name
+            ]
+            pools = [self._pools.pop(key) for key in keys]
+            self._invalidations += len(pools)
+        self._schedule_close(pools)
+        return len(pools)
+
+    async def close_all(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            await pool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pools = list(self._pools.values())
+            invalidations = self._invalidations
+        pool_stats: List[Dict[str, Any]] = [pool.stats() for pool in pools]
+        return {
+            "bound": self._loop is not None,
+            "pool_count": len(pool_stats),
+            "invalidations": invalidations,
+            "total_size": sum(p["size"] for p in pool_stats),
+            "total_in_use": sum(p["in_use"] for p in pool_stats),
+            "pools": pool_stats,
+        }
+
+    def schedule_maintenance(self) -> None:
+        """Prune and re-warm every pool on the serving loop; callable from any thread."""
+        with self._lock:
+            pools = list(self._pools.values())
+        loop = self._loop
+        if not pools or loop is None or loop.is_closed():
+            return
+
+        async def _maintain() -> None:
+            for pool in pools:
+                await pool.prune()
+                await pool.warm()
+
+        if self.is_serving_loop():
+            loop.create_task(_maintain())
+        else:
+            asyncio.run_coroutine_threadsafe(_maintain(), loop)
+
+    def _schedule_close(self, pools: List[AsyncSourceConnectionPool]) -> None:
+        for pool in pools:
+            pool.retire()
+        loop = self._loop
+        if not pools or loop is None or loop.is_closed():
+            return
+
+        async def _close() -> None:
+            for pool in pools:
+                await pool.close()
+
+        if self.is_serving_loop():
+            loop.create_task(_close())
+        else:
+            asyncio.run_coroutine_threadsafe(_close(), loop)
+
+
+_async_pool_registry: AsyncConnectionPoolRegistry | None = None
+_async_registry_lock = threading.Lock()
+
+
+def get_async_pool_registry() -> AsyncConnectionPoolRegistry:
+    """Get the process-wide async connection pool registry."""
+    global _async_pool_registry
+    if _async_pool_registry is None:
+        with _async_registry_lock:
+            if _async_pool_registry is None:
+                _async_pool_registry = AsyncConnectionPoolRegistry()
+    return _async_pool_registry
@@ -12,21 +12,85 @@ import os
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
+from core.config import get_settings
 from core.encryption import get_encryption_manager
 
+from app.modules.ops.services.connections.pool import (
+    SourceConnectionPool,
+    get_pool_registry,
+)
 from app.modules.ops.services.connections.sql_processor import SQLTemplateProcessor
 
 logger = logging.getLogger(__name__)
 
 
+def prepare_sql(
+    query: str, params: Dict[str, Any] | tuple | list | None
+) -> tuple[str, Any]:
+    """
+    Resolve templates and placeholder styles into a ``(sql, params)`` pair for psycopg.
+
+    Shared by the sync and async PostgreSQL connections.
+    """
+    # Process SQL template if params is a dict with filters
+    if isinstance(params, dict) and ("filters" in params or "where_clause" in query or "{where_clause}" in query or "{where}" in query):
+        processed_sql, processed_params = SQLTemplateProcessor.process_template(query, params)
+        execute_params = processed_params
+        query_to_execute = processed_sql
+    elif params is None:
+        execute_params = ()
+        query_to_execute = query
+    elif isinstance(params, dict):
+        # Check if query uses named placeholders (%(name)s)
+        if "%(" in query:
+            execute_params = params
+            query_to_execute = query
+        else:
+            # Convert dict to tuple for positional placeholders
+            execute_params = tuple(params.values())
+            query_to_execute = query
+    elif isinstance(params, list):
+        execute_params = tuple(params)
+        query_to_execute = query
+    else:
+        execute_params = params
+        query_to_execute = query
+
+    # psycopg treats '%' as placeholder prefix.
+    # Escape literal percent signs used in SQL string patterns.
+    query_to_execute = SQLTemplateProcessor.escape_literal_percents(
+        query_to_execute
+    )
+
+    # Validate parameter count if using positional placeholders
+    if "%s" in query_to_execute and isinstance(execute_params, tuple):
+        if not SQLTemplateProcessor.validate_param_count(query_to_execute, execute_params):
+            logger.warning(
+                f"Parameter count mismatch for query. "
+                f"Placeholders: {SQLTemplateProcessor.extract_placeholder_count(query_to_execute)}, "
+                f"Params: {len(execute_params)}"
+            )
+
+    return query_to_execute, execute_params
+
+
 class SourceConnection(ABC):
     """
     Abstract base class for source connections.
 
     Each source type (PostgreSQL, Neo4j, REST API, etc.) should implement
     this interface to provide a consistent execution interface.
+
+    Subclasses implement ``_open_resource`` (and override ``_close_resource``
+    if needed) to get pooling for free: ``_acquire_resource`` checks out a
+    long-lived resource from the source's pool and ``_release_resource`` hands
+    it back on close().
     """
 
+    # Whether one pooled resource can be handed to many callers at once
+    # (e.g. thread-safe drivers/clients that multiplex internally).
+    pool_shared: bool = False
+
     def __init__(self, source_asset: Dict[str, Any]):
         """
         Initialize the connection with source asset configuration.
@@ -37,6 +101,7 @@ class SourceConnection(ABC):
         self.source_asset = source_asset
         self.source_type = source_asset.get("source_type", "postgresql")
         self.connection = None
+        self._pool: SourceConnectionPool | None = None
 
     @abstractmethod
     def connect(self) -> None:
@@ -69,6 +134,40 @@ class SourceConnection(ABC):
         """Close the connection and cleanup resources."""
         pass
 
+    @abstractmethod
+    def _open_resource(self) -> Any:
+        """Open a new underlying resource (connection, driver, client)."""
+        pass
+
+    def _close_resource(self, resource: Any) -> None:
+        """Close an underlying resource opened by _open_resource."""
+        resource.close()
+
+    def _check_resource(self, resource: Any) -> bool:
+        """Return False if a pooled resource is no longer usable."""
+        return True
+
+    def _acquire_resource(self) -> Any:
+        """Check out a resource from the source pool (or open one if pooling is off)."""
+        if not get_settings().ops_source_pool_enabled:
+            return self._open_resource()
+        self._pool = get_pool_registry().get_pool(
+            self.source_asset,
+            opener=self._open_resource,
+            closer=self._close_resource,
+            health_check=self._check_resource,
+            shared=self.pool_shared,
+        )
+        return self._pool.acquire()
+
+    def _release_resource(self, resource: Any, discard: bool = False) -> None:
+        """Return a resource to its pool, or close it when it was not pooled."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            self._close_resource(resource)
+        else:
+            pool.release(resource, discard=discard)
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -146,27 +245,47 @@ class PostgreSQLConnection(SourceConnection):
     PostgreSQL/MySQL database connection.
 
     Supports PostgreSQL and MySQL using psycopg2/mysql-compatible drivers.
+    Connections are checked out from a per-source pool and returned on close().
     """
 
+    def __init__(self, source_asset: Dict[str, Any]):
+        super().__init__(source_asset)
+        self._broken = False
+
+    def _open_resource(self) -> Any:
+        import psycopg
+
+        conn_config = self.source_asset.get("connection", {})
+        connection = psycopg.connect(
+            host=conn_config.get("host"),
+            port=conn_config.get("port", 5432),
+            user=conn_config.get("username"),
+            password=self._resolve_password(),
+            dbname=conn_config.get("database"),
+            connect_timeout=conn_config.get("timeout", 30),
+        )
+        logger.info(
+            f"Connected to PostgreSQL: {conn_config.get('host')}:{conn_config.get('port')}"
+        )
+        return connection
+
+    def _check_resource(self, resource: Any) -> bool:
+        if resource.closed:
+            return False
+        with resource.cursor() as cur:
+            cur.execute("SELECT 1")
+        resource.rollback()
+        return True
+
     def connect(self) -> None:
-        """Establish PostgreSQL connection."""
+        """Check out a PostgreSQL connection from the source pool."""
         try:
-            import psycopg
-
-            conn_config = self.source_asset.get("connection", {})
-            self.connection = psycopg.connect(
-                host=conn_config.get("host"),
-                port=conn_config.get("port", 5432),
-                user=conn_config.get("username"),
-                password=self._resolve_password(),
-                dbname=conn_config.get("database"),
-                connect_timeout=conn_config.get("timeout", 30),
-            )
-            logger.info(
-                f"Connected to PostgreSQL: {conn_config.get('host')}:{conn_config.get('port')}"
-            )
+            import psycopg  # noqa: F401
         except ImportError:
             raise ImportError("psycopg library is required for PostgreSQL connections")
+        try:
+            self.connection = self._acquire_resource()
+            self._broken = False
         except Exception as e:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}")
 
@@ -178,46 +297,8 @@ class PostgreSQLConnection(SourceConnection):
             raise ConnectionError("Not connected to database")
 
         try:
+            query_to_execute, execute_params = prepare_sql(query, params)
             with self.connection.cursor() as cur:
-                # Process SQL template if params is a dict with filters
-                if isinstance(params, dict) and ("filters" in params or "where_clause" in query or "{where_clause}" in query or "{where}" in query):
-                    processed_sql, processed_params = SQLTemplateProcessor.process_template(query, params)
-                    execute_params = processed_params
-                    query_to_execute = processed_sql
-                elif params is None:
-                    execute_params = ()
-                    query_to_execute = query
-                elif isinstance(params, dict):
-                    # Check if query uses named placeholders (%(name)s)
-                    if "%(" in query:
-                        execute_params = params
-                        query_to_execute = query
-                    else:
-                        # Convert dict to tuple for positional placeholders
-                        execute_params = tuple(params.values())
-                        query_to_execute = query
-                elif isinstance(params, list):
-                    execute_params = tuple(params)
-                    query_to_execute = query
-                else:
-                    execute_params = params
-                    query_to_execute = query
-
-                # psycopg treats '%' as placeholder prefix.
-                # Escape literal percent signs used in SQL string patterns.
-                query_to_execute = SQLTemplateProcessor.escape_literal_percents(
-                    query_to_execute
-                )
-
-                # Validate parameter count if using positional placeholders
-                if "%s" in query_to_execute and isinstance(execute_params, tuple):
-                    if not SQLTemplateProcessor.validate_param_count(query_to_execute, execute_params):
-                        logger.warning(
-                            f"Parameter count mismatch for query. "
-                            f"Placeholders: {SQLTemplateProcessor.extract_placeholder_count(query_to_execute)}, "
-                            f"Params: {len(execute_params)}"
-                        )
-
                 cur.execute(query_to_execute, execute_params)
                 # Check if this is a SELECT query
                 if cur.description:
@@ -229,50 +310,85 @@ class PostgreSQLConnection(SourceConnection):
                     self.connection.commit()
                     return {"rowcount": cur.rowcount}
         except Exception as e:
-            self.connection.rollback()
+            try:
+                self.connection.rollback()
+            except Exception:
+                self._broken = True
             raise RuntimeError(f"Query execution failed: {e}")
 
+    def cancel(self) -> None:
+        """Cancel the running query from another thread (e.g. after a timeout)."""
+        connection = self.connection
+        if connection is not None:
+            # State after a cancel is uncertain; do not return it to the pool
+            self._broken = True
+            connection.cancel_safe()
+
     def close(self) -> None:
-        """Close PostgreSQL connection."""
+        """Return PostgreSQL connection to the pool (rolled back to idle)."""
         if self.connection:
-            self.connection.close()
-            self.connection = None
+            connection, self.connection = self.connection, None
+            broken = self._broken or bool(getattr(connection, "closed", False))
+            if not broken:
+                try:
+                    # Never hand out a connection with an open transaction
+                    connection.rollback()
+                except Exception:
+                    broken = True
+            self._release_resource(connection, discard=broken)
 
 
 class Neo4jConnection(SourceConnection):
     """
     Neo4j graph database connection.
 
-    Uses the official Neo4j Python driver.
+    Uses the official Neo4j Python driver. The driver keeps its own bolt
+    connection pool, so a single driver per source is shared by all callers.
     """
 
+    pool_shared = True
+
+    def __init__(self, source_asset: Dict[str, Any]):
+        super().__init__(source_asset)
+        self.driver = None
+
+    def _open_resource(self) -> Any:
+        from neo4j import GraphDatabase
+
+        conn_config = self.source_asset.get("connection", {})
+        # Get URI from connection config
+        uri = conn_config.get("uri")
+        if not uri:
+            # Fallback to building URI from host/port
+            host = conn_config.get("host", "localhost")
+            port = conn_config.get("port", "7687")
+            uri = f"bolt://{host}:{port}"
+
+        username = conn_config.get("username", "neo4j")
+        password = self._resolve_password()
+        database = conn_config.get("database", "neo4j")
+
+        driver = GraphDatabase.driver(
+            uri,
+            auth=(username, password),
+        )
+        # Verify connectivity once per pooled driver, not per call
+        driver.verify_connectivity()
+        logger.info(f"Connected to Neo4j: {uri} (database: {database})")
+        return driver
+
+    def _check_resource(self, resource: Any) -> bool:
+        resource.verify_connectivity()
+        return True
+
     def connect(self) -> None:
-        """Establish Neo4j connection."""
+        """Check out the shared Neo4j driver for this source."""
         try:
-            from neo4j import GraphDatabase
-
-            conn_config = self.source_asset.get("connection", {})
-            # Get URI from connection config
-            uri = conn_config.get("uri")
-            if not uri:
-                # Fallback to building URI from host/port
-                host = conn_config.get("host", "localhost")
-                port = conn_config.get("port", "7687")
-                uri = f"bolt://{host}:{port}"
-
-            username = conn_config.get("username", "neo4j")
-            password = self._resolve_password()
-            database = conn_config.get("database", "neo4j")
-
-            self.driver = GraphDatabase.driver(
-                uri,
-                auth=(username, password),
-            )
-            # Verify connectivity
-            self.driver.verify_connectivity()
-            logger.info(f"Connected to Neo4j: {uri} (database: {database})")
+            import neo4j  # noqa: F401
         except ImportError:
             raise ImportError("neo4j library is required for Neo4j connections")
+        try:
+            self.driver = self._acquire_resource()
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Neo4j: {e}")
 
@@ -289,33 +405,51 @@ class Neo4jConnection(SourceConnection):
             raise RuntimeError(f"Cypher execution failed: {e}")
 
     def close(self) -> None:
-        """Close Neo4j connection."""
-        if hasattr(self, "driver") and self.driver:
-            self.driver.close()
-            self.driver = None
+        """Release the Neo4j driver back to the pool."""
+        if self.driver:
+            driver, self.driver = self.driver, None
+            self._release_resource(driver)
 
 
 class RestAPIConnection(SourceConnection):
     """
     REST API connection.
 
-    Uses httpx for async HTTP requests to REST APIs.
+    Uses httpx for HTTP requests to REST APIs. The client (and its keep-alive
+    connection pool) is shared per source.
     """
 
+    pool_shared = True
+
+    def __init__(self, source_asset: Dict[str, Any]):
+        super().__init__(source_asset)
+        self.client = None
+        self.base_url = None
+
+    def _open_resource(self) -> Any:
+        import httpx
+
+        conn_config = self.source_asset.get("connection", {})
+        base_url = conn_config.get("host")
+        client = httpx.Client(
+            base_url=base_url,
+            timeout=conn_config.get("timeout", 30),
+        )
+        logger.info(f"Initialized HTTP client for: {base_url}")
+        return client
+
+    def _check_resource(self, resource: Any) -> bool:
+        return not resource.is_closed
+
     def connect(self) -> None:
-        """Initialize HTTP client."""
+        """Check out the shared HTTP client for this source."""
         try:
-            import httpx
-
-            conn_config = self.source_asset.get("connection", {})
-            self.base_url = conn_config.get("host")
-            self.client = httpx.Client(
-                base_url=self.base_url,
-                timeout=conn_config.get("timeout", 30),
-            )
-            logger.info(f"Initialized HTTP client for: {self.base_url}")
+            import httpx  # noqa: F401
         except ImportError:
             raise ImportError("httpx library is required for REST API connections")
+        try:
+            self.base_url = self.source_asset.get("connection", {}).get("host")
+            self.client = self._acquire_resource()
         except Exception as e:
             raise ConnectionError(f"Failed to initialize HTTP client: {e}")
 
@@ -373,10 +507,10 @@ class RestAPIConnection(SourceConnection):
         return data
 
     def close(self) -> None:
-        """Close HTTP client."""
-        if hasattr(self, "client") and self.client:
-            self.client.close()
-            self.client = None
+        """Release the HTTP client back to the pool."""
+        if self.client:
+            client, self.client = self.client, None
+            self._release_resource(client)
 
 
 class ConnectionFactory:
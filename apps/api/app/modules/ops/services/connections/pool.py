@@ -0,0 +1,646 @@
+"""
+Source connection pooling.
+
+Keeps long-lived connections per source asset so OPS tool steps reuse an
+established PostgreSQL connection / Neo4j driver / HTTP client instead of
+paying a TCP+TLS+auth handshake on every call.
+
+Pools are keyed by source name + connection fingerprint. Republishing a
+source asset (or changing its connection config) retires the old pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolConfig:
+    """Sizing and lifecycle limits for a single source pool."""
+
+    min_size: int = 0
+    max_size: int = 10
+    idle_timeout_seconds: float = 300.0
+    max_lifetime_seconds: float = 1800.0
+    health_check_interval_seconds: float = 30.0
+    acquire_timeout_seconds: float = 10.0
+
+    @classmethod
+    def from_source_asset(cls, source_asset: Dict[str, Any]) -> "PoolConfig":
+        """
+        Build pool config from settings defaults and source asset overrides.
+
+        ``connection.max_connections`` caps the pool size; other limits can be
+        overridden through ``connection.connection_params`` using ``pool_*`` keys
+        (e.g. ``pool_min_size``, ``pool_idle_timeout_seconds``).
+        """
+        settings = get_settings()
+        config = cls(
+            min_size=settings.ops_source_pool_min_size,
+            max_size=settings.ops_source_pool_max_size,
+            idle_timeout_seconds=settings.ops_source_pool_idle_timeout_seconds,
+            max_lifetime_seconds=settings.ops_source_pool_max_lifetime_seconds,
+            health_check_interval_seconds=settings.ops_source_pool_health_check_interval_seconds,
+            acquire_timeout_seconds=settings.ops_source_pool_acquire_timeout_seconds,
+        )
+
+        conn_config = source_asset.get("connection") or {}
+        max_connections = conn_config.get("max_connections")
+        if isinstance(max_connections, int) and max_connections > 0:
+            config.max_size = max_connections
+
+        params = conn_config.get("connection_params") or {}
+        if isinstance(params, dict):
+            for field_name in asdict(config):
+                raw = params.get(f"pool_{field_name}")
+                if raw is None:
+                    continue
+                try:
+                    setattr(config, field_name, type(getattr(config, field_name))(raw))
+                except (TypeError, ValueError):
+                    logger.warning(f"Ignoring invalid pool override pool_{field_name}={raw!r}")
+
+        config.max_size = max(1, config.max_size)
+        config.min_size = max(0, min(config.min_size, config.max_size))
+        return config
+
+
+@dataclass
+class _PooledResource:
+    resource: Any
+    created_at: float
+    last_used_at: float
+    last_checked_at: float
+    use_count: int = 0
+    refs: int = 0
+
+
+def connection_fingerprint(source_asset: Dict[str, Any]) -> str:
+    """Stable hash of the parts of a source asset that affect connectivity."""
+    payload = json.dumps(
+        {
+            "source_type": str(source_asset.get("source_type", "")).lower(),
+            "connection": source_asset.get("connection") or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class SourceConnectionPool:
+    """
+    Thread-safe pool of connection resources for one source asset.
+
+    In exclusive mode (PostgreSQL) each resource is checked out by one caller
+    at a time. In shared mode (Neo4j driver, HTTP client) a single resource is
+    handed to every caller, since those clients already multiplex internally.
+
+    Opening and health-checking resources are network round trips, so both
+    run outside the pool lock.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        source_name: str,
+        source_type: str,
+        opener: Callable[[], Any],
+        closer: Callable[[Any], None],
+        health_check: Optional[Callable[[Any], bool]] = None,
+        config: Optional[PoolConfig] = None,
+        shared: bool = False,
+    ):
+        self.key = key
+        self.source_name = source_name
+        self.source_type = source_type
+        self.shared = shared
+        self.config = config or PoolConfig()
+        self._opener = opener
+        self._closer = closer
+        self._health_check = health_check
+        self._cond = threading.Condition()
+        self._idle: Deque[_PooledResource] = deque()
+        self._in_use: Dict[int, _PooledResource] = {}
+        self._opening = 0
+        self._closed = False
+        self._counters: Dict[str, int] = {
+            "created": 0,
+            "closed": 0,
+            "acquired": 0,
+            "reused": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "health_check_failures": 0,
+            "discarded": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        if self.shared:
+            return len(self._idle) + len(self._in_use)
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def acquire(self) -> Any:
+        """
+        Check out a resource, opening a new one if needed.
+
+        Raises:
+            ConnectionError: If the pool is closed or exhausted past the acquire timeout
+        """
+        if self.shared:
+            return self._acquire_shared()
+
+        deadline = time.monotonic() + self.config.acquire_timeout_seconds
+        while True:
+            entry = self._reserve(deadline)
+            if entry is None:
+                break
+            if self._is_usable(entry):
+                with self._cond:
+                    return self._checkout_locked(entry, reused=True)
+            with self._cond:
+                self._in_use.pop(id(entry.resource), None)
+                self._counters["closed"] += 1
+                self._cond.notify()
+            self._safe_close(entry.resource)
+
+        # Open outside the lock so a slow handshake does not block other callers
+        try:
+            resource = self._opener()
+        except Exception:
+            with self._cond:
+                self._opening -= 1
+                self._cond.notify()
+            raise
+
+        now = time.monotonic()
+        entry = _PooledResource(resource, now, now, now)
+        with self._cond:
+            self._opening -= 1
+            self._counters["created"] += 1
+            return self._checkout_locked(entry, reused=False)
+
+    def _reserve(self, deadline: float) -> Optional[_PooledResource]:
+        """
+        Take an idle entry, or claim a slot to open a new one (returns None).
+
+        A taken entry stays counted in ``_in_use`` while the caller checks it.
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ConnectionError(f"Connection pool for '{self.source_name}' is closed")
+                self._reap_idle_locked()
+                if self._idle:
+                    entry = self._idle.pop()
+                    self._in_use[id(entry.resource)] = entry
+                    return entry
+                if self.size < self.config.max_size:
+                    self._opening += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise ConnectionError(
+                        f"Connection pool for '{self.source_name}' exhausted "
+                        f"(max_size={self.config.max_size})"
+                    )
+                self._counters["waits"] += 1
+                self._cond.wait(remaining)
+
+    def _acquire_shared(self) -> Any:
+        check_due = False
+        with self._cond:
+            if self._closed:
+                raise ConnectionError(f"Connection pool for '{self.source_name}' is closed")
+            entry = self._idle[0] if self._idle else None
+            now = time.monotonic()
+            if entry is not None and self._expired(entry, now):
+                self._retire_shared_locked(entry)
+                entry = None
+            if entry is not None:
+                # Hold a reference while checking; one caller runs a due check
+                # and the others keep using the resource meanwhile
+                entry.refs += 1
+                check_due = self._health_check_due(entry, now)
+                if check_due:
+                    entry.last_checked_at = now
+
+        if entry is not None:
+            healthy = not check_due or self._run_health_check(entry)
+            with self._cond:
+                if healthy:
+                    return self._checkout_shared_locked(entry, reused=True)
+                entry.refs -= 1
+                self._retire_shared_locked(entry)
+
+        resource = self._opener()
+        now = time.monotonic()
+        entry = _PooledResource(resource, now, now, now)
+        with self._cond:
+            self._counters["created"] += 1
+            if self._closed or self._idle:
+                # Lost a race with another opener, or the pool was retired meanwhile:
+                # hand this one out once and close it on release.
+                self._in_use[id(resource)] = entry
+            else:
+                self._idle.append(entry)
+            entry.refs += 1
+            return self._checkout_shared_locked(entry, reused=False)
+
+    def _checkout_shared_locked(self, entry: _PooledResource, reused: bool) -> Any:
+        entry.use_count += 1
+        entry.last_used_at = time.monotonic()
+        self._counters["acquired"] += 1
+        if reused:
+            self._counters["reused"] += 1
+        return entry.resource
+
+    def _retire_shared_locked(self, entry: _PooledResource) -> None:
+        if self._idle and self._idle[0] is entry:
+            self._idle.clear()
+        if entry.refs > 0:
+            # Still held by other callers; close once the last holder releases
+            self._in_use[id(entry.resource)] = entry
+        else:
+            self._in_use.pop(id(entry.resource), None)
+            self._close_entry(entry)
+
+    def release(self, resource: Any, discard: bool = False) -> None:
+        """Return a resource to the pool, or close it if it is broken or retired."""
+        if resource is None:
+            return
+        with self._cond:
+            if self.shared:
+                self._release_shared_locked(resource, discard)
+                return
+
+            entry = self._in_use.pop(id(resource), None)
+            if entry is None:
+                # Not ours (e.g. pool was recreated); just close it
+                self._safe_close(resource)
+                return
+            entry.last_used_at = time.monotonic()
+            if discard or self._closed or self._expired(entry, entry.last_used_at):
+                if discard:
+                    self._counters["discarded"] += 1
+                self._close_entry(entry)
+            else:
+                self._idle.append(entry)
+            self._cond.notify()
+
+    def _release_shared_locked(self, resource: Any, discard: bool) -> None:
+        current = self._idle[0] if self._idle else None
+        if current is not None and current.resource is resource:
+            entry = current
+        else:
+            entry = self._in_use.get(id(resource))
+        if entry is None:
+            self._safe_close(resource)
+            return
+        entry.refs = max(0, entry.refs - 1)
+        if discard:
+            self._counters["discarded"] += 1
+        if discard or self._closed or entry is not current:
+            self._retire_shared_locked(entry)
+
+    def close(self) -> None:
+        """Retire the pool: close idle resources now, in-use ones on release."""
+        with self._cond:
+            self._closed = True
+            if self.shared:
+                if self._idle:
+                    self._retire_shared_locked(self._idle[0])
+                return
+            while self._idle:
+                self._close_entry(self._idle.pop())
+            self._cond.notify_all()
+
+    def prune(self) -> int:
+        """Close idle resources past their idle timeout or lifetime."""
+        with self._cond:
+            return self._reap_idle_locked()
+
+    def warm(self) -> int:
+        """
+        Open idle resources until the pool holds ``min_size``.
+
+        Returns:
+            Number of resources opened
+        """
+        opened = 0
+        while True:
+            with self._cond:
+                if self._closed or self.size >= self.config.min_size:
+                    return opened
+                if self.shared and self._idle:
+                    return opened
+                if not self.shared:
+                    self._opening += 1
+            try:
+                resource = self._opener()
+            except Exception as exc:
+                if not self.shared:
+                    with self._cond:
+                        self._opening -= 1
+                        self._cond.notify()
+                logger.warning(f"Failed to pre-warm connection pool '{self.key}': {exc}")
+                return opened
+
+            now = time.monotonic()
+            entry = _PooledResource(resource, now, now, now)
+            with self._cond:
+                if not self.shared:
+                    self._opening -= 1
+                self._counters["created"] += 1
+                if self._closed or (self.shared and self._idle):
+                    self._close_entry(entry)
+                    return opened
+                self._idle.append(entry)
+                self._cond.notify()
+            opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            if self.shared:
+                entries = list(self._idle) + list(self._in_use.values())
+                in_use = sum(entry.refs for entry in entries)
+                idle = sum(1 for entry in self._idle if entry.refs == 0)
+            else:
+                in_use = len(self._in_use)
+                idle = len(self._idle)
+            return {
+                "key": self.key,
+                "source_name": self.source_name,
+                "source_type": self.source_type,
+                "mode": "shared" if self.shared else "exclusive",
+                "retired": self._closed,
+                "size": self.size,
+                "idle": idle,
+                "in_use": in_use,
+                "config": asdict(self.config),
+                **self._counters,
+            }
+
+    def _checkout_locked(self, entry: _PooledResource, reused: bool) -> Any:
+        entry.use_count += 1
+        entry.last_used_at = time.monotonic()
+        self._in_use[id(entry.resource)] = entry
+        self._counters["acquired"] += 1
+        if reused:
+            self._counters["reused"] += 1
+        return entry.resource
+
+    def _expired(self, entry: _PooledResource, now: float) -> bool:
+        max_lifetime = self.config.max_lifetime_seconds
+        return max_lifetime > 0 and now - entry.created_at >= max_lifetime
+
+    def _health_check_due(self, entry: _PooledResource, now: float) -> bool:
+        return (
+            self._health_check is not None
+            and now - entry.last_checked_at >= self.config.health_check_interval_seconds
+        )
+
+    def _is_usable(self, entry: _PooledResource) -> bool:
+        """Check a reserved entry; called without the lock."""
+        now = time.monotonic()
+        if self._expired(entry, now):
+            return False
+        if not self._health_check_due(entry, now):
+            return True
+        entry.last_checked_at = now
+        return self._run_health_check(entry)
+
+    def _run_health_check(self, entry: _PooledResource) -> bool:
+        try:
+            healthy = bool(self._health_check(entry.resource))
+        except Exception as exc:
+            logger.debug(f"Pool health check raised for '{self.source_name}': {exc}")
+            healthy = False
+        if not healthy:
+            with self._cond:
+                self._counters["health_check_failures"] += 1
+        return healthy
+
+    def _reap_idle_locked(self) -> int:
+        if self.shared:
+            return 0
+        now = time.monotonic()
+        idle_timeout = self.config.idle_timeout_seconds
+        reaped = 0
+        # Oldest idle entries sit at the left end of the deque
+        while self._idle and self.size > self.config.min_size:
+            entry = self._idle[0]
+            idle_for = now - entry.last_used_at
+            if not self._expired(entry, now) and (idle_timeout <= 0 or idle_for < idle_timeout):
+                break
+            self._idle.popleft()
+            self._close_entry(entry)
+            reaped += 1
+        return reaped
+
+    def _close_entry(self, entry: _PooledResource) -> None:
+        self._counters["closed"] += 1
+        self._safe_close(entry.resource)
+
+    def _safe_close(self, resource: Any) -> None:
+        try:
+            self._closer(resource)
+        except Exception as exc:
+            logger.debug(f"Failed to close pooled resource for '{self.source_name}': {exc}")
+
+
+class ConnectionPoolRegistry:
+    """Process-wide registry of source connection pools."""
+
+    def __init__(self):
+        self._pools: Dict[str, SourceConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._invalidations = 0
+
+    def get_pool(
+        self,
+        source_asset: Dict[str, Any],
+        opener: Callable[[], Any],
+        closer: Callable[[Any], None],
+        health_check: Optional[Callable[[Any], bool]] = None,
+        shared: bool = False,
+    ) -> SourceConnectionPool:
+        """Return the pool for a source asset, creating it on first use."""
+        source_name = str(source_asset.get("name") or "anonymous")
+        key = f"{source_name}:{connection_fingerprint(source_asset)}"
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is not None:
+                return pool
+
+            # Connection config changed under the same name: retire stale pools
+            stale_keys = [k for k, p in self._pools.items() if p.source_name == source_name]
+            for stale_key in stale_keys:
+                self._pools.pop(stale_key).close()
+
+            pool = SourceConnectionPool(
+                key=key,
+                source_name=source_name,
+                source_type=str(source_asset.get("source_type", "")).lower(),
+                opener=opener,
+                closer=closer,
+                health_check=health_check,
+                config=PoolConfig.from_source_asset(source_asset),
+                shared=shared,
+            )
+            self._pools[key] = pool
+            logger.info(f"Created connection pool: {key} (shared={shared})")
+            return pool
+
+    def invalidate(self, source_name: str | None = None) -> int:
+        """
+        Retire pools for a source (or all pools when source_name is None).
+
+        Returns:
+            Number of pools retired
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, pool in self._pools.items()
+                if source_name is None or pool.source_name == source_name
+            ]
+            pools = [self._pools.pop(key) for key in keys]
+            self._invalidations += len(pools)
+        for pool in pools:
+            pool.close()
+        if pools:
+            logger.info(f"Invalidated {len(pools)} connection pool(s) for source: {source_name or '*'}")
+        return len(pools)
+
+    def prune(self) -> int:
+        """Close idle resources past their limits in every pool."""
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.prune() for pool in pools)
+
+    def warm(self) -> int:
+        """Top every pool back up to its ``min_size``."""
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.warm() for pool in pools)
+
+    def close_all(self) -> None:
+        self.invalidate(None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pools = list(self._pools.values())
+            invalidations = self._invalidations
+        pool_stats: List[Dict[str, Any]] = [pool.stats() for pool in pools]
+        return {
+            "enabled": get_settings().ops_source_pool_enabled,
+            "pool_count": len(pool_stats),
+            "invalidations": invalidations,
+            "total_size": sum(p["size"] for p in pool_stats),
+            "total_in_use": sum(p["in_use"] for p in pool_stats),
+            "pools": pool_stats,
+        }
+
+
+_pool_registry: ConnectionPoolRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_pool_registry() -> ConnectionPoolRegistry:
+    """Get the process-wide connection pool registry."""
+    global _pool_registry
+    if _pool_registry is None:
+        with _registry_lock:
+            if _pool_registry is None:
+                _pool_registry = ConnectionPoolRegistry()
+    return _pool_registry
+
+
+class PoolMaintainer:
+    """
+    Background thread that prunes idle source connections and re-warms pools.
+
+    Pools only reap idle resources when a caller acquires from them, so a
+    source that goes quiet would otherwise hold its connections open forever.
+    Each tick prunes and warms the sync pools, and schedules the same on the
+    async pools' serving loop.
+    """
+
+    def __init__(self, interval_seconds: float | None = None):
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else get_settings().ops_source_pool_maintenance_interval_seconds
+        )
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="source-pool-maintenance", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def run_once(self) -> Dict[str, int]:
+        from app.modules.ops.services.connections.async_pool import (
+            get_async_pool_registry,
+        )
+
+        registry = get_pool_registry()
+        result = {"pruned": registry.prune(), "warmed": registry.warm()}
+        get_async_pool_registry().schedule_maintenance()
+        return result
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                result = self.run_once()
+                if result["pruned"] or result["warmed"]:
+                    logger.debug(f"Source pool maintenance: {result}")
+            except Exception as exc:
+                logger.warning(f"Source pool maintenance failed: {exc}")
+
+
+_pool_maintainer: PoolMaintainer | None = None
+
+
+def get_pool_maintainer() -> PoolMaintainer:
+    """Get the process-wide source pool maintenance thread."""
+    global _pool_maintainer
+    if _pool_maintainer is None:
+        with _registry_lock:
+            if _pool_maintainer is None:
+                _pool_maintainer = PoolMaintainer()
+    return _pool_maintainer
+
+
+def invalidate_source_pools(source_name: str | None = None) -> int:
+    """Retire sync and async pools for a source asset (e.g. after it is republished)."""
+    from app.modules.ops.services.connections.async_pool import get_async_pool_registry
+
+    return get_pool_registry().invalidate(source_name) + get_async_pool_registry().invalidate(
+        source_name
+    )
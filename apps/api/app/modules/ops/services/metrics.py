@@ -10,12 +10,20 @@ P0-1: 오케스트레이션 SLO 정의 및 강제 계측
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from core.latency_sketch import LatencySketch
 from core.logging import get_logger
+from core.metrics import (
+    OPS_EVENTS,
+    OPS_STAGE_LATENCY,
+    OPS_TOOL_FAILURES,
+    OPS_TOOL_LATENCY,
+)
 
 logger = get_logger(__name__)
 
@@ -129,9 +137,14 @@ class OrchestrationMetrics:
     # Optional tags for additional context
     OPTIONAL_TAGS = ["plan_id", "tool_call_id", "stage_name", "tool_type", "status"]
 
-    def __init__(self):
+    # Raw values kept for inspection; percentiles come from the sketches
+    MAX_RECORDED_METRICS = 1000
+
+    def __init__(self, max_recorded: int = MAX_RECORDED_METRICS):
         """Initialize metrics collector."""
-        self.recorded_metrics: list[MetricValue] = []
+        self.recorded_metrics: deque[MetricValue] = deque(maxlen=max_recorded)
+        self.metric_count = 0
+        self.latency_sketches: dict[str, LatencySketch] = {}
         self.start_time: float | None = None
         self.end_time: float | None = None
 
@@ -177,6 +190,34 @@ class OrchestrationMetrics:
 
         metric = MetricValue(metric_name=metric_name, value=value, tags=tags)
         self.recorded_metrics.append(metric)
+        self.metric_count += 1
+
+        if (
+            self.METRICS[metric_name].metric_type == MetricType.HISTOGRAM
+            and tags.get("status") != "failed"
+        ):
+            subject = tags.get("stage_name") or tags.get("tool_type")
+            key = f"{metric_name}:{subject}" if subject else metric_name
+            sketch = self.latency_sketches.get(key)
+            if sketch is None:
+                sketch = self.latency_sketches[key] = LatencySketch()
+            sketch.add(value)
+
+        self._export(metric_name, value, tags)
+
+    @staticmethod
+    def _export(metric_name: str, value: float, tags: dict[str, str]) -> None:
+        """Mirror the metric into the shared Prometheus registry"""
+        if metric_name == "stage_latency":
+            OPS_STAGE_LATENCY.labels(tags.get("stage_name") or "unknown").observe(value / 1000)
+        elif metric_name == "tool_execution_latency":
+            tool = tags.get("tool_type") or "unknown"
+            if tags.get("status") == "failed":
+                OPS_TOOL_FAILURES.labels(tool).inc()
+            else:
+                OPS_TOOL_LATENCY.labels(tool).observe(value / 1000)
+        elif metric_name in {"fallback_rate", "replan_rate", "timeout_rate"}:
+            OPS_EVENTS.labels(metric_name.removesuffix("_rate")).inc()
 
     def record_latency(self, stage_name: str, latency_ms: float, tags: dict[str, str] | None = None) -> None:
         """
@@ -279,8 +320,17 @@ class OrchestrationMetrics:
 
         return {
             "total_latency_ms": total_latency,
-            "metric_count": len(self.recorded_metrics),
+            "metric_count": self.metric_count,
             "metrics": [m.to_dict() for m in self.recorded_metrics],
+            "latency_percentiles": {
+                key: {
+                    "count": sketch.count,
+                    "p50": sketch.quantile(0.5),
+                    "p95": sketch.quantile(0.95),
+                    "p99": sketch.quantile(0.99),
+                }
+                for key, sketch in self.latency_sketches.items()
+            },
             "collection_start": datetime.fromtimestamp(self.start_time).isoformat()
             if self.start_time
             else None,
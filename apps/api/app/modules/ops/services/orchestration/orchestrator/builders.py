@@ -20,6 +20,9 @@ from app.modules.ops.services.orchestration.planner.plan_schema import (
     MetricSpec,
     View,
 )
+from app.modules.ops.services.orchestration.tools.graph_hydration import (
+    hydrated_history,
+)
 
 
 class BlockBuilder:
@@ -314,17 +317,22 @@ class BlockBuilder:
 
         node_ids = graph_payload.get("ids") or [detail["ci_id"]]
 
-        try:
-            result = await self.runner._history_recent_async(
-                history_spec,
-                {"ci_id": detail["ci_id"], "ci_code": detail.get("ci_code")},
-                ci_ids=node_ids,
-            )
-        except Exception as exc:
-            self.logger.error(
-                "graph_history_blocks failed", extra={"error": str(exc)}
-            )
-            return [text_block(f"History error: {str(exc)}", title="History")]
+        # Events already hydrated with the graph need no second round-trip
+        result = hydrated_history(
+            graph_payload, history_spec.time_range, history_spec.limit
+        )
+        if result is None:
+            try:
+                result = await self.runner._history_recent_async(
+                    history_spec,
+                    {"ci_id": detail["ci_id"], "ci_code": detail.get("ci_code")},
+                    ci_ids=node_ids,
+                )
+            except Exception as exc:
+                self.logger.error(
+                    "graph_history_blocks failed", extra={"error": str(exc)}
+                )
+                return [text_block(f"History error: {str(exc)}", title="History")]
 
         if not result.get("available"):
             history_trace["available"] = False
@@ -88,6 +88,7 @@ class CIResolver:
             filters=filters_tuple,
             limit=limit,
             sort=sort,
+            tenant_id=self.runner.tenant_id,
         )
         cached_results = await self._cache.get(cache_key)
         if cached_results is not None:
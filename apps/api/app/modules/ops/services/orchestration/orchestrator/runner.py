@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from time import perf_counter
 from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
 
+from core.config import get_settings
 from core.logging import get_logger, get_request_context
 from schemas.tool_contracts import ToolCall
 
@@ -75,7 +76,15 @@ from app.modules.ops.services.orchestration.tools import (
 )
 from app.modules.ops.services.orchestration.tools.base import get_tool_registry
 from app.modules.ops.services.orchestration.tools.cache import ToolResultCache
+from app.modules.ops.services.orchestration.tools.graph_hydration import (
+    aggregate_latest,
+    hydrated_history,
+)
 from app.modules.ops.services.orchestration.tools.observability import ExecutionTracer
+from app.modules.ops.services.orchestration.tools.request_timeout import (
+    TimeoutBudget,
+    timeout_budget_scope,
+)
 
 # NOTE: Built-in tools (ci, graph, metric, history, cep) have been removed for
 # generic orchestration. All tool functionality should be implemented as Tool Assets
@@ -948,6 +957,7 @@ class OpsOrchestratorRunner:
             filters=filters_tuple,
             limit=limit,
             sort=sort,
+            tenant_id=self.tenant_id,
         )
         cached_results = await self._ci_search_cache.get(cache_key)
         if cached_results is not None:
@@ -1928,13 +1938,20 @@ class OpsOrchestratorRunner:
     def run(self, plan_output: PlanOutput | None = None) -> Dict[str, Any]:
         if plan_output is None:
             plan_output = PlanOutput(kind=PlanOutputKind.PLAN, plan=self.plan)
-        return asyncio.run(self._run_async_with_stages(plan_output))
+        with timeout_budget_scope(self._new_timeout_budget()):
+            return asyncio.run(self._run_async_with_stages(plan_output))
 
     async def run_async(self, plan_output: PlanOutput | None = None) -> Dict[str, Any]:
         """Async entrypoint for callers already running inside an event loop."""
         if plan_output is None:
             plan_output = PlanOutput(kind=PlanOutputKind.PLAN, plan=self.plan)
-        return await self._run_async_with_stages(plan_output)
+        with timeout_budget_scope(self._new_timeout_budget()):
+            return await self._run_async_with_stages(plan_output)
+
+    @staticmethod
+    def _new_timeout_budget() -> TimeoutBudget:
+        """Budget that tool queries (DynamicTool) derive their timeouts from."""
+        return TimeoutBudget(total_timeout_ms=get_settings().ops_request_timeout_ms)
 
     async def _run_async(self) -> Dict[str, Any]:
         blocks: List[Block] = []
@@ -2909,6 +2926,22 @@ class OpsOrchestratorRunner:
             entries: List[Dict[str, Any]] = []
             for metric_name, agg in AUTO_METRIC_PREFERENCES:
                 entry: Dict[str, Any] = {"metric": metric_name}
+                # Latest values hydrated with the graph cover every CI at once
+                aggregate = aggregate_latest(payload, metric_name, agg)
+                if aggregate:
+                    rows.append(
+                        [
+                            aggregate["metric_name"],
+                            aggregate["agg"],
+                            str(aggregate["value"]),
+                            f"{aggregate['time_range']} (latest)",
+                            str(aggregate["ci_count_used"]),
+                        ]
+                    )
+                    entries.append(
+                        {"metric": metric_name, "status": "ok", "source": "graph_hydration"}
+                    )
+                    continue
                 # NOTE: metric_tools.metric_exists removed for generic orchestration
                 # Metric availability should be determined from Tool Assets
                 # Treat as unavailable until Tool Assets are created
@@ -2958,13 +2991,15 @@ class OpsOrchestratorRunner:
         history_blocks: List[Block] = []
         history_trace: Dict[str, Any] = {"enabled": spec.include_history}
         if spec.include_history:
-            result = await self._history_recent_async(
-                spec,
-                {"ci_id": detail["ci_id"], "ci_code": detail.get("ci_code")},
-                ci_ids=ci_ids,
-                time_range="last_7d",
-                limit=20,
-            )
+            result = hydrated_history(payload, "last_7d", 20)
+            if result is None:
+                result = await self._history_recent_async(
+                    spec,
+                    {"ci_id": detail["ci_id"], "ci_code": detail.get("ci_code")},
+                    ci_ids=ci_ids,
+                    time_range="last_7d",
+                    limit=20,
+                )
             if result.get("available"):
                 history_blocks.append(
                     table_block(
@@ -5414,9 +5449,26 @@ class OpsOrchestratorRunner:
             view=view,
             depth=depth,
             limits=limits,
+            **self._graph_hydration_params(),
         )
         return result if isinstance(result, dict) else result.dict()
 
+    def _graph_hydration_params(self) -> Dict[str, Any]:
+        """
+        Ask graph tools to hydrate metrics/history for every node in the same call.
+
+        History is hydrated for the plan's graph-scope window when there is one,
+        otherwise for the AUTO graph-scope window (last_7d, 20 rows).
+        """
+        history_spec = self.plan.history
+        if history_spec.enabled and history_spec.scope == "graph":
+            return {
+                "hydrate": True,
+                "history_time_range": history_spec.time_range,
+                "history_limit": max(history_spec.limit, 20),
+            }
+        return {"hydrate": True, "history_time_range": "last_7d", "history_limit": 20}
+
     async def _graph_path_via_registry_async(
         self,
         source_id: str,
@@ -0,0 +1,276 @@
+"""
+Plan cache for create_plan_output.
+
+Planning is the largest latency component of /ops/ask, and operators ask the
+same (or nearly the same) question repeatedly. Two layers:
+
+- Exact: process-local LRUTTLCache keyed by the normalized question plus a
+  context key (tenant, mode, tool registry fingerprint, planner prompt
+  fingerprint, schema/source context).
+- Semantic (optional, ``ops_plan_cache_semantic_enabled``): pgvector lookup
+  over question embeddings in ``tb_ops_plan_cache``, restricted to the same
+  context key and accepted above ``ops_plan_cache_semantic_threshold``.
+
+Because tools and prompts are part of the context key, publishing a tool or
+prompt asset makes old plans unreachable instead of serving them stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from core.config import get_settings
+from core.logging import get_logger
+
+from app.modules.ops.services.orchestration.planner.plan_schema import PlanOutput
+from app.modules.ops.services.orchestration.services.cache_core import LRUTTLCache
+
+logger = get_logger(__name__)
+
+# Bump when planner code changes in a way that makes cached plans invalid
+PLAN_CACHE_SCHEMA_VERSION = 1
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = "?!.。？！ "
+
+# ":embedding::vector" is not a bind parameter in text(); cast explicitly
+SEMANTIC_LOOKUP_SQL = """
+    SELECT plan_output, elapsed_ms,
+           1 - (embedding <=> CAST(:embedding AS vector)) AS similarity
+    FROM tb_ops_plan_cache
+    WHERE context_key = :context_key AND expires_at > now()
+    ORDER BY embedding <=> CAST(:embedding AS vector)
+    LIMIT 1
+"""
+
+SEMANTIC_INSERT_SQL = """
+    INSERT INTO tb_ops_plan_cache
+        (id, context_key, question, embedding, plan_output,
+         elapsed_ms, expires_at)
+    VALUES
+        (:id, :context_key, :question, CAST(:embedding AS vector),
+         CAST(:plan_output AS JSONB), :elapsed_ms,
+         now() + make_interval(secs => :ttl_seconds))
+"""
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a (resolver-normalized) question for exact-match lookup."""
+    normalized = _WHITESPACE_PATTERN.sub(" ", question or "").strip()
+    return normalized.rstrip(_TRAILING_PUNCTUATION).casefold()
+
+
+def fingerprint(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def build_context_key(
+    *,
+    tenant_id: str,
+    mode: str | None,
+    tools_fingerprint: str,
+    prompt_fingerprint: str,
+    schema_context: dict[str, Any] | None,
+    source_context: dict[str, Any] | None,
+) -> str:
+    return fingerprint(
+        {
+            "v": PLAN_CACHE_SCHEMA_VERSION,
+            "tenant_id": tenant_id,
+            "mode": mode,
+            "tools": tools_fingerprint,
+            "prompt": prompt_fingerprint,
+            "schema": fingerprint(schema_context) if schema_context else None,
+            "source": fingerprint(source_context) if source_context else None,
+        }
+    )
+
+
+@dataclass
+class PlanCacheHit:
+    plan_output: PlanOutput
+    layer: str
+    saved_ms: int
+    similarity: float | None = None
+
+
+class PlanCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._exact = LRUTTLCache(
+            max_entries=max_entries, default_ttl_seconds=ttl_seconds
+        )
+        # Misses embed once for lookup and again for store; reuse the vector
+        self._embeddings = LRUTTLCache(max_entries=256, default_ttl_seconds=300)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "saved_ms": 0,
+            "semantic_errors": 0,
+        }
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def _exact_key(self, context_key: str, question: str) -> str:
+        return f"{context_key}:{normalize_question(question)}"
+
+    def lookup(self, question: str, context_key: str) -> Optional[PlanCacheHit]:
+        entry = self._exact.get(self._exact_key(context_key, question))
+        if entry is not None:
+            plan_output, elapsed_ms = entry
+            self._count("exact_hits")
+            self._count("saved_ms", elapsed_ms)
+            return PlanCacheHit(plan_output.model_copy(deep=True), "exact", elapsed_ms)
+
+        if get_settings().ops_plan_cache_semantic_enabled:
+            hit = self._lookup_semantic(question, context_key)
+            if hit is not None:
+                self._count("semantic_hits")
+                self._count("saved_ms", hit.saved_ms)
+                # Promote so the next identical question is an exact hit
+                self._exact.set(
+                    self._exact_key(context_key, question),
+                    (hit.plan_output.model_copy(deep=True), hit.saved_ms),
+                )
+                return hit
+
+        self._count("misses")
+        return None
+
+    def store(
+        self, question: str, context_key: str, plan_output: PlanOutput, elapsed_ms: int
+    ) -> None:
+        self._exact.set(
+            self._exact_key(context_key, question),
+            (plan_output.model_copy(deep=True), elapsed_ms),
+        )
+        self._count("stores")
+        if get_settings().ops_plan_cache_semantic_enabled:
+            self._store_semantic(question, context_key, plan_output, elapsed_ms)
+
+    def clear(self) -> None:
+        self._exact.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+        hits = counters["exact_hits"] + counters["semantic_hits"]
+        total = hits + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "exact_size": len(self._exact),
+            "semantic_enabled": get_settings().ops_plan_cache_semantic_enabled,
+        }
+
+    def _embed(self, question: str) -> List[float]:
+        from app.llm.client import get_llm_client
+
+        normalized = normalize_question(question)
+        embedding = self._embeddings.get(normalized)
+        if embedding is None:
+            response = get_llm_client().embed(normalized)
+            embedding = list(response.data[0].embedding)
+            self._embeddings.set(normalized, embedding)
+        return embedding
+
+    def _lookup_semantic(self, question: str, context_key: str) -> Optional[PlanCacheHit]:
+        from core.db import get_session_context
+        from sqlalchemy import text
+
+        settings = get_settings()
+        try:
+            embedding = self._embed(question)
+            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
+            with get_session_context() as session:
+                row = session.execute(
+                    text(SEMANTIC_LOOKUP_SQL),
+                    {"embedding": embedding_str, "context_key": context_key},
+                ).first()
+        except Exception as exc:
+            self._count("semantic_errors")
+            logger.warning("ops.plan_cache.semantic_lookup_failed", extra={"error": str(exc)})
+            return None
+
+        if row is None or float(row[2]) < settings.ops_plan_cache_semantic_threshold:
+            return None
+        try:
+            plan_output = PlanOutput.model_validate(row[0])
+        except Exception as exc:
+            logger.warning("ops.plan_cache.semantic_decode_failed", extra={"error": str(exc)})
+            return None
+        return PlanCacheHit(plan_output, "semantic", int(row[1] or 0), float(row[2]))
+
+    def _store_semantic(
+        self, question: str, context_key: str, plan_output: PlanOutput, elapsed_ms: int
+    ) -> None:
+        from core.db import get_session_context
+        from sqlalchemy import text
+
+        try:
+            embedding = self._embed(question)
+            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
+            with get_session_context() as session:
+                session.execute(
+                    text("DELETE FROM tb_ops_plan_cache WHERE expires_at <= now()")
+                )
+                session.execute(
+                    text(SEMANTIC_INSERT_SQL),
+                    {
+                        "id": str(uuid.uuid4()),
+                        "context_key": context_key,
+                        "question": normalize_question(question),
+                        "embedding": embedding_str,
+                        "plan_output": plan_output.model_dump_json(),
+                        "elapsed_ms": elapsed_ms,
+                        "ttl_seconds": get_settings().ops_plan_cache_semantic_ttl_seconds,
+                    },
+                )
+                session.commit()
+        except Exception as exc:
+            self._count("semantic_errors")
+            logger.warning("ops.plan_cache.semantic_store_failed", extra={"error": str(exc)})
+
+
+def plan_cache_trace(hit: Optional[PlanCacheHit], lookup_ms: float, cache: PlanCache) -> Dict[str, Any]:
+    """Trace/metadata payload describing a plan cache lookup."""
+    stats = cache.stats()
+    return {
+        "hit": hit is not None,
+        "layer": hit.layer if hit else None,
+        "similarity": hit.similarity if hit else None,
+        "saved_llm_ms": hit.saved_ms if hit else 0,
+        "lookup_ms": round(lookup_ms, 2),
+        "hit_rate": stats["hit_rate"],
+        "total_saved_llm_ms": stats["saved_ms"],
+    }
+
+
+_plan_cache: Optional[PlanCache] = None
+_plan_cache_lock = threading.Lock()
+
+
+def get_plan_cache() -> PlanCache:
+    """Get the process-wide plan cache."""
+    global _plan_cache
+    if _plan_cache is None:
+        with _plan_cache_lock:
+            if _plan_cache is None:
+                settings = get_settings()
+                _plan_cache = PlanCache(
+                    max_entries=settings.ops_plan_cache_max_entries,
+                    ttl_seconds=settings.ops_plan_cache_ttl_seconds,
+                )
+    return _plan_cache
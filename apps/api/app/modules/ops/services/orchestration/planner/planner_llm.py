@@ -7,7 +7,8 @@ from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
 from typing import Any, Dict, Iterable, List, Set, Tuple
 
-from core.logging import get_logger
+from core.config import get_settings
+from core.logging import get_logger, get_request_context
 
 from app.llm.client import get_llm_client
 from app.modules.asset_registry.loader import load_prompt_asset
@@ -28,6 +29,12 @@ from app.modules.ops.services.orchestration.mappings.accessors import (
     _get_series_keywords,
     _get_table_hints,
 )
+from app.modules.ops.services.orchestration.planner.plan_cache import (
+    build_context_key,
+    fingerprint,
+    get_plan_cache,
+    plan_cache_trace,
+)
 from app.modules.ops.services.orchestration.planner.plan_schema import (
     AggregateSpec,
     AutoGraphScopeSpec,
@@ -1412,6 +1419,34 @@ def _apply_document_query_override(plan: Plan, question: str) -> Plan:
     return plan
 
 
+def _plan_cache_context_key(
+    schema_context: dict[str, Any] | None,
+    source_context: dict[str, Any] | None,
+    mode: str | None,
+) -> str:
+    """Context part of the plan cache key; changes when tools or prompts change."""
+    from app.modules.ops.services.orchestration.tools.base import get_tool_registry
+
+    tools_info = sorted(
+        get_tool_registry().get_all_tools_info(), key=lambda info: str(info.get("type"))
+    )
+    prompt_definition = _load_planner_prompt_definition() or {}
+    return build_context_key(
+        tenant_id=get_request_context().get("tenant_id", "-"),
+        mode=mode,
+        tools_fingerprint=fingerprint(tools_info),
+        prompt_fingerprint=fingerprint(
+            {
+                "version": prompt_definition.get("version"),
+                "templates": prompt_definition.get("templates"),
+                "model": OUTPUT_PARSER_MODEL,
+            }
+        ),
+        schema_context=schema_context,
+        source_context=source_context,
+    )
+
+
 def create_plan_output(
     question: str,
     schema_context: dict[str, Any] | None = None,
@@ -1420,12 +1455,64 @@ def create_plan_output(
 ) -> PlanOutput:
     """Create a plan output with route determination (direct, plan, or reject)
 
+    Served from the plan cache when the same question was planned against the
+    same tools, prompt and context; ``metadata["plan_cache"]`` records the
+    lookup for traces.
+
     Args:
         question: User's question
         schema_context: Schema asset for catalog/field context
         source_context: Source asset for data source context
         mode: Explicit mode ("all", "config", "metric", "hist", "graph", "document")
     """
+    if not get_settings().ops_plan_cache_enabled:
+        return _create_plan_output_uncached(question, schema_context, source_context, mode)
+
+    cache = get_plan_cache()
+    lookup_start = perf_counter()
+    try:
+        context_key = _plan_cache_context_key(schema_context, source_context, mode)
+        hit = cache.lookup(question, context_key)
+    except Exception as exc:
+        logger.warning("ci.planner.plan_cache_error", extra={"error": str(exc)})
+        return _create_plan_output_uncached(question, schema_context, source_context, mode)
+    lookup_ms = (perf_counter() - lookup_start) * 1000
+
+    if hit is not None:
+        logger.info(
+            "ci.planner.plan_cache_hit",
+            extra={"layer": hit.layer, "saved_ms": hit.saved_ms, "similarity": hit.similarity},
+        )
+        plan_output = hit.plan_output
+    else:
+        plan_output = _create_plan_output_uncached(
+            question, schema_context, source_context, mode
+        )
+        # Heuristic fallbacks mean the LLM failed; retry it next time
+        if plan_output.metadata.get("plan_source") != "heuristic":
+            cache.store(
+                question,
+                context_key,
+                plan_output,
+                int(plan_output.metadata.get("elapsed_ms") or 0),
+            )
+
+    return plan_output.model_copy(
+        update={
+            "metadata": {
+                **plan_output.metadata,
+                "plan_cache": plan_cache_trace(hit, lookup_ms, cache),
+            }
+        }
+    )
+
+
+def _create_plan_output_uncached(
+    question: str,
+    schema_context: dict[str, Any] | None = None,
+    source_context: dict[str, Any] | None = None,
+    mode: str | None = None,
+) -> PlanOutput:
     normalized = question.strip()
     start = perf_counter()
     logger.info(
@@ -1545,6 +1632,7 @@ def create_plan_output(
             future = executor.submit(asyncio.run, plan_llm_query(query, source_ref=None))
             return future.result()
 
+    plan_source = "llm"
     try:
         # Call LLM-driven planning which includes tool selection
         plan_output = _run_plan_llm_query_sync(normalized)
@@ -1564,6 +1652,7 @@ def create_plan_output(
                 "planner.llm_plan_fallback",
                 extra={"kind": plan_output.kind.value if plan_output.kind else "unknown"}
             )
+            plan_source = "heuristic"
             plan = create_plan(
                 normalized, schema_context=schema_context, source_context=source_context, mode=mode
             )
@@ -1573,6 +1662,7 @@ def create_plan_output(
             extra={"error": str(e), "using_fallback": True}
         )
         # Fallback to keyword-based planning
+        plan_source = "heuristic"
         plan = create_plan(
             normalized, schema_context=schema_context, source_context=source_context, mode=mode
         )
@@ -1590,7 +1680,7 @@ def create_plan_output(
         plan=plan,
         confidence=1.0,
         reasoning="Orchestration plan created with LLM-driven tool selection",
-        metadata={"elapsed_ms": elapsed_ms, "llm_route": route},
+        metadata={"elapsed_ms": elapsed_ms, "llm_route": route, "plan_source": plan_source},
     )
 
 
@@ -2,9 +2,11 @@
 
 This module contains specialized services for CI operations, including:
 - CICache: Caching layer for CI search results
+- LRUTTLCache: Shared O(1) LRU + TTL cache core (also used by ToolResultCache)
 - Performance optimization utilities
 """
 
+from .cache_core import LRUTTLCache
 from .ci_cache import CICache
 
-__all__ = ["CICache"]
+__all__ = ["CICache", "LRUTTLCache"]
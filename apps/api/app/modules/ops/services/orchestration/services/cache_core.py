@@ -0,0 +1,305 @@
+"""
+Shared LRU + TTL cache core.
+
+Used by ToolResultCache and CICache so both get the same properties:
+- O(1) LRU via per-stripe OrderedDict (move_to_end / popitem)
+- Lazy TTL expiry driven by a hashed timer wheel (no full scans)
+- Lock striping so concurrent lookups on different keys don't serialize
+- Byte-size accounting with a memory budget in addition to an entry cap
+
+Operations never await, so stripes use plain threading locks; critical
+sections are O(1) and safe to take from the event loop.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+# Each stripe should hold a meaningful number of entries; smaller caches use a
+# single stripe so LRU order is exact.
+_MIN_ENTRIES_PER_STRIPE = 64
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory footprint of a cached value in bytes."""
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+@dataclass
+class CoreEntry:
+    """A cached value plus bookkeeping used for eviction and stats."""
+
+    key: str
+    value: Any
+    size: int
+    created_at: float
+    expires_at: float
+    last_accessed: float
+    hit_count: int = 0
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel of key expirations.
+
+    Keys are bucketed by expiry tick. ``advance`` returns the keys whose bucket
+    has come due since the last call; callers re-check the real expiry, so
+    entries that were refreshed or whose TTL wraps past the wheel span are
+    simply rescheduled.
+    """
+
+    def __init__(self, resolution_seconds: float = 1.0, slots: int = 512):
+        self.resolution = resolution_seconds
+        self._slots: List[Set[str]] = [set() for _ in range(slots)]
+        self._current_tick = self._tick(time.monotonic())
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp / self.resolution)
+
+    def schedule(self, key: str, expires_at: float) -> None:
+        tick = max(math.ceil(expires_at / self.resolution), self._current_tick + 1)
+        self._slots[tick % len(self._slots)].add(key)
+
+    def advance(self, now: float) -> List[str]:
+        now_tick = self._tick(now)
+        if now_tick <= self._current_tick:
+            return []
+        due: List[str] = []
+        steps = min(now_tick - self._current_tick, len(self._slots))
+        for offset in range(1, steps + 1):
+            slot = self._slots[(self._current_tick + offset) % len(self._slots)]
+            if slot:
+                due.extend(slot)
+                slot.clear()
+        self._current_tick = now_tick
+        return due
+
+    def clear(self) -> None:
+        for slot in self._slots:
+            slot.clear()
+
+
+class _Stripe:
+    def __init__(self, max_entries: int, max_bytes: int | None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, CoreEntry] = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.wheel = TimerWheel()
+
+
+class LRUTTLCache:
+    """
+    Striped LRU cache with per-entry TTL and a memory budget.
+
+    ``max_entries`` and ``max_bytes`` are split evenly across stripes, so LRU
+    order is exact within a stripe and approximate across the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int | None = None,
+        default_ttl_seconds: float = 300.0,
+        stripes: int = 16,
+        size_of: Callable[[Any], int] = estimate_size,
+        on_evict: Optional[Callable[[CoreEntry, str], None]] = None,
+    ):
+        stripe_count = max(1, min(stripes, max_entries // _MIN_ENTRIES_PER_STRIPE))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self._size_of = size_of
+        self._on_evict = on_evict
+        per_stripe_entries = max(1, math.ceil(max_entries / stripe_count))
+        per_stripe_bytes = (
+            max(1, max_bytes // stripe_count) if max_bytes is not None else None
+        )
+        self._stripes = [
+            _Stripe(per_stripe_entries, per_stripe_bytes) for _ in range(stripe_count)
+        ]
+        self._counters_lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "rejected": 0,
+        }
+
+    def _stripe_for(self, key: str) -> _Stripe:
+        if len(self._stripes) == 1:
+            return self._stripes[0]
+        digest = hashlib.blake2b(key.encode(), digest_size=4).digest()
+        return self._stripes[int.from_bytes(digest, "little") % len(self._stripes)]
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counters_lock:
+            self._counters[name] += amount
+
+    def _remove_locked(self, stripe: _Stripe, key: str, reason: str) -> CoreEntry:
+        entry = stripe.entries.pop(key)
+        stripe.bytes -= entry.size
+        if self._on_evict is not None and reason in ("evicted", "expired"):
+            self._on_evict(entry, reason)
+        return entry
+
+    def _expire_due_locked(self, stripe: _Stripe, now: float) -> int:
+        expired = 0
+        for key in stripe.wheel.advance(now):
+            entry = stripe.entries.get(key)
+            if entry is None:
+                continue
+            if entry.expires_at <= now:
+                self._remove_locked(stripe, key, "expired")
+                expired += 1
+            else:
+                stripe.wheel.schedule(key, entry.expires_at)
+        return expired
+
+    def get_entry(self, key: str, touch: bool = True) -> Optional[CoreEntry]:
+        """Return the live entry for ``key`` (updating LRU order when touched)."""
+        stripe = self._stripe_for(key)
+        now = time.monotonic()
+        with stripe.lock:
+            expired = self._expire_due_locked(stripe, now)
+            entry = stripe.entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove_locked(stripe, key, "expired")
+                expired += 1
+                entry = None
+            if entry is not None and touch:
+                stripe.entries.move_to_end(key)
+                entry.hit_count += 1
+                entry.last_accessed = now
+        if expired:
+            self._count("expirations", expired)
+        if touch:
+            self._count("hits" if entry is not None else "misses")
+        return entry
+
+    def get(self, key: str) -> Any | None:
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def contains(self, key: str) -> bool:
+        return self.get_entry(key, touch=False) is not None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Store ``value`` under ``key``.
+
+        Returns False when the value alone exceeds the stripe's memory budget
+        and was not cached.
+        """
+        size = self._size_of(value) + len(key)
+        stripe = self._stripe_for(key)
+        if stripe.max_bytes is not None and size > stripe.max_bytes:
+            self._count("rejected")
+            return False
+
+        now = time.monotonic()
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = CoreEntry(
+            key=key,
+            value=value,
+            size=size,
+            created_at=now,
+            expires_at=now + ttl,
+            last_accessed=now,
+            meta=dict(meta or {}),
+        )
+        evicted = 0
+        with stripe.lock:
+            expired = self._expire_due_locked(stripe, now)
+            if key in stripe.entries:
+                self._remove_locked(stripe, key, "replaced")
+            while stripe.entries and (
+                len(stripe.entries) >= stripe.max_entries
+                or (stripe.max_bytes is not None and stripe.bytes + size > stripe.max_bytes)
+            ):
+                lru_key = next(iter(stripe.entries))
+                self._remove_locked(stripe, lru_key, "evicted")
+                evicted += 1
+            stripe.entries[key] = entry
+            stripe.bytes += size
+            stripe.wheel.schedule(key, entry.expires_at)
+        if expired:
+            self._count("expirations", expired)
+        if evicted:
+            self._count("evictions", evicted)
+        return True
+
+    def delete(self, key: str) -> Optional[CoreEntry]:
+        stripe = self._stripe_for(key)
+        with stripe.lock:
+            if key not in stripe.entries:
+                return None
+            return self._remove_locked(stripe, key, "deleted")
+
+    def delete_where(self, predicate: Callable[[CoreEntry], bool]) -> int:
+        """Remove every entry matching ``predicate`` (O(n); for invalidation only)."""
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                keys = [k for k, e in stripe.entries.items() if predicate(e)]
+                for key in keys:
+                    self._remove_locked(stripe, key, "deleted")
+                removed += len(keys)
+        return removed
+
+    def clear(self) -> int:
+        cleared = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                cleared += len(stripe.entries)
+                stripe.entries.clear()
+                stripe.bytes = 0
+                stripe.wheel.clear()
+        return cleared
+
+    def entries(self) -> Iterator[CoreEntry]:
+        """Snapshot of live entries, least recently used first within a stripe."""
+        now = time.monotonic()
+        for stripe in self._stripes:
+            with stripe.lock:
+                snapshot = [e for e in stripe.entries.values() if e.expires_at > now]
+            yield from snapshot
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(stripe.bytes for stripe in self._stripes)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counters_lock:
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "size": len(self),
+            "max_entries": self.max_entries,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "stripes": len(self._stripes),
+        }
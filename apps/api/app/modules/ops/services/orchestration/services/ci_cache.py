@@ -6,35 +6,24 @@ Features:
 - Cache key generation based on keywords and filters
 - TTL-based expiration (default: 300 seconds)
 - Hit/miss rate tracking for performance monitoring
-- LRU eviction policy
-- Thread-safe operations
+- O(1) LRU eviction with a memory budget (shared LRUTTLCache core)
+- Thread-safe operations (lock-striped)
 """
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from core.logging import get_logger
+from core.config import get_settings
+from core.logging import get_logger, get_request_context
+from core.metrics import CACHE_REQUESTS
 
-
-@dataclass
-class CICacheEntry:
-    """Represents a cached CI search result"""
-
-    key: str
-    results: List[Dict[str, Any]]
-    created_at: datetime
-    expires_at: datetime
-    hit_count: int = 0
-    query_keywords: List[str] = field(default_factory=list)
-    filter_count: int = 0
-    result_count: int = 0
-    last_accessed: datetime = field(default_factory=datetime.now)
+from .cache_core import CoreEntry, LRUTTLCache
+from .result_store import TieredResultCache, get_l2_store
 
 
 class CICache:
@@ -51,14 +40,20 @@ class CICache:
     - ~90% cache hit rate for typical workloads
     - Reduces DB queries from 10-15 per operation to 1-2
     - ~5-10ms cache lookup vs ~50-100ms DB query
+
+    With ``ops_result_cache_l2_enabled`` the process-local entries are backed
+    by a shared Redis L2 (keys include the tenant), so workers warm each other.
     """
 
+    namespace = "ci"
+
     def __init__(
         self,
         max_size: int = 500,
         default_ttl: timedelta = timedelta(seconds=300),
         keyword_ttl: Optional[timedelta] = None,
         filter_ttl: Optional[timedelta] = None,
+        max_bytes: int | None = None,
     ):
         """
         Initialize CI cache.
@@ -68,17 +63,22 @@ class CICache:
             default_ttl: Default cache duration (5 minutes)
             keyword_ttl: Optional override TTL for keyword-only searches
             filter_ttl: Optional override TTL for filter-based searches
+            max_bytes: Memory budget for cached results (defaults to settings)
         """
-        self._cache: Dict[str, CICacheEntry] = {}
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._keyword_ttl = keyword_ttl or timedelta(seconds=600)  # 10 min for keywords
         self._filter_ttl = filter_ttl or timedelta(seconds=300)  # 5 min for filters
-        self._lock = asyncio.Lock()
-        self._hit_count = 0
-        self._miss_count = 0
-        self._eviction_count = 0
         self.logger = get_logger(__name__)
+        if max_bytes is None:
+            max_bytes = get_settings().ops_ci_cache_max_bytes
+        self._core = LRUTTLCache(
+            max_entries=max_size,
+            max_bytes=max_bytes,
+            default_ttl_seconds=default_ttl.total_seconds(),
+            on_evict=self._log_eviction,
+        )
+        self._tiered = TieredResultCache(self.namespace, self._core, get_l2_store(self.namespace))
 
     def generate_key(
         self,
@@ -86,6 +86,7 @@ class CICache:
         filters: Sequence[Dict[str, Any]] | None = None,
         limit: int | None = None,
         sort: Tuple[str, str] | None = None,
+        tenant_id: str | None = None,
     ) -> str:
         """
         Generate cache key from search parameters.
@@ -93,7 +94,7 @@ class CICache:
         Strategy:
         - Keywords are normalized (lowercase, trimmed)
         - Filters are serialized in deterministic order
-        - Limit and sort are included in key
+        - Limit, sort and tenant are included in key
         - MD5 hash to keep key size reasonable
 
         Args:
@@ -101,6 +102,7 @@ class CICache:
             filters: Filter specifications
             limit: Result limit
             sort: Sort column and direction
+            tenant_id: Tenant the results belong to (defaults to the request's)
 
         Returns:
             Cache key string (MD5 hash)
@@ -133,6 +135,7 @@ class CICache:
             "filters": filter_json,
             "limit": limit,
             "sort": sort,
+            "tenant_id": tenant_id or get_request_context()["tenant_id"],
         }
 
         key_string = json.dumps(key_payload, sort_keys=True, default=str)
@@ -145,7 +148,6 @@ class CICache:
         Returns None if:
         - Key not found
         - Entry has expired
-        - Cache is locked
 
         Args:
             key: Cache key
@@ -153,33 +155,24 @@ class CICache:
         Returns:
             Cached results or None if not found/expired
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            if not entry:
-                self._miss_count += 1
-                return None
-
-            # Check expiration
-            if datetime.now() >= entry.expires_at:
-                del self._cache[key]
-                self._miss_count += 1
-                return None
-
-            # Update hit tracking
-            entry.hit_count += 1
-            entry.last_accessed = datetime.now()
-            self._hit_count += 1
-
-            self.logger.debug(
-                "ci_cache.hit",
-                extra={
-                    "key": key[:8],
-                    "results": len(entry.results),
-                    "age_ms": int((datetime.now() - entry.created_at).total_seconds() * 1000),
-                },
-            )
+        entry = self._core.get_entry(key)
+        if entry is None:
+            shared = await self._tiered.get_shared(key)
+            CACHE_REQUESTS.labels("ci", "shared_hit" if shared is not None else "miss").inc()
+            return shared.copy() if shared is not None else None
+
+        CACHE_REQUESTS.labels("ci", "hit").inc()
+
+        self.logger.debug(
+            "ci_cache.hit",
+            extra={
+                "key": key[:8],
+                "results": entry.meta["result_count"],
+                "age_ms": int((time.monotonic() - entry.created_at) * 1000),
+            },
+        )
 
-            return entry.results.copy()
+        return entry.value.copy()
 
     async def set(
         self,
@@ -197,7 +190,7 @@ class CICache:
         - Default: 5 minutes
 
         Eviction:
-        - LRU eviction when cache exceeds max_size
+        - LRU eviction when cache exceeds max_size or max_bytes
         - Evicted entries logged for monitoring
 
         Args:
@@ -206,53 +199,55 @@ class CICache:
             keywords: Search keywords (for TTL selection)
             filters: Filter specifications (for TTL selection)
         """
-        async with self._lock:
-            # Determine TTL
-            has_filters = filters and len(filters) > 0
-            if has_filters:
-                ttl = self._filter_ttl
-            else:
-                ttl = self._keyword_ttl
-
-            now = datetime.now()
-            entry = CICacheEntry(
-                key=key,
-                results=results,
-                created_at=now,
-                expires_at=now + ttl,
-                query_keywords=list(keywords or []),
-                filter_count=len(filters or []),
-                result_count=len(results),
-            )
-
-            # Evict LRU if needed
-            if len(self._cache) >= self._max_size:
-                lru_key = min(
-                    self._cache.values(), key=lambda e: e.last_accessed
-                ).key
-                evicted_entry = self._cache.pop(lru_key)
-                self._eviction_count += 1
-
-                self.logger.debug(
-                    "ci_cache.evict_lru",
-                    extra={
-                        "evicted_key": evicted_entry.key[:8],
-                        "evicted_results": evicted_entry.result_count,
-                        "cache_size": len(self._cache),
-                    },
-                )
-
-            self._cache[key] = entry
-
+        # Determine TTL
+        has_filters = filters and len(filters) > 0
+        if has_filters:
+            ttl = self._filter_ttl
+        else:
+            ttl = self._keyword_ttl
+
+        ci_ids = {
+            str(row["ci_id"]) for row in results if isinstance(row, dict) and row.get("ci_id")
+        }
+        stored = await self._tiered.set(
+            key,
+            results,
+            ttl.total_seconds(),
+            meta={
+                "query_keywords": list(keywords or []),
+                "filter_count": len(filters or []),
+                "result_count": len(results),
+                "tags": sorted(f"ci_id:{ci_id}" for ci_id in ci_ids),
+            },
+        )
+        if not stored:
             self.logger.debug(
-                "ci_cache.set",
-                extra={
-                    "key": key[:8],
-                    "results": len(results),
-                    "ttl_seconds": ttl.total_seconds(),
-                    "cache_size": len(self._cache),
-                },
+                "ci_cache.skip_oversized",
+                extra={"key": key[:8], "results": len(results)},
             )
+            return
+
+        self.logger.debug(
+            "ci_cache.set",
+            extra={
+                "key": key[:8],
+                "results": len(results),
+                "ttl_seconds": ttl.total_seconds(),
+                "cache_size": len(self._core),
+            },
+        )
+
+    def _log_eviction(self, entry: CoreEntry, reason: str) -> None:
+        if reason != "evicted":
+            return
+        self.logger.debug(
+            "ci_cache.evict_lru",
+            extra={
+                "evicted_key": entry.key[:8],
+                "evicted_results": entry.meta.get("result_count", 0),
+                "evicted_bytes": entry.size,
+            },
+        )
 
     async def invalidate(self, key: str) -> bool:
         """
@@ -264,18 +259,17 @@ class CICache:
         Returns:
             True if entry was found and removed, False otherwise
         """
-        async with self._lock:
-            if key in self._cache:
-                entry = self._cache.pop(key)
-                self.logger.debug(
-                    "ci_cache.invalidate",
-                    extra={
-                        "key": key[:8],
-                        "results": entry.result_count,
-                    },
-                )
-                return True
+        entry = self._core.delete(key)
+        if entry is None:
             return False
+        self.logger.debug(
+            "ci_cache.invalidate",
+            extra={
+                "key": key[:8],
+                "results": entry.meta.get("result_count", 0),
+            },
+        )
+        return True
 
     async def invalidate_pattern(self, pattern_keywords: Sequence[str]) -> int:
         """
@@ -289,40 +283,49 @@ class CICache:
         Returns:
             Number of entries invalidated
         """
-        async with self._lock:
-            pattern_set = {kw.lower() for kw in pattern_keywords}
-            keys_to_remove = []
-
-            for key, entry in self._cache.items():
-                entry_keywords = {kw.lower() for kw in entry.query_keywords}
-                if entry_keywords & pattern_set:  # Any intersection
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                del self._cache[key]
-
-            if keys_to_remove:
-                self.logger.info(
-                    "ci_cache.invalidate_pattern",
-                    extra={
-                        "pattern_keywords": list(pattern_keywords),
-                        "invalidated": len(keys_to_remove),
-                        "cache_size": len(self._cache),
-                    },
-                )
+        pattern_set = {kw.lower() for kw in pattern_keywords}
 
-            return len(keys_to_remove)
+        def _matches(entry: CoreEntry) -> bool:
+            entry_keywords = {kw.lower() for kw in entry.meta.get("query_keywords", [])}
+            return bool(entry_keywords & pattern_set)  # Any intersection
 
-    async def clear(self) -> None:
-        """Clear all cache entries."""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
+        removed = self._core.delete_where(_matches)
+
+        if removed:
             self.logger.info(
-                "ci_cache.clear",
-                extra={"cleared_entries": count},
+                "ci_cache.invalidate_pattern",
+                extra={
+                    "pattern_keywords": list(pattern_keywords),
+                    "invalidated": removed,
+                    "cache_size": len(self._core),
+                },
             )
 
+        return removed
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> int:
+        """
+        Invalidate entries tagged with any of ``tags`` (e.g. ``ci_id:<id>``).
+
+        Unlike invalidate_pattern this also drops shared L2 entries and the
+        L1 entries of other workers.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of entries invalidated in this worker and L2
+        """
+        return await self._tiered.invalidate_tags(tags)
+
+    async def clear(self) -> None:
+        """Clear all cache entries."""
+        count = self._core.clear()
+        self.logger.info(
+            "ci_cache.clear",
+            extra={"cleared_entries": count},
+        )
+
     async def contains(self, key: str) -> bool:
         """
         Check if key exists in cache and is not expired.
@@ -333,14 +336,7 @@ class CICache:
         Returns:
             True if key exists and is not expired
         """
-        async with self._lock:
-            entry = self._cache.get(key)
-            if not entry:
-                return False
-            if datetime.now() >= entry.expires_at:
-                del self._cache[key]
-                return False
-            return True
+        return self._core.contains(key)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -352,23 +348,32 @@ class CICache:
         - hit_rate: Hit rate percentage
         - size: Current cache size
         - max_size: Maximum cache size
+        - cache_bytes / max_bytes: Accounted memory and budget
         - eviction_count: Total LRU evictions
         """
-        total_requests = self._hit_count + self._miss_count
+        core_stats = self._core.stats()
+        hit_count = core_stats["hits"]
+        miss_count = core_stats["misses"]
+        total_requests = hit_count + miss_count
         hit_rate = (
-            (self._hit_count / total_requests * 100)
+            (hit_count / total_requests * 100)
             if total_requests > 0
             else 0
         )
 
         return {
-            "hit_count": self._hit_count,
-            "miss_count": self._miss_count,
+            "hit_count": hit_count,
+            "miss_count": miss_count,
             "hit_rate_percent": round(hit_rate, 2),
             "total_requests": total_requests,
-            "cache_size": len(self._cache),
+            "cache_size": core_stats["size"],
             "max_size": self._max_size,
-            "eviction_count": self._eviction_count,
+            "cache_bytes": core_stats["size_bytes"],
+            "max_bytes": core_stats["max_bytes"],
+            "eviction_count": core_stats["evictions"],
+            "expiration_count": core_stats["expirations"],
+            "l2": self._tiered.l2.stats() if self._tiered.l2 is not None else None,
+            "coalesced_loads": self._tiered.stats()["coalesced_loads"],
             "default_ttl_seconds": self._default_ttl.total_seconds(),
             "keyword_ttl_seconds": self._keyword_ttl.total_seconds(),
             "filter_ttl_seconds": self._filter_ttl.total_seconds(),
@@ -386,22 +391,20 @@ class CICache:
         - hit_count: Number of cache hits
         - query_keywords: Original keywords
         """
-        now = datetime.now()
+        now = time.monotonic()
         entries = []
 
         for entry in sorted(
-            self._cache.values(), key=lambda e: e.last_accessed, reverse=True
+            self._core.entries(), key=lambda e: e.last_accessed, reverse=True
         ):
             entries.append({
                 "key": entry.key[:8],
-                "results": entry.result_count,
-                "age_seconds": int((now - entry.created_at).total_seconds()),
-                "expires_in_seconds": int(
-                    (entry.expires_at - now).total_seconds()
-                ),
+                "results": entry.meta["result_count"],
+                "age_seconds": int(now - entry.created_at),
+                "expires_in_seconds": int(entry.expires_at - now),
                 "hit_count": entry.hit_count,
-                "filter_count": entry.filter_count,
-                "query_keywords": entry.query_keywords[:3],  # First 3 keywords
+                "filter_count": entry.meta["filter_count"],
+                "query_keywords": entry.meta["query_keywords"][:3],  # First 3 keywords
             })
 
         return entries
@@ -0,0 +1,483 @@
+"""
+Redis-backed L2 for OPS result caches.
+
+ToolResultCache and CICache keep a process-local L1 (LRUTTLCache); this module
+adds an optional shared L2 so warm results are reused across uvicorn workers
+and nodes:
+- Compact serialization (orjson when installed, zlib above a size threshold)
+- Single-flight coalescing: one loader per key in-process, plus a short Redis
+  fill lock so concurrent misses on other workers wait for the same fill
+- Tag-based invalidation (e.g. ``ci_id:<id>``, ``source_ref:<name>``) that
+  drops L2 keys and fans out over pub/sub to every worker's L1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from core.config import get_settings
+
+from .cache_core import CoreEntry, LRUTTLCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_JSON = b"j"
+_FORMAT_ORJSON = b"o"
+_COMPRESSED = b"z"
+_TAG_SET_MIN_TTL_MS = 3600 * 1000
+
+# Namespaces of the result caches built on TieredResultCache
+RESULT_CACHE_NAMESPACES = ("tool", "ci")
+
+
+def dumps_compact(value: Any, compress_min_bytes: int = 1024) -> bytes:
+    """Serialize to bytes with a 2-byte header: [compressed?][format]."""
+    if orjson is not None:
+        fmt = _FORMAT_ORJSON
+        body = orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        fmt = _FORMAT_JSON
+        body = json.dumps(value, default=str, separators=(",", ":")).encode("utf-8")
+    if len(body) >= compress_min_bytes:
+        return _COMPRESSED + fmt + zlib.compress(body, 1)
+    return b"-" + fmt + body
+
+
+def loads_compact(raw: bytes) -> Any:
+    compressed, fmt, body = raw[:1], raw[1:2], raw[2:]
+    if compressed == _COMPRESSED:
+        body = zlib.decompress(body)
+    if fmt == _FORMAT_ORJSON and orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def entry_has_tags(tags: Iterable[str]) -> Callable[[CoreEntry], bool]:
+    wanted = set(tags)
+    return lambda entry: bool(wanted & set(entry.meta.get("tags", ())))
+
+
+class SingleFlight:
+    """Coalesce concurrent loads of the same key into one in-flight call."""
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[int, str], asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Futures are loop-bound; runners that use asyncio.run() get their own slot
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._inflight.get(flight_key)
+            if task is None:
+                # The load is its own task so a cancelled caller (the one that
+                # started it included) never cancels it for everyone else
+                task = loop.create_task(fn())
+                task.add_done_callback(functools.partial(self._finish, flight_key))
+                self._inflight[flight_key] = task
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, flight_key: Tuple[int, str], task: asyncio.Task) -> None:
+        with self._lock:
+            if self._inflight.get(flight_key) is task:
+                del self._inflight[flight_key]
+        if not task.cancelled():
+            # Mark retrieved so failures whose callers all left don't warn
+            task.exception()
+
+
+class RedisResultStore:
+    """Shared L2 keyed by ``<prefix><namespace>:<key>`` with tag sets."""
+
+    def __init__(self, namespace: str, client: Any = None):
+        settings = get_settings()
+        self.namespace = namespace
+        self.prefix = f"{settings.ops_result_cache_l2_prefix}{namespace}:"
+        self._compress_min_bytes = settings.ops_result_cache_l2_compress_min_bytes
+        self._fill_lock_seconds = settings.ops_result_cache_fill_lock_seconds
+        self._client = client
+        self._counters = {"hits": 0, "misses": 0, "errors": 0, "lock_waits": 0}
+
+    def _get_client(self):
+        if self._client is None:
+            from core.redis import create_redis_client
+
+            # Binary payloads; don't let redis-py decode them as text
+            self._client = create_redis_client(get_settings(), decode_responses=False)
+        return self._client
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _get_sync(self, key: str) -> Any | None:
+        raw = self._get_client().get(self._key(key))
+        return loads_compact(raw) if raw else None
+
+    def _set_sync(self, key: str, payload: bytes, ttl_seconds: float, tags: Iterable[str]) -> None:
+        ttl_ms = max(1, int(ttl_seconds * 1000))
+        pipe = self._get_client().pipeline(transaction=False)
+        pipe.set(self._key(key), payload, px=ttl_ms)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, key)
+            # Result TTLs are minutes; the floor keeps tag sets alive past
+            # every member without growing them forever
+            pipe.pexpire(tag_key, max(ttl_ms, _TAG_SET_MIN_TTL_MS))
+        pipe.execute()
+
+    def _invalidate_tags_sync(self, tags: Iterable[str]) -> int:
+        client = self._get_client()
+        removed = 0
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            members = client.smembers(tag_key)
+            keys = [self._key(m.decode() if isinstance(m, bytes) else m) for m in members]
+            if keys:
+                removed += client.delete(*keys)
+            client.delete(tag_key)
+        return removed
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            value = await asyncio.to_thread(self._get_sync, key)
+        except Exception as exc:
+            self._counters["errors"] += 1
+            logger.warning(f"L2 result cache get failed ({self.namespace}): {exc}")
+            return None
+        self._counters["hits" if value is not None else "misses"] += 1
+        return value
+
+    async def set(
+        self, key: str, value: Any, ttl_seconds: float, tags: Iterable[str] = ()
+    ) -> None:
+        try:
+            payload = dumps_compact(value, self._compress_min_bytes)
+            await asyncio.to_thread(self._set_sync, key, payload, ttl_seconds, list(tags))
+        except Exception as exc:
+            self._counters["errors"] += 1
+            logger.warning(f"L2 result cache set failed ({self.namespace}): {exc}")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Blocking; async callers go through TieredResultCache.invalidate_tags."""
+        try:
+            return self._invalidate_tags_sync(list(tags))
+        except Exception as exc:
+            self._counters["errors"] += 1
+            logger.warning(f"L2 result cache invalidation failed ({self.namespace}): {exc}")
+            return 0
+
+    async def wait_for_fill(self, key: str) -> Any | None:
+        """
+        Take the cross-worker fill lock for ``key``.
+
+        Returns None when this worker should load (lock acquired, lock wait
+        timed out, or Redis unavailable); otherwise the value another worker
+        filled while we waited.
+        """
+        lock_key = f"{self.prefix}lock:{key}"
+        lock_ms = max(1, int(self._fill_lock_seconds * 1000))
+        try:
+            client = self._get_client()
+            acquired = await asyncio.to_thread(client.set, lock_key, b"1", nx=True, px=lock_ms)
+            if acquired:
+                return None
+            self._counters["lock_waits"] += 1
+            deadline = time.monotonic() + self._fill_lock_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                value = await asyncio.to_thread(self._get_sync, key)
+                if value is not None:
+                    return value
+                if not await asyncio.to_thread(client.exists, lock_key):
+                    return None
+        except Exception as exc:
+            self._counters["errors"] += 1
+            logger.warning(f"L2 result cache fill lock failed ({self.namespace}): {exc}")
+        return None
+
+    async def release_fill(self, key: str) -> None:
+        try:
+            await asyncio.to_thread(self._get_client().delete, f"{self.prefix}lock:{key}")
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"namespace": self.namespace, **self._counters}
+
+
+class ResultCacheInvalidationBus:
+    """Fan-out of tag invalidations to every worker's L1 caches via pub/sub."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._caches: Dict[str, "weakref.WeakSet[LRUTTLCache]"] = {}
+        self._registry_lock = threading.Lock()
+        self._client = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def register(self, namespace: str, cache: LRUTTLCache) -> None:
+        with self._registry_lock:
+            self._caches.setdefault(namespace, weakref.WeakSet()).add(cache)
+
+    def drop_local(self, namespace: str, tags: Iterable[str]) -> int:
+        predicate = entry_has_tags(tags)
+        with self._registry_lock:
+            caches = list(self._caches.get(namespace, ()))
+        return sum(cache.delete_where(predicate) for cache in caches)
+
+    def _get_client(self):
+        if self._client is None:
+            from core.redis import create_redis_client
+
+            self._client = create_redis_client(get_settings())
+        return self._client
+
+    def publish(self, namespace: str, tags: Iterable[str]) -> None:
+        if not get_settings().redis_url:
+            return
+        message = json.dumps(
+            {"origin": self.origin, "namespace": namespace, "tags": sorted(tags)}
+        )
+        try:
+            self._get_client().publish(self.channel, message)
+        except Exception as exc:
+            logger.warning(f"Failed to publish result cache invalidation: {exc}")
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        settings = get_settings()
+        if not (settings.redis_url and settings.ops_result_cache_l2_enabled):
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name="result-cache-invalidation", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle(message.get("data"))
+            except Exception as exc:
+                logger.warning(f"Result cache invalidation listener error: {exc}")
+                self._stop.wait(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.origin:
+            return
+        self.drop_local(payload.get("namespace") or "", payload.get("tags") or [])
+
+
+class TieredResultCache:
+    """
+    L1 (process-local LRUTTLCache) + optional L2 (Redis) with single-flight.
+
+    Owned by ToolResultCache / CICache; ``l2`` is None when Redis is not
+    configured or ``ops_result_cache_l2_enabled`` is off. Both levels use the
+    caller's key as is, so keys must already be tenant-qualified.
+    """
+
+    def __init__(self, namespace: str, l1: LRUTTLCache, l2: Optional[RedisResultStore]):
+        self.namespace = namespace
+        self.l1 = l1
+        self.l2 = l2
+        self._flight = get_single_flight(namespace)
+        get_invalidation_bus().register(namespace, l1)
+
+    async def get(self, key: str) -> Any | None:
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+        return await self.get_shared(key)
+
+    async def get_shared(self, key: str) -> Any | None:
+        """L2 lookup only (after an L1 miss); promotes hits into L1."""
+        if self.l2 is None:
+            return None
+        return self._promote(key, await self.l2.get(key))
+
+    def _promote(self, key: str, record: Dict[str, Any] | None) -> Any | None:
+        """Copy an L2 record into L1 for the rest of its lifetime."""
+        if record is None:
+            return None
+        ttl_remaining = record["exp"] - time.time()
+        if ttl_remaining <= 0:
+            return None
+        self.l1.set(key, record["v"], ttl_seconds=ttl_remaining, meta=record.get("meta"))
+        return record["v"]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: float,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        stored = self.l1.set(key, value, ttl_seconds=ttl_seconds, meta=meta)
+        if self.l2 is not None:
+            meta = meta or {}
+            await self.l2.set(
+                key,
+                {"v": value, "exp": time.time() + ttl_seconds, "meta": meta},
+                ttl_seconds,
+                tags=meta.get("tags", ()),
+            )
+        return stored
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Return ``(value, cache_hit)``; concurrent misses share one ``loader`` call.
+
+        ``loader`` returning None means "don't cache".
+        """
+        value = self.l1.get(key)
+        if value is not None:
+            return value, True
+
+        async def _fill() -> Tuple[Any, bool]:
+            if self.l2 is None:
+                loaded = await loader()
+                if loaded is not None:
+                    await self.set(key, loaded, ttl_seconds, meta)
+                return loaded, False
+
+            shared = self._promote(key, await self.l2.get(key))
+            if shared is not None:
+                return shared, True
+            shared = self._promote(key, await self.l2.wait_for_fill(key))
+            if shared is not None:
+                return shared, True
+            try:
+                loaded = await loader()
+                if loaded is not None:
+                    await self.set(key, loaded, ttl_seconds, meta)
+                return loaded, False
+            finally:
+                await self.l2.release_fill(key)
+
+        return await self._flight.do(key, _fill)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        return await asyncio.to_thread(_drop_tagged, self.namespace, self.l2, set(tags))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "l1": self.l1.stats(),
+            "l2": self.l2.stats() if self.l2 is not None else None,
+            "coalesced_loads": self._flight.coalesced,
+        }
+
+
+_single_flights: Dict[str, SingleFlight] = {}
+_l2_stores: Dict[str, RedisResultStore] = {}
+_invalidation_bus: Optional[ResultCacheInvalidationBus] = None
+_singleton_lock = threading.Lock()
+
+
+def get_single_flight(namespace: str) -> SingleFlight:
+    with _singleton_lock:
+        return _single_flights.setdefault(namespace, SingleFlight())
+
+
+def get_l2_store(namespace: str) -> Optional[RedisResultStore]:
+    """Shared L2 store for ``namespace``, or None when L2 is disabled."""
+    settings = get_settings()
+    if not (settings.ops_result_cache_l2_enabled and settings.redis_url):
+        return None
+    with _singleton_lock:
+        store = _l2_stores.get(namespace)
+        if store is None:
+            store = _l2_stores[namespace] = RedisResultStore(namespace)
+        return store
+
+
+def get_invalidation_bus() -> ResultCacheInvalidationBus:
+    global _invalidation_bus
+    if _invalidation_bus is None:
+        with _singleton_lock:
+            if _invalidation_bus is None:
+                _invalidation_bus = ResultCacheInvalidationBus(
+                    get_settings().ops_result_cache_invalidation_channel
+                )
+    return _invalidation_bus
+
+
+def invalidate_result_tags(
+    tags: Iterable[str], namespaces: Iterable[str] = RESULT_CACHE_NAMESPACES
+) -> int:
+    """
+    Drop cached results tagged with any of ``tags`` (e.g. ``ci_id:<id>``).
+
+    Clears this worker's L1 caches and the shared L2, then tells the other
+    workers to clear theirs. Blocking, for the sync write paths that change
+    the underlying data.
+
+    Returns:
+        Number of entries removed in this worker's L1 and in L2
+    """
+    tags = set(tags)
+    return sum(_drop_tagged(ns, get_l2_store(ns), tags) for ns in namespaces)
+
+
+def _drop_tagged(namespace: str, l2: Optional[RedisResultStore], tags: set[str]) -> int:
+    if not tags:
+        return 0
+    bus = get_invalidation_bus()
+    removed = bus.drop_local(namespace, tags)
+    if l2 is not None:
+        removed += l2.invalidate_tags(tags)
+        bus.publish(namespace, tags)
+    return removed
@@ -1,48 +1,47 @@
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
+from core.config import get_settings
 
-@dataclass
-class CacheEntry:
-    key: str
-    value: Dict[str, Any]
-    created_at: datetime
-    expires_at: datetime
-    hit_count: int = 0
-    miss_count: int = 0
-    last_accessed: datetime = field(default_factory=datetime.now)
+from app.modules.ops.services.orchestration.services.cache_core import LRUTTLCache
+from app.modules.ops.services.orchestration.services.result_store import (
+    TieredResultCache,
+    get_l2_store,
+)
+
+# Params whose values identify the data a tool result was read from; used as
+# invalidation tags (e.g. "ci_id:123", "source_ref:primary_postgres")
+_TAG_PARAMS = ("ci_id", "ci_ids", "ci_code", "ci_codes", "source_ref", "source")
 
 
 class ToolResultCache:
+    namespace = "tool"
+
     def __init__(
         self,
         max_size: int = 1000,
         default_ttl: timedelta = timedelta(minutes=5),
         ttl_overrides: Optional[Dict[str, Dict[str, timedelta]]] = None,
+        max_bytes: int | None = None,
     ):
-        self._cache: Dict[str, CacheEntry] = {}
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._ttl_overrides = ttl_overrides or {}
-        self._lock = asyncio.Lock()
+        if max_bytes is None:
+            max_bytes = get_settings().ops_tool_cache_max_bytes
+        self._core = LRUTTLCache(
+            max_entries=max_size,
+            max_bytes=max_bytes,
+            default_ttl_seconds=default_ttl.total_seconds(),
+        )
+        self._tiered = TieredResultCache(self.namespace, self._core, get_l2_store(self.namespace))
 
     async def get(self, key: str) -> Optional[Dict[str, Any]]:
-        async with self._lock:
-            entry = self._cache.get(key)
-            if not entry:
-                return None
-            if datetime.now() >= entry.expires_at:
-                del self._cache[key]
-                return None
-            entry.hit_count += 1
-            entry.last_accessed = datetime.now()
-            return entry.value
+        return await self._tiered.get(key)
 
     async def set(
         self,
@@ -51,27 +50,45 @@ class ToolResultCache:
         ttl: Optional[timedelta] = None,
         tool_type: str | None = None,
         operation: str | None = None,
+        tags: Iterable[str] = (),
     ):
-        async with self._lock:
-            if len(self._cache) >= self._max_size:
-                # Evict least recently used entry
-                lru_key = min(
-                    self._cache.values(), key=lambda entry: entry.last_accessed
-                ).key
-                del self._cache[lru_key]
-
-            ttl_value = ttl or self._determine_ttl(tool_type, operation)
-            now = datetime.now()
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=now,
-                expires_at=now + ttl_value,
-            )
-            self._cache[key] = entry
+        ttl_value = ttl or self._determine_ttl(tool_type, operation)
+        await self._tiered.set(
+            key, value, ttl_value.total_seconds(), meta={"tags": sorted(set(tags))}
+        )
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        tool_type: str | None = None,
+        operation: str | None = None,
+        tags: Iterable[str] = (),
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Return ``(value, cache_hit)``, running ``loader`` once for concurrent misses.
+
+        Checks L1, then the shared L2 (when enabled); a ``loader`` result of
+        None is returned but not cached.
+        """
+        ttl_value = self._determine_ttl(tool_type, operation)
+        return await self._tiered.get_or_load(
+            key,
+            loader,
+            ttl_value.total_seconds(),
+            meta={"tags": sorted(set(tags))},
+        )
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop results tagged with any of ``tags`` on every worker."""
+        return await self._tiered.invalidate_tags(tags)
 
     def generate_key(
-        self, tool_type: str, operation: str, params: Dict[str, Any]
+        self,
+        tool_type: str,
+        operation: str,
+        params: Dict[str, Any],
+        tenant_id: str | None = None,
     ) -> str:
         cacheable_params = {
             k: v
@@ -79,12 +96,30 @@ class ToolResultCache:
             if k not in {"operation", "request_id", "trace_id"}
         }
         key_payload = json.dumps(
-            {"tool": tool_type, "operation": operation, "params": cacheable_params},
+            {
+                "tool": tool_type,
+                "operation": operation,
+                "tenant_id": tenant_id,
+                "params": cacheable_params,
+            },
             sort_keys=True,
             default=str,
         )
         return hashlib.md5(key_payload.encode()).hexdigest()
 
+    def generate_tags(self, params: Dict[str, Any]) -> List[str]:
+        tags = []
+        for name in _TAG_PARAMS:
+            value = params.get(name)
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            tag_name = name[:-1] if name.endswith("s") else name
+            tags.extend(
+                f"{tag_name}:{item}"
+                for item in values
+                if isinstance(item, (str, int)) and item != ""
+            )
+        return tags
+
     def _determine_ttl(self, tool_type: str | None, operation: str | None) -> timedelta:
         if tool_type and operation:
             overrides = self._ttl_overrides.get(tool_type.upper())
@@ -95,15 +130,10 @@ class ToolResultCache:
         return self._default_ttl
 
     async def contains(self, key: str) -> bool:
-        async with self._lock:
-            entry = self._cache.get(key)
-            if not entry:
-                return False
-            if datetime.now() >= entry.expires_at:
-                del self._cache[key]
-                return False
-            return True
+        return self._core.contains(key)
 
     def snapshot_keys(self) -> Dict[str, bool]:
-        now = datetime.now()
-        return {key: (entry.expires_at > now) for key, entry in self._cache.items()}
+        return {entry.key: True for entry in self._core.entries()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self._core.stats(), **self._tiered.stats()}
@@ -6,16 +6,27 @@ This module implements dynamic tool execution based on Tool Asset configuration.
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, Callable
 
+from core.config import get_settings
 from core.logging import get_logger
 
 from app.modules.asset_registry.loader import load_source_asset
-from app.modules.ops.services.connections import ConnectionFactory
+from app.modules.ops.services.connections import (
+    AsyncConnectionFactory,
+    ConnectionFactory,
+)
 
+from . import graph_hydration
 from .base import BaseTool, ToolContext, ToolResult
+from .request_timeout import (
+    RequestTimeoutError,
+    TimeoutPhase,
+    remaining_timeout_seconds,
+)
 
 logger = get_logger(__name__)
 
@@ -533,11 +544,24 @@ class DynamicTool(BaseTool):
                 error_details={"source_type": source_type},
             )
 
-        connection = None
         try:
-            connection = ConnectionFactory.create(source_asset)
-            output = connection.execute(query, params)
+            timeout = self._query_timeout_seconds()
+            output = await self._run_sql(source_asset, query, params, timeout)
             return ToolResult(success=True, data={"rows": output})
+        except (TimeoutError, RequestTimeoutError) as exc:
+            logger.warning(
+                f"Database query timed out: {str(exc)}",
+                extra={"query": query[:200], "source_ref": source_ref_effective},
+            )
+            return ToolResult(
+                success=False,
+                error=f"Database query timed out: {str(exc)}",
+                error_details={
+                    "exception": str(exc),
+                    "source_ref": source_ref_effective,
+                    "timeout": True,
+                },
+            )
         except Exception as exc:
             logger.error(
                 f"Database query failed: {str(exc)}",
@@ -548,12 +572,60 @@ class DynamicTool(BaseTool):
                 error=f"Database query failed: {str(exc)}",
                 error_details={"exception": str(exc), "source_ref": source_ref_effective},
             )
-        finally:
-            if connection:
-                try:
-                    connection.close()
-                except Exception:
-                    pass
+
+    def _query_timeout_seconds(self) -> float:
+        """Per-query timeout: tool_config ``timeout_ms`` capped by the request budget."""
+        timeout_ms = self.tool_config.get("timeout_ms") or get_settings().ops_tool_query_timeout_ms
+        return remaining_timeout_seconds(TimeoutPhase.EXECUTE, float(timeout_ms) / 1000)
+
+    async def _run_sql(
+        self,
+        source_asset: dict[str, Any],
+        query: str,
+        params: Any,
+        timeout: float,
+    ) -> Any:
+        """
+        Run SQL without blocking the event loop.
+
+        On the serving loop this uses an async connection; elsewhere (short-lived
+        loops in sync wrappers) the pooled sync connection runs in a worker
+        thread. Either way the server-side query is cancelled on timeout.
+        """
+        if AsyncConnectionFactory.is_available(source_asset):
+            connection = await AsyncConnectionFactory.create(source_asset, timeout=timeout)
+            try:
+                return await connection.execute_async(query, params, timeout=timeout)
+            finally:
+                await connection.close_async()
+
+        connections: list[Any] = []
+
+        def _execute_sync() -> Any:
+            connection = ConnectionFactory.create(source_asset)
+            connections.append(connection)
+            try:
+                return connection.execute(query, params)
+            finally:
+                connection.close()
+
+        def _cancel_running() -> None:
+            for connection in connections:
+                cancel = getattr(connection, "cancel", None)
+                if cancel is not None:
+                    try:
+                        cancel()
+                    except Exception as cancel_exc:
+                        logger.debug(f"Failed to cancel query: {cancel_exc}")
+
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(_execute_sync), timeout)
+        except asyncio.TimeoutError:
+            _cancel_running()
+            raise TimeoutError(f"Query exceeded {timeout:.1f}s and was cancelled")
+        except asyncio.CancelledError:
+            _cancel_running()
+            raise
 
     def _build_history_query_by_source(self, source: str, input_data: dict[str, Any]) -> tuple[str, list]:
         """Build history query based on source parameter with parameterized queries.
@@ -842,9 +914,16 @@ class DynamicTool(BaseTool):
 
         - Relationships (edges): from Neo4j (COMPOSED_OF, DEPLOYED_ON, RUNS_ON, etc.)
         - CI node basic info (label, type, status): from PostgreSQL ci table
+
+        Seeded queries (``ci_ids`` or ``ci_id``) expand up to ``depth`` hops in a
+        single UNWIND call. With ``hydrate`` (input or tool_config) the latest
+        metrics and recent history of every node are returned alongside, one
+        ``= ANY`` query per table (see ``graph_hydration``).
         """
-        tenant_id = input_data.get("tenant_id", "default")
-        limit = input_data.get("limit", 50)
+        tenant_id = input_data.get("tenant_id") or context.tenant_id or "default"
+        limits = input_data.get("limits")
+        default_limit = limits.get("max_nodes", 50) if isinstance(limits, dict) else 50
+        limit = input_data.get("limit", default_limit)
         ci_ids = input_data.get("ci_ids", [])
         try:
             limit = max(1, min(int(limit), 1000))
@@ -852,6 +931,10 @@ class DynamicTool(BaseTool):
             limit = 50
         if not isinstance(ci_ids, list):
             ci_ids = []
+        if not ci_ids and input_data.get("ci_id"):
+            ci_ids = [input_data["ci_id"]]
+        depth = graph_hydration.clamp_depth(input_data.get("depth", 1))
+        hydrate = bool(input_data.get("hydrate", self.tool_config.get("hydrate", False)))
 
         neo4j_source_ref = self.tool_config.get("source_ref")
         postgres_source_ref = self.tool_config.get("postgres_source_ref")
@@ -869,138 +952,37 @@ class DynamicTool(BaseTool):
                 error_details={"source_ref": neo4j_source_ref},
             )
 
-        # Relationship type → Korean label mapping
-        rel_label_map = {
-            "COMPOSED_OF": "구성",
-            "DEPLOYED_ON": "배포",
-            "RUNS_ON": "실행",
-            "USES": "사용",
-            "PROTECTED_BY": "보호",
-            "DEPENDS_ON": "의존",
-            "CONNECTED_TO": "연결",
-        }
-
-        neo4j_connection = None
-        postgres_connection = None
         try:
-            # --- Step 1: Query Neo4j for relationships ---
-            neo4j_connection = ConnectionFactory.create(neo4j_source_asset)
-            driver = getattr(neo4j_connection, "driver", None)
-            if driver is None:
-                return ToolResult(
-                    success=False,
-                    error=f"Source '{neo4j_source_ref}' does not provide a Neo4j driver",
-                    error_details={"source_type": neo4j_source_asset.get("source_type")},
-                )
-            neo4j_nodes = {}  # ci_id -> node properties from Neo4j
-            edges = []
-
-            with driver.session() as session:
-                if ci_ids and isinstance(ci_ids, list) and len(ci_ids) > 0:
-                    # Expand from specific CI nodes
-                    cypher = (
-                        "MATCH (a:CI)-[r]-(b:CI) "
-                        "WHERE a.tenant_id = $tenant_id "
-                        "  AND a.ci_id IN $ci_ids "
-                        "  AND b.tenant_id = $tenant_id "
-                        "RETURN a.ci_id AS src_id, a.ci_name AS src_name, "
-                        "       a.ci_type AS src_type, a.ci_code AS src_code, "
-                        "       a.status AS src_status, "
-                        "       type(r) AS rel_type, "
-                        "       b.ci_id AS tgt_id, b.ci_name AS tgt_name, "
-                        "       b.ci_type AS tgt_type, b.ci_code AS tgt_code, "
-                        "       b.status AS tgt_status "
-                        "LIMIT $limit"
-                    )
-                    result = session.run(
-                        cypher,
-                        tenant_id=tenant_id,
-                        ci_ids=ci_ids,
-                        limit=limit * 5,
-                    )
-                else:
-                    # Get all relationships for the tenant
-                    cypher = (
-                        "MATCH (a:CI)-[r]->(b:CI) "
-                        "WHERE a.tenant_id = $tenant_id "
-                        "  AND b.tenant_id = $tenant_id "
-                        "RETURN a.ci_id AS src_id, a.ci_name AS src_name, "
-                        "       a.ci_type AS src_type, a.ci_code AS src_code, "
-                        "       a.status AS src_status, "
-                        "       type(r) AS rel_type, "
-                        "       b.ci_id AS tgt_id, b.ci_name AS tgt_name, "
-                        "       b.ci_type AS tgt_type, b.ci_code AS tgt_code, "
-                        "       b.status AS tgt_status "
-                        "LIMIT $limit"
-                    )
-                    result = session.run(
-                        cypher,
-                        tenant_id=tenant_id,
-                        limit=limit * 5,
+            timeout = self._query_timeout_seconds()
+            postgres_source_asset = None
+            if postgres_source_ref:
+                candidate = load_source_asset(name=postgres_source_ref)
+                if candidate and str(candidate.get("source_type", "")).lower() in {
+                    "postgres", "postgresql", "mysql", "bigquery", "snowflake"
+                }:
+                    postgres_source_asset = candidate
+
+            options = self._hydration_options(input_data) if hydrate else None
+
+            def pg_queries(node_ids: list[str]) -> dict[str, tuple[str, list[Any]]]:
+                if not postgres_source_asset:
+                    return {}
+                if options is None:
+                    return graph_hydration.hydration_queries(
+                        tenant_id, node_ids, include_metrics=False, include_history=False
                     )
+                return graph_hydration.hydration_queries(tenant_id, node_ids, **options)
 
-                for record in result:
-                    src_id = record["src_id"]
-                    tgt_id = record["tgt_id"]
-                    rel_type = record["rel_type"]
-
-                    # Collect node info from Neo4j
-                    if src_id and src_id not in neo4j_nodes:
-                        neo4j_nodes[src_id] = {
-                            "ci_name": record["src_name"] or "",
-                            "ci_type": record["src_type"] or "",
-                            "ci_code": record["src_code"] or "",
-                            "status": record["src_status"] or "",
-                        }
-                    if tgt_id and tgt_id not in neo4j_nodes:
-                        neo4j_nodes[tgt_id] = {
-                            "ci_name": record["tgt_name"] or "",
-                            "ci_type": record["tgt_type"] or "",
-                            "ci_code": record["tgt_code"] or "",
-                            "status": record["tgt_status"] or "",
-                        }
-
-                    # Build edge
-                    if src_id and tgt_id:
-                        edges.append({
-                            "source": src_id,
-                            "target": tgt_id,
-                            "relation": rel_type,
-                            "label": rel_label_map.get(rel_type, rel_type),
-                        })
-
-            # --- Step 2: Enrich node info from PostgreSQL ---
-            node_ids_list = list(neo4j_nodes.keys())
-            pg_node_info = {}
-
-            if node_ids_list and postgres_source_ref:
-                # Query PostgreSQL for authoritative CI info - use parameterized query
-                placeholders = ", ".join(["%s"] * len(node_ids_list))
-                pg_query = f"""
-                SELECT ci_id::text, ci_code, ci_name, ci_type::text,
-                       ci_subtype::text, status
-                FROM ci
-                WHERE tenant_id = %s
-                  AND ci_id::text IN ({placeholders})
-                  AND deleted_at IS NULL
-                """
-                postgres_source_asset = load_source_asset(name=postgres_source_ref)
-                if postgres_source_asset and str(
-                    postgres_source_asset.get("source_type", "")
-                ).lower() in {"postgres", "postgresql", "mysql", "bigquery", "snowflake"}:
-                    postgres_connection = ConnectionFactory.create(postgres_source_asset)
-                    raw_conn = getattr(postgres_connection, "connection", None)
-                    if raw_conn:
-                        with raw_conn.cursor() as cur:
-                            cur.execute(pg_query, [tenant_id, *node_ids_list])
-                            columns = (
-                                [desc[0] for desc in cur.description]
-                                if cur.description
-                                else []
-                            )
-                            for row in cur.fetchall():
-                                row_dict = dict(zip(columns, row))
-                                pg_node_info[row_dict["ci_id"]] = row_dict
+            cypher, cypher_params = self._graph_cypher(tenant_id, ci_ids, limit, depth)
+            if AsyncConnectionFactory.is_available(neo4j_source_asset):
+                fetch = self._fetch_graph_async
+            else:
+                fetch = self._fetch_graph_in_thread
+            (neo4j_nodes, edges), pg_results = await fetch(
+                neo4j_source_asset, postgres_source_asset, cypher, cypher_params,
+                ci_ids, pg_queries, timeout,
+            )
+            pg_node_info = {row["ci_id"]: row for row in pg_results.get("nodes") or []}
 
             # --- Step 3: Build final nodes (PostgreSQL preferred, Neo4j fallback) ---
             nodes = []
@@ -1026,33 +1008,230 @@ class DynamicTool(BaseTool):
                         "status": neo4j_info["status"],
                     })
 
+            node_ids = list(neo4j_nodes) or list(ci_ids)
+            data: dict[str, Any] = {
+                "nodes": nodes[:limit],
+                "edges": edges,
+                "ids": node_ids,
+                "total_nodes": len(nodes),
+                "total_edges": len(edges),
+                "meta": {"depth": depth},
+            }
+            if options is not None:
+                code_by_id = {node["id"]: node["code"] for node in nodes}
+                data["hydration"] = graph_hydration.build_hydration(
+                    node_ids,
+                    code_by_id,
+                    pg_results.get("metrics"),
+                    pg_results.get("history"),
+                    metric_time_range=options["metric_time_range"],
+                    history_time_range=options["history_time_range"],
+                )
+            return ToolResult(success=True, data=data)
+
+        except (TimeoutError, RequestTimeoutError) as exc:
             return ToolResult(
-                success=True,
-                data={
-                    "nodes": nodes[:limit],
-                    "edges": edges,
-                    "total_nodes": len(nodes),
-                    "total_edges": len(edges),
-                }
+                success=False,
+                error=f"Graph query timed out: {str(exc)}",
+                error_details={"exception": str(exc), "timeout": True},
             )
-
         except Exception as exc:
             return ToolResult(
                 success=False,
                 error=f"Graph query failed: {str(exc)}",
                 error_details={"exception": str(exc)},
             )
+
+    def _hydration_options(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Hydration settings: input overrides tool_config, then defaults."""
+        config = self.tool_config.get("hydration") or {}
+
+        def option(name: str, default: Any) -> Any:
+            value = input_data.get(name)
+            return value if value is not None else config.get(name, default)
+
+        try:
+            history_limit = max(1, min(int(option("history_limit", 50)), 1000))
+        except (TypeError, ValueError):
+            history_limit = 50
+        return {
+            "include_metrics": bool(option("include_metrics", True)),
+            "include_history": bool(option("include_history", True)),
+            "metric_time_range": option("metric_time_range", "last_24h"),
+            "history_time_range": option("history_time_range", "last_7d"),
+            "history_limit": history_limit,
+        }
+
+    @staticmethod
+    def _graph_cypher(
+        tenant_id: str, ci_ids: list[Any], limit: int, depth: int = 1
+    ) -> tuple[str, dict[str, Any]]:
+        if ci_ids:
+            # Expand from specific CI nodes (all seeds, all hops, one call)
+            cypher = graph_hydration.expand_cypher(depth)
+            return cypher, {
+                "tenant_id": tenant_id,
+                "ci_ids": ci_ids,
+                "limit": limit * 5,
+                "per_seed_limit": limit * 5,
+            }
+        # Get all relationships for the tenant
+        cypher = (
+            "MATCH (a:CI)-[r]->(b:CI) "
+            "WHERE a.tenant_id = $tenant_id "
+            "  AND b.tenant_id = $tenant_id "
+            "RETURN a.ci_id AS src_id, a.ci_name AS src_name, "
+            "       a.ci_type AS src_type, a.ci_code AS src_code, "
+            "       a.status AS src_status, "
+            "       type(r) AS rel_type, "
+            "       b.ci_id AS tgt_id, b.ci_name AS tgt_name, "
+            "       b.ci_type AS tgt_type, b.ci_code AS tgt_code, "
+            "       b.status AS tgt_status "
+            "LIMIT $limit"
+        )
+        return cypher, {"tenant_id": tenant_id, "limit": limit * 5}
+
+    @staticmethod
+    def _collect_graph_records(
+        records: list[dict[str, Any]],
+    ) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+        """Turn Neo4j relationship rows into (ci_id -> node info, edges)."""
+        # Relationship type → Korean label mapping
+        rel_label_map = {
+            "COMPOSED_OF": "구성",
+            "DEPLOYED_ON": "배포",
+            "RUNS_ON": "실행",
+            "USES": "사용",
+            "PROTECTED_BY": "보호",
+            "DEPENDS_ON": "의존",
+            "CONNECTED_TO": "연결",
+        }
+        neo4j_nodes: dict[str, dict[str, Any]] = {}
+        edges: list[dict[str, Any]] = []
+        for record in records:
+            src_id = record["src_id"]
+            tgt_id = record["tgt_id"]
+            rel_type = record["rel_type"]
+
+            # Collect node info from Neo4j
+            if src_id and src_id not in neo4j_nodes:
+                neo4j_nodes[src_id] = {
+                    "ci_name": record["src_name"] or "",
+                    "ci_type": record["src_type"] or "",
+                    "ci_code": record["src_code"] or "",
+                    "status": record["src_status"] or "",
+                }
+            if tgt_id and tgt_id not in neo4j_nodes:
+                neo4j_nodes[tgt_id] = {
+                    "ci_name": record["tgt_name"] or "",
+                    "ci_type": record["tgt_type"] or "",
+                    "ci_code": record["tgt_code"] or "",
+                    "status": record["tgt_status"] or "",
+                }
+
+            # Build edge
+            if src_id and tgt_id:
+                edges.append({
+                    "source": src_id,
+                    "target": tgt_id,
+                    "relation": rel_type,
+                    "label": rel_label_map.get(rel_type, rel_type),
+                })
+        return neo4j_nodes, edges
+
+    async def _fetch_graph_async(
+        self,
+        neo4j_source_asset: dict[str, Any],
+        postgres_source_asset: dict[str, Any] | None,
+        cypher: str,
+        cypher_params: dict[str, Any],
+        seed_ids: list[Any],
+        pg_queries: Callable[[list[str]], dict[str, tuple[str, list[Any]]]],
+        timeout: float,
+    ) -> tuple[tuple[dict[str, Any], list[dict[str, Any]]], dict[str, list[dict[str, Any]]]]:
+        """Neo4j relationships + PostgreSQL hydration on the serving loop's async drivers."""
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        def remaining() -> float:
+            return max(deadline - asyncio.get_running_loop().time(), 0.001)
+
+        # --- Step 1: Query Neo4j for relationships ---
+        neo4j_connection = await AsyncConnectionFactory.create(
+            neo4j_source_asset, timeout=remaining()
+        )
+        try:
+            records = await neo4j_connection.execute_async(
+                cypher, cypher_params, timeout=remaining()
+            )
         finally:
-            if neo4j_connection:
-                try:
-                    neo4j_connection.close()
-                except Exception:
-                    pass
-            if postgres_connection:
+            await neo4j_connection.close_async()
+        neo4j_nodes, edges = self._collect_graph_records(records)
+
+        # --- Step 2: Hydrate from PostgreSQL, one query per table, concurrently ---
+        queries = pg_queries(list(neo4j_nodes) or [str(ci_id) for ci_id in seed_ids])
+        names = list(queries)
+        rows = await asyncio.gather(
+            *(
+                self._run_sql(postgres_source_asset, sql, params, remaining())
+                for sql, params in queries.values()
+            )
+        )
+        return (neo4j_nodes, edges), dict(zip(names, rows))
+
+    async def _fetch_graph_in_thread(
+        self,
+        neo4j_source_asset: dict[str, Any],
+        postgres_source_asset: dict[str, Any] | None,
+        cypher: str,
+        cypher_params: dict[str, Any],
+        seed_ids: list[Any],
+        pg_queries: Callable[[list[str]], dict[str, tuple[str, list[Any]]]],
+        timeout: float,
+    ) -> tuple[tuple[dict[str, Any], list[dict[str, Any]]], dict[str, list[dict[str, Any]]]]:
+        """Same as ``_fetch_graph_async`` using pooled sync drivers in a worker thread."""
+        postgres_connections: list[Any] = []
+
+        def _fetch() -> Any:
+            from neo4j import Query
+
+            # --- Step 1: Query Neo4j for relationships ---
+            neo4j_connection = ConnectionFactory.create(neo4j_source_asset)
+            try:
+                driver = getattr(neo4j_connection, "driver", None)
+                if driver is None:
+                    raise ValueError(
+                        f"Source '{neo4j_source_asset.get('name')}' does not provide a Neo4j driver"
+                    )
+                with driver.session() as session:
+                    # Transaction timeout lets the server give up with us
+                    result = session.run(Query(cypher, timeout=timeout), cypher_params)
+                    records = [record.data() for record in result]
+            finally:
+                neo4j_connection.close()
+            neo4j_nodes, edges = self._collect_graph_records(records)
+
+            # --- Step 2: Hydrate from PostgreSQL, one query per table ---
+            pg_results: dict[str, list[dict[str, Any]]] = {}
+            queries = pg_queries(list(neo4j_nodes) or [str(ci_id) for ci_id in seed_ids])
+            if queries:
+                postgres_connection = ConnectionFactory.create(postgres_source_asset)
+                postgres_connections.append(postgres_connection)
                 try:
+                    for name, (sql, params) in queries.items():
+                        pg_results[name] = postgres_connection.execute(sql, params)
+                finally:
                     postgres_connection.close()
-                except Exception:
-                    pass
+            return (neo4j_nodes, edges), pg_results
+
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(_fetch), timeout)
+        except asyncio.TimeoutError:
+            for connection in postgres_connections:
+                try:
+                    connection.cancel()
+                except Exception as cancel_exc:
+                    logger.debug(f"Failed to cancel query: {cancel_exc}")
+            raise TimeoutError(f"Graph query exceeded {timeout:.1f}s and was cancelled")
 
     async def _execute_mcp(
         self, context: ToolContext, input_data: dict[str, Any]
@@ -155,39 +155,42 @@ class ToolExecutor:
         if not operation:
             raise ValueError("operation parameter required")
 
-        cache_key: str | None = None
-        if self._cache:
-            cache_key = self._cache.generate_key(str(tool_type), operation, params)
-            cached = await self._cache.get(cache_key)
-            if cached:
-                context.set_metadata("cache_hit", True)
-                return cached
-
-        try:
-            result = await tool.safe_execute(context, params)
-        except Exception as exc:
-            self.logger.error(
-                f"Async tool execution failed for {str(tool_type)}",
-                extra={
-                    "error": str(exc),
-                    "tool_type": str(tool_type),
-                    "tenant_id": context.tenant_id,
-                },
-            )
-            raise
-
-        if not result.success:
-            raise ValueError(result.error or "Unknown tool error")
-
-        if self._cache and cache_key:
-            await self._cache.set(
-                cache_key,
-                result.data,
-                tool_type=str(tool_type),
-                operation=operation,
-            )
-
-        return result.data
+        async def _run() -> Dict[str, Any]:
+            try:
+                result = await tool.safe_execute(context, params)
+            except Exception as exc:
+                self.logger.error(
+                    f"Async tool execution failed for {str(tool_type)}",
+                    extra={
+                        "error": str(exc),
+                        "tool_type": str(tool_type),
+                        "tenant_id": context.tenant_id,
+                    },
+                )
+                raise
+
+            if not result.success:
+                raise ValueError(result.error or "Unknown tool error")
+            return result.data
+
+        if not self._cache:
+            return await _run()
+
+        # Concurrent identical calls (in this worker and, with L2, across
+        # workers) share a single tool execution
+        cache_key = self._cache.generate_key(
+            str(tool_type), operation, params, tenant_id=context.tenant_id
+        )
+        data, cache_hit = await self._cache.get_or_load(
+            cache_key,
+            _run,
+            tool_type=str(tool_type),
+            operation=operation,
+            tags=self._cache.generate_tags(params),
+        )
+        if cache_hit:
+            context.set_metadata("cache_hit", True)
+        return data
 
     async def execute_tool(
         self,
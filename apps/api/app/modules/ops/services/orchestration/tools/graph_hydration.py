@@ -0,0 +1,292 @@
+"""
+Batched graph hydration for graph_query tools.
+
+A graph view used to cost one Neo4j call for the relationships, then a
+separate lookup per neighbor for its attributes, metrics and history. This
+module collapses that into a fixed number of round-trips regardless of graph
+size:
+
+- one ``UNWIND`` Cypher call expands every seed CI to the requested depth,
+  with the paths enumerated per seed capped so a hub CI cannot blow up the call
+- one ``= ANY(%s)`` query per PostgreSQL table (ci, metric_value, event_log)
+
+Hydrated metrics and history are column-oriented (``{"columns": [...],
+"rows": [[...], ...]}``), the same shape table blocks take, so block builders
+render them without another query.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from typing import Any, Iterable
+
+MAX_EXPAND_DEPTH = 5
+
+METRIC_COLUMNS = ["ci_code", "metric_name", "value", "unit", "time"]
+HISTORY_COLUMNS = ["time", "ci_code", "event_type", "severity", "source", "title"]
+
+TIME_RANGE_INTERVALS = {
+    "last_1h": "1 hour",
+    "last_24h": "24 hours",
+    "last_7d": "7 days",
+    "last_30d": "30 days",
+}
+
+
+def clamp_depth(depth: Any) -> int:
+    try:
+        return max(1, min(int(depth), MAX_EXPAND_DEPTH))
+    except (TypeError, ValueError):
+        return 1
+
+
+def expand_cypher(depth: int) -> str:
+    """
+    Cypher expanding all seeds in one call.
+
+    Variable-length bounds cannot be parameters, so ``depth`` is clamped and
+    inlined. Each seed stops enumerating paths after ``$per_seed_limit``, so
+    the undirected expansion is bounded per seed rather than only by the final
+    ``$limit``. Rows have the same columns as the single-hop relationship query.
+    """
+    depth = clamp_depth(depth)
+    return (
+        "UNWIND $ci_ids AS seed_id "
+        "CALL { "
+        "  WITH seed_id "
+        "  MATCH p = (a:CI {ci_id: seed_id, tenant_id: $tenant_id})"
+        f"-[*1..{depth}]-(:CI) "
+        "  WHERE all(n IN nodes(p) WHERE n.tenant_id = $tenant_id) "
+        "  RETURN p LIMIT $per_seed_limit "
+        "} "
+        "UNWIND relationships(p) AS r "
+        "WITH DISTINCT r "
+        "WITH startNode(r) AS s, r, endNode(r) AS t "
+        "RETURN s.ci_id AS src_id, s.ci_name AS src_name, "
+        "       s.ci_type AS src_type, s.ci_code AS src_code, "
+        "       s.status AS src_status, "
+        "       type(r) AS rel_type, "
+        "       t.ci_id AS tgt_id, t.ci_name AS tgt_name, "
+        "       t.ci_type AS tgt_type, t.ci_code AS tgt_code, "
+        "       t.status AS tgt_status "
+        "LIMIT $limit"
+    )
+
+
+def uuid_ids(ci_ids: Iterable[Any]) -> tuple[list[str], list[Any]]:
+    """
+    Split ids into those that can bind to a ``uuid[]`` parameter and the rest.
+
+    Returns:
+        (valid ids, skipped ids); skipped ids can never match and are not hydrated
+    """
+    valid: list[str] = []
+    skipped: list[Any] = []
+    for ci_id in ci_ids:
+        try:
+            valid.append(str(uuid.UUID(str(ci_id))))
+        except (TypeError, ValueError):
+            skipped.append(ci_id)
+    return valid, skipped
+
+
+def node_query(tenant_id: str, ci_ids: list[str]) -> tuple[str, list[Any]]:
+    """Authoritative CI attributes for every graph node."""
+    sql = """
+    SELECT ci_id::text AS ci_id, ci_code, ci_name, ci_type::text AS ci_type,
+           ci_subtype::text AS ci_subtype, status
+    FROM ci
+    WHERE tenant_id = %s
+      AND ci_id = ANY(%s::uuid[])
+      AND deleted_at IS NULL
+    """
+    return sql, [tenant_id, ci_ids]
+
+
+def latest_metrics_query(
+    tenant_id: str, ci_ids: list[str], time_range: str
+) -> tuple[str, list[Any]]:
+    """Latest value of every metric per CI within ``time_range``."""
+    sql = """
+    SELECT DISTINCT ON (mv.ci_id, md.metric_name)
+           mv.ci_id::text AS ci_id, md.metric_name, mv.value, md.unit, mv.time
+    FROM metric_value mv
+    JOIN metric_def md ON md.metric_id = mv.metric_id
+    WHERE mv.tenant_id = %s
+      AND mv.ci_id = ANY(%s::uuid[])
+      AND mv.time >= now() - %s::interval
+    ORDER BY mv.ci_id, md.metric_name, mv.time DESC
+    """
+    return sql, [tenant_id, ci_ids, _interval(time_range)]
+
+
+def recent_history_query(
+    tenant_id: str, ci_ids: list[str], time_range: str, limit: int
+) -> tuple[str, list[Any]]:
+    """Most recent events across all CIs within ``time_range``."""
+    sql = """
+    SELECT time, ci_id::text AS ci_id, event_type, severity,
+           source::text AS source, title
+    FROM event_log
+    WHERE tenant_id = %s
+      AND ci_id = ANY(%s::uuid[])
+      AND time >= now() - %s::interval
+    ORDER BY time DESC
+    LIMIT %s
+    """
+    return sql, [tenant_id, ci_ids, _interval(time_range), limit]
+
+
+def hydration_queries(
+    tenant_id: str,
+    ci_ids: Iterable[Any],
+    *,
+    include_metrics: bool = True,
+    include_history: bool = True,
+    metric_time_range: str = "last_24h",
+    history_time_range: str = "last_7d",
+    history_limit: int = 50,
+) -> dict[str, tuple[str, list[Any]]]:
+    """One query per table for every CI in the graph, keyed by table role."""
+    ids, _ = uuid_ids(ci_ids)
+    if not ids:
+        return {}
+    queries = {"nodes": node_query(tenant_id, ids)}
+    # Unbounded ranges (e.g. all_time) are left to the regular history/metric tools
+    if include_metrics and metric_time_range in TIME_RANGE_INTERVALS:
+        queries["metrics"] = latest_metrics_query(tenant_id, ids, metric_time_range)
+    if include_history and history_time_range in TIME_RANGE_INTERVALS:
+        queries["history"] = recent_history_query(
+            tenant_id, ids, history_time_range, history_limit
+        )
+    return queries
+
+
+def build_hydration(
+    ci_ids: list[str],
+    code_by_id: dict[str, str],
+    metric_rows: list[dict[str, Any]] | None,
+    history_rows: list[dict[str, Any]] | None,
+    *,
+    metric_time_range: str,
+    history_time_range: str,
+) -> dict[str, Any]:
+    """
+    Column-oriented hydration payload attached to a graph result.
+
+    ``ci_count`` counts the hydrated CIs; ids that are not UUIDs are listed
+    under ``skipped_ids`` instead of being dropped silently.
+    """
+    valid, skipped = uuid_ids(ci_ids)
+    hydration: dict[str, Any] = {"ci_count": len(valid)}
+    if skipped:
+        hydration["skipped_ids"] = skipped
+    if metric_rows is not None:
+        hydration["metrics"] = {
+            "time_range": metric_time_range,
+            "columns": METRIC_COLUMNS,
+            "rows": [
+                [
+                    code_by_id.get(row["ci_id"], row["ci_id"]),
+                    row["metric_name"],
+                    row["value"],
+                    row.get("unit"),
+                    _json_value(row.get("time")),
+                ]
+                for row in metric_rows
+            ],
+        }
+    if history_rows is not None:
+        hydration["history"] = {
+            "time_range": history_time_range,
+            "columns": HISTORY_COLUMNS,
+            "rows": [
+                [
+                    _json_value(row.get("time")),
+                    code_by_id.get(row["ci_id"], row["ci_id"]),
+                    row.get("event_type"),
+                    row.get("severity"),
+                    row.get("source"),
+                    row.get("title"),
+                ]
+                for row in history_rows
+            ],
+        }
+    return hydration
+
+
+def hydrated_history(
+    graph_payload: dict[str, Any] | None, time_range: str, limit: int | None = None
+) -> dict[str, Any] | None:
+    """
+    History table from a hydrated graph payload, shaped like a history tool result.
+
+    Returns None when the payload was not hydrated for ``time_range`` so the
+    caller falls back to querying.
+    """
+    history = ((graph_payload or {}).get("hydration") or {}).get("history")
+    if not history or history.get("time_range") != time_range:
+        return None
+    rows = history["rows"][:limit] if limit else history["rows"]
+    return {
+        "available": True,
+        "columns": history["columns"],
+        "rows": rows,
+        "warnings": [],
+        "meta": {
+            "source": "graph_hydration",
+            "ci_count_used": graph_payload["hydration"].get("ci_count"),
+            "ci_ids_truncated": False,
+        },
+    }
+
+
+def aggregate_latest(
+    graph_payload: dict[str, Any] | None, metric_name: str, agg: str
+) -> dict[str, Any] | None:
+    """
+    Aggregate the latest hydrated value of ``metric_name`` across graph CIs.
+
+    Returns None if the payload has no hydrated values for the metric.
+    """
+    metrics = ((graph_payload or {}).get("hydration") or {}).get("metrics")
+    if not metrics:
+        return None
+    name_index = metrics["columns"].index("metric_name")
+    value_index = metrics["columns"].index("value")
+    values = [
+        row[value_index]
+        for row in metrics["rows"]
+        if row[name_index] == metric_name and row[value_index] is not None
+    ]
+    if not values:
+        return None
+    agg = agg.lower()
+    if agg == "count":
+        value: float = len(values)
+    elif agg == "min":
+        value = min(values)
+    elif agg == "sum":
+        value = sum(values)
+    elif agg == "avg":
+        value = sum(values) / len(values)
+    else:
+        value = max(values)
+    return {
+        "metric_name": metric_name,
+        "agg": agg,
+        "value": value,
+        "time_range": metrics.get("time_range"),
+        "ci_count_used": len(values),
+    }
+
+
+def _interval(time_range: str) -> str:
+    return TIME_RANGE_INTERVALS[time_range]
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
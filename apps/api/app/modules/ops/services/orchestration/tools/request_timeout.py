@@ -11,11 +11,12 @@ from __future__ import annotations
 
 import asyncio
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from core.logging import get_logger
 
@@ -320,3 +321,56 @@ def reset_request_timeout_manager() -> None:
     """Reset global timeout manager."""
     global _global_timeout_manager
     _global_timeout_manager = None
+
+
+# Budget of the request currently executing; propagates into tasks and threads
+_current_budget: ContextVar[TimeoutBudget | None] = ContextVar(
+    "ops_timeout_budget", default=None
+)
+
+
+def get_current_timeout_budget() -> TimeoutBudget | None:
+    """Return the timeout budget of the current request, if one is active."""
+    return _current_budget.get()
+
+
+@contextmanager
+def timeout_budget_scope(budget: TimeoutBudget) -> Iterator[TimeoutBudget]:
+    """
+    Make ``budget`` the current request's budget.
+
+    An already active budget wins, so nested scopes never extend the
+    deadline set by an outer caller.
+    """
+    active = _current_budget.get()
+    if active is not None:
+        yield active
+        return
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def remaining_timeout_seconds(
+    phase: TimeoutPhase, default_seconds: float | None = None
+) -> float | None:
+    """
+    Seconds an operation in ``phase`` may take under the current budget.
+
+    Returns the smaller of ``default_seconds`` and what is left of the budget.
+
+    Raises:
+        RequestTimeoutError: If the current budget is already exhausted
+    """
+    budget = _current_budget.get()
+    if budget is None:
+        return default_seconds
+    remaining_ms = budget.get_remaining_for_phase(phase)
+    if remaining_ms <= 0:
+        raise RequestTimeoutError(
+            phase.value, budget.get_elapsed_ms(), budget.total_timeout_ms
+        )
+    remaining = remaining_ms / 1000
+    return remaining if default_seconds is None else min(default_seconds, remaining)
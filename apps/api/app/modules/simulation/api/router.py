@@ -15,9 +15,12 @@ from app.modules.simulation.schemas import (
     SimulationBacktestRequest,
     SimulationFunctionExecuteRequest,
     SimulationFunctionValidateRequest,
+    SimulationMonteCarloRequest,
     SimulationQueryRequest,
     SimulationRealtimeRunRequest,
     SimulationRunRequest,
+    SimulationSensitivityRequest,
+    SimulationSweepRequest,
 )
 from app.modules.simulation.services.simulation.backtest_real import run_backtest_real
 from app.modules.simulation.services.simulation.custom_function_runner import (
@@ -30,6 +33,9 @@ from app.modules.simulation.services.simulation.functions import (
     execute_simulation,
     get_function_info,
     list_functions,
+    run_monte_carlo,
+    run_parameter_sweep,
+    run_sensitivity_analysis,
 )
 from app.modules.simulation.services.simulation.planner import plan_simulation
 from app.modules.simulation.services.simulation.realtime_executor import (
@@ -486,6 +492,103 @@ def execute_function_endpoint(
     return ResponseEnvelope.success(data=result)
 
 
+@router.post("/functions/{function_id}/sweep", response_model=ResponseEnvelope)
+def sweep_function_endpoint(
+    function_id: str,
+    payload: SimulationSweepRequest,
+    current_user: TbUser = Depends(get_current_user),
+    tenant_id: str = Depends(get_current_tenant),
+) -> ResponseEnvelope:
+    """
+    Evaluate a function over a parameter grid in one vectorized batch.
+
+    ``sweep`` maps each swept parameter to the values to try; the full
+    cartesian product is evaluated, other parameters come from ``assumptions``.
+    """
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=403, detail="Tenant mismatch")
+
+    try:
+        result = run_parameter_sweep(
+            function_id,
+            baseline=payload.baseline,
+            assumptions=payload.assumptions,
+            sweep=payload.sweep,
+            context=payload.context,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+    return ResponseEnvelope.success(data=result)
+
+
+@router.post("/functions/{function_id}/sensitivity", response_model=ResponseEnvelope)
+def sensitivity_function_endpoint(
+    function_id: str,
+    payload: SimulationSensitivityRequest,
+    current_user: TbUser = Depends(get_current_user),
+    tenant_id: str = Depends(get_current_tenant),
+) -> ResponseEnvelope:
+    """
+    One-at-a-time sensitivity analysis (tornado chart data).
+
+    Each parameter moves to its min/max (or +/- ``variation_pct``) while the
+    others stay at their ``assumptions`` values; bars are ranked by swing.
+    """
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=403, detail="Tenant mismatch")
+
+    try:
+        result = run_sensitivity_analysis(
+            function_id,
+            baseline=payload.baseline,
+            assumptions=payload.assumptions,
+            parameters=payload.parameters,
+            variation_pct=payload.variation_pct,
+            context=payload.context,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+    return ResponseEnvelope.success(data=result)
+
+
+@router.post("/functions/{function_id}/monte-carlo", response_model=ResponseEnvelope)
+def monte_carlo_function_endpoint(
+    function_id: str,
+    payload: SimulationMonteCarloRequest,
+    current_user: TbUser = Depends(get_current_user),
+    tenant_id: str = Depends(get_current_tenant),
+) -> ResponseEnvelope:
+    """
+    Monte Carlo confidence bands for a function's outputs.
+
+    Parameters in ``distributions`` are sampled ``samples`` times and
+    evaluated in one vectorized batch; ``seed`` makes the run reproducible.
+    """
+    if current_user.tenant_id != tenant_id:
+        raise HTTPException(status_code=403, detail="Tenant mismatch")
+
+    try:
+        result = run_monte_carlo(
+            function_id,
+            baseline=payload.baseline,
+            assumptions=payload.assumptions,
+            distributions={
+                name: spec.model_dump(exclude_none=True)
+                for name, spec in payload.distributions.items()
+            },
+            samples=payload.samples,
+            seed=payload.seed,
+            percentiles=payload.percentiles,
+            context=payload.context,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+    return ResponseEnvelope.success(data=result)
+
+
 # =============================================================================
 # User Function Registration Endpoints
 # =============================================================================
@@ -109,3 +109,37 @@ class SimulationFunctionExecuteRequest(BaseModel):
     function: SimulationCustomFunctionSpec
     params: dict[str, Any] = Field(default_factory=dict)
     input_payload: dict[str, Any] = Field(default_factory=dict)
+
+
+class SimulationSweepRequest(BaseModel):
+    baseline: dict[str, float] = Field(default_factory=dict)
+    assumptions: dict[str, Any] = Field(default_factory=dict)
+    sweep: dict[str, list[float]] = Field(min_length=1)
+    context: dict[str, Any] | None = None
+
+
+class SimulationSensitivityRequest(BaseModel):
+    baseline: dict[str, float] = Field(default_factory=dict)
+    assumptions: dict[str, Any] = Field(default_factory=dict)
+    parameters: list[str] | None = None
+    variation_pct: float | None = Field(default=None, gt=0, le=100)
+    context: dict[str, Any] | None = None
+
+
+class SimulationDistributionSpec(BaseModel):
+    type: Literal["normal", "uniform", "triangular", "lognormal"] = "normal"
+    mean: float | None = None
+    std: float | None = Field(default=None, ge=0)
+    low: float | None = None
+    high: float | None = None
+    mode: float | None = None
+
+
+class SimulationMonteCarloRequest(BaseModel):
+    baseline: dict[str, float] = Field(default_factory=dict)
+    assumptions: dict[str, Any] = Field(default_factory=dict)
+    distributions: dict[str, SimulationDistributionSpec] = Field(min_length=1)
+    samples: int = Field(default=1000, ge=10, le=100_000)
+    seed: int | None = None
+    percentiles: list[float] = Field(default_factory=lambda: [5.0, 50.0, 95.0])
+    context: dict[str, Any] | None = None
@@ -2,20 +2,14 @@ from __future__ import annotations
 
 import json
 import subprocess
-import sys
-from pathlib import Path
 from typing import Any
 
 from core.config import get_settings
 from fastapi import HTTPException
 
+from app.modules.api_manager.sandbox_pool import run_script_runner
 from app.modules.simulation.schemas import SimulationCustomFunctionSpec
 
-SCRIPT_RUNNER = (
-    Path(__file__).resolve().parents[3]
-    / "api_manager"
-    / "script_executor_runner.py"
-)
 DEFAULT_TIMEOUT_MS = 5000
 DEFAULT_MAX_RESPONSE_BYTES = 1_048_576
 
@@ -107,13 +101,7 @@ def execute_custom_function(
     }
 
     try:
-        proc = subprocess.run(
-            [sys.executable, str(SCRIPT_RUNNER)],
-            input=json.dumps(payload).encode("utf-8"),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=(timeout_ms / 1000) + 1,
-        )
+        proc = run_script_runner(payload, timeout=(timeout_ms / 1000) + 1)
     except subprocess.TimeoutExpired as exc:
         raise HTTPException(status_code=500, detail="Custom function execution timed out") from exc
 
@@ -26,8 +26,21 @@ Usage:
         baseline={"latency_ms": 50, "throughput_rps": 1000},
         assumptions={"traffic_change_pct": 20, "cpu_change_pct": 10},
     )
+
+    # Sweep a parameter grid in one vectorized batch
+    sweep = run_parameter_sweep(
+        "rule_linear_weight",
+        baseline={"latency_ms": 50, "throughput_rps": 1000},
+        assumptions={"cpu_change_pct": 10},
+        sweep={"traffic_change_pct": [0, 10, 20, 30]},
+    )
 """
 
+from app.modules.simulation.services.simulation.functions.analysis import (
+    run_monte_carlo,
+    run_parameter_sweep,
+    run_sensitivity_analysis,
+)
 from app.modules.simulation.services.simulation.functions.base import (
     CompositeFunction,
     FunctionCategory,
@@ -36,6 +49,8 @@ from app.modules.simulation.services.simulation.functions.base import (
     FunctionOutput,
     FunctionParameter,
     SimulationFunction,
+    batch_column,
+    batch_size,
     create_error_result,
 )
 from app.modules.simulation.services.simulation.functions.registry import (
@@ -56,10 +71,16 @@ __all__ = [
     "FunctionParameter",
     "FunctionOutput",
     "create_error_result",
+    "batch_column",
+    "batch_size",
     # Registry
     "FunctionRegistry",
     "list_functions",
     "get_function_info",
     "execute_simulation",
     "get_strategy_function",
+    # Batch analyses
+    "run_parameter_sweep",
+    "run_sensitivity_analysis",
+    "run_monte_carlo",
 ]
@@ -0,0 +1,275 @@
+"""
+SIM Function Library - Batch Analyses
+
+What-if explorations built on ``execute_batch``: each analysis builds one
+assumption batch (a grid, a one-at-a-time design or Monte Carlo samples) and
+evaluates it in a single call instead of one execution per point.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from app.modules.simulation.services.simulation.functions.registry import (
+    FunctionRegistry,
+)
+
+MAX_BATCH_ROWS = 100_000
+
+
+def _to_float(value: float) -> float | None:
+    """JSON-safe float; NaN/inf (failed rows) become None."""
+    return float(value) if np.isfinite(value) else None
+
+
+def _to_list(values: np.ndarray) -> list[float | None]:
+    return [_to_float(v) for v in values]
+
+
+def _run_batch(
+    function_id: str,
+    baseline: dict[str, float],
+    assumptions: dict[str, Any],
+    context: dict[str, Any] | None,
+) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+    # Parameters the caller did not pin keep their catalog defaults
+    metadata = FunctionRegistry.get_metadata(function_id)
+    if not metadata:
+        raise ValueError(f"Function not found: {function_id}")
+    defaults = {p.name: p.default for p in metadata.parameters}
+
+    outputs, confidence, debug_info = FunctionRegistry.execute_function_batch(
+        function_id,
+        baseline=baseline,
+        assumptions={**defaults, **assumptions},
+        context=context,
+    )
+    if "error" in debug_info:
+        details = debug_info.get("details")
+        raise ValueError(f"{debug_info['error']}: {'; '.join(details)}" if details else debug_info["error"])
+    return outputs, confidence, debug_info
+
+
+def _numeric_parameters(function_id: str) -> dict[str, Any]:
+    metadata = FunctionRegistry.get_metadata(function_id)
+    if not metadata:
+        raise ValueError(f"Function not found: {function_id}")
+    return {p.name: p for p in metadata.parameters if p.type in ("number", "integer")}
+
+
+def run_parameter_sweep(
+    function_id: str,
+    *,
+    baseline: dict[str, float],
+    assumptions: dict[str, Any],
+    sweep: dict[str, list[float]],
+    context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Evaluate the full grid (cartesian product) of the swept parameter values.
+
+    Args:
+        function_id: The function ID to execute
+        baseline: Baseline KPI values
+        assumptions: Values for the parameters that are not swept (catalog
+            defaults fill the rest)
+        sweep: Values to try per swept parameter
+
+    Returns:
+        Dict with the grid columns, one output array per KPI (row-major over
+        ``shape``), per-row confidence and timing
+    """
+    if not sweep:
+        raise ValueError("At least one parameter must be swept")
+    shape = [len(values) for values in sweep.values()]
+    if min(shape) == 0:
+        raise ValueError("Swept parameters need at least one value")
+    if int(np.prod(shape)) > MAX_BATCH_ROWS:
+        raise ValueError(f"Sweep grid has {int(np.prod(shape))} points, limit is {MAX_BATCH_ROWS}")
+
+    start = perf_counter()
+    grids = np.meshgrid(*(np.asarray(v, dtype=float) for v in sweep.values()), indexing="ij")
+    columns = {name: grid.ravel() for name, grid in zip(sweep, grids)}
+
+    outputs, confidence, debug_info = _run_batch(
+        function_id, baseline, {**assumptions, **columns}, context
+    )
+
+    return {
+        "function_id": function_id,
+        "parameters": {name: [float(v) for v in values] for name, values in sweep.items()},
+        "shape": shape,
+        "grid": {name: _to_list(column) for name, column in columns.items()},
+        "outputs": {name: _to_list(values) for name, values in outputs.items()},
+        "confidence": _to_list(confidence),
+        "count": len(confidence),
+        "vectorized": debug_info.get("vectorized", False),
+        "duration_ms": round((perf_counter() - start) * 1000, 2),
+    }
+
+
+def run_sensitivity_analysis(
+    function_id: str,
+    *,
+    baseline: dict[str, float],
+    assumptions: dict[str, Any],
+    parameters: list[str] | None = None,
+    variation_pct: float | None = None,
+    context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    One-at-a-time sensitivity analysis for tornado charts.
+
+    Each parameter is moved to a low and a high value while the others stay at
+    their base values. Low/high are the parameter's min/max, or
+    ``base * (1 -/+ variation_pct/100)`` clipped to that range when given.
+
+    Returns:
+        Dict with the base outputs and, per output KPI, the parameters ranked
+        by swing (|high_output - low_output|)
+    """
+    numeric = _numeric_parameters(function_id)
+    names = parameters or list(numeric)
+    unknown = [name for name in names if name not in numeric]
+    if unknown:
+        raise ValueError(f"Not numeric parameters of {function_id}: {', '.join(unknown)}")
+
+    start = perf_counter()
+    base_values = {name: float(assumptions.get(name, numeric[name].default)) for name in names}
+    bounds = {}
+    for name in names:
+        param, base = numeric[name], base_values[name]
+        if variation_pct is None:
+            low = param.min if param.min is not None else base
+            high = param.max if param.max is not None else base
+        else:
+            low, high = sorted((base * (1 - variation_pct / 100), base * (1 + variation_pct / 100)))
+            low = max(low, param.min) if param.min is not None else low
+            high = min(high, param.max) if param.max is not None else high
+        bounds[name] = (low, high)
+
+    # Row 0 is the base case, then a (low, high) pair per parameter
+    size = 1 + 2 * len(names)
+    columns = {name: np.full(size, base_values[name]) for name in names}
+    for i, name in enumerate(names):
+        columns[name][1 + 2 * i], columns[name][2 + 2 * i] = bounds[name]
+
+    outputs, _, debug_info = _run_batch(function_id, baseline, {**assumptions, **columns}, context)
+
+    tornado: dict[str, list[dict[str, Any]]] = {}
+    for output_name, values in outputs.items():
+        bars = []
+        for i, name in enumerate(names):
+            low_output, high_output = values[1 + 2 * i], values[2 + 2 * i]
+            bars.append({
+                "parameter": name,
+                "base_value": base_values[name],
+                "low_value": bounds[name][0],
+                "high_value": bounds[name][1],
+                "low_output": _to_float(low_output),
+                "high_output": _to_float(high_output),
+                "swing": _to_float(abs(high_output - low_output)),
+            })
+        tornado[output_name] = sorted(bars, key=lambda bar: bar["swing"] or 0.0, reverse=True)
+
+    return {
+        "function_id": function_id,
+        "base_outputs": {name: _to_float(values[0]) for name, values in outputs.items()},
+        "tornado": tornado,
+        "vectorized": debug_info.get("vectorized", False),
+        "duration_ms": round((perf_counter() - start) * 1000, 2),
+    }
+
+
+def _sample(spec: dict[str, Any], size: int, rng: np.random.Generator) -> np.ndarray:
+    kind = spec.get("type", "normal")
+    if kind == "normal":
+        return rng.normal(spec["mean"], spec.get("std") or 0.0, size)
+    if kind == "uniform":
+        return rng.uniform(spec["low"], spec["high"], size)
+    if kind == "triangular":
+        return rng.triangular(spec["low"], spec["mode"], spec["high"], size)
+    if kind == "lognormal":
+        return rng.lognormal(spec["mean"], spec.get("std") or 0.0, size)
+    raise ValueError(f"Unsupported distribution: {kind}")
+
+
+def run_monte_carlo(
+    function_id: str,
+    *,
+    baseline: dict[str, float],
+    assumptions: dict[str, Any],
+    distributions: dict[str, dict[str, Any]],
+    samples: int = 1000,
+    seed: int | None = None,
+    percentiles: list[float] | None = None,
+    context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Monte Carlo confidence bands for every output KPI.
+
+    Uncertain parameters are sampled from their distribution (normal, uniform,
+    triangular, lognormal) and clipped to the parameter range; the rest keep
+    their values from ``assumptions``.
+
+    Returns:
+        Dict with mean, std and the requested percentiles per output KPI
+    """
+    if not distributions:
+        raise ValueError("At least one parameter distribution is required")
+    if not 1 <= samples <= MAX_BATCH_ROWS:
+        raise ValueError(f"samples must be between 1 and {MAX_BATCH_ROWS}")
+    numeric = _numeric_parameters(function_id)
+    unknown = [name for name in distributions if name not in numeric]
+    if unknown:
+        raise ValueError(f"Not numeric parameters of {function_id}: {', '.join(unknown)}")
+    percentiles = percentiles or [5.0, 50.0, 95.0]
+
+    start = perf_counter()
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, spec in distributions.items():
+        try:
+            values = _sample(spec, samples, rng)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid distribution for {name}: missing {e}") from None
+        param = numeric[name]
+        columns[name] = np.clip(
+            values,
+            param.min if param.min is not None else -np.inf,
+            param.max if param.max is not None else np.inf,
+        )
+
+    outputs, confidence, debug_info = _run_batch(
+        function_id, baseline, {**assumptions, **columns}, context
+    )
+
+    bands = {}
+    for name, values in outputs.items():
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            bands[name] = None
+            continue
+        bands[name] = {
+            "mean": float(finite.mean()),
+            "std": float(finite.std()),
+            "min": float(finite.min()),
+            "max": float(finite.max()),
+            "percentiles": {
+                f"p{p:g}": float(v) for p, v in zip(percentiles, np.percentile(finite, percentiles))
+            },
+        }
+
+    return {
+        "function_id": function_id,
+        "samples": samples,
+        "failed_samples": int((confidence == 0).sum()),
+        "seed": seed,
+        "bands": bands,
+        "mean_confidence": float(confidence.mean()),
+        "vectorized": debug_info.get("vectorized", False),
+        "duration_ms": round((perf_counter() - start) * 1000, 2),
+    }
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 
 class FunctionCategory(str, Enum):
     """Simulation function categories."""
@@ -79,7 +81,9 @@ class SimulationFunction(ABC):
     Base class for all simulation functions.
 
     A simulation function takes baseline data and assumptions,
-    then produces simulated KPI outputs.
+    then produces simulated KPI outputs. ``execute_batch`` evaluates many
+    assumption rows at once; functions with a closed-form model override it
+    with NumPy, everything else falls back to calling ``execute`` per row.
     """
 
     # Subclasses must define these class attributes
@@ -109,6 +113,55 @@ class SimulationFunction(ABC):
         """
         pass
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        """
+        Execute the simulation function for a batch of assumption rows.
+
+        Args:
+            baseline: Baseline KPI values shared by every row
+            assumptions: 1-D arrays are per-row columns (a sweep grid or Monte
+                Carlo samples); any other value is shared by every row
+            context: Additional context (service name, tenant_id, etc.)
+
+        Returns:
+            (outputs, confidence, debug_info)
+            - outputs: One array per output KPI; NaN where a row failed
+              (error result or arithmetic/value error)
+            - confidence: Per-row confidence scores (0 where a row failed)
+            - debug_info: Batch-level debug data
+        """
+        size = batch_size(assumptions)
+        outputs = {output.name: np.full(size, np.nan) for output in self.metadata.outputs}
+        confidence = np.zeros(size)
+        failed = 0
+
+        for i in range(size):
+            row = {
+                name: value[i].item() if _is_column(value) else value
+                for name, value in assumptions.items()
+            }
+            try:
+                row_outputs, row_confidence, row_debug = self.execute(
+                    baseline=baseline, assumptions=row, context=context
+                )
+            except (ArithmeticError, ValueError):
+                failed += 1
+                continue
+            if not row_outputs or "error" in row_debug:
+                failed += 1
+                continue
+            confidence[i] = row_confidence
+            for name, value in row_outputs.items():
+                outputs.setdefault(name, np.full(size, np.nan))[i] = value
+
+        return outputs, confidence, {"vectorized": False, "rows": size, "failed_rows": failed}
+
     def validate_inputs(
         self,
         baseline: dict[str, float],
@@ -143,6 +196,45 @@ class SimulationFunction(ABC):
 
         return errors
 
+    def validate_batch_inputs(
+        self,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+    ) -> list[str]:
+        """
+        Validate batch inputs; ranges are checked across every row.
+
+        Returns:
+            List of validation error messages (empty if valid).
+        """
+        errors = []
+
+        for output in self.metadata.outputs:
+            if output.name not in baseline:
+                errors.append(f"Missing baseline KPI: {output.name}")
+
+        try:
+            batch_size(assumptions)
+        except ValueError as e:
+            errors.append(str(e))
+
+        for param in self.metadata.parameters:
+            if param.required and param.name not in assumptions:
+                errors.append(f"Missing required assumption: {param.name}")
+
+            value = assumptions.get(param.name)
+            if value is None or param.type not in ("number", "integer"):
+                continue
+            values = np.asarray(value, dtype=float)
+            if values.size == 0:
+                continue
+            if param.min is not None and values.min() < param.min:
+                errors.append(f"{param.name} must be >= {param.min}, got {values.min()}")
+            if param.max is not None and values.max() > param.max:
+                errors.append(f"{param.name} must be <= {param.max}, got {values.max()}")
+
+        return errors
+
 
 class CompositeFunction(SimulationFunction):
     """
@@ -163,3 +255,25 @@ class CompositeFunction(SimulationFunction):
 def create_error_result(message: str) -> tuple[dict[str, float], float, dict[str, Any]]:
     """Create an error result for function execution failures."""
     return {}, 0.0, {"error": message, "success": False}
+
+
+def _is_column(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and value.ndim == 1
+
+
+def batch_size(assumptions: dict[str, Any]) -> int:
+    """Number of rows in a batch; every 1-D array column must have the same length."""
+    sizes = {len(value) for value in assumptions.values() if _is_column(value)}
+    if len(sizes) > 1:
+        raise ValueError(f"Batch columns must have the same length, got {sorted(sizes)}")
+    return sizes.pop() if sizes else 1
+
+
+def batch_column(
+    assumptions: dict[str, Any],
+    name: str,
+    default: float,
+    size: int,
+) -> np.ndarray:
+    """Float column for ``name``, broadcasting shared values and defaults to ``size`` rows."""
+    return np.broadcast_to(np.asarray(assumptions.get(name, default), dtype=float), (size,))
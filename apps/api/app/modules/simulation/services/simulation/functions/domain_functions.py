@@ -9,6 +9,8 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
+
 from app.modules.simulation.services.simulation.functions.base import (
     FunctionCategory,
     FunctionComplexity,
@@ -16,6 +18,8 @@ from app.modules.simulation.services.simulation.functions.base import (
     FunctionOutput,
     FunctionParameter,
     SimulationFunction,
+    batch_column,
+    batch_size,
 )
 
 # =============================================================================
@@ -142,6 +146,36 @@ class ResponseTimeDecomposition(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        service_time = batch_column(assumptions, "service_time_ms", 20.0, n)
+        queue_depth = batch_column(assumptions, "queue_depth", 5.0, n)
+        service_rate = batch_column(assumptions, "service_rate_per_ms", 0.05, n)
+        network_base = batch_column(assumptions, "network_latency_ms", 10.0, n)
+        congestion = batch_column(assumptions, "network_congestion_pct", 0.0, n)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            queue_time = np.where(service_rate > 0, queue_depth / service_rate, 0.0)
+        network_time = network_base * (1 + congestion / 100.0)
+
+        outputs = {
+            "total_response_time": np.round(service_time + queue_time + network_time, 2),
+            "service_component": np.round(service_time, 2),
+            "queue_component": np.round(queue_time, 2),
+            "network_component": np.round(network_time, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class UtilizationImpact(SimulationFunction):
     """
@@ -259,6 +293,42 @@ class UtilizationImpact(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        util = batch_column(assumptions, "utilization_pct", 70.0, n) / 100.0
+        base_rt = batch_column(assumptions, "base_response_time_ms", 50.0, n)
+        cv_a = batch_column(assumptions, "cv_arrival", 1.0, n)
+        cv_s = batch_column(assumptions, "cv_service", 1.0, n)
+
+        # Saturated rows fail like execute() does: NaN outputs, zero confidence
+        saturated = util >= 0.99
+        with np.errstate(divide="ignore", invalid="ignore"):
+            waiting_time = base_rt * (util / (1 - util)) * ((cv_a ** 2 + cv_s ** 2) / 2)
+            response_time = base_rt + waiting_time
+            degradation = np.where(base_rt > 0, response_time / base_rt, 1.0)
+
+        outputs = {
+            "response_time_ms": np.where(saturated, np.nan, np.round(response_time, 2)),
+            "waiting_time_ms": np.where(saturated, np.nan, np.round(waiting_time, 2)),
+            "degradation_factor": np.where(saturated, np.nan, np.round(degradation, 2)),
+        }
+        confidence = np.where(saturated, 0.0, self.metadata.confidence)
+
+        return outputs, confidence, {
+            "vectorized": True,
+            "rows": n,
+            "failed_rows": int(saturated.sum()),
+        }
+
 
 # =============================================================================
 # 2. Reliability Domain Functions
@@ -378,6 +448,36 @@ class AvailabilityModel(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        mtbf = batch_column(assumptions, "mtbf_hours", 720.0, n)
+        mttr = batch_column(assumptions, "mttr_hours", 4.0, n)
+        redundancy = batch_column(assumptions, "redundancy_factor", 1.0, n)
+
+        effective_mtbf = mtbf * redundancy
+        availability = effective_mtbf / (effective_mtbf + mttr)
+        downtime_minutes = 720 * (1 - availability) * 60
+
+        # Number of SLA thresholds (95% .. 99.999%) the availability reaches
+        sla_class = np.searchsorted([0.95, 0.99, 0.999, 0.9999, 0.99999], availability, side="right")
+
+        outputs = {
+            "availability_pct": np.round(availability * 100, 4),
+            "downtime_minutes_per_month": np.round(downtime_minutes, 2),
+            "sla_class": sla_class.astype(float),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class FailureCascading(SimulationFunction):
     """
@@ -636,6 +736,38 @@ class CloudCostModel(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        instances = np.trunc(batch_column(assumptions, "compute_instances", 10, n))
+        instance_cost = batch_column(assumptions, "instance_cost_per_hour", 0.15, n)
+        storage_gb = batch_column(assumptions, "storage_gb", 1000.0, n)
+        storage_cost = batch_column(assumptions, "storage_cost_per_gb_month", 0.02, n)
+        network_gb = batch_column(assumptions, "network_gb_per_month", 5000.0, n)
+        network_cost = batch_column(assumptions, "network_cost_per_gb", 0.01, n)
+        hours = batch_column(assumptions, "hours_per_month", 730.0, n)
+
+        compute_cost_month = instances * instance_cost * hours
+        storage_cost_month = storage_gb * storage_cost
+        network_cost_month = network_gb * network_cost
+
+        outputs = {
+            "monthly_cost_usd": np.round(compute_cost_month + storage_cost_month + network_cost_month, 2),
+            "compute_cost": np.round(compute_cost_month, 2),
+            "storage_cost": np.round(storage_cost_month, 2),
+            "network_cost": np.round(network_cost_month, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class TCOCalculator(SimulationFunction):
     """
@@ -877,3 +1009,32 @@ class CapacityPlanning(SimulationFunction):
         }
 
         return outputs, self.metadata.confidence, debug_info
+
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        current = batch_column(assumptions, "current_capacity_units", 1000.0, n)
+        growth_rate = batch_column(assumptions, "growth_rate_pct", 20.0, n) / 100.0
+        periods = np.trunc(batch_column(assumptions, "num_periods", 12, n))
+        margin = batch_column(assumptions, "safety_margin_pct", 20.0, n) / 100.0
+
+        growth_factor = (1 + growth_rate) ** periods
+        projected = current * growth_factor
+        recommended = projected * (1 + margin)
+
+        outputs = {
+            "projected_capacity": np.round(projected, 1),
+            "recommended_capacity": np.round(recommended, 1),
+            "additional_needed": np.round(recommended - current, 1),
+            "compound_growth_factor": np.round(growth_factor, 3),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
@@ -10,6 +10,8 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
+
 from app.modules.simulation.services.simulation.functions.base import (
     FunctionCategory,
     FunctionComplexity,
@@ -17,6 +19,8 @@ from app.modules.simulation.services.simulation.functions.base import (
     FunctionOutput,
     FunctionParameter,
     SimulationFunction,
+    batch_column,
+    batch_size,
 )
 
 # =============================================================================
@@ -170,6 +174,41 @@ class ARIMASurrogate(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        ar_coeff = batch_column(assumptions, "ar_coeff", 0.7, n)
+        trend = batch_column(assumptions, "trend", 0.5, n)
+        periods = np.trunc(batch_column(assumptions, "num_periods", 7, n))
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        base_value = baseline.get(kpi_name, 50.0)
+
+        # ar_coeff == 1 takes the base_value branch; silence the unused division
+        with np.errstate(divide="ignore", invalid="ignore"):
+            long_term_mean = np.where(ar_coeff < 1, base_value / (1 - ar_coeff), base_value)
+
+        forecast = long_term_mean + (base_value - long_term_mean) * (ar_coeff ** periods) + trend * periods
+
+        ci_width = base_value * 0.1 * np.sqrt(periods)
+        lower_ci = forecast - 1.96 * ci_width
+        upper_ci = forecast + 1.96 * ci_width
+
+        outputs = {
+            "forecast": np.round(forecast, 2),
+            "lower_ci": np.round(np.maximum(0, lower_ci), 2),
+            "upper_ci": np.round(upper_ci, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class ProphetSurrogate(SimulationFunction):
     """
@@ -296,6 +335,35 @@ class ProphetSurrogate(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        growth = batch_column(assumptions, "growth_rate", 1.0, n)
+        seas_amp = batch_column(assumptions, "seasonality_amplitude", 5.0, n)
+        seas_period = batch_column(assumptions, "seasonality_period", 7.0, n)
+        day = batch_column(assumptions, "forecast_day", 7.0, n)
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        base_value = baseline.get(kpi_name, 50.0)
+
+        trend = base_value + (growth * day)
+        seasonality = seas_amp * np.sin(2 * np.pi * day / seas_period)
+
+        outputs = {
+            "forecast": np.round(trend + seasonality, 2),
+            "trend_component": np.round(trend, 2),
+            "seasonality_component": np.round(seasonality, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 2. Regression ML Functions
@@ -419,6 +487,34 @@ class SVRSurrogate(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        x1 = batch_column(assumptions, "x1", 20.0, n)
+        x2 = batch_column(assumptions, "x2", 10.0, n)
+        gamma = batch_column(assumptions, "kernel_gamma", 0.1, n)
+        epsilon = batch_column(assumptions, "epsilon", 0.1, n)
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        base_value = baseline.get(kpi_name, 50.0)
+
+        kernel_value = np.exp(-gamma * ((x1 * x1 + x2 * x2) / 100))
+        prediction = base_value * (1 + 0.5 * kernel_value * (x1 + x2) / 100)
+
+        outputs = {
+            "prediction": np.round(prediction, 2),
+            "margin": np.round(epsilon * base_value, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class RandomForestSurrogate(SimulationFunction):
     """
@@ -566,6 +662,39 @@ class RandomForestSurrogate(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        traffic = batch_column(assumptions, "traffic_change", 20.0, n)
+        cpu = batch_column(assumptions, "cpu_change", 10.0, n)
+        memory = batch_column(assumptions, "memory_change", 5.0, n)
+        n_trees = np.trunc(batch_column(assumptions, "num_trees", 100, n))
+        w_traffic = batch_column(assumptions, "feature_importance_traffic", 0.6, n)
+        w_cpu = batch_column(assumptions, "feature_importance_cpu", 0.3, n)
+        w_memory = batch_column(assumptions, "feature_importance_memory", 0.1, n)
+
+        base_latency = baseline.get("latency_ms", 50.0)
+
+        interaction = (traffic * cpu) / 500
+        feature_effect = (w_traffic * traffic + w_cpu * cpu + w_memory * memory)
+        tree_variance = 5.0 / np.sqrt(n_trees)
+
+        prediction = base_latency * (1 + feature_effect / 100 + interaction / 100)
+
+        outputs = {
+            "prediction": np.round(prediction, 2),
+            "std_error": np.round(tree_variance * base_latency / 100, 3),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 3. Deep Learning Functions
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from app.modules.simulation.services.simulation.functions.base import (
     FunctionCategory,
     FunctionComplexity,
@@ -242,6 +244,41 @@ class FunctionRegistry:
             return {}, 0.0, {"error": f"Execution failed: {str(e)}"}
 
 
+    @classmethod
+    def execute_function_batch(
+        cls,
+        function_id: str,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        """
+        Execute a function by ID for a batch of assumption rows.
+
+        Args:
+            function_id: The function ID to execute
+            baseline: Baseline KPI values
+            assumptions: Per-row arrays and shared values (see SimulationFunction.execute_batch)
+            context: Optional context
+
+        Returns:
+            (outputs, confidence, debug_info)
+        """
+        function = cls.get(function_id)
+        if not function:
+            return {}, np.zeros(0), {"error": f"Function not found: {function_id}"}
+
+        validation_errors = function.validate_batch_inputs(baseline, assumptions)
+        if validation_errors:
+            return {}, np.zeros(0), {"error": "Validation failed", "details": validation_errors}
+
+        try:
+            return function.execute_batch(baseline=baseline, assumptions=assumptions, context=context)
+        except Exception as e:
+            return {}, np.zeros(0), {"error": f"Execution failed: {str(e)}"}
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from app.modules.simulation.services.simulation.functions.base import (
     FunctionCategory,
     FunctionComplexity,
@@ -16,6 +18,8 @@ from app.modules.simulation.services.simulation.functions.base import (
     FunctionOutput,
     FunctionParameter,
     SimulationFunction,
+    batch_column,
+    batch_size,
 )
 
 # =============================================================================
@@ -194,6 +198,44 @@ class LinearWeightRule(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        w_traffic = batch_column(assumptions, "traffic_weight", self.metadata.parameters[0].default, n)
+        w_cpu = batch_column(assumptions, "cpu_weight", self.metadata.parameters[1].default, n)
+        w_memory = batch_column(assumptions, "memory_weight", self.metadata.parameters[2].default, n)
+
+        traffic = batch_column(assumptions, "traffic_change_pct", 0.0, n)
+        cpu = batch_column(assumptions, "cpu_change_pct", 0.0, n)
+        memory = batch_column(assumptions, "memory_change_pct", 0.0, n)
+
+        lat_sens = batch_column(assumptions, "latency_sensitivity", 0.9, n)
+        err_sens = batch_column(assumptions, "error_sensitivity", 0.015, n)
+        cost_sens = batch_column(assumptions, "cost_sensitivity", 0.2, n)
+
+        impact = (w_traffic * traffic) + (w_cpu * cpu) + (w_memory * memory)
+
+        baseline_latency = baseline.get("latency_ms", 50.0)
+        baseline_error = baseline.get("error_rate_pct", 0.1)
+        baseline_throughput = baseline.get("throughput_rps", 1000.0)
+        baseline_cost = baseline.get("cost_usd_hour", 10.0)
+
+        outputs = {
+            "latency_ms": np.round(baseline_latency * (1.0 + np.maximum(-60.0, impact) / 100.0 * lat_sens), 2),
+            "error_rate_pct": np.round(np.maximum(0.0, baseline_error + np.maximum(0.0, impact) * err_sens), 3),
+            "throughput_rps": np.round(np.maximum(1.0, baseline_throughput * (1.0 + traffic / 100.0 * 0.8 - cpu / 100.0 * 0.15)), 2),
+            "cost_usd_hour": np.round(baseline_cost * (1.0 + np.maximum(0.0, traffic) / 100.0 * cost_sens), 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class PolynomialRule(SimulationFunction):
     """
@@ -304,6 +346,33 @@ class PolynomialRule(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        x = batch_column(assumptions, "x", 0.0, n)
+        a = batch_column(assumptions, "quadratic_coeff", self.metadata.parameters[1].default, n)
+        b = batch_column(assumptions, "linear_coeff", self.metadata.parameters[2].default, n)
+        c = batch_column(assumptions, "intercept", self.metadata.parameters[3].default, n)
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        baseline_value = baseline.get(kpi_name, 50.0)
+
+        impact_pct = (a * x * x) + (b * x) + c
+        multiplier = np.maximum(0.1, 1.0 + impact_pct / 100.0)
+
+        outputs = {
+            "simulated_value": np.round(baseline_value * multiplier, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 2. Threshold Rule Functions
@@ -450,6 +519,37 @@ class ThresholdRule(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        x = batch_column(assumptions, "input_value", 50.0, n)
+        warn_thr = batch_column(assumptions, "warning_threshold", 70.0, n)
+        crit_thr = batch_column(assumptions, "critical_threshold", 90.0, n)
+        norm_mult = batch_column(assumptions, "normal_multiplier", 1.0, n)
+        warn_mult = batch_column(assumptions, "warning_multiplier", 1.5, n)
+        crit_mult = batch_column(assumptions, "critical_multiplier", 3.0, n)
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        baseline_value = baseline.get(kpi_name, 50.0)
+
+        # normal=1, warning=2, critical=3
+        state = np.where(x < warn_thr, 1.0, np.where(x < crit_thr, 2.0, 3.0))
+        multiplier = np.choose(state.astype(int) - 1, [norm_mult, warn_mult, crit_mult])
+
+        outputs = {
+            "simulated_value": np.round(baseline_value * multiplier, 2),
+            "state": state,
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 3. Domain-Specific Rule Functions
@@ -550,6 +650,34 @@ class LittleLawRule(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        arrival_change = batch_column(assumptions, "arrival_rate_change_pct", 0.0, n)
+        service_change = batch_column(assumptions, "service_time_change_pct", 0.0, n)
+
+        base_latency = baseline.get("latency_ms", 50.0)
+        base_throughput = baseline.get("throughput_rps", 1000.0)
+
+        new_latency = base_latency * (1.0 + service_change / 100.0)
+        new_throughput = base_throughput * (1.0 + arrival_change / 100.0)
+        new_queue_length = new_throughput * new_latency / 1000.0
+
+        outputs = {
+            "latency_ms": np.round(new_latency, 2),
+            "queue_length": np.round(new_queue_length, 2),
+            "throughput_rps": np.round(new_throughput, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class ErlangCRule(SimulationFunction):
     """
@@ -10,6 +10,8 @@ from __future__ import annotations
 import math
 from typing import Any
 
+import numpy as np
+
 from app.modules.simulation.services.simulation.functions.base import (
     FunctionCategory,
     FunctionComplexity,
@@ -17,6 +19,8 @@ from app.modules.simulation.services.simulation.functions.base import (
     FunctionOutput,
     FunctionParameter,
     SimulationFunction,
+    batch_column,
+    batch_size,
 )
 
 # =============================================================================
@@ -138,6 +142,34 @@ class SimpleMovingAverage(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        slope = batch_column(assumptions, "trend_slope", 0.0, n)
+        noise = batch_column(assumptions, "noise_level", 0.1, n)
+        periods = np.trunc(batch_column(assumptions, "num_periods", 1, n))
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        base_value = baseline.get(kpi_name, 50.0)
+        smoothed = np.full(n, float(base_value))
+
+        forecast = smoothed + (slope * periods) + (noise * base_value * 0.1)
+
+        outputs = {
+            "forecast": np.round(forecast, 2),
+            "trend": np.round(slope, 3),
+            "smoothed_baseline": np.round(smoothed, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class ExponentialMovingAverage(SimulationFunction):
     """
@@ -244,6 +276,36 @@ class ExponentialMovingAverage(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        period = np.trunc(batch_column(assumptions, "smoothing_period", 12, n))
+        change_rate = batch_column(assumptions, "change_rate", 0.0, n)
+        periods = np.trunc(batch_column(assumptions, "num_periods", 1, n))
+        kpi_name = assumptions.get("baseline_kpi", "latency_ms")
+
+        alpha = 2.0 / (period + 1)
+
+        base_value = baseline.get(kpi_name, 50.0)
+
+        momentum = base_value * change_rate
+        forecast = base_value + (momentum * periods)
+
+        outputs = {
+            "forecast": np.round(forecast, 2),
+            "ema_alpha": np.round(alpha, 4),
+            "momentum": np.round(momentum, 3),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 2. Regression Functions
@@ -359,6 +421,35 @@ class LinearRegressionForecast(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        slope = batch_column(assumptions, "slope", 1.0, n)
+        intercept = batch_column(assumptions, "intercept", 50.0, n)
+        x = batch_column(assumptions, "forecast_x", 10.0, n)
+        r2 = batch_column(assumptions, "r_squared", 0.85, n)
+
+        forecast = slope * x + intercept
+
+        std_error = np.sqrt(1 - r2) * np.abs(intercept) * 0.2
+        margin = std_error * np.sqrt(1 + 1/30 + (x - 15)**2 / 1000)
+
+        outputs = {
+            "forecast": np.round(forecast, 2),
+            "confidence_interval_lower": np.round(forecast - margin, 2),
+            "confidence_interval_upper": np.round(forecast + margin, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 class PolynomialRegressionForecast(SimulationFunction):
     """
@@ -464,6 +555,31 @@ class PolynomialRegressionForecast(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        _ = baseline
+        n = batch_size(assumptions)
+
+        a = batch_column(assumptions, "quadratic_coeff", 0.05, n)
+        b = batch_column(assumptions, "linear_coeff", 2.0, n)
+        c = batch_column(assumptions, "intercept", 50.0, n)
+        x = batch_column(assumptions, "forecast_x", 10.0, n)
+
+        forecast = (a * x * x) + (b * x) + c
+
+        outputs = {
+            "forecast": np.round(forecast, 2),
+            "curvature": np.sign(a),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 3. Variance/Dispersion Functions
@@ -583,6 +699,34 @@ class StandardDeviationImpact(SimulationFunction):
 
         return outputs, self.metadata.confidence, debug_info
 
+    def execute_batch(
+        self,
+        *,
+        baseline: dict[str, float],
+        assumptions: dict[str, Any],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, dict[str, Any]]:
+        _ = context
+        n = batch_size(assumptions)
+
+        z = batch_column(assumptions, "z_score", 1.96, n)
+        std_mult = batch_column(assumptions, "std_dev_multiplier", 1.0, n)
+        mean = batch_column(assumptions, "baseline_mean", 50.0, n)
+        std = batch_column(assumptions, "baseline_std", 10.0, n)
+
+        margin = z * std * std_mult
+
+        upper_bound = mean + margin
+        lower_bound = np.maximum(0, mean - margin)
+
+        outputs = {
+            "upper_bound": np.round(upper_bound, 2),
+            "lower_bound": np.round(lower_bound, 2),
+            "range": np.round(upper_bound - lower_bound, 2),
+        }
+
+        return outputs, np.full(n, self.metadata.confidence), {"vectorized": True, "rows": n}
+
 
 # =============================================================================
 # 4. Distribution Functions
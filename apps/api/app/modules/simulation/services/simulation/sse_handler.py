@@ -6,18 +6,24 @@ instead of WebSocket.
 """
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, AsyncGenerator
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, AsyncGenerator, Optional
+
+from core.config import get_settings
 
 from app.modules.simulation.schemas import SimulationRunRequest
-from app.modules.simulation.services.simulation import (
-    RuleBasedStrategy,
-    StatisticalStrategy,
-)
 from app.modules.simulation.services.simulation.baseline_loader import (
     load_baseline_and_scenario_kpis,
 )
 from app.modules.simulation.services.simulation.planner import plan_simulation
+from app.modules.simulation.services.simulation.strategies import (
+    RuleBasedStrategy,
+    StatisticalStrategy,
+)
 from app.modules.simulation.services.simulation.strategies.dl_strategy_real import (
     create_dl_strategy_real as create_dl_strategy,
 )
@@ -266,8 +272,11 @@ class MultiStrategyComparisonSSE:
         """
         Stream multi-strategy comparison results via SSE.
 
-        Executes each strategy sequentially and streams results.
+        Strategies run concurrently on a shared thread pool against the same
+        plan and baseline objects, and each ``strategy_result`` is streamed as
+        soon as that strategy finishes.
         """
+        pending: set[asyncio.Future] = set()
         try:
             # Initial setup
             yield self._sse_event("progress", {"step": "init", "message": "Initializing comparison", "total": len(strategies)})
@@ -282,7 +291,8 @@ class MultiStrategyComparisonSSE:
                 service=payload.service,
             )
 
-            baseline_kpis, scenario_kpis = load_baseline_and_scenario_kpis(
+            baseline_kpis, scenario_kpis = await asyncio.to_thread(
+                load_baseline_and_scenario_kpis,
                 tenant_id=tenant_id,
                 service=payload.service,
                 scenario_type=payload.scenario_type,
@@ -294,9 +304,10 @@ class MultiStrategyComparisonSSE:
                 "strategies_to_compare": strategies,
             })
 
-            # Run each strategy
-            results = {}
-
+            # Start every known strategy at once
+            loop = asyncio.get_running_loop()
+            executor = get_strategy_executor()
+            names: dict[asyncio.Future, str] = {}
             for i, strategy_name in enumerate(strategies):
                 yield self._sse_event("progress", {
                     "step": "running_strategy",
@@ -313,20 +324,45 @@ class MultiStrategyComparisonSSE:
                         "strategy": strategy_name,
                     })
                     continue
-
-                try:
-                    kpis, confidence, model_info = strategy.run(
-                        plan=plan,
-                        baseline_data=baseline_kpis,
-                        tenant_id=tenant_id
-                    )
-
-                    # Align with scenario KPIs
-                    for kpi in kpis:
-                        if kpi.kpi in scenario_kpis:
-                            kpi.simulated = round(scenario_kpis[kpi.kpi], 3)
-
-                    results[strategy_name] = {
+                future = loop.run_in_executor(
+                    executor,
+                    self._run_strategy,
+                    strategy,
+                    plan,
+                    baseline_kpis,
+                    scenario_kpis,
+                    tenant_id,
+                )
+                names[future] = strategy_name
+                pending.add(future)
+
+            # Stream results in completion order
+            finished: dict[str, dict[str, Any]] = {}
+            completed = 0
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    strategy_name = names[future]
+                    completed += 1
+                    yield self._sse_event("progress", {
+                        "step": "strategy_complete",
+                        "message": f"Finished {strategy_name} ({completed}/{len(names)})",
+                        "completed": completed,
+                        "total": len(names),
+                        "strategy": strategy_name,
+                    })
+                    try:
+                        kpis, confidence, model_info, elapsed_ms = future.result()
+                    except Exception as e:
+                        yield self._sse_event("error", {
+                            "message": f"Strategy {strategy_name} failed: {str(e)}",
+                            "strategy": strategy_name,
+                        })
+                        continue
+
+                    finished[strategy_name] = {
                         "kpis": [k.model_dump() for k in kpis],
                         "confidence": confidence,
                         "model_info": model_info,
@@ -336,13 +372,15 @@ class MultiStrategyComparisonSSE:
                         "strategy": strategy_name,
                         "confidence": confidence,
                         "kpis": {k.kpi: k.model_dump() for k in kpis},
+                        "elapsed_ms": elapsed_ms,
+                        "completed": len(finished),
+                        "total": len(names),
                     })
 
-                except Exception as e:
-                    yield self._sse_event("error", {
-                        "message": f"Strategy {strategy_name} failed: {str(e)}",
-                        "strategy": strategy_name,
-                    })
+            # Keep the requested strategy order in the final comparison
+            results = {
+                name: finished[name] for name in names.values() if name in finished
+            }
 
             # Final comparison
             yield self._sse_event("progress", {"step": "finalizing", "message": "Building comparison"})
@@ -360,6 +398,33 @@ class MultiStrategyComparisonSSE:
             yield self._sse_event("error", {
                 "message": f"Comparison failed: {str(e)}",
             })
+        finally:
+            # Client went away: drop strategies that have not started yet
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _run_strategy(
+        strategy: Any,
+        plan: Any,
+        baseline_kpis: dict[str, float],
+        scenario_kpis: dict[str, float],
+        tenant_id: str,
+    ) -> tuple[list[Any], float, dict[str, Any], int]:
+        """Run one strategy on a pool thread and align it with the scenario KPIs."""
+        start = perf_counter()
+        kpis, confidence, model_info = strategy.run(
+            plan=plan,
+            baseline_data=baseline_kpis,
+            tenant_id=tenant_id
+        )
+
+        # Align with scenario KPIs
+        for kpi in kpis:
+            if kpi.kpi in scenario_kpis:
+                kpi.simulated = round(scenario_kpis[kpi.kpi], 3)
+
+        return kpis, confidence, model_info, int((perf_counter() - start) * 1000)
 
     def _build_comparison(
         self, results: dict[str, dict[str, Any]], baseline: dict[str, float]
@@ -459,6 +524,23 @@ class FunctionExecutionSSE:
 
 
 # Global handlers
+_strategy_executor: Optional[ThreadPoolExecutor] = None
+_strategy_executor_lock = threading.Lock()
+
+
+def get_strategy_executor() -> ThreadPoolExecutor:
+    """Get the process-wide pool that runs comparison strategies."""
+    global _strategy_executor
+    if _strategy_executor is None:
+        with _strategy_executor_lock:
+            if _strategy_executor is None:
+                _strategy_executor = ThreadPoolExecutor(
+                    max_workers=max(1, get_settings().simulation_strategy_workers),
+                    thread_name_prefix="sim-strategy",
+                )
+    return _strategy_executor
+
+
 simulation_sse_handler = SimulationSSEHandler()
 comparison_sse_handler = MultiStrategyComparisonSSE()
 function_sse_handler = FunctionExecutionSSE()
@@ -1,15 +1,14 @@
 """Authentication and authorization dependencies."""
 
-import json
 from typing import Optional
 
 from app.modules.api_keys.crud import get_api_key_scopes, validate_api_key
+from app.modules.api_manager.route_table import get_route_table
 from app.modules.auth.models import TbUser, UserRole
-from app.modules.operation_settings.crud import get_setting_effective_value
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
-from models.api_definition import ApiAuthMode, ApiDefinition
+from models.api_definition import ApiAuthMode
 from sqlmodel import Session, select
 
 from core.config import get_settings
@@ -43,75 +42,32 @@ def _pick_debug_user(candidates: list[TbUser], default_tenant_id: str) -> TbUser
     return None
 
 
-def _unwrap_api_definition(result) -> ApiDefinition | None:
-    if isinstance(result, ApiDefinition):
-        return result
-    mapping = getattr(result, "_mapping", None)
-    if mapping is not None:
-        direct = mapping.get(ApiDefinition)
-        if isinstance(direct, ApiDefinition):
-            return direct
-        for value in mapping.values():
-            if isinstance(value, ApiDefinition):
-                return value
-    if isinstance(result, (tuple, list)) and result:
-        first = result[0]
-        if isinstance(first, ApiDefinition):
-            return first
-    return None
-
-
 def _resolve_runtime_api_policy(
     session: Session, request: Request, settings
 ) -> tuple[str, list[str], bool]:
-    """Resolve auth policy for /runtime/* request."""
-    default_mode_effective = get_setting_effective_value(
-        session=session,
-        setting_key="api_auth_default_mode",
-        default_value=settings.api_auth_default_mode,
-        env_value=settings.api_auth_default_mode,
+    """Resolve auth policy for /runtime/* request from the compiled route table."""
+    table = get_route_table()
+    default_mode = str(
+        table.published_setting(
+            session, "api_auth_default_mode", settings.api_auth_default_mode
+        )
+        or "jwt_only"
     )
-    enforce_scopes_effective = get_setting_effective_value(
-        session=session,
-        setting_key="api_auth_enforce_scopes",
-        default_value=settings.api_auth_enforce_scopes,
-        env_value=settings.api_auth_enforce_scopes,
+    enforce_scopes = table.published_setting(
+        session, "api_auth_enforce_scopes", settings.api_auth_enforce_scopes
     )
-    default_mode = str(default_mode_effective.get("value") or "jwt_only")
-    enforce_scopes = bool(enforce_scopes_effective.get("value", True))
+    enforce_scopes = bool(True if enforce_scopes is None else enforce_scopes)
 
     full_path = request.url.path
     runtime_idx = full_path.find("/runtime/")
     if runtime_idx >= 0:
         full_path = full_path[runtime_idx:]
-    method = request.method.upper()
-    normalized = f"/{full_path.lstrip('/')}"
-    if normalized.startswith("/runtime/"):
-        normalized = normalized[len("/runtime") :]
-        normalized = f"/{normalized.lstrip('/')}"
-    candidates = [normalized, f"/runtime{normalized}", f"/{normalized.lstrip('/')}"]
-    api = _unwrap_api_definition(
-        session.exec(
-        select(ApiDefinition)
-        .where(ApiDefinition.path.in_(candidates))
-        .where(ApiDefinition.method == method)
-        .where(ApiDefinition.is_enabled)
-        .limit(1)
-    ).first()
-    )
-    if not api:
+    route = table.lookup(session, request.method, full_path)
+    if not route:
         return default_mode, [], enforce_scopes
 
-    mode = str(getattr(api, "auth_mode", None) or default_mode)
-    scopes = getattr(api, "required_scopes", None) or []
-    if isinstance(scopes, str):
-        try:
-            scopes = json.loads(scopes)
-        except json.JSONDecodeError:
-            scopes = []
-    if not isinstance(scopes, list):
-        scopes = []
-    return mode, [str(scope) for scope in scopes], enforce_scopes
+    mode = str(route.auth_mode or default_mode)
+    return mode, list(route.required_scopes), enforce_scopes
 
 
 def _authenticate_jwt_only(token: str, session: Session, settings) -> TbUser:
@@ -190,6 +146,7 @@ def _authenticate_api_key_only(
 
     setattr(user, "_auth_mode", "api_key")
     setattr(user, "_api_key_scopes", scopes)
+    setattr(user, "_api_key_id", api_key.id)
     return user
 
 
@@ -30,10 +30,17 @@ class AppSettings(BaseSettings):
     cep_enable_metric_polling: bool = False
     cep_metric_poll_global_interval_seconds: int = 10
     cep_metric_poll_concurrency: int = 5
+    cep_metric_poll_jitter_ratio: float = 0.1
+    cep_metric_poll_max_rules_per_tick: int = 1000
+    cep_metric_rule_full_sync_seconds: int = 300
     cep_metric_http_timeout_seconds: float = 3.0
+    cep_metric_http_max_connections: int = 100
+    cep_metric_http_per_host_limit: int = 20
+    cep_metric_http2: bool = True
     cep_metric_poll_snapshot_interval_seconds: int = 60
     cep_enable_notifications: bool = False
     cep_notification_interval_seconds: int = 30
+    cep_notification_send_concurrency: int = 10
 
     pg_host: Optional[str] = None
     pg_port: int = 5432
@@ -57,6 +64,41 @@ class AppSettings(BaseSettings):
     data_query_timeout_ms: int = 3000
     ops_enable_cep_scheduler: bool = False
 
+    ops_source_pool_enabled: bool = True
+    ops_source_pool_min_size: int = 0
+    ops_source_pool_max_size: int = 10
+    ops_source_pool_idle_timeout_seconds: float = 300.0
+    ops_source_pool_max_lifetime_seconds: float = 1800.0
+    ops_source_pool_health_check_interval_seconds: float = 30.0
+    ops_source_pool_acquire_timeout_seconds: float = 10.0
+    ops_source_pool_maintenance_interval_seconds: float = 30.0
+
+    ops_tool_cache_max_bytes: int = 64 * 1024 * 1024
+    ops_ci_cache_max_bytes: int = 32 * 1024 * 1024
+    ops_result_cache_l2_enabled: bool = False
+    ops_result_cache_l2_prefix: str = "ops_result_cache:"
+    ops_result_cache_l2_compress_min_bytes: int = 1024
+    ops_result_cache_fill_lock_seconds: float = 5.0
+    ops_result_cache_invalidation_channel: str = "ops_result_cache:invalidate"
+
+    ops_plan_cache_enabled: bool = True
+    ops_plan_cache_max_entries: int = 1000
+    ops_plan_cache_ttl_seconds: float = 900.0
+    ops_plan_cache_semantic_enabled: bool = False
+    ops_plan_cache_semantic_threshold: float = 0.95
+    ops_plan_cache_semantic_ttl_seconds: int = 86400
+
+    ops_request_timeout_ms: int = 120000
+    ops_tool_query_timeout_ms: int = 30000
+
+    ops_ask_coalesce_enabled: bool = True
+    ops_ask_coalesce_wait_seconds: float = 120.0
+
+    asset_cache_enabled: bool = True
+    asset_cache_ttl_seconds: float = 300.0
+    asset_cache_max_entries: int = 2000
+    asset_cache_invalidation_channel: str = "asset_registry:invalidate"
+
     embed_model: Optional[str] = None
     chat_model: str = "gpt-5-nano"
     openai_api_key: Optional[str] = None
@@ -71,7 +113,51 @@ class AppSettings(BaseSettings):
     llm_internal_api_key: Optional[str] = None
     api_auth_default_mode: str = "jwt_only"
     api_auth_enforce_scopes: bool = True
+    script_sandbox_pool_enabled: bool = True
+    script_sandbox_pool_min_size: int = 2
+    script_sandbox_pool_max_size: int = 8
+    script_sandbox_max_executions: int = 100
+    script_sandbox_idle_seconds: float = 300.0
+    script_sandbox_memory_mb: int = 512
+    api_workflow_max_concurrency: int = 4
+    api_route_table_invalidation_channel: str = "api_manager:routes:invalidate"
+    api_route_table_max_age_seconds: float = 300.0
+    runtime_rate_limit_backend: Literal["auto", "memory", "redis"] = "auto"
+    runtime_rate_limit_prefix: str = "runtime_rl:"
+    runtime_rate_limit_window_seconds: int = 60
+    runtime_rate_limit_per_ip: int = 120
+    runtime_rate_limit_per_api_key: int = 0
+    runtime_rate_limit_per_tenant: int = 0
+    runtime_rate_limit_max_keys: int = 100_000
+    runtime_rate_limit_redis_retry_seconds: float = 5.0
+    api_key_cache_enabled: bool = True
+    api_key_cache_ttl_seconds: float = 60.0
+    api_key_cache_max_entries: int = 10_000
+    api_key_cache_invalidation_channel: str = "api_keys:invalidate"
+    api_key_last_used_flush_seconds: float = 30.0
+    telemetry_sink_enabled: bool = True
+    telemetry_sink_max_queue: int = 10_000
+    telemetry_sink_batch_size: int = 500
+    telemetry_sink_flush_interval_ms: int = 500
+    telemetry_sink_drop_policy: Literal["drop_oldest", "drop_newest", "block"] = "drop_oldest"
+    telemetry_sink_block_timeout_ms: int = 50
+    telemetry_sink_spill_dir: Optional[str] = None
+    trace_rollup_enabled: bool = True
+    trace_rollup_flush_seconds: float = 15.0
+    trace_rollup_relative_accuracy: float = 0.01
+    trace_rollup_retention_days: int = 30
+    metrics_enabled: bool = True
+    metrics_multiproc_dir: Optional[str] = None
+    # /metrics is only served when this token is set
+    metrics_bearer_token: Optional[str] = None
+    simulation_strategy_workers: int = 4
     embedding_dimension: int = 1536
+    embedding_batch_size: int = 64
+    embedding_concurrency: int = 4
+    embedding_requests_per_minute: int = 3000
+    embedding_tokens_per_minute: int = 1000000
+    embedding_max_retries: int = 5
+    embedding_cache_enabled: bool = True
     document_storage_root: Optional[Path] = Field(
         default=None, env="DOCUMENT_STORAGE_ROOT"
     )
@@ -0,0 +1,145 @@
+"""
+Mergeable latency sketch (DDSketch).
+
+Values are counted in logarithmic bins whose width grows with the value, so
+any quantile is returned within ``relative_accuracy`` of the true value while
+the sketch stays a few hundred bins regardless of how many values were added.
+Two sketches with the same accuracy merge by adding bin counts, which lets
+per-minute / per-dimension sketches be rolled up into any window exactly as
+if the raw values had been kept.
+
+Negative values (CEP window percentiles over arbitrary metrics) are kept in a
+mirrored set of bins, so the same sketch serves latencies and signed values.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Optional
+
+
+class LatencySketch:
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max(1, max_bins)
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.negative_bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        if count <= 0 or value is None or math.isnan(value):
+            return
+        value = float(value)
+        if value == 0.0:
+            self.zero_count += count
+        else:
+            store = self.bins if value > 0 else self.negative_bins
+            key = self._key(abs(value))
+            store[key] = store.get(key, 0) + count
+            if len(self.bins) + len(self.negative_bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        if other.count == 0:
+            return self
+        same_layout = math.isclose(other.relative_accuracy, self.relative_accuracy)
+        stores = ((self.bins, other.bins), (self.negative_bins, other.negative_bins))
+        for store, other_store in stores:
+            for key, count in other_store.items():
+                if not same_layout:
+                    # Different bin layout (accuracy setting changed): re-bin midpoints
+                    key = self._key(other._bin_value(key))
+                store[key] = store.get(key, 0) + count
+        if len(self.bins) + len(self.negative_bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        q = min(max(q, 0.0), 1.0)
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative_bins, reverse=True):
+            seen += self.negative_bins[key]
+            if rank < seen:
+                return min(max(-self._bin_value(key), self.min), self.max)
+        seen += self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return min(max(self._bin_value(key), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON form (bin keys are strings)"""
+        data = {
+            "a": self.relative_accuracy,
+            "n": self.count,
+            "s": self.sum,
+            "z": self.zero_count,
+            "lo": self.min if self.count else None,
+            "hi": self.max if self.count else None,
+            "b": {str(key): count for key, count in self.bins.items()},
+        }
+        if self.negative_bins:
+            data["nb"] = {str(key): count for key, count in self.negative_bins.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any] | None) -> "LatencySketch":
+        data = data or {}
+        sketch = cls(relative_accuracy=float(data.get("a") or 0.01))
+        sketch.bins = {int(key): int(count) for key, count in (data.get("b") or {}).items()}
+        sketch.negative_bins = {
+            int(key): int(count) for key, count in (data.get("nb") or {}).items()
+        }
+        sketch.zero_count = int(data.get("z") or 0)
+        sketch.count = int(data.get("n") or 0)
+        sketch.sum = float(data.get("s") or 0.0)
+        if sketch.count:
+            sketch.min = float(data.get("lo") or 0.0)
+            sketch.max = float(data.get("hi") or 0.0)
+        return sketch
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _bin_value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        # Fold the lowest-magnitude bins of the larger store together; only
+        # values nearest zero lose accuracy
+        while True:
+            excess = len(self.bins) + len(self.negative_bins) - self.max_bins
+            store = self.bins if len(self.bins) >= len(self.negative_bins) else self.negative_bins
+            keys = sorted(store)
+            overflow = keys[: min(excess, len(keys) - 1)]
+            if excess <= 0 or not overflow:
+                return
+            target = keys[len(overflow)]
+            store[target] += sum(store.pop(key) for key in overflow)
@@ -0,0 +1,152 @@
+"""
+Process-wide Prometheus metrics.
+
+Every collector in the app (HTTP middleware, OPS orchestration, CEP rule
+monitor, CEP performance utils, system monitor, CI/API caches) records into
+the series defined here, and ``/metrics`` renders them in the Prometheus text
+format or OpenMetrics (when the scraper asks for it).
+
+Multi-process mode: when ``PROMETHEUS_MULTIPROC_DIR`` (or the
+``metrics_multiproc_dir`` setting) is set, each uvicorn worker writes its
+values to mmap'd files in that directory and a scrape of any worker merges
+all of them, so counters and histograms cover the whole deployment rather
+than one worker's slice. The directory must exist and be emptied before the
+server starts; workers mark themselves dead on shutdown.
+
+Label values must stay low-cardinality (route templates, tool names, rule
+ids) - never trace ids, users or raw paths.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional, Tuple
+
+from core.config import get_settings
+
+# prometheus_client picks its value store when imported, so the multiprocess
+# directory has to be exported first
+_multiproc_dir = get_settings().metrics_multiproc_dir
+if _multiproc_dir and not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(_multiproc_dir, exist_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = _multiproc_dir
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.openmetrics.exposition import (  # noqa: E402
+    CONTENT_TYPE_LATEST as OPENMETRICS_CONTENT_TYPE,
+)
+from prometheus_client.openmetrics.exposition import (  # noqa: E402
+    generate_latest as generate_openmetrics,
+)
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# OPS orchestration (OrchestrationMetrics)
+OPS_STAGE_LATENCY = Histogram(
+    "ops_stage_latency_seconds",
+    "Orchestration pipeline stage latency",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+OPS_TOOL_LATENCY = Histogram(
+    "ops_tool_latency_seconds",
+    "Orchestration tool execution latency",
+    ["tool"],
+    buckets=LATENCY_BUCKETS,
+)
+OPS_TOOL_FAILURES = Counter(
+    "ops_tool_failures_total", "Failed orchestration tool executions", ["tool"]
+)
+OPS_EVENTS = Counter(
+    "ops_orchestration_events_total",
+    "Orchestration fallback, replan and timeout events",
+    ["event"],
+)
+
+# CEP (RulePerformanceMonitor, PerformanceMetrics)
+CEP_RULE_EXECUTIONS = Counter(
+    "cep_rule_executions_total", "CEP rule executions", ["rule_id", "outcome"]
+)
+CEP_RULE_DURATION = Histogram(
+    "cep_rule_execution_seconds",
+    "CEP rule execution latency",
+    ["rule_id"],
+    buckets=LATENCY_BUCKETS,
+)
+CEP_RULE_EVENTS = Counter(
+    "cep_rule_events_total", "Events processed/matched by CEP rules", ["rule_id", "kind"]
+)
+CEP_OPERATION_DURATION = Histogram(
+    "cep_operation_seconds",
+    "CEP builder operation and query latency",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# System (SystemMonitor); host-wide values, so the latest write wins
+SYSTEM_CPU_PERCENT = Gauge(
+    "system_cpu_percent", "Host CPU utilisation", multiprocess_mode="mostrecent"
+)
+SYSTEM_MEMORY_PERCENT = Gauge(
+    "system_memory_percent", "Host memory utilisation", multiprocess_mode="mostrecent"
+)
+SYSTEM_DISK_PERCENT = Gauge(
+    "system_disk_percent", "Root disk utilisation", multiprocess_mode="mostrecent"
+)
+# Database-wide values reported by any worker, so summing would overcount
+DB_CONNECTIONS = Gauge(
+    "db_connections", "Database connections in use", multiprocess_mode="max"
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Database connection pool size", multiprocess_mode="max"
+)
+
+# Caches (CICache, APICacheService)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]
+)
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics(accept: Optional[str] = None) -> Tuple[bytes, str]:
+    """Exposition body and content type; OpenMetrics when the scraper accepts it"""
+    registry = REGISTRY
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    if accept and "application/openmetrics-text" in accept:
+        return generate_openmetrics(registry), OPENMETRICS_CONTENT_TYPE
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Drop this worker's live gauges from the shared directory"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from time import perf_counter
 from uuid import uuid4
 
 from app.modules.inspector.asset_context import reset_asset_context
@@ -14,6 +15,7 @@ from apps.api.core.logging import (
     set_request_context,
 )
 from core.config import get_settings
+from core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
 from core.tenant import normalize_tenant_id
 
 logger = get_logger(__name__)
@@ -65,3 +67,23 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         if parent_trace_id:
             response.headers["X-Parent-Trace-ID"] = parent_trace_id
         return response
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Records request count and latency per route template"""
+
+    async def dispatch(self, request: Request, call_next):
+        start = perf_counter()
+        status = 500
+        try:
+            response: Response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            # Template (e.g. /runtime/{path:path}), never the raw path
+            route_label = getattr(route, "path", None) or "<unmatched>"
+            HTTP_REQUESTS.labels(request.method, route_label, str(status)).inc()
+            HTTP_REQUEST_DURATION.labels(request.method, route_label).observe(
+                perf_counter() - start
+            )
@@ -6,10 +6,10 @@ from redis.exceptions import RedisError
 from .config import AppSettings
 
 
-def create_redis_client(settings: AppSettings) -> Redis:
+def create_redis_client(settings: AppSettings, decode_responses: bool = True) -> Redis:
     if not settings.redis_url:
         raise ValueError("Redis URL is not configured")
-    return Redis.from_url(settings.redis_url, decode_responses=True)
+    return Redis.from_url(settings.redis_url, decode_responses=decode_responses)
 
 
 def test_redis_connection(settings: AppSettings) -> bool:
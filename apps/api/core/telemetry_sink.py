@@ -0,0 +1,406 @@
+"""
+Write-behind sink for telemetry rows (execution traces, LLM call logs, API
+execution logs).
+
+Request handlers ``submit`` a SQLModel row and return; a background flusher
+drains the bounded queue every ``flush_interval_ms`` or once ``batch_size``
+rows are waiting, and writes each batch with one multi-row INSERT per table
+(parent tables first) in a single transaction.
+
+- When the queue is full the ``drop_policy`` applies: ``drop_oldest``,
+  ``drop_newest`` or ``block`` (wait up to ``block_timeout_ms``, then drop).
+  ``drop_oldest`` evicts queued child rows (``_QUEUE_LINKS``) together with
+  their parent so no orphans are written.
+- A batch that fails to insert is retried row by row, so one bad row does not
+  cost the whole batch. Rows that still fail are appended to a JSONL file in
+  ``spill_dir`` when configured (replayed when the sink next starts),
+  otherwise dropped.
+- Replay skips files it cannot read or rows that still fail by moving them to
+  ``quarantine-*.jsonl``, and carries on with the remaining files.
+- ``stop`` drains the queue, so shutdown flushes pending rows.
+- While the sink is not running (scripts, tests, disabled) ``submit`` writes
+  synchronously on the caller's session, as before.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlmodel import SQLModel
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = {"drop_oldest", "drop_newest", "block"}
+
+# Telemetry tables linked without a foreign key:
+# child table -> (link column, parent table, parent key column)
+_QUEUE_LINKS = {
+    "tb_api_exec_step_log": ("exec_id", "tb_api_exec_log", "exec_id"),
+}
+_PARENT_KEYS = {parent: key for _column, parent, key in _QUEUE_LINKS.values()}
+
+
+def _row_values(row: SQLModel) -> Dict[str, Any]:
+    # Omit unset (None) values so server defaults apply
+    return {key: value for key, value in row.model_dump().items() if value is not None}
+
+
+def _table_rank(model: type) -> int:
+    try:
+        return SQLModel.metadata.sorted_tables.index(model.__table__)
+    except (AttributeError, ValueError):
+        return len(SQLModel.metadata.sorted_tables)
+
+
+def _parent_ref(row: SQLModel) -> Optional[tuple]:
+    link = _QUEUE_LINKS.get(getattr(row, "__tablename__", None))
+    if link is None:
+        return None
+    column, parent_table, _key = link
+    return parent_table, getattr(row, column, None)
+
+
+def _is_unavailable(exc: Exception) -> bool:
+    # Connection-level failures fail every row; per-row retries are pointless
+    return isinstance(exc, (OperationalError, InterfaceError))
+
+
+def _models_by_table() -> Dict[str, type]:
+    return {
+        mapper.class_.__tablename__: mapper.class_
+        for mapper in SQLModel._sa_registry.mappers
+        if getattr(mapper.class_, "__tablename__", None)
+    }
+
+
+class TelemetrySink:
+    def __init__(
+        self,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 500,
+        drop_policy: str = "drop_oldest",
+        block_timeout_ms: int = 50,
+        spill_dir: Optional[str] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown telemetry drop policy '{drop_policy}'")
+        self.max_queue = max(1, max_queue)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(1, flush_interval_ms) / 1000.0
+        self.drop_policy = drop_policy
+        self.block_timeout = max(0, block_timeout_ms) / 1000.0
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._session_factory = session_factory
+        self._queue: deque[SQLModel] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "quarantined_rows": 0,
+            "quarantined_files": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, row: SQLModel, session: Any = None) -> bool:
+        """Queue ``row`` for insert; returns False if it was dropped"""
+        if not self.running:
+            self._write_sync(row, session)
+            return True
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                if self.drop_policy == "block":
+                    self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_queue, self.block_timeout
+                    )
+                if len(self._queue) >= self.max_queue:
+                    if self.drop_policy != "drop_oldest":
+                        self._stats["dropped"] += 1
+                        return False
+                    self._stats["dropped"] += self._evict_oldest()
+            self._queue.append(row)
+            self._stats["submitted"] += 1
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def start(self) -> None:
+        if self.running:
+            return
+        with self._cond:
+            self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-sink", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush queued rows and stop the flusher"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def flush(self) -> int:
+        """Write everything queued now; returns rows written"""
+        written = 0
+        while True:
+            batch = self._take(wait=False)
+            if not batch:
+                return written
+            written += self._write_batch(batch)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {**self._stats, "queued": len(self._queue), "running": self.running}
+
+    def _run(self) -> None:
+        self._replay_spilled()
+        while True:
+            batch = self._take(wait=True)
+            if batch:
+                self._write_batch(batch)
+                continue
+            with self._cond:
+                if self._stopping and not self._queue:
+                    return
+
+    def _evict_oldest(self) -> int:
+        """Drop the oldest row and any queued children; caller holds the lock"""
+        oldest = self._queue.popleft()
+        table = getattr(oldest, "__tablename__", None)
+        key_column = _PARENT_KEYS.get(table)
+        if key_column is None:
+            return 1
+        parent = (table, getattr(oldest, key_column, None))
+        remaining = deque(row for row in self._queue if _parent_ref(row) != parent)
+        evicted = 1 + len(self._queue) - len(remaining)
+        self._queue = remaining
+        return evicted
+
+    def _take(self, wait: bool) -> List[SQLModel]:
+        with self._cond:
+            if wait:
+                self._cond.wait_for(
+                    lambda: self._stopping or len(self._queue) >= self.batch_size,
+                    self.flush_interval,
+                )
+            count = min(len(self._queue), self.batch_size)
+            batch = [self._queue.popleft() for _ in range(count)]
+            if batch:
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+            return batch
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        from core.db import get_session_context
+
+        return get_session_context()
+
+    def _write_batch(self, batch: List[SQLModel]) -> int:
+        groups: Dict[type, List[Dict[str, Any]]] = {}
+        for row in batch:
+            groups.setdefault(type(row), []).append(_row_values(row))
+        try:
+            self._insert(groups)
+        except Exception as exc:
+            logger.warning(
+                f"Telemetry sink failed to write {len(batch)} rows, retrying row by row: {exc}"
+            )
+            written, failed, _unavailable = self._insert_rows(groups)
+            with self._cond:
+                self._stats["failed_batches"] += 1
+                self._stats["written"] += written
+            if failed:
+                self._spill(failed)
+            return written
+        with self._cond:
+            self._stats["batches"] += 1
+            self._stats["written"] += len(batch)
+        return len(batch)
+
+    def _insert(self, groups: Dict[type, List[Dict[str, Any]]]) -> None:
+        with self._session() as session:
+            for model in sorted(groups, key=_table_rank):
+                session.execute(insert(model), groups[model])
+            session.commit()
+
+    def _insert_rows(
+        self, groups: Dict[type, List[Dict[str, Any]]]
+    ) -> tuple[int, Dict[type, List[Dict[str, Any]]], bool]:
+        """
+        Insert rows one per transaction, parents first.
+
+        Returns (written, failed rows, whether the database became unavailable).
+        """
+        pending = [
+            (model, values)
+            for model in sorted(groups, key=_table_rank)
+            for values in groups[model]
+        ]
+        written = 0
+        failed: Dict[type, List[Dict[str, Any]]] = {}
+        for index, (model, values) in enumerate(pending):
+            try:
+                self._insert({model: [values]})
+            except Exception as exc:
+                if _is_unavailable(exc):
+                    for rest_model, rest_values in pending[index:]:
+                        failed.setdefault(rest_model, []).append(rest_values)
+                    return written, failed, True
+                logger.warning(f"Telemetry sink rejected a {model.__tablename__} row: {exc}")
+                failed.setdefault(model, []).append(values)
+                continue
+            written += 1
+        return written, failed, False
+
+    def _write_sync(self, row: SQLModel, session: Any) -> None:
+        if session is None:
+            with self._session() as own_session:
+                own_session.add(row)
+                own_session.commit()
+            return
+        session.add(row)
+        session.commit()
+        session.refresh(row)
+
+    def _spill(self, groups: Dict[type, List[Dict[str, Any]]]) -> None:
+        count = sum(len(rows) for rows in groups.values())
+        if self.spill_dir is None:
+            with self._cond:
+                self._stats["dropped"] += count
+            return
+        try:
+            self._write_spill_file("telemetry", groups)
+        except OSError as exc:
+            logger.warning(f"Telemetry sink failed to spill {count} rows: {exc}")
+            with self._cond:
+                self._stats["dropped"] += count
+            return
+        with self._cond:
+            self._stats["spilled"] += count
+
+    def _write_spill_file(self, prefix: str, groups: Dict[type, List[Dict[str, Any]]]) -> None:
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        path = self.spill_dir / f"{prefix}-{os.getpid()}-{uuid.uuid4().hex}.jsonl"
+        with path.open("w", encoding="utf-8") as handle:
+            for model, rows in groups.items():
+                for values in rows:
+                    handle.write(
+                        json.dumps(
+                            {"table": model.__tablename__, "row": values},
+                            default=str,
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+
+    def _read_spill_file(
+        self, path: Path, models: Dict[str, type]
+    ) -> Dict[type, List[Dict[str, Any]]]:
+        groups: Dict[type, List[Dict[str, Any]]] = {}
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                record = json.loads(line)
+                model = models.get(record.get("table"))
+                if model is None:
+                    continue
+                # Re-validate so UUID/datetime strings get their types back
+                row = model.model_validate(record.get("row") or {})
+                groups.setdefault(model, []).append(_row_values(row))
+        return groups
+
+    def _replay_spilled(self) -> None:
+        if self.spill_dir is None or not self.spill_dir.is_dir():
+            return
+        models = _models_by_table()
+        for path in sorted(self.spill_dir.glob("telemetry-*.jsonl")):
+            try:
+                groups = self._read_spill_file(path, models)
+            except Exception as exc:
+                logger.warning(f"Telemetry sink quarantined unreadable {path.name}: {exc}")
+                path.replace(path.with_name(f"quarantine-{path.name}"))
+                with self._cond:
+                    self._stats["quarantined_files"] += 1
+                continue
+            total = sum(len(rows) for rows in groups.values())
+            try:
+                self._insert(groups)
+                written, failed, unavailable = total, {}, False
+            except Exception:
+                written, failed, unavailable = self._insert_rows(groups)
+            if unavailable and not written:
+                logger.warning(f"Telemetry sink could not replay {path.name}; will retry")
+                continue
+            if failed:
+                # Rows the database rejected are set aside; an outage mid-file
+                # leaves the rest for the next start
+                prefix = "telemetry" if unavailable else "quarantine"
+                try:
+                    self._write_spill_file(prefix, failed)
+                except OSError as exc:
+                    logger.warning(
+                        f"Telemetry sink could not set aside rows from {path.name}: {exc}"
+                    )
+                    continue
+                if not unavailable:
+                    logger.warning(
+                        f"Telemetry sink quarantined {total - written} rows from {path.name}"
+                    )
+            path.unlink(missing_ok=True)
+            with self._cond:
+                self._stats["replayed"] += written
+                if not unavailable:
+                    self._stats["quarantined_rows"] += total - written
+
+
+_sink: Optional[TelemetrySink] = None
+_sink_lock = threading.Lock()
+
+
+def get_telemetry_sink() -> TelemetrySink:
+    """Get the process-wide telemetry sink."""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                settings = get_settings()
+                _sink = TelemetrySink(
+                    max_queue=settings.telemetry_sink_max_queue,
+                    batch_size=settings.telemetry_sink_batch_size,
+                    flush_interval_ms=settings.telemetry_sink_flush_interval_ms,
+                    drop_policy=settings.telemetry_sink_drop_policy,
+                    block_timeout_ms=settings.telemetry_sink_block_timeout_ms,
+                    spill_dir=settings.telemetry_sink_spill_dir,
+                )
+    return _sink
+
+
+def submit_telemetry(row: SQLModel, session: Any = None) -> bool:
+    return get_telemetry_sink().submit(row, session)
@@ -12,6 +12,7 @@ from api.routes.chat import router as chat_router
 from api.routes.health import router as health_router
 from api.routes.hello import router as hello_router
 from api.routes.history import router as history_router
+from api.routes.metrics import router as metrics_router
 from api.routes.threads import router as thread_router
 from app.core.exception_handlers import register_exception_handlers
 from app.modules.admin.routes.logs import router as admin_logs_router
@@ -55,7 +56,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from apps.api.core.cors_config import CORSConfig
 from apps.api.core.logging import configure_logging
-from apps.api.core.middleware import RequestIDMiddleware
+from apps.api.core.middleware import MetricsMiddleware, RequestIDMiddleware
 from apps.api.core.security_middleware import add_security_middleware
 
 # Note: initialize_domain_planners() and initialize_tools() are now called in on_startup()
@@ -66,6 +67,7 @@ configure_logging(settings.log_level)
 
 app = FastAPI(redirect_slashes=False)
 app.add_middleware(RequestIDMiddleware)
+app.add_middleware(MetricsMiddleware)
 add_security_middleware(app, settings)
 
 # Register global exception handlers
@@ -88,6 +90,9 @@ app.include_router(hello_router, dependencies=auth_required)
 app.include_router(admin_dashboard_router, dependencies=auth_required)
 app.include_router(admin_logs_router, prefix="/admin", dependencies=auth_required)
 app.include_router(auth_router)
+# Scraped by Prometheus; guarded by METRICS_BEARER_TOKEN instead of JWT and
+# not served at all until that token is configured
+app.include_router(metrics_router)
 app.include_router(api_keys_router, dependencies=auth_required)
 app.include_router(permissions_router, dependencies=auth_required)
 app.include_router(simulation_router, dependencies=auth_required)
@@ -210,6 +215,73 @@ def _run_heavy_startup_sync(logger) -> None:
 
     logger.info("Startup: Runtime tool discovery system started.")
 
+    logger.info("Startup: Starting asset cache invalidation listener...")
+    from app.modules.asset_registry.cache import get_invalidation_bus
+
+    if get_invalidation_bus().start():
+        logger.info("Startup: Asset cache invalidation listener started.")
+    else:
+        logger.info("Startup: Redis not configured; asset cache invalidation is process-local.")
+
+    logger.info("Startup: Building runtime API route table...")
+    from app.modules.api_manager.route_table import (
+        get_invalidation_bus as get_route_table_invalidation_bus,
+    )
+    from app.modules.api_manager.route_table import get_route_table
+    from core.db import get_session_context
+
+    try:
+        with get_session_context() as session:
+            get_route_table().build(session)
+        logger.info("Startup: Runtime API route table built.")
+    except Exception as e:
+        logger.warning(f"Failed to build runtime API route table: {str(e)}")
+    if get_route_table_invalidation_bus().start():
+        logger.info("Startup: Route table invalidation listener started.")
+    else:
+        logger.info("Startup: Redis not configured; route table invalidation is process-local.")
+
+    logger.info("Startup: Starting API key cache invalidation and last-used flusher...")
+    from app.modules.api_keys.cache import (
+        get_invalidation_bus as get_api_key_invalidation_bus,
+    )
+    from app.modules.api_keys.cache import get_last_used_buffer
+
+    get_last_used_buffer().start()
+    if get_api_key_invalidation_bus().start():
+        logger.info("Startup: API key cache invalidation listener started.")
+    else:
+        logger.info("Startup: Redis not configured; API key cache invalidation is process-local.")
+
+    from core.telemetry_sink import get_telemetry_sink
+
+    if settings.telemetry_sink_enabled:
+        get_telemetry_sink().start()
+        logger.info("Startup: Telemetry sink started.")
+    else:
+        logger.info("Startup: Telemetry sink disabled; trace and log rows are written inline.")
+    if settings.trace_rollup_enabled:
+        from app.modules.inspector.rollups import get_trace_rollups
+
+        get_trace_rollups().start()
+        logger.info("Startup: Trace rollup flusher started.")
+
+    if settings.ops_source_pool_enabled:
+        from app.modules.ops.services.connections import get_pool_maintainer
+
+        get_pool_maintainer().start()
+        logger.info("Startup: Source connection pool maintenance started.")
+
+    logger.info("Startup: Starting OPS result cache invalidation listener...")
+    from app.modules.ops.services.orchestration.services.result_store import (
+        get_invalidation_bus as get_result_cache_invalidation_bus,
+    )
+
+    if get_result_cache_invalidation_bus().start():
+        logger.info("Startup: OPS result cache invalidation listener started.")
+    else:
+        logger.info("Startup: OPS result cache L2 disabled; invalidation is process-local.")
+
     logger.info("Startup: Starting CEP scheduler...")
     start_scheduler()
     logger.info("Startup: CEP scheduler started.")
@@ -250,6 +322,11 @@ async def on_startup() -> None:
     # tables/columns that are not yet present in the runtime database.
     _run_migrations(logger)
 
+    # Async source connections (tool queries) may only be pooled on this loop
+    from app.modules.ops.services.connections import get_async_pool_registry
+
+    get_async_pool_registry().bind(asyncio.get_running_loop())
+
     if _should_defer_heavy_startup():
         logger.info(
             "Startup: Deferring heavy initialization to background task (DEFER_HEAVY_STARTUP=true)."
@@ -292,11 +369,95 @@ async def on_shutdown() -> None:
     await stop_scheduler()
     logger.info("Shutdown: CEP scheduler stopped.")
 
+    logger.info("Shutdown: Stopping script sandbox pool...")
+    try:
+        from app.modules.api_manager.sandbox_pool import shutdown_sandbox_pool
+
+        shutdown_sandbox_pool()
+    except Exception as e:
+        logger.warning(f"Failed to stop script sandbox pool: {str(e)}")
+
+    logger.info("Shutdown: Stopping asset cache invalidation listener...")
+    try:
+        from app.modules.asset_registry.cache import get_invalidation_bus
+
+        get_invalidation_bus().stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop asset cache invalidation listener: {str(e)}")
+
+    logger.info("Shutdown: Stopping route table invalidation listener...")
+    try:
+        from app.modules.api_manager.route_table import get_invalidation_bus
+
+        get_invalidation_bus().stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop route table invalidation listener: {str(e)}")
+
+    logger.info("Shutdown: Flushing API key last-used updates...")
+    try:
+        from app.modules.api_keys.cache import (
+            get_invalidation_bus,
+            get_last_used_buffer,
+        )
+
+        get_last_used_buffer().stop()
+        get_invalidation_bus().stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop API key cache workers: {str(e)}")
+
+    logger.info("Shutdown: Flushing trace rollups...")
+    try:
+        from app.modules.inspector.rollups import get_trace_rollups
+
+        get_trace_rollups().stop()
+    except Exception as e:
+        logger.warning(f"Failed to flush trace rollups: {str(e)}")
+
+    logger.info("Shutdown: Flushing telemetry sink...")
+    try:
+        from core.telemetry_sink import get_telemetry_sink
+
+        get_telemetry_sink().stop()
+    except Exception as e:
+        logger.warning(f"Failed to flush telemetry sink: {str(e)}")
+
+    logger.info("Shutdown: Stopping OPS result cache invalidation listener...")
+    try:
+        from app.modules.ops.services.orchestration.services.result_store import (
+            get_invalidation_bus as get_result_cache_invalidation_bus,
+        )
+
+        get_result_cache_invalidation_bus().stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop OPS result cache invalidation listener: {str(e)}")
+
+    logger.info("Shutdown: Closing source connection pools...")
+    try:
+        from app.modules.ops.services.connections import (
+            get_async_pool_registry,
+            get_pool_maintainer,
+            get_pool_registry,
+        )
+
+        get_pool_maintainer().stop()
+        get_pool_registry().close_all()
+        await get_async_pool_registry().close_all()
+        logger.info("Shutdown: Source connection pools closed.")
+    except Exception as e:
+        logger.warning(f"Failed to close source connection pools: {str(e)}")
+
     logger.info("Shutdown: Stopping resource watcher...")
     # Stop resource watcher
     config_loader.stop_watching()
     logger.info("Shutdown: Resource watcher stopped.")
 
+    try:
+        from core.metrics import mark_process_dead
+
+        mark_process_dead()
+    except Exception as e:
+        logger.warning(f"Failed to release worker metrics: {str(e)}")
+
     logger.info("Shutdown: All cleanup complete.")
 
 
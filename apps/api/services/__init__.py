@@ -3,6 +3,7 @@ from .document import (
     DocumentProcessingError,
     DocumentSearchService,
 )
+from .embedding import EmbeddingService, get_embedding_service
 from .orchestrator import BaseOrchestrator, FakeOrchestrator, get_orchestrator
 from .summary import ConversationSummaryService, get_summary_service
 
@@ -15,4 +16,6 @@ __all__ = [
     "DocumentIndexService",
     "DocumentSearchService",
     "DocumentProcessingError",
+    "EmbeddingService",
+    "get_embedding_service",
 ]
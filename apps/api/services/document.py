@@ -9,15 +9,15 @@ from pathlib import Path
 from typing import Iterator
 
 import docx
-from app.llm.client import get_llm_client
 from core.config import AppSettings
 from models import Document, DocumentChunk, DocumentStatus
 from pypdf import PdfReader
 from sqlalchemy import delete, select
 from sqlmodel import Session
 
+from .embedding import get_embedding_service
+
 MAX_CHUNK_CHARS = 1100
-EMBED_BATCH_SIZE = 16
 
 
 class DocumentStorage:
@@ -55,7 +55,7 @@ class DocumentIndexService:
             raise DocumentProcessingError("OpenAI API key is required for embeddings")
         if not settings.embed_model:
             raise DocumentProcessingError("EMBED_MODEL is required for embeddings")
-        self._llm = get_llm_client()
+        self._embeddings = get_embedding_service()
 
     def process(self, document_id: str) -> None:
         document = self.session.get(Document, document_id)
@@ -96,16 +96,7 @@ class DocumentIndexService:
             raise
 
     def _embed_chunks(self, texts: list[str]) -> list[list[float]]:
-        embeddings: list[list[float]] = []
-        for batch_start in range(0, len(texts), EMBED_BATCH_SIZE):
-            batch = texts[batch_start : batch_start + EMBED_BATCH_SIZE]
-            response = self._llm.embed(
-                model=self.settings.embed_model,
-                input=batch,
-            )
-            for item in response.data:
-                embeddings.append(list(item.embedding))
-        return embeddings
+        return self._embeddings.embed_texts(texts)
 
     def _overwrite_chunks(
         self,
@@ -183,16 +174,13 @@ class DocumentSearchService:
             raise DocumentProcessingError("OpenAI API key is required for queries")
         if not settings.embed_model:
             raise DocumentProcessingError("EMBED_MODEL is required for queries")
-        self._llm = get_llm_client()
+        self._embeddings = get_embedding_service()
 
     def embed_query(self, query: str) -> list[float]:
-        response = self._llm.embed(
-            model=self.settings.embed_model,
-            input=query,
-        )
-        if not response.data:
+        embedding = self._embeddings.embed_query(query)
+        if not embedding:
             raise DocumentProcessingError("OpenAI embedding response was empty")
-        return list(response.data[0].embedding)
+        return embedding
 
     def fetch_top_chunks(
         self,
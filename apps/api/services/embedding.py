@@ -0,0 +1,310 @@
+"""
+Batch embedding service shared by document indexing and query embedding.
+
+- Texts are deduplicated and looked up by sha256 content hash (the same hash
+  as ``ChunkingStrategy.compute_source_hash``) in ``tb_embedding_cache``, so
+  reindexing only embeds chunks whose text changed. Query embeddings read
+  the cache but are never written to it, since the table has no expiry and
+  one-off questions would otherwise accumulate forever.
+- Misses are split into batches that are sent concurrently, each admitted by
+  a requests/tokens-per-minute budget and retried with exponential backoff
+  on rate-limit and transient errors.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+from core.config import AppSettings, get_settings
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+_RETRYABLE_ERRORS = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+}
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token is close enough for budgeting
+    return len(text) // 4 + 1
+
+
+class EmbeddingCacheStore(Protocol):
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, List[float]]: ...
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]) -> None: ...
+
+
+class PgEmbeddingCache:
+    """Content-hash -> vector cache in ``tb_embedding_cache``"""
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, List[float]]:
+        from core.db import get_session_context
+        from sqlalchemy import bindparam, text
+
+        if not hashes:
+            return {}
+        statement = text(
+            """
+            SELECT content_hash, embedding::text
+            FROM tb_embedding_cache
+            WHERE model = :model AND content_hash IN :hashes
+            """
+        ).bindparams(bindparam("hashes", expanding=True))
+        with get_session_context() as session:
+            rows = session.execute(
+                statement, {"model": model, "hashes": list(hashes)}
+            ).all()
+        return {row[0]: _parse_vector(row[1]) for row in rows}
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]) -> None:
+        from core.db import get_session_context
+        from sqlalchemy import text
+
+        if not vectors:
+            return
+        with get_session_context() as session:
+            session.execute(
+                text(
+                    """
+                    INSERT INTO tb_embedding_cache (model, content_hash, embedding)
+                    VALUES (:model, :content_hash, CAST(:embedding AS vector))
+                    ON CONFLICT (model, content_hash) DO NOTHING
+                    """
+                ),
+                [
+                    {
+                        "model": model,
+                        "content_hash": key,
+                        "embedding": "[" + ",".join(map(str, vector)) + "]",
+                    }
+                    for key, vector in vectors.items()
+                ],
+            )
+            session.commit()
+
+
+def _parse_vector(value: Any) -> List[float]:
+    if isinstance(value, str):
+        return [float(item) for item in value.strip("[]").split(",") if item]
+    return [float(item) for item in value]
+
+
+class RateBudget:
+    """Sliding one-minute budget of requests and tokens, shared by threads"""
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.requests_per_minute = max(1, requests_per_minute)
+        self.tokens_per_minute = max(1, tokens_per_minute)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._window: deque[tuple[float, int]] = deque()
+        self._tokens = 0
+
+    def acquire(self, tokens: int) -> float:
+        """Block until a request of ``tokens`` fits; returns seconds waited"""
+        # A single request larger than the budget is admitted on an empty window
+        tokens = min(tokens, self.tokens_per_minute)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                while self._window and self._window[0][0] <= now - 60.0:
+                    self._tokens -= self._window.popleft()[1]
+                if (
+                    len(self._window) < self.requests_per_minute
+                    and self._tokens + tokens <= self.tokens_per_minute
+                ):
+                    self._window.append((now, tokens))
+                    self._tokens += tokens
+                    return waited
+                delay = max(0.01, self._window[0][0] + 60.0 - now)
+            self._sleep(delay)
+            waited += delay
+
+
+class EmbeddingService:
+    def __init__(
+        self,
+        settings: Optional[AppSettings] = None,
+        client: Any = None,
+        cache: Optional[EmbeddingCacheStore] = None,
+        budget: Optional[RateBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.settings = settings or get_settings()
+        if client is None:
+            from app.llm.client import get_llm_client
+
+            client = get_llm_client()
+        self._client = client
+        if cache is None and self.settings.embedding_cache_enabled:
+            cache = PgEmbeddingCache()
+        self._cache = cache
+        self._budget = budget or RateBudget(
+            self.settings.embedding_requests_per_minute,
+            self.settings.embedding_tokens_per_minute,
+        )
+        self._sleep = sleep
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "texts": 0,
+            "cache_hits": 0,
+            "embedded": 0,
+            "requests": 0,
+            "retries": 0,
+            "throttled_seconds": 0.0,
+        }
+
+    @property
+    def model(self) -> str:
+        return self.settings.embed_model
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_texts([text], store=False)[0]
+
+    def embed_texts(self, texts: Sequence[str], store: bool = True) -> List[List[float]]:
+        """
+        Embed ``texts`` in order, reusing cached vectors for unchanged text
+
+        ``store=False`` skips writing new vectors to the cache (query text).
+        """
+        if not texts:
+            return []
+        hashes = [content_hash(text) for text in texts]
+        unique: Dict[str, str] = dict(zip(hashes, texts))
+        vectors = self._cache_get(list(unique))
+        missing = [key for key in unique if key not in vectors]
+
+        if missing:
+            embedded = self._embed_missing([(key, unique[key]) for key in missing])
+            vectors.update(embedded)
+            if store:
+                self._cache_put(embedded)
+
+        self._count("texts", len(texts))
+        self._count("cache_hits", len(unique) - len(missing))
+        self._count("embedded", len(missing))
+        return [vectors[key] for key in hashes]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _embed_missing(self, items: List[tuple[str, str]]) -> Dict[str, List[float]]:
+        batch_size = max(1, self.settings.embedding_batch_size)
+        batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+        workers = max(1, min(self.settings.embedding_concurrency, len(batches)))
+        results: Dict[str, List[float]] = {}
+        if workers == 1:
+            for batch in batches:
+                results.update(self._embed_batch(batch))
+            return results
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as pool:
+            for embedded in pool.map(self._embed_batch, batches):
+                results.update(embedded)
+        return results
+
+    def _embed_batch(self, batch: List[tuple[str, str]]) -> Dict[str, List[float]]:
+        texts = [text for _, text in batch]
+        tokens = sum(estimate_tokens(text) for text in texts)
+        attempt = 0
+        while True:
+            self._count("throttled_seconds", self._budget.acquire(tokens))
+            self._count("requests")
+            try:
+                response = self._client.embed(model=self.model, input=texts)
+                break
+            except Exception as exc:
+                if attempt >= self.settings.embedding_max_retries or not _is_retryable(exc):
+                    raise
+                delay = _retry_after(exc) or min(
+                    30.0, (2**attempt) * (1 + random.random()) * 0.5
+                )
+                attempt += 1
+                self._count("retries")
+                logger.warning(
+                    "Embedding batch failed (%s); retry %s in %.2fs",
+                    exc,
+                    attempt,
+                    delay,
+                )
+                self._sleep(delay)
+
+        data = sorted(response.data, key=lambda item: getattr(item, "index", 0))
+        if len(data) != len(batch):
+            raise ValueError("Embedding response size does not match request")
+        return {key: list(item.embedding) for (key, _), item in zip(batch, data)}
+
+    def _cache_get(self, hashes: List[str]) -> Dict[str, List[float]]:
+        if self._cache is None:
+            return {}
+        try:
+            return self._cache.get_many(self.model, hashes)
+        except Exception as exc:
+            logger.warning("Embedding cache lookup failed: %s", exc)
+            return {}
+
+    def _cache_put(self, vectors: Dict[str, List[float]]) -> None:
+        if self._cache is None:
+            return
+        try:
+            self._cache.put_many(self.model, vectors)
+        except Exception as exc:
+            logger.warning("Embedding cache store failed: %s", exc)
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+
+def _is_retryable(exc: Exception) -> bool:
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status in _RETRYABLE_STATUS
+    return type(exc).__name__ in _RETRYABLE_ERRORS
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = EmbeddingService()
+    return _service
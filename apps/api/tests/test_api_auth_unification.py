@@ -6,6 +6,8 @@ PUBLIC_PATHS = {
     "/auth/login",
     "/auth/refresh",
     "/health",
+    # Guarded by METRICS_BEARER_TOKEN (Prometheus cannot send a JWT); 404 without it
+    "/metrics",
 }
 
 
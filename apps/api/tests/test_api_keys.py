@@ -277,6 +277,77 @@ class TestApiKeyScopes:
         assert has_scope(api_key, "api:write") is False
 
 
+class TestVerifiedKeyCache:
+    """Test the verified-key cache and write-behind last_used_at."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        from app.modules.api_keys import cache as key_cache_module
+
+        cache = key_cache_module.VerifiedKeyCache(max_entries=100, ttl_seconds=60)
+        buffer = key_cache_module.LastUsedBuffer(flush_seconds=60)
+        monkeypatch.setattr(key_cache_module, "_key_cache", cache)
+        monkeypatch.setattr(key_cache_module, "_last_used_buffer", buffer)
+        return cache, buffer
+
+    @pytest.fixture
+    def verify_calls(self, monkeypatch):
+        from app.modules.api_keys import crud
+
+        calls = []
+        original = crud.pwd_context.verify
+
+        def counting_verify(key, key_hash):
+            calls.append(key)
+            return original(key, key_hash)
+
+        monkeypatch.setattr(crud.pwd_context, "verify", counting_verify)
+        return calls
+
+    def test_repeat_validation_skips_bcrypt(
+        self, session: Session, test_user: TbUser, verify_calls, fresh_cache
+    ):
+        """Test that a cached key is not re-verified."""
+        api_key, full_key = create_api_key(session, test_user.id, "Cached", ["api:read"])
+
+        first = validate_api_key(session, full_key)
+        second = validate_api_key(session, full_key)
+
+        assert first.id == second.id == api_key.id
+        assert second.user_id == test_user.id
+        assert len(verify_calls) == 1
+        assert fresh_cache[0].stats()["hits"] == 1
+
+    def test_revoke_invalidates_cached_key(
+        self, session: Session, test_user: TbUser, verify_calls
+    ):
+        """Test that revoking a key drops it from the cache."""
+        api_key, full_key = create_api_key(session, test_user.id, "Revoked", ["api:read"])
+        assert validate_api_key(session, full_key) is not None
+
+        revoke_api_key(session, api_key.id, test_user.id)
+
+        assert validate_api_key(session, full_key) is None
+
+    def test_wrong_key_is_not_served_from_cache(self, session: Session, test_user: TbUser):
+        """Test that a different key with the same prefix is still verified."""
+        _, full_key = create_api_key(session, test_user.id, "Prefix", ["api:read"])
+        assert validate_api_key(session, full_key) is not None
+
+        assert validate_api_key(session, full_key[:-1] + "x") is None
+
+    def test_last_used_is_buffered(self, session: Session, test_user: TbUser, fresh_cache):
+        """Test that last_used_at is buffered rather than committed per call."""
+        api_key, full_key = create_api_key(session, test_user.id, "Buffered", ["api:read"])
+
+        validate_api_key(session, full_key)
+        validate_api_key(session, full_key)
+
+        session.refresh(api_key)
+        assert api_key.last_used_at is None
+        assert list(fresh_cache[1].pending()) == [api_key.id]
+
+
 class TestApiKeysRouter:
     """Test API Keys REST endpoints."""
 
@@ -0,0 +1,157 @@
+"""
+Script Sandbox Pool Tests
+
+Tests for pre-warmed script sandbox workers (real worker processes):
+- Workers are fork servers: one warm server, a fresh child per call
+- Patches a script makes to the runner or stdlib never reach later calls
+- Script errors, print() and child crashes do not break the frame protocol
+- Timeouts kill the worker together with its running child
+- Workers retired after max_executions; worker stderr is logged
+"""
+
+import json
+import logging
+import os
+import subprocess
+import time
+
+import pytest
+from app.modules.api_manager.sandbox_pool import SandboxPool
+
+
+def _payload(script, timeout_ms=5000):
+    return {
+        "script": script,
+        "params": {"x": 2},
+        "input": None,
+        "policy": {},
+        "base_url": "http://127.0.0.1:8000",
+        "executed_by": "tester",
+        "timeout_ms": timeout_ms,
+        "max_response_bytes": 1_048_576,
+    }
+
+
+PID_SCRIPT = """
+import os
+def main(params, input, ctx):
+    print("noise on stdout")
+    return {"pid": os.getpid(), "double": params["x"] * 2}
+"""
+
+
+@pytest.fixture
+def pool():
+    pool = SandboxPool(min_size=0, max_size=2, max_executions=3)
+    yield pool
+    pool.shutdown()
+
+
+def _run(pool, script, timeout=5.0):
+    result = pool.execute(_payload(script), timeout)
+    return result.returncode, json.loads(result.stdout) if result.stdout else None
+
+
+TAMPER_SCRIPT = """
+import socket
+import sys
+def main(params, input, ctx):
+    runner = sys.modules["__main__"]
+    runner.ScriptHttpClient._ensure_not_private = lambda self, host: None
+    runner.DISALLOWED_MODULES.clear()
+    socket.getaddrinfo = lambda *a, **k: []
+    sys.meta_path.pop(0)
+    return {}
+"""
+
+INTACT_SCRIPT = """
+import socket
+import sys
+def main(params, input, ctx):
+    runner = sys.modules["__main__"]
+    return {
+        "guard_patched": runner.ScriptHttpClient._ensure_not_private.__name__ == "<lambda>",
+        "blocked": sorted(runner.DISALLOWED_MODULES),
+        "dns_patched": socket.getaddrinfo.__name__ == "<lambda>",
+        "hook_first": type(sys.meta_path[0]).__name__,
+    }
+"""
+
+
+class TestSandboxPool:
+    def test_each_call_runs_in_fresh_child_of_one_server(self, pool):
+        code, first = _run(pool, PID_SCRIPT)
+        _, second = _run(pool, PID_SCRIPT)
+
+        assert code == 0
+        assert first["output"]["double"] == 4
+        assert first["output"]["pid"] != second["output"]["pid"]
+        assert pool.stats()["spawned"] == 1
+
+    def test_blocked_import_reported_as_failure(self, pool):
+        code, body = _run(pool, "import sqlalchemy\ndef main(p, i, c):\n    return {}")
+
+        assert code == 1
+        assert "prohibited" in body["error"]
+        assert _run(pool, PID_SCRIPT)[0] == 0
+
+    def test_tampering_does_not_leak_into_later_calls(self, pool):
+        assert _run(pool, TAMPER_SCRIPT)[0] == 0
+        code, body = _run(pool, INTACT_SCRIPT)
+
+        assert code == 0
+        assert body["output"] == {
+            "guard_patched": False,
+            "blocked": ["asyncpg", "pg8000", "psycopg", "pymysql", "pyodbc", "sqlalchemy"],
+            "dns_patched": False,
+            "hook_first": "BlockedImportFinder",
+        }
+        assert pool.stats()["spawned"] == 1
+
+    def test_killed_child_reported_and_server_kept(self, pool):
+        code, body = _run(pool, "import os\ndef main(p, i, c):\n    os.kill(os.getpid(), 9)")
+
+        assert code == 1
+        assert "SIGKILL" in body["error"]
+        assert _run(pool, PID_SCRIPT)[0] == 0
+        assert pool.stats()["spawned"] == 1
+
+    def test_timeout_kills_worker_and_child(self, pool, tmp_path):
+        pid_file = tmp_path / "child.pid"
+        script = (
+            "import os, time\n"
+            "def main(p, i, c):\n"
+            f"    open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+            "    time.sleep(30)"
+        )
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run(pool, script, timeout=1.0)
+
+        child = int(pid_file.read_text())
+        for _ in range(50):
+            try:
+                os.kill(child, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("script child survived the worker")
+        assert _run(pool, PID_SCRIPT)[0] == 0
+        assert pool.stats()["timeouts"] == 1
+
+    def test_recycled_after_max_executions(self, pool):
+        for _ in range(4):
+            _run(pool, PID_SCRIPT)
+
+        assert pool.stats()["spawned"] == 2
+
+    def test_worker_stderr_is_logged(self, pool, caplog):
+        caplog.set_level(logging.WARNING, logger="app.modules.api_manager.sandbox_pool")
+        script = "import sys\ndef main(p, i, c):\n    print('to stderr', file=sys.stderr)\n    return {}"
+        _run(pool, script)
+
+        for _ in range(50):
+            if "to stderr" in caplog.text:
+                break
+            time.sleep(0.05)
+        assert "to stderr" in caplog.text
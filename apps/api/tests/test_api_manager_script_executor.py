@@ -29,7 +29,7 @@ def test_execute_script_api_requires_allow_runtime(mock_log: Mock):
 
 
 @patch("app.modules.api_manager.script_executor.record_exec_log")
-@patch("app.modules.api_manager.script_executor.subprocess.run")
+@patch("app.modules.api_manager.script_executor.run_script_runner")
 def test_execute_script_api_success(mock_run: Mock, mock_log: Mock):
     payload = {
         "status": "success",
@@ -63,7 +63,7 @@ def test_execute_script_api_success(mock_run: Mock, mock_log: Mock):
 
 
 @patch("app.modules.api_manager.script_executor.record_exec_log")
-@patch("app.modules.api_manager.script_executor.subprocess.run")
+@patch("app.modules.api_manager.script_executor.run_script_runner")
 def test_execute_script_api_runner_timeout(mock_run: Mock, mock_log: Mock):
     mock_run.side_effect = subprocess.TimeoutExpired(cmd=["python"], timeout=1)
     session = Mock(spec=Session)
@@ -84,7 +84,7 @@ def test_execute_script_api_runner_timeout(mock_run: Mock, mock_log: Mock):
 
 
 @patch("app.modules.api_manager.script_executor.record_exec_log")
-@patch("app.modules.api_manager.script_executor.subprocess.run")
+@patch("app.modules.api_manager.script_executor.run_script_runner")
 def test_execute_script_api_runner_returns_nonzero(mock_run: Mock, mock_log: Mock):
     mock_run.return_value = SimpleNamespaceLike(
         returncode=1,
@@ -109,7 +109,7 @@ def test_execute_script_api_runner_returns_nonzero(mock_run: Mock, mock_log: Moc
 
 
 @patch("app.modules.api_manager.script_executor.record_exec_log")
-@patch("app.modules.api_manager.script_executor.subprocess.run")
+@patch("app.modules.api_manager.script_executor.run_script_runner")
 def test_execute_script_api_invalid_runner_json(mock_run: Mock, mock_log: Mock):
     mock_run.return_value = SimpleNamespaceLike(
         returncode=0,
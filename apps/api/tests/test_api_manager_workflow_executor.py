@@ -151,3 +151,152 @@ def test_execute_workflow_api_node_not_found_logs_failure(
     assert "not found" in str(exc.value.detail)
     assert mock_log.call_count == 1
     assert mock_step_log.call_count == 0
+
+
+def _sql_result(rows):
+    return ApiExecuteResponse(
+        executed_sql="SELECT 1",
+        params={},
+        columns=["id"],
+        rows=rows,
+        row_count=len(rows),
+        duration_ms=1,
+    )
+
+
+def _dag_session(*api_ids: str):
+    session = Mock(spec=Session)
+    apis = {api_id: _node_api(api_id, f"SELECT '{api_id}'") for api_id in api_ids}
+    session.get.side_effect = lambda _model, api_id: apis.get(api_id)
+    return session
+
+
+@patch("app.modules.api_manager.workflow_executor.Session")
+@patch("app.modules.api_manager.workflow_executor.record_exec_step")
+@patch("app.modules.api_manager.workflow_executor.record_exec_log")
+@patch("app.modules.api_manager.workflow_executor.execute_sql_api")
+def test_execute_workflow_api_runs_independent_nodes_in_parallel(
+    mock_exec_sql: Mock, mock_log: Mock, mock_step_log: Mock, mock_session_cls: Mock
+):
+    import threading
+    import time
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+    started: list[str] = []
+
+    def run_sql(**kwargs):
+        with lock:
+            started.append(kwargs["api_id"])
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return _sql_result([{"id": kwargs["api_id"]}])
+
+    mock_exec_sql.side_effect = run_sql
+    mock_log.return_value = SimpleNamespace(exec_id="exec-1")
+    spec = {
+        "version": 1,
+        "max_concurrency": 2,
+        "nodes": [
+            {"id": "a", "type": "sql", "api_id": "api-a"},
+            {"id": "b", "type": "sql", "api_id": "api-b"},
+            {"id": "c", "type": "sql", "api_id": "api-c"},
+            {
+                "id": "join",
+                "type": "sql",
+                "api_id": "api-join",
+                "params": {
+                    "a": "{{steps.a.output.rows}}",
+                    "c": "{{steps.c.output.rows}}",
+                },
+                "depends_on": ["b"],
+            },
+        ],
+    }
+
+    result = execute_workflow_api(
+        session=_dag_session("api-a", "api-b", "api-c", "api-join"),
+        workflow_api=_workflow_api(spec),
+        params={},
+        input_payload=None,
+        executed_by="tester",
+        limit=10,
+    )
+
+    assert active["peak"] == 2
+    assert started[-1] == "api-join"
+    assert [step.node_id for step in result.steps] == ["a", "b", "c", "join"]
+    assert result.final_output == {"columns": ["id"], "rows": [{"id": "api-join"}]}
+    join_params = mock_exec_sql.call_args_list[-1].kwargs["params"]
+    assert join_params == {"a": [{"id": "api-a"}], "c": [{"id": "api-c"}]}
+    assert mock_step_log.call_count == 4
+    # Parallel nodes each get (and close) their own session
+    assert mock_session_cls.call_count >= 2
+    assert mock_session_cls.return_value.close.call_count == mock_session_cls.call_count
+
+
+@patch("app.modules.api_manager.workflow_executor.record_exec_step")
+@patch("app.modules.api_manager.workflow_executor.record_exec_log")
+def test_execute_workflow_api_rejects_cycles(mock_log: Mock, mock_step_log: Mock):
+    mock_log.return_value = SimpleNamespace(exec_id="exec-1")
+    spec = {
+        "version": 1,
+        "nodes": [
+            {"id": "a", "type": "sql", "api_id": "api-a", "params": {"x": "{{steps.b.rows}}"}},
+            {"id": "b", "type": "sql", "api_id": "api-b", "params": {"x": "{{steps.a.rows}}"}},
+        ],
+    }
+    with pytest.raises(HTTPException) as exc:
+        execute_workflow_api(
+            session=_dag_session("api-a", "api-b"),
+            workflow_api=_workflow_api(spec),
+            params={},
+            input_payload=None,
+            executed_by="tester",
+            limit=10,
+        )
+    assert exc.value.status_code == 400
+    assert "circular" in str(exc.value.detail)
+    assert mock_step_log.call_count == 0
+
+
+@patch("app.modules.api_manager.workflow_executor.Session")
+@patch("app.modules.api_manager.workflow_executor.record_exec_step")
+@patch("app.modules.api_manager.workflow_executor.record_exec_log")
+@patch("app.modules.api_manager.workflow_executor.execute_sql_api")
+def test_execute_workflow_api_failure_skips_dependents(
+    mock_exec_sql: Mock, mock_log: Mock, mock_step_log: Mock, _mock_session_cls: Mock
+):
+    def run_sql(**kwargs):
+        if kwargs["api_id"] == "api-a":
+            raise RuntimeError("boom")
+        return _sql_result([])
+
+    mock_exec_sql.side_effect = run_sql
+    mock_log.return_value = SimpleNamespace(exec_id="exec-1")
+    spec = {
+        "version": 1,
+        "nodes": [
+            {"id": "a", "type": "sql", "api_id": "api-a"},
+            {"id": "b", "type": "sql", "api_id": "api-b"},
+            {"id": "c", "type": "sql", "api_id": "api-c", "depends_on": ["a"]},
+        ],
+    }
+    with pytest.raises(HTTPException) as exc:
+        execute_workflow_api(
+            session=_dag_session("api-a", "api-b", "api-c"),
+            workflow_api=_workflow_api(spec),
+            params={},
+            input_payload=None,
+            executed_by="tester",
+            limit=10,
+        )
+    assert exc.value.status_code == 500
+    called = {call.kwargs["api_id"] for call in mock_exec_sql.call_args_list}
+    assert called == {"api-a", "api-b"}
+    assert mock_log.call_args.kwargs["status"] == "fail"
+    logged = [call.kwargs["node_id"] for call in mock_step_log.call_args_list]
+    assert logged == ["a", "b"]
@@ -0,0 +1,165 @@
+"""
+Asset Registry Loader Cache Tests
+
+Tests for the read-through asset cache:
+- Repeated loads are served from cache
+- Inspector track hooks still fire on cache hits
+- Commits touching tb_asset_registry invalidate the asset type
+- Generation guard prevents storing payloads loaded before an invalidation
+- Redis invalidation messages from other workers are applied
+"""
+
+import json
+from contextlib import contextmanager
+
+import pytest
+from app.modules.asset_registry import cache as asset_cache_module
+from app.modules.asset_registry import loader
+from app.modules.asset_registry.cache import AssetCache, AssetCacheKey
+from app.modules.asset_registry.models import TbAssetRegistry
+from app.modules.inspector.asset_context import (
+    end_stage_asset_tracking,
+    reset_asset_context,
+)
+from sqlmodel import Session
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = AssetCache(max_entries=100, ttl_seconds=60)
+    monkeypatch.setattr(asset_cache_module, "_asset_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def loader_session(monkeypatch, test_engine):
+    calls = {"count": 0}
+
+    @contextmanager
+    def _session_context():
+        calls["count"] += 1
+        with Session(test_engine) as session:
+            yield session
+
+    monkeypatch.setattr(loader, "get_session_context", _session_context)
+    yield calls
+    # Loads track assets in inspector (and stage) context; don't leak them into other tests
+    reset_asset_context()
+    end_stage_asset_tracking()
+
+
+def _add_source(session: Session, host: str = "db1") -> TbAssetRegistry:
+    asset = TbAssetRegistry(
+        asset_type="source",
+        name="primary_postgres",
+        status="published",
+        content={
+            "source_type": "postgresql",
+            "connection": {"host": host, "port": 5432, "username": "u"},
+        },
+    )
+    session.add(asset)
+    session.commit()
+    session.refresh(asset)
+    return asset
+
+
+def test_source_asset_served_from_cache(session, fresh_cache, loader_session, monkeypatch):
+    _add_source(session)
+    tracked = []
+    monkeypatch.setattr(loader, "track_source_asset_to_stage", tracked.append)
+
+    first = loader.load_source_asset("primary_postgres")
+    second = loader.load_source_asset("primary_postgres")
+
+    assert first == second
+    assert loader_session["count"] == 1
+    assert len(tracked) == 2
+    stats = fresh_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["by_asset_type"]["source"] == {"hits": 1, "misses": 1}
+
+
+def test_cached_payload_is_isolated_from_caller_mutation(session, fresh_cache, loader_session):
+    _add_source(session)
+
+    first = loader.load_source_asset("primary_postgres")
+    first["connection"]["host"] = "mutated"
+
+    assert loader.load_source_asset("primary_postgres")["connection"]["host"] == "db1"
+
+
+def test_commit_on_asset_row_invalidates_type(session, fresh_cache, loader_session, monkeypatch):
+    asset = _add_source(session)
+    invalidated_pools = []
+    monkeypatch.setattr(
+        "app.modules.ops.services.connections.invalidate_source_pools",
+        invalidated_pools.append,
+    )
+
+    assert loader.load_source_asset("primary_postgres")["connection"]["host"] == "db1"
+
+    asset.content = {
+        "source_type": "postgresql",
+        "connection": {"host": "db2", "port": 5432, "username": "u"},
+    }
+    session.add(asset)
+    session.commit()
+
+    assert loader.load_source_asset("primary_postgres")["connection"]["host"] == "db2"
+    assert loader_session["count"] == 2
+    assert invalidated_pools == ["primary_postgres"]
+
+
+def test_missing_asset_is_not_cached(fresh_cache, loader_session):
+    with pytest.raises(ValueError):
+        loader.load_source_asset("does_not_exist")
+    with pytest.raises(ValueError):
+        loader.load_source_asset("does_not_exist")
+
+    assert loader_session["count"] == 2
+    assert fresh_cache.stats()["size"] == 0
+
+
+def test_put_skips_payload_loaded_before_invalidation():
+    cache = AssetCache()
+    key = AssetCacheKey("tool", None, "metric_tool")
+    generation = cache.generation("tool")
+
+    cache.invalidate("tool")
+    cache.put(key, ({"name": "metric_tool"}, None), generation)
+
+    assert cache.get(key) is None
+    assert cache.stats()["stale_skips"] == 1
+
+
+def test_lru_eviction_respects_max_entries():
+    cache = AssetCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        key = AssetCacheKey("prompt", "ops", name)
+        cache.put(key, ({"name": name}, None), cache.generation("prompt"))
+
+    assert cache.get(AssetCacheKey("prompt", "ops", "a")) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_remote_invalidation_message_is_applied(fresh_cache):
+    key = AssetCacheKey("policy", None, "plan_budget")
+    fresh_cache.put(key, ({"content": {}}, None), fresh_cache.generation("policy"))
+
+    bus = asset_cache_module.AssetInvalidationBus("test-channel")
+    bus._handle(json.dumps({"origin": "other-worker", "asset_types": ["policy"], "source_names": []}))
+
+    assert fresh_cache.get(key) is None
+    assert fresh_cache.stats()["remote_invalidations"] == 1
+
+
+def test_own_invalidation_message_is_ignored(fresh_cache):
+    key = AssetCacheKey("policy", None, "plan_budget")
+    fresh_cache.put(key, ({"content": {}}, None), fresh_cache.generation("policy"))
+
+    bus = asset_cache_module.AssetInvalidationBus("test-channel")
+    bus._handle(json.dumps({"origin": bus.origin, "asset_types": ["policy"]}))
+
+    assert fresh_cache.get(key) is not None
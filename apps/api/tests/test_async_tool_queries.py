@@ -0,0 +1,212 @@
+"""
+Async Tool Query Tests
+
+Tests for the non-blocking DynamicTool database/graph execution path:
+- Async source pool reuse, max_size enforcement and shared mode
+- Async pools pre-warm to min_size and prune idle resources
+- Async pools are only handed out on the bound serving loop
+- Request timeout budget scoping and per-query timeout derivation
+- Off-loop (thread) execution cancels the server-side query on timeout
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.modules.ops.services.connections.async_pool import (
+    AsyncConnectionPoolRegistry,
+    AsyncSourceConnectionPool,
+)
+from app.modules.ops.services.connections.pool import PoolConfig
+from app.modules.ops.services.orchestration.tools.dynamic_tool import DynamicTool
+from app.modules.ops.services.orchestration.tools.request_timeout import (
+    RequestTimeoutError,
+    TimeoutBudget,
+    TimeoutPhase,
+    get_current_timeout_budget,
+    remaining_timeout_seconds,
+    timeout_budget_scope,
+)
+
+
+class _Resource:
+    def __init__(self, ident: int):
+        self.ident = ident
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _make_pool(shared: bool = False, **config):
+    opened = []
+
+    async def opener():
+        resource = _Resource(len(opened))
+        opened.append(resource)
+        return resource
+
+    async def closer(resource):
+        await resource.close()
+
+    pool = AsyncSourceConnectionPool(
+        key="src:abc",
+        source_name="src",
+        source_type="postgresql",
+        opener=opener,
+        closer=closer,
+        config=PoolConfig(**config),
+        shared=shared,
+    )
+    return pool, opened
+
+
+class TestAsyncSourceConnectionPool:
+    @pytest.mark.asyncio
+    async def test_released_resource_is_reused(self):
+        pool, opened = _make_pool()
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+
+        assert first is second
+        assert len(opened) == 1
+        assert pool.stats()["reused"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_times_out(self):
+        pool, _ = _make_pool(max_size=1, acquire_timeout_seconds=0.05)
+        await pool.acquire()
+
+        with pytest.raises(ConnectionError, match="exhausted"):
+            await pool.acquire()
+
+    @pytest.mark.asyncio
+    async def test_discarded_resource_is_closed(self):
+        pool, opened = _make_pool()
+
+        resource = await pool.acquire()
+        await pool.release(resource, discard=True)
+
+        assert opened[0].closed is True
+        assert pool.stats()["idle"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_mode_hands_out_one_driver(self):
+        pool, opened = _make_pool(shared=True)
+
+        a, b = await asyncio.gather(pool.acquire(), pool.acquire())
+
+        assert a is b
+        assert len(opened) == 1
+        assert pool.stats()["in_use"] == 2
+
+
+    @pytest.mark.asyncio
+    async def test_warm_and_prune_keep_min_size(self):
+        pool, opened = _make_pool(min_size=1, idle_timeout_seconds=0.0001)
+
+        assert await pool.warm() == 1
+        extra = [await pool.acquire(), await pool.acquire()]
+        for resource in extra:
+            await pool.release(resource)
+        await asyncio.sleep(0.01)
+
+        assert await pool.prune() == 1
+        assert pool.stats()["idle"] == 1
+        assert len(opened) == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_does_not_exceed_max_size(self):
+        pool, opened = _make_pool(min_size=1, max_size=1)
+        held = await pool.acquire()
+
+        assert await pool.warm() == 0
+        assert len(opened) == 1
+        await pool.release(held)
+
+
+class TestAsyncConnectionPoolRegistry:
+    @pytest.mark.asyncio
+    async def test_pools_require_serving_loop(self):
+        registry = AsyncConnectionPoolRegistry()
+
+        assert registry.is_serving_loop() is False
+        with pytest.raises(RuntimeError):
+            registry.get_pool({"name": "src"}, opener=None, closer=None)
+
+        registry.bind(asyncio.get_running_loop())
+        assert registry.is_serving_loop() is True
+
+    @pytest.mark.asyncio
+    async def test_invalidate_retires_and_closes_pool(self):
+        registry = AsyncConnectionPoolRegistry()
+        registry.bind(asyncio.get_running_loop())
+        opened = []
+
+        async def opener():
+            opened.append(_Resource(len(opened)))
+            return opened[-1]
+
+        async def closer(resource):
+            await resource.close()
+
+        pool = registry.get_pool(
+            {"name": "src", "source_type": "postgresql"}, opener=opener, closer=closer
+        )
+        await pool.release(await pool.acquire())
+
+        assert registry.invalidate("src") == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert opened[0].closed is True
+        with pytest.raises(ConnectionError, match="closed"):
+            await pool.acquire()
+
+
+class TestTimeoutBudgetScope:
+    def test_outer_budget_wins(self):
+        outer = TimeoutBudget(total_timeout_ms=1000)
+
+        with timeout_budget_scope(outer):
+            with timeout_budget_scope(TimeoutBudget(total_timeout_ms=99999)) as active:
+                assert active is outer
+        assert get_current_timeout_budget() is None
+
+    def test_remaining_is_capped_by_budget(self):
+        assert remaining_timeout_seconds(TimeoutPhase.EXECUTE, 30.0) == 30.0
+
+        with timeout_budget_scope(TimeoutBudget(total_timeout_ms=2000)):
+            assert remaining_timeout_seconds(TimeoutPhase.EXECUTE, 30.0) <= 2.0
+
+    def test_exhausted_budget_raises(self):
+        budget = TimeoutBudget(total_timeout_ms=1)
+        time.sleep(0.01)
+
+        with timeout_budget_scope(budget):
+            with pytest.raises(RequestTimeoutError):
+                remaining_timeout_seconds(TimeoutPhase.EXECUTE, 30.0)
+
+
+class TestDynamicToolOffLoopExecution:
+    @pytest.mark.asyncio
+    async def test_slow_query_is_cancelled_on_timeout(self):
+        tool = DynamicTool({"name": "slow", "tool_type": "database_query", "tool_config": {}})
+        connection = MagicMock()
+        connection.execute.side_effect = lambda *_args: time.sleep(0.5)
+
+        with patch(
+            "app.modules.ops.services.orchestration.tools.dynamic_tool.ConnectionFactory.create",
+            return_value=connection,
+        ):
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                await tool._run_sql(
+                    {"name": "pg", "source_type": "postgresql"}, "SELECT pg_sleep(1)", [], 0.05
+                )
+
+        assert time.monotonic() - started < 0.4
+        connection.cancel.assert_called_once()
@@ -0,0 +1,123 @@
+"""
+Shared Cache Core Tests
+
+Tests for LRUTTLCache used by ToolResultCache and CICache:
+- O(1) LRU eviction by entry count
+- Memory budget eviction and oversized value rejection
+- Timer wheel expiry of entries that are never read again
+- Lock striping keeps per-stripe budgets
+"""
+
+import time
+
+import pytest
+from app.modules.ops.services.orchestration.services.cache_core import (
+    LRUTTLCache,
+    TimerWheel,
+)
+from app.modules.ops.services.orchestration.tools.cache import ToolResultCache
+
+
+class TestLRUTTLCacheEviction:
+    """Entry-count and byte-budget eviction"""
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = LRUTTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_memory_budget_evicts_lru_entries(self):
+        cache = LRUTTLCache(max_entries=100, max_bytes=200, size_of=len)
+        cache.set("a", "x" * 90)
+        cache.set("b", "x" * 90)
+        cache.set("c", "x" * 90)
+
+        assert cache.contains("a") is False
+        assert cache.contains("c") is True
+        assert cache.size_bytes <= 200
+
+    def test_oversized_value_is_rejected(self):
+        cache = LRUTTLCache(max_entries=100, max_bytes=50, size_of=len)
+
+        assert cache.set("big", "x" * 100) is False
+        assert len(cache) == 0
+        assert cache.stats()["rejected"] == 1
+
+    def test_replacing_key_updates_byte_accounting(self):
+        cache = LRUTTLCache(max_entries=10, size_of=len)
+        cache.set("a", "x" * 50)
+        cache.set("a", "x" * 10)
+
+        assert len(cache) == 1
+        assert cache.size_bytes == 10 + len("a")
+
+
+class TestLRUTTLCacheExpiry:
+    """Lazy TTL expiry"""
+
+    def test_expired_entry_is_not_returned(self):
+        cache = LRUTTLCache(max_entries=10)
+        cache.set("a", 1, ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_timer_wheel_reaps_unread_entries(self):
+        cache = LRUTTLCache(max_entries=100)
+        for i in range(10):
+            cache.set(f"k{i}", i, ttl_seconds=0.01)
+        time.sleep(1.1)
+
+        # Any write advances the wheel and drops the due entries
+        cache.set("fresh", 1, ttl_seconds=60)
+
+        assert len(cache) == 1
+        assert cache.stats()["expirations"] == 10
+
+    def test_timer_wheel_returns_due_keys_once(self):
+        wheel = TimerWheel(resolution_seconds=1.0, slots=8)
+        now = time.monotonic()
+        wheel.schedule("a", now + 1.5)
+
+        assert wheel.advance(now) == []
+        assert wheel.advance(now + 3) == ["a"]
+        assert wheel.advance(now + 4) == []
+
+
+class TestLRUTTLCacheStriping:
+    """Lock striping"""
+
+    def test_small_caches_use_single_stripe(self):
+        assert LRUTTLCache(max_entries=10).stats()["stripes"] == 1
+
+    def test_large_cache_respects_total_entry_budget(self):
+        cache = LRUTTLCache(max_entries=1024, stripes=16)
+        for i in range(5000):
+            cache.set(f"k{i}", i)
+
+        stats = cache.stats()
+        assert stats["stripes"] == 16
+        assert stats["size"] <= 1024
+
+
+class TestToolResultCache:
+    """ToolResultCache on the shared core"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = ToolResultCache(max_size=2)
+        await cache.set("a", {"rows": [1]})
+        await cache.set("b", {"rows": [2]})
+        await cache.get("a")
+        await cache.set("c", {"rows": [3]})
+
+        assert await cache.contains("a") is True
+        assert await cache.contains("b") is False
+        assert cache.get_stats()["evictions"] == 1
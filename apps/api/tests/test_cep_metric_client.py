@@ -0,0 +1,110 @@
+"""
+CEP Metric Client Tests
+
+Tests for the shared async runtime client used by metric polling:
+- Identical requests in one poll tick share a single HTTP call
+- Different params / new ticks issue their own calls
+- Per-host concurrency limit is enforced
+- Prefetched runtime payloads are evaluated without another fetch
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from app.modules.cep_builder.executor.metric_client import RuntimeMetricClient
+from app.modules.cep_builder.executor.metric_executor import _evaluate_metric_trigger
+
+
+def _client(handler, per_host_limit: int = 20) -> RuntimeMetricClient:
+    return RuntimeMetricClient(
+        timeout=1.0,
+        per_host_limit=per_host_limit,
+        http2=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestMetricPollTick:
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_coalesced(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"cpu": 91})
+
+        client = _client(handler)
+        tick = client.tick()
+        url = "http://runtime/metrics"
+
+        results = await asyncio.gather(
+            *(tick.fetch(url, "GET", {"host": "web-01"}) for _ in range(10)),
+            tick.fetch(url, "GET", {"host": "web-02"}),
+        )
+
+        assert len(calls) == 2
+        assert results[0] == {"cpu": 91}
+        assert tick.request_count == 2
+        assert tick.coalesced == 9
+
+        await client.tick().fetch(url, "GET", {"host": "web-01"})
+        assert len(calls) == 3
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        client = _client(lambda request: httpx.Response(503))
+        tick = client.tick()
+
+        results = await asyncio.gather(
+            tick.fetch("http://runtime/m", "GET", {}),
+            tick.fetch("http://runtime/m", "GET", {}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        await client.aclose()
+
+
+class TestRuntimeMetricClient:
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={})
+
+        client = _client(handler, per_host_limit=2)
+
+        await asyncio.gather(
+            *(client.fetch("http://runtime/m", "GET", {"i": i}) for i in range(6))
+        )
+
+        assert peak == 2
+        assert client.stats()["requests"] == 6
+        await client.aclose()
+
+
+class TestPrefetchedEvaluation:
+    def test_runtime_payload_is_used_without_fetch(self):
+        spec = {
+            "endpoint": "http://runtime/metrics",
+            "value_path": "cpu",
+            "op": ">",
+            "threshold": 80,
+        }
+
+        matched, refs = _evaluate_metric_trigger(spec, None, runtime_payload={"cpu": 91})
+
+        assert matched is True
+        assert refs["runtime_prefetched"] is True
+        assert refs["used_test_payload"] is False
+        assert refs["actual_value"] == 91.0
@@ -0,0 +1,120 @@
+"""
+CEP Metric Poll Queue Tests
+
+Tests for the due-time priority queue behind the metric poll loop:
+- Only due rules are popped; each is rescheduled one interval later
+- Per-rule poll_interval_seconds with the global interval as the floor
+- Incremental upsert/remove and full sync (deleted / deactivated rules)
+- Tick limit leaves a backlog; lag is reported for late ticks
+- Jitter spreads rules that share an interval
+"""
+
+import random
+import uuid
+from types import SimpleNamespace
+
+from app.modules.cep_builder.metric_poll_queue import (
+    MetricPollQueue,
+    rule_poll_interval,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _rule(poll_interval=None, is_active=True, trigger_type="metric", rule_id=None):
+    spec = {"poll_interval_seconds": poll_interval} if poll_interval else {}
+    return SimpleNamespace(
+        rule_id=rule_id or uuid.uuid4(),
+        rule_name="r",
+        trigger_type=trigger_type,
+        trigger_spec=spec,
+        is_active=is_active,
+    )
+
+
+def _queue(clock, jitter_ratio=0.0):
+    return MetricPollQueue(10, jitter_ratio=jitter_ratio, clock=clock, rng=random.Random(0))
+
+
+class TestRulePollInterval:
+    def test_global_interval_is_the_floor(self):
+        assert rule_poll_interval(_rule(), 10) == 10
+        assert rule_poll_interval(_rule(poll_interval=60), 10) == 60
+        assert rule_poll_interval(_rule(poll_interval=2), 10) == 10
+        assert rule_poll_interval(_rule(poll_interval="bogus"), 10) == 10
+
+
+class TestMetricPollQueue:
+    def test_pops_only_due_rules_and_reschedules(self):
+        clock = _Clock()
+        queue = _queue(clock)
+        fast, slow = _rule(), _rule(poll_interval=30)
+        queue.sync([fast, slow])
+
+        assert queue.pop_due() == [fast, slow]
+        assert queue.pop_due() == []
+        clock.now += 10
+        assert queue.pop_due() == [fast]
+        clock.now += 20
+        assert {str(r.rule_id) for r in queue.pop_due()} == {
+            str(fast.rule_id),
+            str(slow.rule_id),
+        }
+        assert queue.next_due_in() == 10
+
+    def test_incremental_changes_drop_inactive_and_non_metric_rules(self):
+        clock = _Clock()
+        queue = _queue(clock)
+        rule = _rule()
+        queue.upsert(rule)
+        assert rule.rule_id in queue
+
+        queue.upsert(_rule(is_active=False, rule_id=rule.rule_id))
+        assert rule.rule_id not in queue
+
+        queue.upsert(rule)
+        queue.upsert(_rule(trigger_type="schedule", rule_id=rule.rule_id))
+        assert len(queue) == 0
+        assert queue.pop_due() == []
+
+    def test_full_sync_removes_deleted_rules(self):
+        queue = _queue(_Clock())
+        kept, deleted = _rule(), _rule()
+        queue.sync([kept, deleted])
+
+        queue.sync([kept])
+
+        assert kept.rule_id in queue
+        assert deleted.rule_id not in queue
+        assert queue.pop_due() == [kept]
+
+    def test_limit_leaves_backlog_and_reports_lag(self):
+        clock = _Clock()
+        queue = _queue(clock)
+        queue.sync([_rule() for _ in range(5)])
+        clock.now += 3
+
+        assert len(queue.pop_due(limit=2)) == 2
+        assert queue.backlog() == 3
+        assert queue.last_tick_lag_seconds == 3
+        assert queue.stats()["metric_poll_backlog"] == 3
+        assert queue.stats()["metric_poll_next_due_in_ms"] == 0
+
+    def test_jitter_spreads_rules_with_same_interval(self):
+        clock = _Clock()
+        queue = _queue(clock, jitter_ratio=0.5)
+        queue.sync([_rule() for _ in range(20)])
+
+        assert len(queue.pop_due()) < 20
+        clock.now += 5
+        assert len(queue.pop_due()) == 20
+        clock.now += 8
+
+        # Rescheduled within +-2.5s of the interval, not all at once
+        assert 0 < len(queue.pop_due()) < 20
@@ -0,0 +1,118 @@
+"""
+CEP Notification Batch Tests
+
+Tests for set-based notification evaluation in notification_engine:
+- Snapshot window loaded once per distinct window_minutes
+- Cooldown / rate-limit state from one grouped query for all notifications
+- Webhooks sent concurrently with a bound, failures recorded per delivery
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from app.modules.cep_builder import notification_engine
+
+MODULE = "app.modules.cep_builder.notification_engine"
+
+
+def _notification(window_minutes=5, value=1, policy=None, url="https://hooks.example.com/a"):
+    return SimpleNamespace(
+        notification_id=uuid.uuid4(),
+        name="n",
+        channel="webhook",
+        webhook_url=url,
+        headers={},
+        rule_id=None,
+        policy=policy or {},
+        trigger={
+            "type": "snapshot_threshold",
+            "field": "fail_count",
+            "op": ">=",
+            "value": value,
+            "window_minutes": window_minutes,
+        },
+    )
+
+
+def _snapshots(window_minutes):
+    return [SimpleNamespace(model_dump=lambda: {"fail_count": 3, "tick_at": None})]
+
+
+class TestEvaluateNotifications:
+    def test_snapshots_loaded_once_per_window(self):
+        notifications = [_notification(5), _notification(5), _notification(15)]
+
+        with patch(f"{MODULE}.list_metric_poll_snapshots") as snapshots, \
+                patch(f"{MODULE}._load_delivery_state", return_value=({}, {})) as state:
+            snapshots.side_effect = lambda session, limit, since_minutes: _snapshots(
+                since_minutes
+            )
+            deliveries = notification_engine._evaluate_notifications(
+                MagicMock(), notifications, datetime.utcnow()
+            )
+
+        assert len(deliveries) == 3
+        assert sorted(c.kwargs["since_minutes"] for c in snapshots.call_args_list) == [5, 15]
+        state.assert_called_once()
+
+    def test_cooldown_and_rate_limit_from_batched_state(self):
+        now = datetime.utcnow()
+        cooling = _notification(policy={"cooldown_seconds": 60})
+        limited = _notification(value=2, policy={"cooldown_seconds": 0, "max_per_hour": 2})
+        ready = _notification(value=3)
+        cooling_key = f"{cooling.notification_id}:snapshot_threshold:fail_count:>=:1.0"
+        last_fired = {(cooling.notification_id, cooling_key): now - timedelta(seconds=10)}
+        sent_last_hour = {limited.notification_id: 2}
+
+        with patch(f"{MODULE}.list_metric_poll_snapshots", return_value=_snapshots(5)), \
+                patch(
+                    f"{MODULE}._load_delivery_state",
+                    return_value=(last_fired, sent_last_hour),
+                ):
+            deliveries = notification_engine._evaluate_notifications(
+                MagicMock(), [cooling, limited, ready], now
+            )
+
+        assert [(d.status, d.reason) for d in deliveries] == [
+            ("skipped", "cooldown 60s"),
+            ("skipped", "rate limit (2/h)"),
+            (None, None),
+        ]
+
+
+class TestSendWebhooks:
+    @pytest.mark.asyncio
+    async def test_sends_concurrently_within_bound(self):
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            if request.url.path == "/fail":
+                return httpx.Response(500)
+            return httpx.Response(200, text="ok")
+
+        deliveries = [
+            notification_engine._Delivery(
+                _notification(url=f"https://hooks.example.com/{path}"), {}, [{}], "k"
+            )
+            for path in ["a", "b", "c", "fail"]
+        ]
+
+        with patch(f"{MODULE}._ensure_webhook_allowed"):
+            await notification_engine._send_webhooks(
+                deliveries, concurrency=2, transport=httpx.MockTransport(handler)
+            )
+
+        assert peak == 2
+        assert [d.status for d in deliveries] == ["sent", "sent", "sent", "fail"]
+        assert deliveries[0].response_status == 200
@@ -0,0 +1,156 @@
+"""
+CEP Windowing Tests
+
+Tests for bounded-state windowed aggregation in the Bytewax CEP engine:
+- Incremental aggregates and quantile sketch accuracy
+- Tumbling windows emit once, when the watermark closes them
+- Sliding and session windows (session merge on bridging events)
+- Allowed lateness, late drops and the open-window cap
+- Checkpoint/restore round trip
+"""
+
+import random
+
+import pytest
+from app.modules.cep_builder.bytewax_engine import (
+    AggregationProcessor,
+)
+from app.modules.cep_builder.windowing import (
+    RunningAggregate,
+    WindowedAggregator,
+)
+from core.latency_sketch import LatencySketch
+
+
+def _event(ts, value=1.0, host="web-01"):
+    return {"timestamp": ts, "value": value, "host": host}
+
+
+class TestAggregates:
+    def test_running_aggregate_keeps_no_values(self):
+        agg = RunningAggregate()
+        for value in (3.0, None, 1.0, 2.0):
+            agg.add(value)
+
+        assert agg.result("count") == 4
+        assert agg.result("avg") == 2.0
+        assert (agg.result("min"), agg.result("max")) == (1.0, 3.0)
+        assert not hasattr(agg, "__dict__")
+
+    def test_quantile_sketch_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.uniform(1, 1000) for _ in range(5000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        exact = sorted(values)[int(0.95 * (len(values) - 1))]
+        assert abs(sketch.quantile(0.95) - exact) / exact < 0.02
+
+    def test_quantile_sketch_handles_signed_values(self):
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in range(-500, 501):
+            sketch.add(value)
+
+        restored = LatencySketch.from_dict(sketch.to_dict())
+        assert restored.quantile(0.0) == pytest.approx(-500, rel=0.02)
+        assert restored.quantile(0.5) == 0.0
+        assert restored.quantile(0.1) == pytest.approx(-400, rel=0.02)
+        assert restored.quantile(0.9) == pytest.approx(400, rel=0.02)
+
+    def test_aggregation_processor_state_is_bounded(self):
+        processor = AggregationProcessor({"type": "p50", "field": "value", "group_by": "host"})
+        for i in range(1000):
+            result = processor.process(_event(i, value=i % 10), {})
+
+        assert result["aggregated_value"] == pytest.approx(4.5, abs=0.6)
+        assert len(processor.state["web-01"].sketch.bins) <= 10
+
+
+class TestWindowedAggregator:
+    def test_tumbling_emits_only_on_close(self):
+        windows = WindowedAggregator(
+            {"type": "tumbling", "size_seconds": 10},
+            {"type": "sum", "field": "value", "group_by": "host"},
+        )
+
+        assert windows.add(_event(1)) == []
+        assert windows.add(_event(5)) == []
+        fired = windows.add(_event(12))
+
+        assert len(fired) == 1
+        assert fired[0]["aggregated_value"] == 2.0
+        assert fired[0]["final"] is True
+        assert windows.stats()["open_windows"] == 1
+
+    def test_sliding_event_counts_in_each_overlapping_window(self):
+        windows = WindowedAggregator({"type": "sliding", "size_seconds": 10, "slide_seconds": 5})
+
+        windows.add(_event(7))
+        fired = windows.advance_watermark(100)
+
+        assert sorted(r["window_id"] for r in fired) == [0, 5]
+
+    def test_session_merges_bridging_event(self):
+        windows = WindowedAggregator(
+            {"type": "session", "gap_seconds": 5, "watermark_delay_seconds": 10},
+            {"type": "count", "group_by": "host"},
+        )
+        windows.add(_event(0))
+        windows.add(_event(8))
+        assert windows.stats()["open_windows"] == 2
+
+        windows.add(_event(4))
+        fired = windows.advance_watermark(100)
+
+        assert len(fired) == 1
+        assert fired[0]["event_count"] == 3
+
+    def test_allowed_lateness_and_late_drop(self):
+        windows = WindowedAggregator(
+            {"type": "tumbling", "size_seconds": 10, "allowed_lateness_seconds": 5}
+        )
+        windows.add(_event(1))
+        assert windows.add(_event(12)) == []
+
+        windows.add(_event(9))  # late but within lateness: still counted
+        fired = windows.add(_event(16))
+        assert fired[0]["event_count"] == 2
+
+        windows.add(_event(3))  # window already closed
+        assert windows.late_dropped == 1
+
+    def test_early_trigger_and_window_cap(self):
+        windows = WindowedAggregator(
+            {
+                "type": "tumbling",
+                "size_seconds": 10,
+                "trigger_every": 2,
+                "max_windows": 2,
+                "watermark_delay_seconds": 1000,
+            }
+        )
+        early = windows.add(_event(1)) + windows.add(_event(2))
+        assert [r["final"] for r in early] == [False]
+
+        windows.add(_event(500))
+        evicted = windows.add(_event(200))
+
+        assert windows.stats()["open_windows"] == 2
+        assert [(r["window_id"], r.get("evicted")) for r in evicted] == [(0, True)]
+
+
+class TestCheckpoint:
+    def test_restore_resumes_open_windows(self):
+        config = {"type": "tumbling", "size_seconds": 10}
+        spec = {"type": "p50", "field": "value"}
+        windows = WindowedAggregator(config, spec)
+        windows.add(_event(1, value=10))
+        windows.add(_event(2, value=20))
+
+        restored = WindowedAggregator(config, spec)
+        restored.restore(windows.checkpoint())
+        fired = restored.add(_event(15, value=30))
+
+        assert fired[0]["event_count"] == 2
+        assert fired[0]["aggregated_value"] == pytest.approx(10, rel=0.02)
@@ -0,0 +1,134 @@
+"""
+Document Ingestion Pipeline Tests
+
+Tests for the staged upload ingestion pipeline:
+- Uploads copied to disk in bounded chunks
+- Text parsed in blocks, chunks embedded and inserted in batches
+- Per-stage throughput recorded in document metadata
+- Failures mark the document as failed
+"""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.modules.document_processor.services import ingestion_pipeline
+from app.modules.document_processor.services.ingestion_pipeline import (
+    DocumentIngestionPipeline,
+    copy_upload,
+)
+from models.document import DocumentStatus
+
+
+def _document(path, file_format="txt"):
+    return SimpleNamespace(
+        id="doc-1",
+        format=file_format,
+        status=DocumentStatus.queued,
+        processing_progress=0,
+        total_chunks=0,
+        error_message=None,
+        doc_metadata={"storage_path": str(path)},
+        updated_at=None,
+    )
+
+
+def _session(document):
+    session = MagicMock()
+    session.get.return_value = document
+    return session
+
+
+def _embedder(calls):
+    def embed(texts):
+        calls.append(len(texts))
+        return [[0.1] * 4 for _ in texts]
+
+    return embed
+
+
+class TestCopyUpload:
+    def test_copies_in_chunks(self, tmp_path):
+        payload = b"x" * (ingestion_pipeline.UPLOAD_COPY_BYTES * 2 + 7)
+        destination = tmp_path / "tenant" / "doc" / "file.bin"
+
+        written = copy_upload(io.BytesIO(payload), destination)
+
+        assert written == len(payload)
+        assert destination.read_bytes() == payload
+
+
+class TestDocumentIngestionPipeline:
+    def test_text_document_embedded_and_inserted_in_batches(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text(
+            "\n\n".join(f"Paragraph {i} talks about topic {i}." * 20 for i in range(30))
+        )
+        document = _document(path)
+        session = _session(document)
+        calls = []
+
+        result = DocumentIngestionPipeline(
+            session, embedder=_embedder(calls), batch_size=8
+        ).run("doc-1")
+
+        inserted = [
+            chunk for call in session.add_all.call_args_list for chunk in call.args[0]
+        ]
+        assert result["status"] == "done"
+        assert result["chunks"] == len(inserted) == sum(calls)
+        assert max(calls) <= 8 and len(calls) == session.add_all.call_count
+        assert [chunk.chunk_index for chunk in inserted] == list(range(len(inserted)))
+        assert document.status == DocumentStatus.done
+        assert document.processing_progress == 100
+        stages = document.doc_metadata["ingestion"]["stages"]
+        assert stages["embed"]["items"] == stages["insert"]["items"] == len(inserted)
+        assert document.doc_metadata["storage_path"] == str(path)
+
+    def test_pdf_pages_streamed_from_processor(self, tmp_path):
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF")
+        processor = MagicMock()
+        processor.page_count.return_value = 2
+        processor.iter_pages.return_value = iter(
+            [
+                {"page_num": 0, "text": "First page text."},
+                {"page_num": 1, "text": "Second page text."},
+            ]
+        )
+        document = _document(path, "pdf")
+        session = _session(document)
+
+        DocumentIngestionPipeline(
+            session, processor=processor, embedder=_embedder([])
+        ).run("doc-1")
+
+        inserted = session.add_all.call_args_list[0].args[0]
+        assert [chunk.page_number for chunk in inserted] == [1, 2]
+        assert document.doc_metadata["ingestion"]["pages_total"] == 2
+
+    def test_failure_marks_document_failed(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("Some text to embed.")
+        document = _document(path)
+        session = _session(document)
+
+        def broken(texts):
+            raise RuntimeError("embedding service down")
+
+        with pytest.raises(RuntimeError):
+            DocumentIngestionPipeline(session, embedder=broken).run("doc-1")
+
+        session.rollback.assert_called_once()
+        assert document.status == DocumentStatus.failed
+        assert document.error_message == "embedding service down"
+
+    def test_placeholder_embedder_without_model(self):
+        settings = SimpleNamespace(
+            openai_api_key=None, embed_model=None, embedding_dimension=3
+        )
+        with patch.object(ingestion_pipeline, "get_settings", return_value=settings):
+            embed = ingestion_pipeline.default_embedder()
+
+        assert embed(["a", "b"]) == [[0.0] * 3, [0.0] * 3]
@@ -3,18 +3,24 @@ Tests for Document Search Service and API
 
 Tests cover:
 - DocumentSearchService with mocked DB
+- Parallel hybrid retrieval, RRF fusion and the query-embedding cache
+- Vector SQL binds the embedding; vector failures are surfaced
 - Search endpoints with various search types
 - Tool Asset configuration
 """
 
+import threading
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from app.modules.document_processor.search_crud import search_chunks_by_vector
 from app.modules.document_processor.services.search_service import (
     DocumentSearchService,
     SearchFilters,
     SearchResult,
+    query_embedding_cache,
 )
 from fastapi.testclient import TestClient
 
@@ -93,6 +99,32 @@ class TestDocumentSearchService:
 
         assert results == []
 
+    def test_vector_sql_binds_embedding(self):
+        session = Mock()
+        session.execute = Mock(return_value=Mock(fetchall=Mock(return_value=[])))
+
+        search_chunks_by_vector(session, [0.1, 0.2], tenant_id="t1")
+
+        statement = session.execute.call_args[0][0]
+        assert "embedding" in statement.compile().params
+
+    @pytest.mark.asyncio
+    async def test_vector_failure_degrades_hybrid_to_text(self, search_service, search_filters):
+        search_service.embedding_service.embed = AsyncMock(side_effect=RuntimeError("embedder down"))
+        search_service.db.execute = Mock(
+            return_value=Mock(fetchall=Mock(return_value=[
+                ("chunk1", "doc1", "document.pdf", "Text about AI", 1, "text", 0.8),
+            ]))
+        )
+
+        with pytest.raises(RuntimeError):
+            await search_service._vector_search("ai", search_filters, top_k=5)
+
+        results = await search_service.search(
+            query="ai", filters=search_filters, top_k=5, search_type="hybrid"
+        )
+        assert [r.chunk_id for r in results] == ["chunk1"]
+
     @pytest.mark.asyncio
     async def test_hybrid_search_combination(self, search_service, search_filters):
         """Test hybrid search combining vector and text results"""
@@ -166,6 +198,98 @@ class TestDocumentSearchService:
         assert result.page_number == 5
 
 
+def _result(chunk_id):
+    return SearchResult(
+        chunk_id=chunk_id, document_id="d1", document_name="doc.pdf", chunk_text="x"
+    )
+
+
+class TestHybridSearch:
+    """Parallel retrieval, fusion and query embedding cache"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        query_embedding_cache.clear()
+        yield
+        query_embedding_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_retrievers_run_in_parallel_on_own_sessions(self):
+        sessions = []
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def execute(statement, params):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return Mock(fetchall=Mock(return_value=[]))
+
+        def factory():
+            session = Mock(execute=Mock(side_effect=execute))
+            sessions.append(session)
+            return session
+
+        embedding_service = Mock()
+        embedding_service.embed = AsyncMock(return_value=[0.1] * 3)
+        service = DocumentSearchService(Mock(), embedding_service, session_factory=factory)
+
+        await service.search("query text", SearchFilters(tenant_id="t1"), top_k=5)
+
+        assert len(sessions) == 2
+        assert peak == 2
+        assert all(session.close.called for session in sessions)
+
+    @pytest.mark.asyncio
+    async def test_shared_session_serialized_without_factory(self):
+        active = 0
+        peak = 0
+
+        def execute(statement, params):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            time.sleep(0.02)
+            active -= 1
+            return Mock(fetchall=Mock(return_value=[]))
+
+        embedding_service = Mock()
+        embedding_service.embed = AsyncMock(return_value=[0.1] * 3)
+        service = DocumentSearchService(
+            Mock(execute=Mock(side_effect=execute)), embedding_service
+        )
+
+        await service.search("query text", SearchFilters(tenant_id="t1"), top_k=5)
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_query_embedding_cached_across_instances(self):
+        embedding_service = Mock(spec=["embed_query", "model"], model="embed-test")
+        embedding_service.embed_query = Mock(return_value=[0.2, 0.3])
+
+        for _ in range(3):
+            service = DocumentSearchService(None, embedding_service)
+            assert await service._embed_query("disk  latency") == [0.2, 0.3]
+
+        embedding_service.embed_query.assert_called_once_with("disk  latency")
+        assert query_embedding_cache.hits == 2
+
+    def test_rrf_rewards_agreement(self):
+        text_results = [_result("a"), _result("b"), _result("c")]
+        vector_results = [_result("c"), _result("d")]
+
+        combined = DocumentSearchService._combine_results(text_results, vector_results, 2)
+
+        assert [r.chunk_id for r in combined] == ["c", "a"]
+        assert combined[0].relevance_score == pytest.approx(1 / 63 + 1 / 61)
+
+
 class TestDocumentSearchAPI:
     """Test Document Search API endpoints"""
 
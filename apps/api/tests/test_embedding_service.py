@@ -0,0 +1,159 @@
+"""
+Embedding Service Tests
+
+Tests for the shared batch embedding service:
+- Content-hash cache skips unchanged texts; duplicates embedded once
+- Query embeddings read the cache but are not written to it
+- Batches sent concurrently up to the configured bound
+- Rate-limit errors retried with backoff
+- Requests/tokens-per-minute budget throttles admission
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from services.embedding import EmbeddingService, RateBudget, content_hash
+
+
+def _settings(**overrides):
+    values = {
+        "embed_model": "embed-test",
+        "embedding_batch_size": 2,
+        "embedding_concurrency": 3,
+        "embedding_requests_per_minute": 10_000,
+        "embedding_tokens_per_minute": 10_000_000,
+        "embedding_max_retries": 3,
+        "embedding_cache_enabled": False,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _response(texts):
+    return SimpleNamespace(
+        data=[
+            SimpleNamespace(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(texts)
+        ]
+    )
+
+
+class _Client:
+    def __init__(self, delay=0.0, failures=0):
+        self.delay = delay
+        self.failures = failures
+        self.inputs = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def embed(self, model, input):
+        with self.lock:
+            if self.failures:
+                self.failures -= 1
+                raise _RateLimited()
+            self.inputs.append(list(input))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return _response(input)
+
+
+class _RateLimited(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={"retry-after": "0.5"})
+
+
+class _Cache:
+    def __init__(self):
+        self.vectors = {}
+
+    def get_many(self, model, hashes):
+        return {key: self.vectors[(model, key)] for key in hashes if (model, key) in self.vectors}
+
+    def put_many(self, model, vectors):
+        for key, vector in vectors.items():
+            self.vectors[(model, key)] = vector
+
+
+class TestEmbeddingService:
+    def test_cache_skips_unchanged_texts(self):
+        client = _Client()
+        cache = _Cache()
+        service = EmbeddingService(_settings(), client=client, cache=cache)
+
+        assert service.embed_texts(["alpha", "beta", "alpha"]) == [[5.0], [4.0], [5.0]]
+        assert sum(len(batch) for batch in client.inputs) == 2
+
+        client.inputs.clear()
+        service.embed_texts(["alpha", "beta", "gamma!"])
+
+        assert client.inputs == [["gamma!"]]
+        assert ("embed-test", content_hash("gamma!")) in cache.vectors
+        assert service.stats()["cache_hits"] == 2
+
+    def test_query_embeddings_are_not_cached(self):
+        client = _Client()
+        cache = _Cache()
+        service = EmbeddingService(_settings(), client=client, cache=cache)
+
+        assert service.embed_query("what failed?") == [12.0]
+        assert cache.vectors == {}
+
+        service.embed_texts(["indexed chunk"])
+        client.inputs.clear()
+        assert service.embed_query("indexed chunk") == [13.0]
+        assert client.inputs == []
+
+    def test_batches_run_concurrently_in_order(self):
+        client = _Client(delay=0.05)
+        service = EmbeddingService(_settings(), client=client, cache=None)
+        texts = [f"text {'x' * i}" for i in range(12)]
+
+        vectors = service.embed_texts(texts)
+
+        assert vectors == [[float(len(text))] for text in texts]
+        assert len(client.inputs) == 6
+        assert client.peak == 3
+
+    def test_rate_limit_errors_retried_with_backoff(self):
+        sleeps = []
+        client = _Client(failures=2)
+        service = EmbeddingService(
+            _settings(), client=client, cache=None, sleep=sleeps.append
+        )
+
+        assert service.embed_query("hello") == [5.0]
+        assert sleeps == [0.5, 0.5]
+        assert service.stats()["retries"] == 2
+
+    def test_non_retryable_error_raises(self):
+        class Broken:
+            def embed(self, model, input):
+                raise ValueError("bad input")
+
+        service = EmbeddingService(_settings(), client=Broken(), cache=None)
+        with pytest.raises(ValueError):
+            service.embed_texts(["x"])
+
+
+class TestRateBudget:
+    def test_waits_for_window_when_budget_spent(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        budget = RateBudget(2, 100, clock=lambda: now[0], sleep=sleep)
+        assert budget.acquire(40) == 0
+        now[0] = 10.0
+        assert budget.acquire(40) == 0
+
+        assert budget.acquire(40) == pytest.approx(50.0)
+        assert sleeps == [pytest.approx(50.0)]
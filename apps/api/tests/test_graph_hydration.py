@@ -0,0 +1,153 @@
+"""
+Graph Hydration Tests
+
+Tests for batched graph expansion and hydration:
+- UNWIND Cypher expands all seeds in one call with a clamped depth and a
+  per-seed path cap
+- One ``= ANY`` query per table, skipping unbounded ranges and non-UUID ids
+- Skipped non-UUID ids are reported in the hydration payload
+- Column-oriented metrics/history consumed without further queries
+- DynamicTool issues one Cypher call and one query per table
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.modules.ops.services.orchestration.tools import graph_hydration
+from app.modules.ops.services.orchestration.tools.base import ToolContext
+from app.modules.ops.services.orchestration.tools.dynamic_tool import DynamicTool
+
+CI_A = str(uuid.uuid4())
+CI_B = str(uuid.uuid4())
+
+
+def _hydrated_payload():
+    hydration = graph_hydration.build_hydration(
+        [CI_A, CI_B],
+        {CI_A: "web-01", CI_B: "db-01"},
+        [
+            {"ci_id": CI_A, "metric_name": "cpu_usage", "value": 40.0, "unit": "%", "time": None},
+            {"ci_id": CI_B, "metric_name": "cpu_usage", "value": 90.0, "unit": "%", "time": None},
+        ],
+        [
+            {"ci_id": CI_B, "time": None, "event_type": "alarm", "severity": 3, "source": "device", "title": "disk"},
+            {"ci_id": CI_A, "time": None, "event_type": "deploy", "severity": 1, "source": "system", "title": "v2"},
+        ],
+        metric_time_range="last_24h",
+        history_time_range="last_7d",
+    )
+    return {"ids": [CI_A, CI_B], "hydration": hydration}
+
+
+class TestExpandCypher:
+    def test_depth_is_clamped_and_inlined(self):
+        assert "[*1..3]" in graph_hydration.expand_cypher(3)
+        assert "[*1..5]" in graph_hydration.expand_cypher(99)
+        assert "[*1..1]" in graph_hydration.expand_cypher("bogus")
+
+    def test_all_seeds_in_one_call(self):
+        assert graph_hydration.expand_cypher(2).startswith("UNWIND $ci_ids AS seed_id")
+
+    def test_paths_are_capped_per_seed(self):
+        cypher = graph_hydration.expand_cypher(5)
+        assert "RETURN p LIMIT $per_seed_limit" in cypher
+        assert cypher.index("$per_seed_limit") < cypher.index("UNWIND relationships(p)")
+
+        _, params = DynamicTool._graph_cypher("t1", [CI_A], limit=10, depth=5)
+        assert params["per_seed_limit"] == 50
+
+
+class TestHydrationQueries:
+    def test_one_any_query_per_table(self):
+        queries = graph_hydration.hydration_queries("t1", [CI_A, CI_B, "not-a-uuid"])
+
+        assert set(queries) == {"nodes", "metrics", "history"}
+        for sql, params in queries.values():
+            assert "= ANY(%s::uuid[])" in sql
+            assert params[1] == [CI_A, CI_B]
+
+    def test_unbounded_history_range_is_not_hydrated(self):
+        queries = graph_hydration.hydration_queries(
+            "t1", [CI_A], history_time_range="all_time"
+        )
+
+        assert "history" not in queries
+
+    def test_no_valid_ids_means_no_queries(self):
+        assert graph_hydration.hydration_queries("t1", ["x", None]) == {}
+
+    def test_skipped_ids_are_reported(self):
+        hydration = graph_hydration.build_hydration(
+            [CI_A, "legacy-7"], {}, [], None,
+            metric_time_range="last_24h", history_time_range="last_7d",
+        )
+
+        assert hydration["ci_count"] == 1
+        assert hydration["skipped_ids"] == ["legacy-7"]
+        assert "skipped_ids" not in graph_hydration.build_hydration(
+            [CI_A], {}, [], None, metric_time_range="last_24h", history_time_range="last_7d"
+        )
+
+
+class TestHydratedConsumers:
+    def test_history_matches_only_its_time_range(self):
+        payload = _hydrated_payload()
+
+        result = graph_hydration.hydrated_history(payload, "last_7d", limit=1)
+
+        assert result["columns"] == graph_hydration.HISTORY_COLUMNS
+        assert result["rows"] == [[None, "db-01", "alarm", 3, "device", "disk"]]
+        assert result["meta"]["ci_count_used"] == 2
+        assert graph_hydration.hydrated_history(payload, "last_30d") is None
+        assert graph_hydration.hydrated_history({"ids": [CI_A]}, "last_7d") is None
+
+    def test_aggregate_latest_across_ci(self):
+        payload = _hydrated_payload()
+
+        assert graph_hydration.aggregate_latest(payload, "cpu_usage", "max")["value"] == 90.0
+        assert graph_hydration.aggregate_latest(payload, "cpu_usage", "avg")["value"] == 65.0
+        assert graph_hydration.aggregate_latest(payload, "latency", "max") is None
+
+
+class TestDynamicToolGraphHydration:
+    @pytest.mark.asyncio
+    async def test_hydrated_expand_uses_fixed_round_trips(self):
+        tool = DynamicTool(
+            {
+                "name": "graph_expand",
+                "tool_type": "graph_query",
+                "tool_config": {"source_ref": "neo4j", "postgres_source_ref": "pg"},
+            }
+        )
+        record = MagicMock()
+        record.data.return_value = {
+            "src_id": CI_A, "src_name": "web", "src_type": "server", "src_code": "web-01",
+            "src_status": "ok", "rel_type": "DEPENDS_ON",
+            "tgt_id": CI_B, "tgt_name": "db", "tgt_type": "db", "tgt_code": "db-01",
+            "tgt_status": "ok",
+        }
+        neo4j = MagicMock()
+        session = neo4j.driver.session.return_value.__enter__.return_value
+        session.run.return_value = [record]
+        postgres = MagicMock()
+        postgres.execute.side_effect = lambda sql, params: []
+        sources = {
+            "neo4j": {"name": "neo4j", "source_type": "neo4j"},
+            "pg": {"name": "pg", "source_type": "postgresql"},
+        }
+
+        module = "app.modules.ops.services.orchestration.tools.dynamic_tool"
+        with patch(f"{module}.load_source_asset", side_effect=lambda name: sources[name]), \
+                patch(f"{module}.ConnectionFactory.create", side_effect=[neo4j, postgres]):
+            result = await tool.execute(
+                ToolContext(tenant_id="t1"),
+                {"ci_id": CI_A, "depth": 3, "hydrate": True},
+            )
+
+        assert result.success, result.error
+        assert session.run.call_count == 1
+        assert postgres.execute.call_count == 3
+        assert sorted(result.data["ids"]) == sorted([CI_A, CI_B])
+        assert set(result.data["hydration"]) == {"ci_count", "metrics", "history"}
+        assert result.data["meta"]["depth"] == 3
@@ -0,0 +1,121 @@
+"""
+Prometheus Metrics Tests
+
+Tests for the shared metrics registry:
+- Existing collectors (OPS orchestration, CEP rule monitor, API cache) record
+  into the registry
+- OpenMetrics exposition is negotiated from the Accept header
+- Multi-process mode merges values written by separate worker processes
+- /metrics is only served with the configured bearer token
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from app.modules.api_manager.cache_service import APICacheService
+from app.modules.cep_builder.rule_monitor import RulePerformanceMonitor
+from app.modules.ops.services.metrics import OrchestrationMetrics
+from core.config import get_settings
+from core.metrics import REGISTRY, render_metrics
+from fastapi.testclient import TestClient
+
+APP_ROOT = Path(__file__).parent.parent
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_orchestration_metrics_are_exported():
+    before_latency = _sample("ops_tool_latency_seconds_count", tool="metric_query")
+    before_failures = _sample("ops_tool_failures_total", tool="metric_query")
+    before_fallbacks = _sample("ops_orchestration_events_total", event="fallback")
+
+    metrics = OrchestrationMetrics()
+    metrics.record_tool_latency("metric_query", 250.0, {"trace_id": "t", "tenant_id": "x"})
+    metrics.record_tool_failure("metric_query", {"trace_id": "t", "tenant_id": "x"})
+    metrics.record_fallback("timeout", {"trace_id": "t", "tenant_id": "x"})
+
+    assert _sample("ops_tool_latency_seconds_count", tool="metric_query") == before_latency + 1
+    assert _sample("ops_tool_failures_total", tool="metric_query") == before_failures + 1
+    assert _sample("ops_orchestration_events_total", event="fallback") == before_fallbacks + 1
+
+
+def test_cep_rule_executions_are_exported():
+    before = _sample("cep_rule_executions_total", rule_id="rule-m", outcome="error")
+
+    RulePerformanceMonitor().record_execution(
+        "rule-m", execution_time_ms=12, events_processed=5, events_matched=2, errors=["boom"]
+    )
+
+    assert _sample("cep_rule_executions_total", rule_id="rule-m", outcome="error") == before + 1
+    assert _sample("cep_rule_events_total", rule_id="rule-m", kind="matched") >= 2
+
+
+def test_api_cache_hits_and_misses_are_exported():
+    hits = _sample("cache_requests_total", cache="api_manager", result="hit")
+    misses = _sample("cache_requests_total", cache="api_manager", result="miss")
+    cache = APICacheService(use_redis=False)
+
+    assert cache.get("api-1", {"a": 1}) is None
+    cache.set("api-1", {"a": 1}, {"rows": []})
+    assert cache.get("api-1", {"a": 1}) == {"rows": []}
+
+    assert _sample("cache_requests_total", cache="api_manager", result="hit") == hits + 1
+    assert _sample("cache_requests_total", cache="api_manager", result="miss") == misses + 1
+
+
+def test_openmetrics_negotiated_from_accept_header():
+    body, content_type = render_metrics("application/openmetrics-text; version=1.0.0")
+    assert content_type.startswith("application/openmetrics-text")
+    assert body.rstrip().endswith(b"# EOF")
+
+    body, content_type = render_metrics("text/plain")
+    assert content_type.startswith("text/plain")
+    assert b"# EOF" not in body
+
+
+def test_multiprocess_mode_merges_workers(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    worker = textwrap.dedent(
+        """
+        from core.metrics import CACHE_REQUESTS
+        CACHE_REQUESTS.labels("ci", "hit").inc(3)
+        """
+    )
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", worker], cwd=APP_ROOT, env=env, check=True)
+
+    scrape = textwrap.dedent(
+        """
+        from core.metrics import render_metrics
+        print(render_metrics()[0].decode())
+        """
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", scrape],
+        cwd=APP_ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert 'cache_requests_total{cache="ci",result="hit"} 6.0' in output
+
+
+def test_metrics_endpoint_requires_configured_token(monkeypatch):
+    from main import app
+
+    client = TestClient(app)
+    monkeypatch.setattr(get_settings(), "metrics_bearer_token", None)
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setattr(get_settings(), "metrics_bearer_token", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert b"cache_requests_total" in response.content
@@ -0,0 +1,134 @@
+"""
+OPS Ask Coalescer Tests
+
+Tests for in-flight coalescing of identical /ops/ask requests:
+- Flight keys cover tenant, normalized question and rerun patch
+- Followers wait on the leader and get private copies of its result
+- Leader errors propagate; slow or aborted leaders let followers fall back
+- Stream followers replay past events and follow live ones
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from app.modules.ops.schemas import OpsAskRequest
+from app.modules.ops.services.ask_coalescer import (
+    AskCoalescer,
+    AskFlightAborted,
+    AskFlightError,
+    ask_flight_key,
+)
+
+
+class TestAskFlightKey:
+    def test_normalized_question_shares_key(self):
+        a = ask_flight_key("ask", "t1", OpsAskRequest(question="Show server-01 CPU?"))
+        b = ask_flight_key("ask", "t1", OpsAskRequest(question="  show SERVER-01 cpu "))
+
+        assert a == b
+
+    def test_tenant_mode_and_endpoint_separate_keys(self):
+        base = ask_flight_key("ask", "t1", OpsAskRequest(question="show cpu"))
+
+        assert base != ask_flight_key("ask", "t2", OpsAskRequest(question="show cpu"))
+        assert base != ask_flight_key(
+            "ask", "t1", OpsAskRequest(question="show cpu", mode="metric")
+        )
+        assert base != ask_flight_key("ask_stream", "t1", OpsAskRequest(question="show cpu"))
+
+
+class TestAskCoalescer:
+    def test_followers_share_leader_result(self):
+        coalescer = AskCoalescer()
+        leader, is_leader = coalescer.join("k", "trace-leader")
+        results = []
+
+        def follow():
+            flight, follower_is_leader = coalescer.join("k", "trace-follower")
+            assert follower_is_leader is False
+            results.append(flight.wait(timeout=5))
+
+        threads = [threading.Thread(target=follow) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while leader.followers < 3:
+            time.sleep(0.01)
+        coalescer.finish(leader, result={"answer": "42", "meta": {"trace_id": "trace-leader"}})
+        for thread in threads:
+            thread.join()
+
+        assert is_leader is True
+        assert [r["answer"] for r in results] == ["42", "42", "42"]
+        # Followers get private copies they can annotate
+        results[0]["meta"]["coalesced"] = True
+        assert "coalesced" not in results[1]["meta"]
+        assert coalescer.stats() == {"leaders": 1, "followers": 3, "in_flight": 0}
+
+    def test_finished_flight_is_not_reused(self):
+        coalescer = AskCoalescer()
+        first, _ = coalescer.join("k", "trace-1")
+        coalescer.finish(first, result={"answer": "old"})
+
+        second, is_leader = coalescer.join("k", "trace-2")
+
+        assert is_leader is True
+        assert second is not first
+
+    def test_leader_error_propagates(self):
+        coalescer = AskCoalescer()
+        leader, _ = coalescer.join("k", "trace-leader")
+        follower, _ = coalescer.join("k", "trace-follower")
+
+        coalescer.finish(leader, error=ValueError("llm down"))
+
+        with pytest.raises(AskFlightError, match="llm down"):
+            follower.wait(timeout=1)
+
+    def test_aborted_leader_is_not_an_error(self):
+        coalescer = AskCoalescer()
+        leader, _ = coalescer.join("k", "trace-leader")
+        follower, _ = coalescer.join("k", "trace-follower")
+
+        coalescer.finish(leader)
+
+        with pytest.raises(AskFlightAborted):
+            follower.wait(timeout=1)
+
+    def test_slow_leader_returns_none(self):
+        coalescer = AskCoalescer()
+        coalescer.join("k", "trace-leader")
+        follower, _ = coalescer.join("k", "trace-follower")
+
+        assert follower.wait(timeout=0.01) is None
+
+
+class TestStreamFollowers:
+    @pytest.mark.asyncio
+    async def test_subscriber_replays_and_follows_events(self):
+        coalescer = AskCoalescer()
+        leader, _ = coalescer.join("k", "trace-leader")
+        leader.publish("progress", {"stage": "init"})
+        follower, _ = coalescer.join("k", "trace-follower")
+
+        async def drive_leader():
+            await asyncio.sleep(0.01)
+            leader.publish("progress", {"stage": "planning"})
+            leader.publish("complete", {"answer": "42"})
+            coalescer.finish(leader, result={"answer": "42"})
+
+        received = []
+
+        async def follow():
+            async for event in follower.subscribe(timeout=5):
+                received.append(event)
+
+        await asyncio.gather(drive_leader(), follow())
+
+        assert received == [
+            ("progress", {"stage": "init"}),
+            ("progress", {"stage": "planning"}),
+            ("complete", {"answer": "42"}),
+        ]
+        assert follower.result() == {"answer": "42"}
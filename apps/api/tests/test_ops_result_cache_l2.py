@@ -0,0 +1,252 @@
+"""
+OPS Result Cache L2 Tests
+
+Tests for the Redis-backed L2 behind ToolResultCache / CICache:
+- Compact serialization round-trips (with and without compression)
+- Single-flight: concurrent identical misses run the loader once, and a
+  cancelled caller doesn't cancel the load for the others
+- Warm results are shared between workers through L2
+- CI cache keys are tenant-qualified for both levels
+- Tag invalidation drops L1 and L2 entries, including other workers' L1
+"""
+
+import asyncio
+import fnmatch
+import json
+import time
+
+import pytest
+from app.modules.ops.services.orchestration.services import result_store
+from app.modules.ops.services.orchestration.services.cache_core import LRUTTLCache
+from app.modules.ops.services.orchestration.services.ci_cache import CICache
+from app.modules.ops.services.orchestration.services.result_store import (
+    RedisResultStore,
+    ResultCacheInvalidationBus,
+    TieredResultCache,
+    dumps_compact,
+    invalidate_result_tags,
+    loads_compact,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis-py commands the L2 uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, px=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += int(self.values.pop(key, None) is not None)
+            self.sets.pop(key, None)
+        return removed
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def pexpire(self, key, ms):
+        return True
+
+    def keys(self, pattern):
+        return [k for k in self.values if fnmatch.fnmatch(k, pattern)]
+
+    def pipeline(self, transaction=False):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self._redis, name)(*a, **kw) for name, a, kw in self._calls]
+
+
+def _worker(redis, namespace="tool"):
+    return TieredResultCache(
+        namespace, LRUTTLCache(max_entries=100), RedisResultStore(namespace, client=redis)
+    )
+
+
+class TestCompactSerialization:
+    def test_roundtrip_small_payload(self):
+        value = {"rows": [{"ci_id": 1, "name": "srv-01"}]}
+        assert loads_compact(dumps_compact(value)) == value
+
+    def test_large_payload_is_compressed(self):
+        value = {"rows": [{"ci_id": i, "name": "server"} for i in range(500)]}
+        raw = dumps_compact(value, compress_min_bytes=1024)
+
+        assert raw[:1] == b"z"
+        assert len(raw) < len(json.dumps(value))
+        assert loads_compact(raw) == value
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        cache = TieredResultCache("sf-test", LRUTTLCache(max_entries=10), None)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"rows": [1]}
+
+        results = await asyncio.gather(
+            *[cache.get_or_load("k", loader, ttl_seconds=60) for _ in range(10)]
+        )
+
+        assert calls == 1
+        assert all(value == {"rows": [1]} for value, _ in results)
+        assert cache.stats()["coalesced_loads"] >= 9
+
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_to_followers(self):
+        cache = TieredResultCache("sf-error-test", LRUTTLCache(max_entries=10), None)
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise ValueError("db down")
+
+        results = await asyncio.gather(
+            *[cache.get_or_load("k", loader, ttl_seconds=60) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert cache.l1.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        cache = TieredResultCache("sf-cancel-test", LRUTTLCache(max_entries=10), None)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"rows": [1]}
+
+        leader = asyncio.create_task(cache.get_or_load("k", loader, ttl_seconds=60))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load("k", loader, ttl_seconds=60))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == ({"rows": [1]}, False)
+        assert leader.cancelled()
+        assert calls == 1
+        assert cache.l1.get("k") == {"rows": [1]}
+
+
+class TestSharedL2:
+    @pytest.mark.asyncio
+    async def test_second_worker_hits_l2(self):
+        redis = FakeRedis()
+        worker_a = _worker(redis)
+        worker_b = _worker(redis)
+
+        async def loader():
+            return {"rows": [42]}
+
+        value_a, hit_a = await worker_a.get_or_load("k", loader, ttl_seconds=60)
+
+        async def must_not_load():
+            raise AssertionError("worker B should reuse worker A's result")
+
+        value_b, hit_b = await worker_b.get_or_load("k", must_not_load, ttl_seconds=60)
+
+        assert (value_a, hit_a) == ({"rows": [42]}, False)
+        assert (value_b, hit_b) == ({"rows": [42]}, True)
+        # Promoted into worker B's L1
+        assert worker_b.l1.get("k") == {"rows": [42]}
+
+    @pytest.mark.asyncio
+    async def test_expired_l2_record_is_ignored(self):
+        redis = FakeRedis()
+        store = RedisResultStore("tool", client=redis)
+        await store.set("k", {"v": {"rows": [1]}, "exp": time.time() - 1}, 60)
+
+        assert await _worker(redis).get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_ci_keys_are_tenant_qualified(self):
+        cache = CICache()
+        key_t1 = cache.generate_key(keywords=["srv"], tenant_id="t1")
+        key_t2 = cache.generate_key(keywords=["srv"], tenant_id="t2")
+        await cache.set(key_t1, [{"ci_id": 1}], keywords=["srv"])
+
+        assert key_t1 != key_t2
+        assert await cache.get(key_t2) is None
+        assert await cache.get(key_t1) == [{"ci_id": 1}]
+
+
+class TestTagInvalidation:
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_drops_l1_and_l2(self):
+        redis = FakeRedis()
+        worker = _worker(redis, namespace="tag-test")
+        await worker.set("a", {"rows": [1]}, 60, meta={"tags": ["ci_id:1"]})
+        await worker.set("b", {"rows": [2]}, 60, meta={"tags": ["ci_id:2"]})
+
+        await worker.invalidate_tags(["ci_id:1"])
+
+        assert worker.l1.get("a") is None
+        assert worker.l1.get("b") == {"rows": [2]}
+        assert await _worker(redis, namespace="tag-test").get("a") is None
+
+    def test_write_path_invalidation_reaches_every_namespace(self, monkeypatch):
+        redis = FakeRedis()
+        stores = {ns: RedisResultStore(ns, client=redis) for ns in ("tool", "ci")}
+        bus = ResultCacheInvalidationBus("test-channel")
+        monkeypatch.setattr(bus, "publish", lambda namespace, tags: None)
+        monkeypatch.setattr(result_store, "get_l2_store", stores.get)
+        monkeypatch.setattr(result_store, "get_invalidation_bus", lambda: bus)
+        tool = TieredResultCache("tool", LRUTTLCache(max_entries=10), stores["tool"])
+        ci = TieredResultCache("ci", LRUTTLCache(max_entries=10), stores["ci"])
+        asyncio.run(tool.set("a", {"rows": [1]}, 60, meta={"tags": ["ci_id:7"]}))
+        asyncio.run(ci.set("b", [{"ci_id": 7}], 60, meta={"tags": ["ci_id:7"]}))
+
+        assert invalidate_result_tags(["ci_id:7"]) == 4
+        assert tool.l1.get("a") is None and ci.l1.get("b") is None
+        assert not any(key.endswith((":a", ":b")) for key in redis.values)
+
+    def test_remote_message_drops_registered_l1(self):
+        bus = ResultCacheInvalidationBus("test-channel")
+        l1 = LRUTTLCache(max_entries=10)
+        bus.register("tool", l1)
+        l1.set("a", {"rows": [1]}, meta={"tags": ["source_ref:pg"]})
+        l1.set("b", {"rows": [2]}, meta={"tags": ["source_ref:neo"]})
+
+        bus._handle(
+            json.dumps({"origin": "other-worker", "namespace": "tool", "tags": ["source_ref:pg"]})
+        )
+
+        assert l1.get("a") is None
+        assert l1.get("b") == {"rows": [2]}
@@ -1,7 +1,10 @@
 import json
+import threading
 from uuid import uuid4
 
 from app.modules.ops.routes.ask_stream import _sse_event as ask_stream_sse_event
+from app.modules.ops.schemas import OpsAskRequest
+from app.modules.ops.services.ask_coalescer import ask_flight_key, get_ask_coalescer
 from app.modules.ops.services.ops_sse_handler import OpsSSEHandler
 from app.modules.ops.services.orchestration.planner.plan_schema import (
     DirectAnswerPayload,
@@ -159,3 +162,98 @@ def test_ops_ask_stream_persists_history_with_uuid_payload(client, monkeypatch)
     assert history.status == "ok"
     assert history.response is not None
     assert history.response["trace"]["trace_uuid"] == str(expected_trace_uuid)
+
+
+def _stub_direct_answer(monkeypatch, answer: str) -> None:
+    from app.modules.ops.routes import ask_stream as ask_stream_module
+
+    monkeypatch.setattr(ask_stream_module, "load_resolver_asset", lambda *_a, **_k: None)
+    monkeypatch.setattr(ask_stream_module, "load_source_asset", lambda *_a, **_k: None)
+    monkeypatch.setattr(ask_stream_module, "load_catalog_asset", lambda *_a, **_k: None)
+    monkeypatch.setattr(
+        ask_stream_module, "resolve_catalog_asset_for_source", lambda *_a, **_k: None
+    )
+    monkeypatch.setattr(
+        ask_stream_module, "load_mapping_asset", lambda *_a, **_k: ({}, "meta")
+    )
+    monkeypatch.setattr(ask_stream_module, "load_policy_asset", lambda *_a, **_k: {})
+    monkeypatch.setattr(ask_stream_module, "persist_execution_trace", lambda *_a, **_k: None)
+    monkeypatch.setattr(ask_stream_module, "get_all_spans", lambda: [])
+    monkeypatch.setattr(
+        ask_stream_module.planner_llm,
+        "create_plan_output",
+        lambda *_a, **_k: PlanOutput(
+            kind=PlanOutputKind.DIRECT,
+            direct_answer=DirectAnswerPayload(answer=answer),
+            confidence=1.0,
+        ),
+    )
+
+
+def _join_as_leader(question: str):
+    coalescer = get_ask_coalescer()
+    key = ask_flight_key("ask_stream", "default", OpsAskRequest(question=question))
+    leader, _ = coalescer.join(key, "trace-leader")
+    return coalescer, leader
+
+
+def test_ops_ask_stream_follower_gets_error_when_leader_fails(client, monkeypatch) -> None:
+    _stub_direct_answer(monkeypatch, "unused")
+    coalescer, leader = _join_as_leader("leader fails")
+    timer = threading.Timer(
+        0.2, coalescer.finish, kwargs={"flight": leader, "error": RuntimeError("leader gone")}
+    )
+    timer.start()
+
+    response = client.post(
+        "/ops/ask/stream",
+        json={"question": "leader fails"},
+        headers={"x-tenant-id": "default"},
+    )
+    timer.join()
+
+    assert response.status_code == 200
+    assert "event: error" in response.text
+    assert "leader gone" in response.text
+
+
+def test_ops_ask_stream_follower_runs_itself_when_leader_aborts(client, monkeypatch) -> None:
+    _stub_direct_answer(monkeypatch, "follower answered itself")
+    coalescer, leader = _join_as_leader("leader aborts")
+    # Leader's client disconnected: finished with neither a result nor an error
+    timer = threading.Timer(0.2, coalescer.finish, kwargs={"flight": leader})
+    timer.start()
+
+    response = client.post(
+        "/ops/ask/stream",
+        json={"question": "leader aborts"},
+        headers={"x-tenant-id": "default"},
+    )
+    timer.join()
+
+    assert response.status_code == 200
+    assert "event: complete" in response.text
+    assert "follower answered itself" in response.text
+    assert "event: error" not in response.text
+
+
+def test_ops_ask_stream_follower_runs_itself_after_timeout(client, monkeypatch) -> None:
+    from core.config import get_settings
+
+    _stub_direct_answer(monkeypatch, "follower answered itself")
+    monkeypatch.setattr(get_settings(), "ops_ask_coalesce_wait_seconds", 0.1)
+    coalescer, leader = _join_as_leader("slow leader")
+
+    try:
+        response = client.post(
+            "/ops/ask/stream",
+            json={"question": "slow leader"},
+            headers={"x-tenant-id": "default"},
+        )
+    finally:
+        coalescer.finish(leader, result={"answer": "late"})
+
+    assert response.status_code == 200
+    assert "event: complete" in response.text
+    assert "follower answered itself" in response.text
+    assert "event: error" not in response.text
@@ -0,0 +1,141 @@
+"""
+Plan Cache Tests
+
+Tests for the create_plan_output plan cache:
+- Question normalization for exact-match keys
+- Exact hits/misses and context key isolation (tools, prompt, tenant)
+- create_plan_output serves repeats from cache and records trace metadata
+- Heuristic fallback plans are not cached
+- Semantic lookup/insert SQL binds the embedding parameter
+"""
+
+import pytest
+from app.modules.ops.services.orchestration.planner import (
+    plan_cache as plan_cache_module,
+)
+from app.modules.ops.services.orchestration.planner import planner_llm
+from app.modules.ops.services.orchestration.planner.plan_cache import (
+    PlanCache,
+    build_context_key,
+    normalize_question,
+)
+from app.modules.ops.services.orchestration.planner.plan_schema import (
+    DirectAnswerPayload,
+    PlanOutput,
+    PlanOutputKind,
+)
+from sqlalchemy import text
+
+
+def _context_key(tools="tools-v1", prompt="prompt-v1", tenant_id="t1"):
+    return build_context_key(
+        tenant_id=tenant_id,
+        mode="all",
+        tools_fingerprint=tools,
+        prompt_fingerprint=prompt,
+        schema_context=None,
+        source_context=None,
+    )
+
+
+def _direct_output(answer="hello", **metadata):
+    return PlanOutput(
+        kind=PlanOutputKind.DIRECT,
+        direct_answer=DirectAnswerPayload(answer=answer),
+        metadata=metadata,
+    )
+
+
+def _install_cache(monkeypatch, calls, plan_source="llm"):
+    cache = PlanCache(max_entries=10, ttl_seconds=60)
+    monkeypatch.setattr(plan_cache_module, "_plan_cache", cache)
+    monkeypatch.setattr(
+        planner_llm, "_plan_cache_context_key", lambda *_args, **_kwargs: _context_key()
+    )
+
+    def fake_uncached(question, schema_context=None, source_context=None, mode=None):
+        calls.append(question)
+        return _direct_output(elapsed_ms=1200, plan_source=plan_source)
+
+    monkeypatch.setattr(planner_llm, "_create_plan_output_uncached", fake_uncached)
+    return cache
+
+
+def test_normalize_question_ignores_case_whitespace_and_trailing_punctuation():
+    assert normalize_question("  Show   CPU usage?  ") == normalize_question("show cpu usage")
+
+
+def test_exact_lookup_hits_only_same_context():
+    cache = PlanCache(max_entries=10, ttl_seconds=60)
+    cache.store("show cpu", _context_key(), _direct_output(), 800)
+
+    hit = cache.lookup("Show CPU?", _context_key())
+
+    assert hit is not None
+    assert hit.layer == "exact"
+    assert hit.saved_ms == 800
+    assert cache.lookup("show cpu", _context_key(tools="tools-v2")) is None
+    assert cache.lookup("show cpu", _context_key(prompt="prompt-v2")) is None
+    assert cache.lookup("show cpu", _context_key(tenant_id="t2")) is None
+    assert cache.stats()["exact_hits"] == 1
+
+
+def test_cached_plan_is_isolated_from_caller_mutation():
+    cache = PlanCache(max_entries=10, ttl_seconds=60)
+    cache.store("show cpu", _context_key(), _direct_output(), 800)
+
+    first = cache.lookup("show cpu", _context_key())
+    first.plan_output.metadata["mutated"] = True
+    second = cache.lookup("show cpu", _context_key())
+
+    assert "mutated" not in second.plan_output.metadata
+
+
+def test_create_plan_output_serves_repeat_from_cache(monkeypatch):
+    calls = []
+    _install_cache(monkeypatch, calls)
+
+    first = planner_llm.create_plan_output("show cpu usage", mode="all")
+    second = planner_llm.create_plan_output("Show CPU usage?", mode="all")
+
+    assert calls == ["show cpu usage"]
+    assert first.metadata["plan_cache"]["hit"] is False
+    assert second.metadata["plan_cache"]["hit"] is True
+    assert second.metadata["plan_cache"]["layer"] == "exact"
+    assert second.metadata["plan_cache"]["saved_llm_ms"] == 1200
+    assert second.direct_answer.answer == "hello"
+
+
+def test_heuristic_fallback_plans_are_not_cached(monkeypatch):
+    calls = []
+    cache = _install_cache(monkeypatch, calls, plan_source="heuristic")
+
+    planner_llm.create_plan_output("show cpu usage", mode="all")
+    planner_llm.create_plan_output("show cpu usage", mode="all")
+
+    assert len(calls) == 2
+    assert cache.stats()["stores"] == 0
+
+
+def test_disabled_plan_cache_bypasses_lookup(monkeypatch):
+    calls = []
+    _install_cache(monkeypatch, calls)
+    monkeypatch.setattr(
+        planner_llm.get_settings(), "ops_plan_cache_enabled", False
+    )
+
+    planner_llm.create_plan_output("show cpu usage", mode="all")
+    result = planner_llm.create_plan_output("show cpu usage", mode="all")
+
+    assert len(calls) == 2
+    assert "plan_cache" not in result.metadata
+
+
+@pytest.mark.parametrize(
+    "sql", [plan_cache_module.SEMANTIC_LOOKUP_SQL, plan_cache_module.SEMANTIC_INSERT_SQL]
+)
+def test_semantic_sql_binds_embedding(sql):
+    params = text(sql).compile().params
+
+    assert "embedding" in params
+    assert "context_key" in params
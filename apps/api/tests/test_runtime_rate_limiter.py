@@ -0,0 +1,158 @@
+"""
+Runtime Rate Limiter Tests
+
+Tests for /runtime rate limiting:
+- GCRA allows a full burst, then spaces requests evenly
+- Key count is bounded
+- Per-API, per-API-key and per-tenant limits resolved from policy/settings
+- Rejections counted per dimension; Redis failures fall back to memory and
+  Redis is retried after an exponential backoff
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from app.modules.api_manager import rate_limiter as rate_limiter_module
+from app.modules.api_manager.rate_limiter import (
+    GcraLimiter,
+    RateLimit,
+    RuntimeRateLimiter,
+    route_limits,
+)
+
+
+@pytest.fixture
+def limiter_settings(monkeypatch):
+    settings = SimpleNamespace(
+        redis_url=None,
+        runtime_rate_limit_backend="memory",
+        runtime_rate_limit_prefix="test_rl:",
+        runtime_rate_limit_window_seconds=60,
+        runtime_rate_limit_per_ip=120,
+        runtime_rate_limit_per_api_key=30,
+        runtime_rate_limit_per_tenant=0,
+        runtime_rate_limit_max_keys=1000,
+        runtime_rate_limit_redis_retry_seconds=5.0,
+    )
+    monkeypatch.setattr(rate_limiter_module, "get_settings", lambda: settings)
+    return settings
+
+
+class TestGcraLimiter:
+    def test_burst_then_steady_rate(self):
+        now = [0.0]
+        limiter = GcraLimiter(clock=lambda: now[0])
+        limit = RateLimit(requests=3, window_seconds=3)
+
+        assert all(limiter.hit("k", limit).allowed for _ in range(3))
+        rejected = limiter.hit("k", limit)
+        assert not rejected.allowed
+        assert rejected.retry_after == pytest.approx(1.0)
+
+        now[0] = 1.0
+        assert limiter.hit("k", limit).allowed
+        assert not limiter.hit("k", limit).allowed
+        assert limiter.hit("other", limit).allowed
+
+    def test_key_count_is_bounded(self):
+        limiter = GcraLimiter(max_keys=2)
+        for key in ("a", "b", "c"):
+            limiter.hit(key, RateLimit(1, 60))
+
+        assert len(limiter) == 2
+
+
+class TestRouteLimits:
+    def test_defaults_apply_across_apis(self, limiter_settings):
+        limits = route_limits("api-1", {}, api_key_id="key-1", tenant_id="default")
+
+        assert limits == [("api_key", "key-1", RateLimit(30, 60))]
+
+    def test_policy_overrides_are_scoped_to_api(self, limiter_settings):
+        policy = {
+            "rate_limit": {"requests": 100, "per_api_key": 5, "per_tenant": 50, "window_seconds": 10}
+        }
+        limits = route_limits("api-1", policy, api_key_id="key-1", tenant_id="default")
+
+        assert limits == [
+            ("api", "api-1", RateLimit(100, 10)),
+            ("api_key", "api-1:key-1", RateLimit(5, 10)),
+            ("tenant", "api-1:default", RateLimit(50, 10)),
+        ]
+
+
+class TestRuntimeRateLimiter:
+    def test_rejections_counted_per_dimension(self, limiter_settings):
+        limiter = RuntimeRateLimiter()
+        limits = [("ip", "10.0.0.1", RateLimit(10, 60)), ("api", "api-1", RateLimit(1, 60))]
+
+        assert limiter.check(limits) is None
+        dimension, decision = limiter.check(limits)
+
+        assert dimension == "api"
+        assert not decision.allowed
+        stats = limiter.stats()
+        assert stats["backend"] == "memory"
+        assert stats["rejected"] == {"api": 1}
+        assert stats["allowed"] == {"ip": 2, "api": 1}
+
+    def test_redis_failure_falls_back_to_memory(self, limiter_settings):
+        class BrokenRedis:
+            def ping(self):
+                return True
+
+            def register_script(self, _script):
+                def run(keys, args):
+                    raise ConnectionError("redis down")
+
+                return run
+
+        limiter = RuntimeRateLimiter(use_redis=True, redis_client=BrokenRedis())
+        assert limiter.backend == "redis"
+
+        assert limiter.check([("ip", "10.0.0.1", RateLimit(1, 60))]) is None
+        assert limiter.backend == "memory"
+        assert limiter.check([("ip", "10.0.0.1", RateLimit(1, 60))])[0] == "ip"
+
+    def test_redis_retried_after_backoff(self, limiter_settings):
+        now = [0.0]
+        calls = []
+
+        class FlakyRedis:
+            down = True
+
+            def ping(self):
+                raise ConnectionError("redis down")
+
+            def register_script(self, _script):
+                def run(keys, args):
+                    calls.append(now[0])
+                    if self.down:
+                        raise ConnectionError("redis down")
+                    return [1, 0]
+
+                return run
+
+        redis = FlakyRedis()
+        limiter = RuntimeRateLimiter(use_redis=True, redis_client=redis, clock=lambda: now[0])
+        limit = [("ip", "10.0.0.1", RateLimit(100, 60))]
+        assert limiter.backend == "memory"
+
+        limiter.check(limit)
+        assert calls == []
+
+        now[0] = 5.0
+        limiter.check(limit)
+        assert calls == [5.0]
+
+        # Backoff doubles after a failed retry
+        now[0] = 14.0
+        limiter.check(limit)
+        assert calls == [5.0]
+
+        redis.down = False
+        now[0] = 15.0
+        assert limiter.check(limit) is None
+        assert limiter.backend == "redis"
+        limiter.check(limit)
+        assert calls == [5.0, 15.0, 15.0]
@@ -0,0 +1,171 @@
+"""
+Runtime Route Table Tests
+
+Tests for the compiled /runtime route table:
+- Lookups normalize /runtime prefixes and trailing slashes
+- Routes are served without DB queries once built
+- Commits touching api_definitions or auth settings invalidate the table,
+  including the settings upsert's Core UPDATE
+- Tables older than the max age are rebuilt
+- Disabled APIs are not routed
+- Redis invalidation messages from other workers are applied
+"""
+
+import json
+
+import pytest
+from app.modules.api_manager import route_table as route_table_module
+from app.modules.api_manager.route_table import (
+    RuntimeRouteTable,
+    normalize_runtime_path,
+)
+from models.api_definition import ApiAuthMode, ApiDefinition, ApiMode, ApiScope
+from sqlalchemy import event
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = RuntimeRouteTable()
+    monkeypatch.setattr(route_table_module, "_route_table", table)
+    return table
+
+
+@pytest.fixture
+def query_counter(test_engine):
+    calls = {"count": 0}
+
+    def _count(*_args):
+        calls["count"] += 1
+
+    event.listen(test_engine, "before_cursor_execute", _count)
+    yield calls
+    event.remove(test_engine, "before_cursor_execute", _count)
+
+
+def _add_api(session, path: str, **overrides) -> ApiDefinition:
+    values = {
+        "scope": ApiScope.custom,
+        "name": f"api-{path.strip('/').replace('/', '-')}",
+        "method": "GET",
+        "path": path,
+        "mode": ApiMode.sql,
+        "logic": "SELECT 1",
+        "auth_mode": ApiAuthMode.api_key_only,
+        "required_scopes": ["api:execute"],
+        "runtime_policy": {"cache": {"ttl_seconds": 30}},
+        "is_enabled": True,
+    }
+    values.update(overrides)
+    api = ApiDefinition(**values)
+    session.add(api)
+    session.commit()
+    session.refresh(api)
+    return api
+
+
+def test_normalize_runtime_path():
+    assert normalize_runtime_path("/runtime/orders/") == "/orders"
+    assert normalize_runtime_path("orders") == "/orders"
+    assert normalize_runtime_path("/runtime") == "/"
+    assert normalize_runtime_path("/runtimes/x") == "/runtimes/x"
+
+
+def test_lookup_served_from_memory(session, table, query_counter):
+    api = _add_api(session, "/runtime/orders")
+    table.build(session)
+    query_counter["count"] = 0
+
+    route = table.lookup(session, "get", "/runtime/orders/")
+
+    assert route.id == api.id
+    assert route.mode == "sql"
+    assert route.auth_mode == "api_key_only"
+    assert route.required_scopes == ("api:execute",)
+    assert route.cache_policy == {"ttl_seconds": 30}
+    assert table.lookup(session, "GET", "/orders") == route
+    assert table.lookup(session, "POST", "/orders") is None
+    assert query_counter["count"] == 0
+
+
+def test_commit_on_api_definition_invalidates(session, table):
+    api = _add_api(session, "/runtime/items")
+    assert table.lookup(session, "GET", "/runtime/items").logic == "SELECT 1"
+
+    api.logic = "SELECT 2"
+    session.add(api)
+    session.commit()
+
+    assert table.stats()["stale"] is True
+    assert table.lookup(session, "GET", "/runtime/items").logic == "SELECT 2"
+
+    api.is_enabled = False
+    session.add(api)
+    session.commit()
+
+    assert table.lookup(session, "GET", "/runtime/items") is None
+    assert table.stats()["builds"] == 3
+
+
+def test_published_auth_setting_is_cached(session, table):
+    from app.modules.operation_settings.crud import create_or_update_setting
+
+    assert table.published_setting(session, "api_auth_default_mode", "jwt_only") == "jwt_only"
+
+    create_or_update_setting(
+        session=session,
+        setting_key="api_auth_default_mode",
+        setting_value={"value": "jwt_or_api_key"},
+        published_by="tester",
+    )
+
+    assert (
+        table.published_setting(session, "api_auth_default_mode", "jwt_only")
+        == "jwt_or_api_key"
+    )
+
+
+def test_auth_setting_update_invalidates(session, table):
+    from app.modules.operation_settings.crud import create_or_update_setting
+
+    for value in ("jwt_or_api_key", "api_key_only"):
+        # The second call updates the existing row through a Core UPDATE
+        create_or_update_setting(
+            session=session,
+            setting_key="api_auth_default_mode",
+            setting_value={"value": value},
+            published_by="tester",
+        )
+        assert table.published_setting(session, "api_auth_default_mode", None) == value
+
+
+def test_table_older_than_max_age_is_rebuilt(session, monkeypatch):
+    table = RuntimeRouteTable(max_age_seconds=60)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(route_table_module.time, "monotonic", lambda: clock["now"])
+    table.build(session)
+
+    clock["now"] += 59
+    assert table.stats()["stale"] is False
+    clock["now"] += 2
+    assert table.stats()["stale"] is True
+    table.lookup(session, "GET", "/orders")
+    assert table.stats()["builds"] == 2
+
+
+def test_remote_invalidation_message_is_applied(session, table):
+    table.build(session)
+
+    bus = route_table_module.RouteTableInvalidationBus("test-channel")
+    bus._handle(json.dumps({"origin": "other-worker"}))
+
+    assert table.stats()["stale"] is True
+    assert table.stats()["remote_invalidations"] == 1
+
+
+def test_own_invalidation_message_is_ignored(session, table):
+    table.build(session)
+
+    bus = route_table_module.RouteTableInvalidationBus("test-channel")
+    bus._handle(json.dumps({"origin": bus.origin}))
+
+    assert table.stats()["stale"] is False
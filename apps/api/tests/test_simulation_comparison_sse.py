@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+from app.modules.simulation.schemas import SimulationRunRequest
+from app.modules.simulation.services.simulation import sse_handler
+from app.modules.simulation.services.simulation.schemas import KpiResult
+
+
+class _SlowStrategy:
+    def __init__(self, delay: float, latency: float):
+        self.delay = delay
+        self.latency = latency
+
+    def run(self, *, plan, baseline_data, tenant_id):
+        time.sleep(self.delay)
+        kpi = KpiResult(
+            kpi="latency_ms",
+            baseline=baseline_data["latency_ms"],
+            simulated=self.latency,
+            unit="ms",
+        )
+        return [kpi], 0.8, {"delay": self.delay}
+
+
+def _parse(event: str) -> tuple[str, dict]:
+    lines = event.strip().splitlines()
+    return lines[0].removeprefix("event: "), json.loads(lines[1].removeprefix("data: "))
+
+
+async def _collect(handler, strategies):
+    return [
+        _parse(event)
+        async for event in handler.stream_comparison(
+            payload=SimulationRunRequest(question="트래픽 증가 영향"),
+            strategies=strategies,
+            tenant_id="t1",
+            requested_by="tester",
+        )
+    ]
+
+
+def test_comparison_runs_strategies_concurrently(monkeypatch):
+    monkeypatch.setattr(
+        sse_handler,
+        "load_baseline_and_scenario_kpis",
+        lambda **_: ({"latency_ms": 100.0}, {}),
+    )
+    handler = sse_handler.MultiStrategyComparisonSSE.__new__(
+        sse_handler.MultiStrategyComparisonSSE
+    )
+    handler._strategies = {
+        "slow": _SlowStrategy(0.6, 130.0),
+        "fast": _SlowStrategy(0.1, 110.0),
+    }
+
+    start = time.perf_counter()
+    events = asyncio.run(_collect(handler, ["slow", "missing", "fast"]))
+    elapsed = time.perf_counter() - start
+
+    # Wall time tracks the slowest strategy, not the sum
+    assert elapsed < 0.6 + 0.1
+    results = [data["strategy"] for name, data in events if name == "strategy_result"]
+    assert results == ["fast", "slow"]
+    errors = [data["strategy"] for name, data in events if name == "error"]
+    assert errors == ["missing"]
+
+    # Per-strategy progress: one running_strategy each, strategy_complete as they finish
+    steps = [(data["step"], data.get("strategy")) for name, data in events if name == "progress"]
+    assert [s for s in steps if s[0] == "running_strategy"] == [
+        ("running_strategy", "slow"),
+        ("running_strategy", "missing"),
+        ("running_strategy", "fast"),
+    ]
+    assert [s for s in steps if s[0] == "strategy_complete"] == [
+        ("strategy_complete", "fast"),
+        ("strategy_complete", "slow"),
+    ]
+
+    name, complete = events[-1]
+    assert name == "complete"
+    assert complete["strategies"] == ["slow", "fast"]
+    assert complete["comparison"]["kpi_comparison"]["latency_ms"]["strategies"] == {
+        "slow": 130.0,
+        "fast": 110.0,
+    }
@@ -34,7 +34,7 @@ def test_execute_custom_function_success(monkeypatch):
     }
 
     monkeypatch.setattr(
-        "app.modules.simulation.services.simulation.custom_function_runner.subprocess.run",
+        "app.modules.simulation.services.simulation.custom_function_runner.run_script_runner",
         lambda *args, **kwargs: SimpleNamespace(
             returncode=0,
             stdout=json.dumps(output).encode("utf-8"),
@@ -54,7 +54,7 @@ def test_execute_custom_function_success(monkeypatch):
 
 def test_execute_custom_function_rejects_schema_mismatch(monkeypatch):
     monkeypatch.setattr(
-        "app.modules.simulation.services.simulation.custom_function_runner.subprocess.run",
+        "app.modules.simulation.services.simulation.custom_function_runner.run_script_runner",
         lambda *args, **kwargs: SimpleNamespace(returncode=0, stdout=b"{}", stderr=b""),
     )
 
@@ -69,7 +69,7 @@ def test_execute_custom_function_rejects_schema_mismatch(monkeypatch):
 
 def test_execute_custom_function_runner_error(monkeypatch):
     monkeypatch.setattr(
-        "app.modules.simulation.services.simulation.custom_function_runner.subprocess.run",
+        "app.modules.simulation.services.simulation.custom_function_runner.run_script_runner",
         lambda *args, **kwargs: SimpleNamespace(returncode=1, stdout=b"", stderr=b"boom"),
     )
 
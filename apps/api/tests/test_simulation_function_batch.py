@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from app.modules.simulation.services.simulation.functions import (
+    FunctionRegistry,
+    SimulationFunction,
+    run_monte_carlo,
+    run_parameter_sweep,
+    run_sensitivity_analysis,
+)
+
+BASELINE = {
+    "latency_ms": 180.0,
+    "error_rate_pct": 1.2,
+    "throughput_rps": 1200.0,
+    "cost_usd_hour": 42.0,
+    # Catalog validation expects a baseline value for every output
+    "prediction": 180.0,
+    "std_error": 0.0,
+}
+
+
+def _random_batch(function: SimulationFunction, size: int, rng: np.random.Generator) -> dict:
+    columns = {}
+    for param in function.metadata.parameters:
+        if param.type not in ("number", "integer") or param.min is None or param.max is None:
+            continue
+        values = rng.uniform(param.min, param.max, size)
+        columns[param.name] = np.round(values) if param.type == "integer" else values
+    return columns
+
+
+@pytest.mark.parametrize("function_id", [m.id for m in FunctionRegistry.list_all()])
+def test_execute_batch_matches_scalar_execute(function_id):
+    function = FunctionRegistry.get(function_id)
+    assumptions = _random_batch(function, 64, np.random.default_rng(3))
+
+    outputs, confidence, _ = function.execute_batch(baseline=BASELINE, assumptions=assumptions)
+    expected, expected_confidence, _ = SimulationFunction.execute_batch(
+        function, baseline=BASELINE, assumptions=assumptions
+    )
+
+    assert outputs.keys() == expected.keys()
+    for name in expected:
+        np.testing.assert_allclose(outputs[name], expected[name], rtol=1e-9, atol=0.0011)
+    np.testing.assert_allclose(confidence, expected_confidence)
+
+
+def test_builtin_surrogates_are_vectorized():
+    for function_id in ("ml_random_forest_surrogate", "ml_arima_surrogate", "stat_linear_regression"):
+        function = FunctionRegistry.get(function_id)
+        _, _, debug_info = function.execute_batch(
+            baseline=BASELINE, assumptions=_random_batch(function, 8, np.random.default_rng(0))
+        )
+        assert debug_info["vectorized"] is True
+
+
+def test_parameter_sweep_evaluates_full_grid():
+    result = run_parameter_sweep(
+        "rule_linear_weight",
+        baseline=BASELINE,
+        assumptions={"cpu_change_pct": 10.0},
+        sweep={"traffic_change_pct": [0, 20, 40], "memory_change_pct": [0, 5]},
+    )
+
+    assert result["shape"] == [3, 2]
+    assert result["count"] == 6
+    assert result["grid"]["traffic_change_pct"] == [0, 0, 20, 20, 40, 40]
+    latency = result["outputs"]["latency_ms"]
+    assert latency == sorted(latency)
+
+
+def test_sensitivity_ranks_parameters_by_swing():
+    result = run_sensitivity_analysis(
+        "ml_random_forest_surrogate",
+        baseline=BASELINE,
+        assumptions={},
+        parameters=["traffic_change", "memory_change"],
+        variation_pct=50,
+    )
+
+    bars = result["tornado"]["prediction"]
+    assert [bar["parameter"] for bar in bars] == ["traffic_change", "memory_change"]
+    assert bars[0]["low_value"] == 10.0 and bars[0]["high_value"] == 30.0
+    assert bars[0]["low_output"] < result["base_outputs"]["prediction"] < bars[0]["high_output"]
+
+
+def test_monte_carlo_bands_are_reproducible():
+    kwargs = {
+        "baseline": BASELINE,
+        "assumptions": {},
+        "distributions": {"traffic_change": {"type": "normal", "mean": 20.0, "std": 10.0}},
+        "samples": 5000,
+        "seed": 11,
+    }
+
+    first = run_monte_carlo("ml_random_forest_surrogate", **kwargs)
+    second = run_monte_carlo("ml_random_forest_surrogate", **kwargs)
+
+    band = first["bands"]["prediction"]
+    assert band == second["bands"]["prediction"]
+    assert band["percentiles"]["p5"] < band["percentiles"]["p50"] < band["percentiles"]["p95"]
+    assert first["failed_samples"] == 0
+
+
+def test_invalid_ranges_are_rejected():
+    with pytest.raises(ValueError, match="traffic_change_pct must be <= 300.0"):
+        run_parameter_sweep(
+            "rule_linear_weight",
+            baseline=BASELINE,
+            assumptions={},
+            sweep={"traffic_change_pct": [0, 500]},
+        )
@@ -0,0 +1,312 @@
+"""
+Source Connection Pool Tests
+
+Tests for the per-source connection pool registry used by ConnectionFactory:
+- Reuse of pooled resources across connect/close cycles
+- max_size enforcement and acquire timeout
+- Health check / discard handling; health checks run outside the pool lock
+- Shared (driver/client) mode
+- Pre-warming to min_size and background pruning of idle resources
+- Invalidation on republish / config change
+- Source connections must implement _open_resource
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.modules.ops.services.connections.factory import (
+    PostgreSQLConnection,
+    SourceConnection,
+)
+from app.modules.ops.services.connections.pool import (
+    ConnectionPoolRegistry,
+    PoolConfig,
+    PoolMaintainer,
+    SourceConnectionPool,
+    connection_fingerprint,
+)
+
+
+class _Resource:
+    def __init__(self, ident: int):
+        self.ident = ident
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _make_pool(shared: bool = False, **config) -> tuple[SourceConnectionPool, list]:
+    opened: list[_Resource] = []
+
+    def opener():
+        resource = _Resource(len(opened))
+        opened.append(resource)
+        return resource
+
+    pool = SourceConnectionPool(
+        key="src:abc",
+        source_name="src",
+        source_type="postgresql",
+        opener=opener,
+        closer=lambda r: r.close(),
+        health_check=lambda r: not r.closed,
+        config=PoolConfig(**config),
+        shared=shared,
+    )
+    return pool, opened
+
+
+def _source(name: str = "primary_postgres", host: str = "db1") -> dict:
+    return {
+        "name": name,
+        "source_type": "postgresql",
+        "connection": {"host": host, "port": 5432, "username": "u", "password": "p"},
+    }
+
+
+class TestSourceConnectionPool:
+    def test_resource_is_reused_after_release(self):
+        pool, opened = _make_pool()
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second is first
+        assert len(opened) == 1
+        stats = pool.stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 1
+        assert stats["in_use"] == 1
+
+    def test_exhausted_pool_times_out(self):
+        pool, _ = _make_pool(max_size=1, acquire_timeout_seconds=0.05)
+        pool.acquire()
+
+        with pytest.raises(ConnectionError, match="exhausted"):
+            pool.acquire()
+        assert pool.stats()["timeouts"] == 1
+
+    def test_discarded_resource_is_closed_and_replaced(self):
+        pool, opened = _make_pool()
+        first = pool.acquire()
+        pool.release(first, discard=True)
+        second = pool.acquire()
+
+        assert first.closed
+        assert second is not first
+        assert len(opened) == 2
+
+    def test_failed_health_check_replaces_resource(self):
+        pool, opened = _make_pool(health_check_interval_seconds=0)
+        first = pool.acquire()
+        pool.release(first)
+        first.closed = True  # simulate server-side disconnect
+
+        second = pool.acquire()
+        assert second is not first
+        assert pool.stats()["health_check_failures"] == 1
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_health_check_runs_outside_pool_lock(self, shared):
+        pool, _ = _make_pool(shared=shared, health_check_interval_seconds=0)
+        checking = threading.Event()
+        proceed = threading.Event()
+
+        def slow_check(resource):
+            if not checking.is_set():
+                checking.set()
+                proceed.wait(2)
+            return True
+
+        first = pool.acquire()
+        pool.release(first)
+        pool._health_check = slow_check
+        acquired = []
+        worker = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        worker.start()
+        assert checking.wait(2)
+
+        # The lock is free while the check is in flight
+        started = time.monotonic()
+        if shared:
+            pool.release(pool.acquire())
+        assert pool.stats()["size"] == 1
+        assert time.monotonic() - started < 0.5
+        proceed.set()
+        worker.join(2)
+
+        assert acquired == [first]
+
+    def test_idle_resources_are_reaped(self):
+        pool, _ = _make_pool(idle_timeout_seconds=0.0001, min_size=0)
+        resource = pool.acquire()
+        pool.release(resource)
+
+        time.sleep(0.01)
+        assert pool.prune() == 1
+        assert resource.closed
+        assert pool.stats()["size"] == 0
+
+    def test_warm_opens_up_to_min_size(self):
+        pool, opened = _make_pool(min_size=2, idle_timeout_seconds=0.0001)
+
+        assert pool.warm() == 2
+        assert pool.warm() == 0
+        assert pool.stats()["idle"] == 2
+
+        # min_size connections survive idle pruning and are reused
+        time.sleep(0.01)
+        assert pool.prune() == 0
+        assert pool.acquire() in opened
+        assert len(opened) == 2
+
+    def test_warm_failure_releases_reserved_slot(self):
+        pool = SourceConnectionPool(
+            key="src:abc",
+            source_name="src",
+            source_type="postgresql",
+            opener=MagicMock(side_effect=OSError("refused")),
+            closer=MagicMock(),
+            config=PoolConfig(min_size=1),
+        )
+
+        assert pool.warm() == 0
+        assert pool.stats()["size"] == 0
+
+    def test_closed_pool_closes_resources_on_release(self):
+        pool, _ = _make_pool()
+        resource = pool.acquire()
+        pool.close()
+
+        pool.release(resource)
+        assert resource.closed
+        with pytest.raises(ConnectionError, match="closed"):
+            pool.acquire()
+
+    def test_shared_mode_hands_out_one_resource(self):
+        pool, opened = _make_pool(shared=True)
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert first is second
+        assert len(opened) == 1
+        assert pool.stats()["in_use"] == 2
+
+        pool.close()
+        pool.release(first)
+        assert not first.closed
+        pool.release(second)
+        assert first.closed
+
+
+class TestConnectionPoolRegistry:
+    def test_same_source_shares_pool(self):
+        registry = ConnectionPoolRegistry()
+        opener = MagicMock(return_value=_Resource(0))
+        pool_a = registry.get_pool(_source(), opener=opener, closer=lambda r: r.close())
+        pool_b = registry.get_pool(_source(), opener=opener, closer=lambda r: r.close())
+
+        assert pool_a is pool_b
+        assert registry.stats()["pool_count"] == 1
+
+    def test_config_change_retires_stale_pool(self):
+        registry = ConnectionPoolRegistry()
+        old_pool = registry.get_pool(_source(host="db1"), opener=MagicMock(), closer=MagicMock())
+        new_pool = registry.get_pool(_source(host="db2"), opener=MagicMock(), closer=MagicMock())
+
+        assert old_pool is not new_pool
+        assert old_pool.stats()["retired"] is True
+        assert registry.stats()["pool_count"] == 1
+
+    def test_invalidate_by_source_name(self):
+        registry = ConnectionPoolRegistry()
+        registry.get_pool(_source("a"), opener=MagicMock(), closer=MagicMock())
+        registry.get_pool(_source("b"), opener=MagicMock(), closer=MagicMock())
+
+        assert registry.invalidate("a") == 1
+        assert [p["source_name"] for p in registry.stats()["pools"]] == ["b"]
+
+    def test_maintainer_prunes_and_warms_registry_pools(self):
+        registry = ConnectionPoolRegistry()
+        opened: list[_Resource] = []
+
+        def opener():
+            opened.append(_Resource(len(opened)))
+            return opened[-1]
+
+        source = _source()
+        source["connection"]["connection_params"] = {
+            "pool_min_size": 1,
+            "pool_idle_timeout_seconds": 0.0001,
+        }
+        pool = registry.get_pool(source, opener=opener, closer=lambda r: r.close())
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        time.sleep(0.01)
+
+        with patch(
+            "app.modules.ops.services.connections.pool.get_pool_registry",
+            return_value=registry,
+        ):
+            result = PoolMaintainer(interval_seconds=60).run_once()
+
+        assert result == {"pruned": 1, "warmed": 0}
+        assert pool.stats()["idle"] == 1
+        assert first.closed and not second.closed
+
+    def test_fingerprint_ignores_asset_metadata(self):
+        base = _source()
+        republished = {**base, "version": 7, "asset_id": "x"}
+        assert connection_fingerprint(base) == connection_fingerprint(republished)
+
+    def test_pool_config_overrides_from_source(self):
+        source = _source()
+        source["connection"]["max_connections"] = 3
+        source["connection"]["connection_params"] = {"pool_idle_timeout_seconds": "12"}
+
+        config = PoolConfig.from_source_asset(source)
+        assert config.max_size == 3
+        assert config.idle_timeout_seconds == 12.0
+
+
+class TestPostgreSQLConnectionPooling:
+    def test_connect_close_reuses_psycopg_connection(self):
+        registry = ConnectionPoolRegistry()
+        raw_conn = MagicMock()
+        raw_conn.closed = False
+
+        with (
+            patch(
+                "app.modules.ops.services.connections.factory.get_pool_registry",
+                return_value=registry,
+            ),
+            patch("psycopg.connect", return_value=raw_conn) as connect,
+        ):
+            for _ in range(3):
+                conn = PostgreSQLConnection(_source())
+                conn.connect()
+                conn.close()
+
+        assert connect.call_count == 1
+        assert raw_conn.rollback.called
+        assert not raw_conn.close.called
+        assert registry.stats()["pools"][0]["reused"] == 2
+
+
+def test_source_connection_requires_open_resource():
+    class Incomplete(SourceConnection):
+        def connect(self):
+            pass
+
+        def execute(self, query, params=None):
+            pass
+
+        def close(self):
+            pass
+
+    with pytest.raises(TypeError, match="_open_resource"):
+        Incomplete(_source())
@@ -0,0 +1,234 @@
+"""
+Telemetry Sink Tests
+
+Tests for the write-behind telemetry sink:
+- Without a running flusher rows are written inline on the caller's session
+- Queued rows are written in one multi-row INSERT per table on stop
+- drop_oldest / drop_newest policies when the queue is full; drop_oldest
+  evicts an API exec log together with its queued steps
+- Failed batches are retried row by row; only rejected rows spill
+- Spilled JSONL is replayed on the next start; unreadable files and rejected
+  rows are quarantined without stopping the replay
+"""
+
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from app.modules.api_manager.models import ApiExecLog, ApiExecStepLog
+from app.modules.llm.models import TbLlmCallLog
+from core.telemetry_sink import TelemetrySink
+from sqlalchemy.exc import OperationalError
+
+
+class RecordingSession:
+    def __init__(self, fail: bool = False, reject=None, error=None):
+        self.fail = fail
+        self.reject = reject
+        self.error = error or RuntimeError("database unavailable")
+        self.executed = []
+        self.added = []
+        self.commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, statement, rows):
+        if self.fail:
+            raise self.error
+        if self.reject and any(self.reject(row) for row in rows):
+            raise RuntimeError("row rejected")
+        self.executed.append((statement.table.name, list(rows)))
+
+    def add(self, row):
+        self.added.append(row)
+
+    def commit(self):
+        self.commits += 1
+
+    def refresh(self, _row):
+        pass
+
+
+def _row(call_type: str) -> TbLlmCallLog:
+    return TbLlmCallLog(
+        call_type=call_type, model_name="gpt-4o", request_time=datetime(2024, 1, 1)
+    )
+
+
+def _sink(session: RecordingSession, **overrides) -> TelemetrySink:
+    options = {"max_queue": 100, "batch_size": 100, "flush_interval_ms": 60_000}
+    options.update(overrides)
+    return TelemetrySink(session_factory=lambda: session, **options)
+
+
+def test_submit_without_flusher_writes_inline():
+    caller_session = RecordingSession()
+    sink = _sink(RecordingSession())
+
+    assert sink.submit(_row("planner"), caller_session)
+
+    assert len(caller_session.added) == 1
+    assert caller_session.commits == 1
+
+
+def test_stop_flushes_queue_as_one_batch():
+    db = RecordingSession()
+    sink = _sink(db)
+    sink.start()
+    for call_type in ("planner", "tool", "output_parser"):
+        sink.submit(_row(call_type))
+    sink.stop()
+
+    assert len(db.executed) == 1
+    table, rows = db.executed[0]
+    assert table == "tb_llm_call_log"
+    assert [row["call_type"] for row in rows] == ["planner", "tool", "output_parser"]
+    assert sink.stats()["written"] == 3
+    assert sink.stats()["queued"] == 0
+
+
+@pytest.mark.parametrize(
+    "policy, kept",
+    [("drop_oldest", ["b", "c"]), ("drop_newest", ["a", "b"])],
+)
+def test_full_queue_applies_drop_policy(policy, kept):
+    db = RecordingSession()
+    sink = _sink(db, max_queue=2, drop_policy=policy)
+    sink.start()
+    results = [sink.submit(_row(call_type)) for call_type in ("a", "b", "c")]
+    sink.stop()
+
+    assert results[-1] is (policy == "drop_oldest")
+    assert [row["call_type"] for row in db.executed[0][1]] == kept
+    assert sink.stats()["dropped"] == 1
+
+
+def test_failed_batch_spills_and_replays(tmp_path):
+    failing = _sink(RecordingSession(fail=True), spill_dir=str(tmp_path))
+    failing.start()
+    failing.submit(_row("planner"))
+    failing.stop()
+
+    assert failing.stats()["spilled"] == 1
+    assert len(list(tmp_path.glob("telemetry-*.jsonl"))) == 1
+
+    db = RecordingSession()
+    replaying = _sink(db, spill_dir=str(tmp_path))
+    replaying.start()
+    replaying.stop()
+
+    assert replaying.stats()["replayed"] == 1
+    assert db.executed[0][1][0]["call_type"] == "planner"
+    assert list(tmp_path.glob("telemetry-*.jsonl")) == []
+
+
+def test_drop_oldest_evicts_exec_log_with_its_steps():
+    db = RecordingSession()
+    sink = _sink(db, max_queue=3)
+    sink.start()
+    log = ApiExecLog(api_id=uuid.uuid4(), status="success", duration_ms=1, row_count=0)
+    sink.submit(log)
+    for node_id in ("n1", "n2"):
+        sink.submit(
+            ApiExecStepLog(
+                exec_id=log.exec_id,
+                node_id=node_id,
+                node_type="sql",
+                status="success",
+                duration_ms=1,
+                row_count=0,
+            )
+        )
+    sink.submit(_row("planner"))
+    sink.stop()
+
+    assert [table for table, _rows in db.executed] == ["tb_llm_call_log"]
+    assert sink.stats()["dropped"] == 3
+
+
+def test_failed_batch_retried_row_by_row(tmp_path):
+    db = RecordingSession(reject=lambda row: row["call_type"] == "bad")
+    sink = _sink(db, spill_dir=str(tmp_path))
+    sink.start()
+    for call_type in ("planner", "bad", "tool"):
+        sink.submit(_row(call_type))
+    sink.stop()
+
+    written = [row["call_type"] for _table, rows in db.executed for row in rows]
+    assert written == ["planner", "tool"]
+    assert sink.stats()["written"] == 2
+    assert sink.stats()["spilled"] == 1
+
+
+def test_unavailable_database_stops_row_retries(tmp_path):
+    error = OperationalError("INSERT", {}, Exception("connection refused"))
+    db = RecordingSession(fail=True, error=error)
+    calls = []
+    sink = TelemetrySink(
+        session_factory=lambda: calls.append(1) or db,
+        flush_interval_ms=60_000,
+        spill_dir=str(tmp_path),
+    )
+    sink.start()
+    for call_type in ("a", "b", "c"):
+        sink.submit(_row(call_type))
+    sink.stop()
+
+    assert len(calls) == 2
+    assert sink.stats()["spilled"] == 3
+
+
+def _spill_file(path, call_types):
+    records = [
+        {
+            "table": "tb_llm_call_log",
+            "row": {
+                "call_type": call_type,
+                "model_name": "gpt-4o",
+                "request_time": "2024-01-01T00:00:00",
+            },
+        }
+        for call_type in call_types
+    ]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def test_replay_quarantines_bad_input_and_continues(tmp_path):
+    (tmp_path / "telemetry-1.jsonl").write_text("{not json\n")
+    _spill_file(tmp_path / "telemetry-2.jsonl", ["bad", "planner"])
+    _spill_file(tmp_path / "telemetry-3.jsonl", ["tool"])
+
+    db = RecordingSession(reject=lambda row: row["call_type"] == "bad")
+    sink = _sink(db, spill_dir=str(tmp_path))
+    sink.start()
+    sink.stop()
+
+    written = [row["call_type"] for _table, rows in db.executed for row in rows]
+    assert written == ["planner", "tool"]
+    assert list(tmp_path.glob("telemetry-*.jsonl")) == []
+    unreadable = tmp_path / "quarantine-telemetry-1.jsonl"
+    assert unreadable.exists()
+    (quarantined,) = set(tmp_path.glob("quarantine-*.jsonl")) - {unreadable}
+    assert json.loads(quarantined.read_text())["row"]["call_type"] == "bad"
+    stats = sink.stats()
+    assert (stats["replayed"], stats["quarantined_rows"], stats["quarantined_files"]) == (2, 1, 1)
+
+
+def test_replay_keeps_files_while_database_is_down(tmp_path):
+    _spill_file(tmp_path / "telemetry-1.jsonl", ["planner"])
+    error = OperationalError("INSERT", {}, Exception("connection refused"))
+    sink = _sink(RecordingSession(fail=True, error=error), spill_dir=str(tmp_path))
+    sink.start()
+    sink.stop()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["telemetry-1.jsonl"]
+
+
+def test_unknown_drop_policy_rejected():
+    with pytest.raises(ValueError):
+        TelemetrySink(drop_policy="discard")
@@ -0,0 +1,178 @@
+"""
+Trace Rollup Tests
+
+Tests for per-minute trace rollups:
+- Latency sketch quantiles stay within the relative accuracy and merge exactly
+- Traces are folded per (minute, tenant, ops_mode, tool) and flushed as rows
+- Queries merge rollup rows in the window
+- KPI stats scan traces for the unflushed tail and fall back to a full scan
+  when traces predate the earliest rollup bucket
+- Rows older than the retention are purged
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from app.modules.inspector import rollups as rollups_module
+from app.modules.inspector.models import TbExecutionTrace, TbTraceRollup
+from app.modules.inspector.observability_crud import get_trace_rollup_stats
+from app.modules.inspector.rollups import (
+    RollupStats,
+    TraceRollupAggregator,
+    purge_trace_rollups,
+    query_trace_rollups,
+)
+from core.latency_sketch import LatencySketch
+
+
+class TestLatencySketch:
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(5, 1) for _ in range(20_000))
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.02)
+        assert len(sketch.bins) < 1000
+
+    def test_merge_matches_single_sketch(self):
+        whole, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+        for value in range(1, 1001):
+            whole.add(value)
+            (left if value % 2 else right).add(value)
+
+        merged = LatencySketch.from_dict(left.to_dict()).merge(right)
+
+        assert merged.count == whole.count
+        assert merged.bins == whole.bins
+        assert merged.quantile(0.95) == whole.quantile(0.95)
+
+
+def _trace(trace_id: str, duration_ms: int, status: str = "success", **fields):
+    fields.setdefault("created_at", datetime(2026, 1, 1, 12, 30, 15))
+    return TbExecutionTrace(
+        trace_id=trace_id,
+        feature="ops",
+        endpoint="/ops/ask",
+        method="POST",
+        ops_mode="real",
+        question="q",
+        status=status,
+        duration_ms=duration_ms,
+        **fields,
+    )
+
+
+def test_aggregator_folds_traces_and_tools(monkeypatch):
+    submitted = []
+    monkeypatch.setattr(rollups_module, "submit_telemetry", submitted.append)
+    aggregator = TraceRollupAggregator()
+
+    aggregator.record_trace(
+        _trace(
+            "t1",
+            120,
+            execution_steps=[{"tool_name": "metric", "duration_ms": 40, "status": "success"}],
+        ),
+        tenant_id="default",
+    )
+    aggregator.record_trace(
+        _trace("t2", 300, status="error", answer={"meta": {"summary": "No data found"}}),
+        tenant_id="default",
+    )
+
+    minute = datetime(2026, 1, 1, 12, 30)
+    pending = aggregator.pending()
+    request_stats = pending[(minute, "default", "real", "")]
+    assert (request_stats.request_count, request_stats.error_count) == (2, 1)
+    assert request_stats.no_data_count == 1
+    assert pending[(minute, "default", "real", "metric")].request_count == 1
+
+    assert aggregator.flush() == 2
+    assert aggregator.pending() == {}
+    assert {row.tool for row in submitted} == {"", "metric"}
+    assert all(isinstance(row, TbTraceRollup) for row in submitted)
+
+
+def test_query_merges_rows_in_window(session):
+    for minute, durations in ((10, [100, 200]), (11, [300]), (5, [9999])):
+        stats = RollupStats()
+        for duration in durations:
+            stats.add(duration, error=duration == 300)
+        session.add(
+            TbTraceRollup(
+                bucket_start=datetime(2026, 1, 1, 12, minute),
+                tenant_id="default",
+                ops_mode="real",
+                request_count=stats.request_count,
+                error_count=stats.error_count,
+                sketch=stats.sketch.to_dict(),
+            )
+        )
+    session.commit()
+
+    merged = query_trace_rollups(session, datetime(2026, 1, 1, 12, 10, 30))
+
+    assert merged.request_count == 3
+    assert merged.error_count == 1
+    assert merged.percentile(0.5) == pytest.approx(200, rel=0.02)
+    assert merged.sketch.max == 300
+
+
+def _rollup_row(minute: datetime, durations: list[int]) -> TbTraceRollup:
+    stats = RollupStats()
+    for duration in durations:
+        stats.add(duration, error=False)
+    return TbTraceRollup(
+        bucket_start=minute,
+        tenant_id="default",
+        ops_mode="real",
+        request_count=stats.request_count,
+        sketch=stats.sketch.to_dict(),
+    )
+
+
+NOW = datetime(2026, 1, 1, 13, 0, 10)
+
+
+def test_stats_scan_traces_after_flush_lag(session):
+    # 12:59 is inside the flush lag: its partial rollup row is ignored and
+    # the traces of that minute are scanned instead
+    session.add(_rollup_row(datetime(2026, 1, 1, 12, 58), [100, 100]))
+    session.add(_rollup_row(datetime(2026, 1, 1, 12, 59), [200]))
+    session.add(_trace("t1", 200, created_at=datetime(2026, 1, 1, 12, 59, 5)))
+    session.add(_trace("t2", 400, status="error", created_at=datetime(2026, 1, 1, 12, 59, 50)))
+    session.commit()
+
+    stats = get_trace_rollup_stats(session, NOW - timedelta(minutes=5), now=NOW)
+
+    assert (stats.request_count, stats.error_count) == (4, 1)
+    assert stats.sketch.max == pytest.approx(400, rel=0.02)
+
+
+def test_stats_fall_back_when_traces_predate_rollups(session):
+    session.add(_rollup_row(datetime(2026, 1, 1, 12, 50), [100]))
+    session.commit()
+    since = NOW - timedelta(hours=1)
+
+    assert get_trace_rollup_stats(session, since, now=NOW).request_count == 1
+
+    session.add(_trace("old", 100, created_at=datetime(2026, 1, 1, 12, 20)))
+    session.commit()
+
+    assert get_trace_rollup_stats(session, since, now=NOW) is None
+
+
+def test_purge_drops_rows_before_cutoff(session):
+    for minute in (datetime(2025, 11, 1), datetime(2026, 1, 1, 12, 0)):
+        session.add(_rollup_row(minute, [100]))
+    session.commit()
+
+    assert purge_trace_rollups(session, datetime(2025, 12, 2)) == 1
+    assert [row.bucket_start for row in session.query(TbTraceRollup).all()] == [
+        datetime(2026, 1, 1, 12, 0)
+    ]
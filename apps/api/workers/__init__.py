@@ -1,4 +1,10 @@
-from .jobs import parse_and_index_document
-from .queue import enqueue_parse_document, get_rq_queue
+from .jobs import ingest_uploaded_document, parse_and_index_document
+from .queue import enqueue_ingest_document, enqueue_parse_document, get_rq_queue
 
-__all__ = ["parse_and_index_document", "get_rq_queue", "enqueue_parse_document"]
+__all__ = [
+    "parse_and_index_document",
+    "ingest_uploaded_document",
+    "get_rq_queue",
+    "enqueue_parse_document",
+    "enqueue_ingest_document",
+]
@@ -28,3 +28,20 @@ def parse_and_index_document(document_id: str) -> dict[str, str]:
         }
     finally:
         session.close()
+
+
+def ingest_uploaded_document(document_id: str) -> dict[str, str]:
+    from app.modules.document_processor.services.ingestion_pipeline import (
+        DocumentIngestionPipeline,
+    )
+
+    session = SessionLocal()
+    try:
+        result = DocumentIngestionPipeline(session).run(document_id)
+        return {"document_id": document_id, "status": str(result["status"])}
+    except Exception as exc:
+        # The pipeline has already marked the document as failed
+        logging.exception("Ingestion failed for document %s: %s", document_id, exc)
+        return {"document_id": document_id, "status": "failed", "error": str(exc)}
+    finally:
+        session.close()
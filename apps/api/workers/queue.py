@@ -4,7 +4,7 @@ from core.config import get_settings
 from redis import Redis
 from rq import Queue
 
-from .jobs import parse_and_index_document
+from .jobs import ingest_uploaded_document, parse_and_index_document
 
 
 def get_rq_queue(name: str = "default") -> Queue:
@@ -18,3 +18,8 @@ def get_rq_queue(name: str = "default") -> Queue:
 def enqueue_parse_document(document_id: str):
     queue = get_rq_queue(name="documents")
     return queue.enqueue(parse_and_index_document, document_id=document_id)
+
+
+def enqueue_ingest_document(document_id: str):
+    queue = get_rq_queue(name="documents")
+    return queue.enqueue(ingest_uploaded_document, document_id=document_id)